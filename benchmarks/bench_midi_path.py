@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+from benchmarks.synth_midi import generate_smf
+from midi_editor.config import load_rs_drums_json
+from midi_editor.drum_remap import remap_channel_9_notes_in_place
+from midi_editor.midi_init_injector import inject_init_events
+from midi_editor.midi_io import load_midi_as_notes, save_project_to_midi
+from midi_editor.models import MidiProject
+
+ROOT = Path(__file__).resolve().parent.parent
+BUNDLED_MIDI_DIR = ROOT / "resources" / "midi"
+DRUMS_JSON = ROOT / "midi_editor" / "data" / "rs_drums.json"
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000, 1_000_000, 5_000_000]
+
+
+def _measure(fn: Callable[[], Any], repeat: int) -> Dict[str, Any]:
+    """Best wall time over `repeat` runs, plus tracemalloc peak of the first run."""
+    gc.collect()
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    result = fn()
+    best = time.perf_counter() - t0
+    _cur, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    for _ in range(repeat - 1):
+        gc.collect()
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return {"seconds": best, "peak_bytes": int(peak), "result": result}
+
+
+def _max_rss_kb() -> Optional[int]:
+    """Process peak RSS (includes numpy buffers tracemalloc may miss); None where unsupported."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    return int(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True
+        )
+        return out.stdout.strip() or None
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def bench_file(
+    case: str,
+    midi_path: Path,
+    work_dir: Path,
+    *,
+    repeat: int,
+    drums_by_note: Dict[int, Any],
+    inject_max_notes: int,
+) -> List[Dict[str, Any]]:
+    rows: List[Dict[str, Any]] = []
+
+    def record(stage: str, fn: Callable[[], Any], notes: int, reps: int = repeat) -> Any:
+        m = _measure(fn, reps)
+        rows.append({
+            "case": case,
+            "stage": stage,
+            "notes": notes,
+            "seconds": round(m["seconds"], 6),
+            "peak_bytes": m["peak_bytes"],
+        })
+        print(f"  {stage:<28} {m['seconds'] * 1000:10.2f} ms  peak {m['peak_bytes'] / 1e6:9.2f} MB", flush=True)
+        return m["result"]
+
+    project: MidiProject = record("load_midi_as_notes", lambda: load_midi_as_notes(midi_path), 0)
+    n = len(project.notes)
+    for r in rows:
+        r["notes"] = n
+    print(f"  ({n} notes, {len(project.used_channels())} channels)")
+
+    record("load_midi_as_notes[parallel]", lambda: load_midi_as_notes(midi_path, parallel=True), n)
+
+    out_mid = work_dir / f"{case}.out.mid"
+    record("save_project_to_midi", lambda: save_project_to_midi(project, out_mid), n)
+
+    if n <= inject_max_notes:
+        record("inject_init_events", lambda: inject_init_events(out_mid, work_dir / f"{case}.init.mid"), n)
+
+    # Edits mutate the project: run each on a fresh copy-on-write restore
+    def on_copy(fn: Callable[[MidiProject], Any]) -> Callable[[], Any]:
+        snap = project.snapshot(muted=())
+        return lambda: fn(snap.restore())
+
+    record("remap_channel_9_notes_in_place",
+           on_copy(lambda p: remap_channel_9_notes_in_place(p, drums_by_note)), n)
+    # The list path is for notes no project owns: views onto a detached copy
+    record("remap_channel_9[list]",
+           lambda: remap_channel_9_notes_in_place(list(project.notes.copy())[: min(n, 200_000)], dict(drums_by_note)),
+           min(n, 200_000), reps=1)
+
+    used = project.used_channels()
+    a, b = (used[0], used[1]) if len(used) > 1 else (0, 1)
+    record("used_channels", project.used_channels, n)
+    record("channel_note_counts", project.channel_note_counts, n)
+    record("notes_for_channel", lambda: project.notes_for_channel(a), n)
+    record("swap_channels", on_copy(lambda p: p.swap_channels(a, b)), n)
+    record("merge_channel_into", on_copy(lambda p: p.merge_channel_into(a, b)), n)
+    record("delete_channel", on_copy(lambda p: p.delete_channel(a)), n)
+    record("snapshot[mute]", lambda: len(project.snapshot(muted={a}).notes), n)
+
+    end = project.notes.max_end_tick()
+    record("interval_index_build", on_copy(lambda p: p.notes_overlapping(0, 1)), n)
+    project.notes_overlapping(0, 1)
+    window = max(1, project.ticks_per_beat * 16)
+    starts = np.linspace(0, max(0, end - window), 200).astype(int).tolist()
+    record("notes_overlapping[x200]",
+           lambda: [project.notes_overlapping(s, s + window) for s in starts], n)
+    return rows
+
+
+def compare(new: Dict[str, Any], old_path: Path) -> None:
+    old = json.loads(old_path.read_text(encoding="utf-8"))
+    old_by_key = {(r["case"], r["stage"]): r for r in old.get("results", [])}
+    print(f"\nCompared with {old_path} (commit {old.get('meta', {}).get('commit')}):")
+    for r in new["results"]:
+        o = old_by_key.get((r["case"], r["stage"]))
+        if not o or not o["seconds"]:
+            continue
+        ratio = r["seconds"] / o["seconds"]
+        print(f"  {r['case']:<24} {r['stage']:<28} {ratio:6.2f}x time  "
+              f"{(r['peak_bytes'] / o['peak_bytes']) if o['peak_bytes'] else float('nan'):6.2f}x peak")
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Benchmark the MIDI load/save/edit data path.")
+    ap.add_argument("--sizes", default=",".join(str(s) for s in DEFAULT_SIZES),
+                    help="Comma-separated synthetic note counts (default 1k..5M)")
+    ap.add_argument("--tracks", default="4,32", help="Comma-separated track counts for the synthetic corpus")
+    ap.add_argument("--channels", type=int, default=10, help="Channels used by synthetic files")
+    ap.add_argument("--overlap", type=float, default=0.1, help="Fraction of restruck (overlapping) pitches")
+    ap.add_argument("--repeat", type=int, default=3, help="Runs per stage (best time is reported)")
+    ap.add_argument("--inject-max-notes", type=int, default=200_000,
+                    help="Skip the mido-based inject_init_events stage above this many notes")
+    ap.add_argument("--no-bundled", action="store_true", help="Skip resources/midi/*.mid")
+    ap.add_argument("--no-synthetic", action="store_true", help="Skip the synthetic corpus")
+    ap.add_argument("--corpus-dir", type=Path, default=None, help="Where to cache generated .mid files")
+    ap.add_argument("--out", type=Path, default=None, help="Write results JSON here")
+    ap.add_argument("--compare", type=Path, default=None, help="Print ratios against an earlier results JSON")
+    ap.add_argument("--smoke", action="store_true",
+                    help="Run every stage once on the bundled MIDIs and one small synthetic file (quick pre-merge check)")
+    args = ap.parse_args()
+    if args.smoke:
+        args.sizes, args.tracks, args.repeat = "1000", "16", 1
+
+    drums_by_note = load_rs_drums_json(DRUMS_JSON)
+
+    with tempfile.TemporaryDirectory(prefix="midi_bench_") as tmp:
+        work_dir = Path(tmp)
+        corpus_dir = args.corpus_dir or work_dir
+        corpus_dir.mkdir(parents=True, exist_ok=True)
+
+        cases: List[tuple] = []
+        if not args.no_bundled:
+            for p in sorted(BUNDLED_MIDI_DIR.glob("*.mid")):
+                cases.append((p.stem, p))
+        if not args.no_synthetic:
+            for size in (int(s) for s in args.sizes.split(",") if s.strip()):
+                for tracks in (int(t) for t in args.tracks.split(",") if t.strip()):
+                    name = f"synth_{size}n_{tracks}t_{args.channels}c"
+                    path = corpus_dir / f"{name}.mid"
+                    if not path.exists():
+                        generate_smf(path, size, n_tracks=tracks, n_channels=args.channels, overlap=args.overlap)
+                    cases.append((name, path))
+
+        results: List[Dict[str, Any]] = []
+        for case, path in cases:
+            print(f"{case}  ({path.stat().st_size / 1e6:.2f} MB)", flush=True)
+            results.extend(bench_file(
+                case, path, work_dir,
+                repeat=args.repeat,
+                drums_by_note=drums_by_note,
+                inject_max_notes=args.inject_max_notes,
+            ))
+
+    report = {
+        "meta": {
+            "commit": _git_commit(),
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": sys.version.split()[0],
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "max_rss_kb": _max_rss_kb(),
+        },
+        "results": results,
+    }
+    if args.out:
+        args.out.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print(f"\nWrote {args.out}")
+    if args.compare:
+        compare(report, args.compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,4528 @@
+	.include "MPlayDef.s"
+
+	.equ	mus_assumption_grp, voicegroup_test
+	.equ	mus_assumption_pri, 0
+	.equ	mus_assumption_rev, reverb_set+50
+	.equ	mus_assumption_mvl, 90
+	.equ	mus_assumption_key, 0
+	.equ	mus_assumption_tbs, 1
+	.equ	mus_assumption_exg, 1
+	.equ	mus_assumption_cmp, 1
+
+	.section .rodata
+	.global	mus_assumption
+	.align	2
+
+@**************** Track 1 (Midi-Chn.1) ****************@
+
+mus_assumption_1:
+	.byte	KEYSH , mus_assumption_key+0
+@ 000   ----------------------------------------
+	.byte	TEMPO , 126*mus_assumption_tbs/2
+	.byte		VOICE , 1
+	.byte		VOL   , 127*mus_assumption_mvl/mxv
+	.byte		N06   , Dn3 , v050
+	.byte		N06   , Fs3 , v050
+	.byte		N06   , An3 , v050
+	.byte		N06   , Cs4 , v050
+	.byte	W18
+	.byte		N06   , Dn3 , v050
+	.byte		N06   , Fs3 , v050
+	.byte		N06   , An3 , v050
+	.byte		N06   , Bn3 , v050
+	.byte	W18
+	.byte		N06   , Dn3 , v050
+	.byte		N06   , Fs3 , v050
+	.byte		N06   , An3 , v050
+	.byte	W12
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , Gs3 , v050
+	.byte	W12
+	.byte		N06   , Gs3 , v050
+	.byte	W06
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , An3 , v050
+	.byte	W18
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , An3 , v050
+	.byte	W06
+	.byte		N06   , Fs4 , v050
+	.byte	W06
+@ 001   ----------------------------------------
+	.byte		N06   , Dn3 , v050
+	.byte		N06   , Fs3 , v050
+	.byte		N06   , An3 , v050
+	.byte		N06   , Cs4 , v050
+	.byte	W24
+	.byte		N06   , Dn3 , v050
+	.byte		N06   , Fs3 , v050
+	.byte		N06   , An3 , v050
+	.byte		N06   , Bn3 , v050
+	.byte	W24
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , Gs3 , v050
+	.byte	W12
+	.byte		N06   , Gs3 , v050
+	.byte	W06
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , An3 , v050
+	.byte	W18
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , An3 , v050
+	.byte	W06
+	.byte		N06   , Fs4 , v050
+	.byte	W06
+@ 002   ----------------------------------------
+	.byte		N06   , Dn3 , v050
+	.byte		N06   , Fs3 , v050
+	.byte		N06   , An3 , v050
+	.byte		N06   , Cs4 , v050
+	.byte	W18
+	.byte		N06   , Dn3 , v050
+	.byte		N06   , Fs3 , v050
+	.byte		N06   , An3 , v050
+	.byte		N06   , Bn3 , v050
+	.byte	W30
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , Gs3 , v050
+	.byte	W12
+	.byte		N06   , Gs3 , v050
+	.byte	W06
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , An3 , v050
+	.byte	W18
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , An3 , v050
+	.byte	W06
+	.byte		N06   , Fs4 , v050
+	.byte	W06
+@ 003   ----------------------------------------
+	.byte		N06   , Dn3 , v050
+	.byte		N06   , Fs3 , v050
+	.byte		N06   , An3 , v050
+	.byte		N06   , Cs4 , v050
+	.byte	W24
+	.byte		N06   , Dn3 , v050
+	.byte		N06   , Fs3 , v050
+	.byte		N06   , An3 , v050
+	.byte		N06   , Bn3 , v050
+	.byte	W24
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , Gs3 , v050
+	.byte	W12
+	.byte		N06   , Gs3 , v050
+	.byte	W06
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , An3 , v050
+	.byte	W18
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , An3 , v050
+	.byte	W06
+	.byte		N06   , Fs4 , v050
+	.byte	W06
+@ 004   ----------------------------------------
+	.byte		N06   , Dn3 , v050
+	.byte		N06   , Fs3 , v050
+	.byte		N06   , An3 , v050
+	.byte		N06   , Cs4 , v050
+	.byte	W18
+	.byte		N06   , Dn3 , v050
+	.byte		N06   , Fs3 , v050
+	.byte		N06   , An3 , v050
+	.byte		N06   , Bn3 , v050
+	.byte	W18
+	.byte		N06   , Dn3 , v050
+	.byte		N06   , Fs3 , v050
+	.byte		N06   , An3 , v050
+	.byte	W12
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , Gs3 , v050
+	.byte	W12
+	.byte		N06   , Gs3 , v050
+	.byte	W06
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , An3 , v050
+	.byte	W18
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , An3 , v050
+	.byte	W06
+	.byte		N06   , Fs4 , v050
+	.byte	W06
+@ 005   ----------------------------------------
+	.byte		N06   , Dn3 , v050
+	.byte		N06   , Fs3 , v050
+	.byte		N06   , An3 , v050
+	.byte		N06   , Cs4 , v050
+	.byte	W24
+	.byte		N06   , Dn3 , v050
+	.byte		N06   , Fs3 , v050
+	.byte		N06   , An3 , v050
+	.byte		N06   , Bn3 , v050
+	.byte	W24
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , Gs3 , v050
+	.byte	W12
+	.byte		N06   , Gs3 , v050
+	.byte	W06
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , An3 , v050
+	.byte	W18
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , An3 , v050
+	.byte	W06
+	.byte		N06   , Fs4 , v050
+	.byte	W06
+@ 006   ----------------------------------------
+	.byte		N06   , Dn3 , v050
+	.byte		N06   , Fs3 , v050
+	.byte		N06   , An3 , v050
+	.byte		N06   , Cs4 , v050
+	.byte	W18
+	.byte		N06   , Dn3 , v050
+	.byte		N06   , Fs3 , v050
+	.byte		N06   , An3 , v050
+	.byte		N06   , Bn3 , v050
+	.byte	W30
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , Gs3 , v050
+	.byte	W12
+	.byte		N06   , Gs3 , v050
+	.byte	W06
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , An3 , v050
+	.byte	W18
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , An3 , v050
+	.byte	W06
+	.byte		N06   , Fs4 , v050
+	.byte	W06
+@ 007   ----------------------------------------
+	.byte		N06   , Dn3 , v050
+	.byte		N06   , Fs3 , v050
+	.byte		N06   , An3 , v050
+	.byte		N06   , Cs4 , v050
+	.byte	W24
+	.byte		N06   , Dn3 , v050
+	.byte		N06   , Fs3 , v050
+	.byte		N06   , An3 , v050
+	.byte		N06   , Bn3 , v050
+	.byte	W24
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , Gs3 , v050
+	.byte	W12
+	.byte		N06   , Gs3 , v050
+	.byte	W06
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , An3 , v050
+	.byte	W18
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , An3 , v050
+	.byte	W06
+	.byte		N06   , Fs4 , v050
+	.byte	W06
+@ 008   ----------------------------------------
+	.byte		N06   , Dn3 , v050
+	.byte		N06   , Fs3 , v050
+	.byte		N06   , An3 , v050
+	.byte		N06   , Cs4 , v050
+	.byte	W18
+	.byte		N06   , Dn3 , v050
+	.byte		N06   , Fs3 , v050
+	.byte		N06   , An3 , v050
+	.byte		N06   , Bn3 , v050
+	.byte	W18
+	.byte		N06   , Dn3 , v050
+	.byte		N06   , Fs3 , v050
+	.byte		N06   , An3 , v050
+	.byte	W12
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , Gs3 , v050
+	.byte	W12
+	.byte		N06   , Gs3 , v050
+	.byte	W06
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , An3 , v050
+	.byte	W18
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , An3 , v050
+	.byte	W06
+	.byte		N06   , Fs4 , v050
+	.byte	W06
+@ 009   ----------------------------------------
+	.byte		N06   , Dn3 , v050
+	.byte		N06   , Fs3 , v050
+	.byte		N06   , An3 , v050
+	.byte		N06   , Cs4 , v050
+	.byte	W24
+	.byte		N06   , Dn3 , v050
+	.byte		N06   , Fs3 , v050
+	.byte		N06   , An3 , v050
+	.byte		N06   , Bn3 , v050
+	.byte	W24
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , Gs3 , v050
+	.byte	W12
+	.byte		N06   , Gs3 , v050
+	.byte	W06
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , An3 , v050
+	.byte	W18
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , An3 , v050
+	.byte	W06
+	.byte		N06   , Fs4 , v050
+	.byte	W06
+@ 010   ----------------------------------------
+	.byte		N06   , Dn3 , v050
+	.byte		N06   , Fs3 , v050
+	.byte		N06   , An3 , v050
+	.byte		N06   , Cs4 , v050
+	.byte	W18
+	.byte		N06   , Dn3 , v050
+	.byte		N06   , Fs3 , v050
+	.byte		N06   , An3 , v050
+	.byte		N06   , Bn3 , v050
+	.byte	W30
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , Gs3 , v050
+	.byte	W12
+	.byte		N06   , Gs3 , v050
+	.byte	W06
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , An3 , v050
+	.byte	W18
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , An3 , v050
+	.byte	W06
+	.byte		N06   , Fs4 , v050
+	.byte	W06
+@ 011   ----------------------------------------
+	.byte		N06   , Dn3 , v050
+	.byte		N06   , Fs3 , v050
+	.byte		N06   , An3 , v050
+	.byte		N06   , Cs4 , v050
+	.byte	W24
+	.byte		N06   , Dn3 , v050
+	.byte		N06   , Fs3 , v050
+	.byte		N06   , An3 , v050
+	.byte		N06   , Bn3 , v050
+	.byte	W24
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , Gs3 , v050
+	.byte	W12
+	.byte		N06   , Gs3 , v050
+	.byte	W06
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , An3 , v050
+	.byte	W18
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , An3 , v050
+	.byte	W06
+	.byte		N06   , Fs4 , v050
+	.byte	W06
+@ 012   ----------------------------------------
+	.byte		N06   , Dn3 , v050
+	.byte		N06   , Fs3 , v050
+	.byte		N06   , An3 , v050
+	.byte		N06   , Cs4 , v050
+	.byte	W18
+	.byte		N06   , Dn3 , v050
+	.byte		N06   , Fs3 , v050
+	.byte		N06   , An3 , v050
+	.byte		N06   , Bn3 , v050
+	.byte	W18
+	.byte		N06   , Dn3 , v050
+	.byte		N06   , Fs3 , v050
+	.byte		N06   , An3 , v050
+	.byte	W12
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , Gs3 , v050
+	.byte	W12
+	.byte		N06   , Gs3 , v050
+	.byte	W06
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , An3 , v050
+	.byte	W18
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , An3 , v050
+	.byte	W06
+	.byte		N06   , Fs4 , v050
+	.byte	W06
+@ 013   ----------------------------------------
+	.byte		N06   , Dn3 , v050
+	.byte		N06   , Fs3 , v050
+	.byte		N06   , An3 , v050
+	.byte		N06   , Cs4 , v050
+	.byte	W24
+	.byte		N06   , Dn3 , v050
+	.byte		N06   , Fs3 , v050
+	.byte		N06   , An3 , v050
+	.byte		N06   , Bn3 , v050
+	.byte	W24
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , Gs3 , v050
+	.byte	W12
+	.byte		N06   , Gs3 , v050
+	.byte	W06
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , An3 , v050
+	.byte	W18
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , An3 , v050
+	.byte	W06
+	.byte		N06   , Fs4 , v050
+	.byte	W06
+@ 014   ----------------------------------------
+	.byte		N06   , Dn3 , v050
+	.byte		N06   , Fs3 , v050
+	.byte		N06   , An3 , v050
+	.byte		N06   , Cs4 , v050
+	.byte	W18
+	.byte		N06   , Dn3 , v050
+	.byte		N06   , Fs3 , v050
+	.byte		N06   , An3 , v050
+	.byte		N06   , Bn3 , v050
+	.byte	W30
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , Gs3 , v050
+	.byte	W12
+	.byte		N06   , Gs3 , v050
+	.byte	W06
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , An3 , v050
+	.byte	W18
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , An3 , v050
+	.byte	W06
+	.byte		N06   , Fs4 , v050
+	.byte	W06
+@ 015   ----------------------------------------
+	.byte		N06   , Dn3 , v050
+	.byte		N06   , Fs3 , v050
+	.byte		N06   , An3 , v050
+	.byte		N06   , Cs4 , v050
+	.byte	W24
+	.byte		N06   , Dn3 , v050
+	.byte		N06   , Fs3 , v050
+	.byte		N06   , An3 , v050
+	.byte		N06   , Bn3 , v050
+	.byte	W24
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , Gs3 , v050
+	.byte	W12
+	.byte		N06   , Gs3 , v050
+	.byte	W06
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , An3 , v050
+	.byte	W18
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , An3 , v050
+	.byte	W06
+	.byte		N06   , Fs4 , v050
+	.byte	W06
+@ 016   ----------------------------------------
+	.byte		N06   , Dn3 , v050
+	.byte		N06   , Fs3 , v050
+	.byte		N06   , An3 , v050
+	.byte		N06   , Cs4 , v050
+	.byte	W18
+	.byte		N06   , Dn3 , v050
+	.byte		N06   , Fs3 , v050
+	.byte		N06   , An3 , v050
+	.byte		N06   , Bn3 , v050
+	.byte	W18
+	.byte		N06   , Dn3 , v050
+	.byte		N06   , Fs3 , v050
+	.byte		N06   , An3 , v050
+	.byte	W12
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , Gs3 , v050
+	.byte	W12
+	.byte		N06   , Gs3 , v050
+	.byte	W06
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , An3 , v050
+	.byte	W18
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , An3 , v050
+	.byte	W06
+	.byte		N06   , Fs4 , v050
+	.byte	W06
+@ 017   ----------------------------------------
+	.byte		N06   , Dn3 , v050
+	.byte		N06   , Fs3 , v050
+	.byte		N06   , An3 , v050
+	.byte		N06   , Cs4 , v050
+	.byte	W24
+	.byte		N06   , Dn3 , v050
+	.byte		N06   , Fs3 , v050
+	.byte		N06   , An3 , v050
+	.byte		N06   , Bn3 , v050
+	.byte	W24
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , Gs3 , v050
+	.byte	W12
+	.byte		N06   , Gs3 , v050
+	.byte	W06
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , An3 , v050
+	.byte	W18
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , An3 , v050
+	.byte	W06
+	.byte		N06   , Fs4 , v050
+	.byte	W06
+@ 018   ----------------------------------------
+	.byte		N06   , Dn3 , v050
+	.byte		N06   , Fs3 , v050
+	.byte		N06   , An3 , v050
+	.byte		N06   , Cs4 , v050
+	.byte	W18
+	.byte		N06   , Dn3 , v050
+	.byte		N06   , Fs3 , v050
+	.byte		N06   , An3 , v050
+	.byte		N06   , Bn3 , v050
+	.byte	W30
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , Gs3 , v050
+	.byte	W12
+	.byte		N06   , Gs3 , v050
+	.byte	W06
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , An3 , v050
+	.byte	W18
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , An3 , v050
+	.byte	W06
+	.byte		N06   , Fs4 , v050
+	.byte	W06
+@ 019   ----------------------------------------
+	.byte		N06   , Dn3 , v050
+	.byte		N06   , Fs3 , v050
+	.byte		N06   , An3 , v050
+	.byte		N06   , Cs4 , v050
+	.byte	W24
+	.byte		N06   , Dn3 , v050
+	.byte		N06   , Fs3 , v050
+	.byte		N06   , An3 , v050
+	.byte		N06   , Bn3 , v050
+	.byte	W24
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , Gs3 , v050
+	.byte	W12
+	.byte		N06   , Gs3 , v050
+	.byte	W06
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , An3 , v050
+	.byte	W18
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , An3 , v050
+	.byte	W06
+	.byte		N06   , Fs4 , v050
+	.byte	W06
+@ 020   ----------------------------------------
+	.byte		N06   , Dn3 , v050
+	.byte		N06   , Fs3 , v050
+	.byte		N06   , An3 , v050
+	.byte		N06   , Cs4 , v050
+	.byte	W18
+	.byte		N06   , Dn3 , v050
+	.byte		N06   , Fs3 , v050
+	.byte		N06   , An3 , v050
+	.byte		N06   , Bn3 , v050
+	.byte	W18
+	.byte		N06   , Dn3 , v050
+	.byte		N06   , Fs3 , v050
+	.byte		N06   , An3 , v050
+	.byte	W12
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , Gs3 , v050
+	.byte	W12
+	.byte		N06   , Gs3 , v050
+	.byte	W06
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , An3 , v050
+	.byte	W18
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , An3 , v050
+	.byte	W06
+	.byte		N06   , Fs4 , v050
+	.byte	W06
+@ 021   ----------------------------------------
+	.byte		N06   , Dn3 , v050
+	.byte		N06   , Fs3 , v050
+	.byte		N06   , An3 , v050
+	.byte		N06   , Cs4 , v050
+	.byte	W24
+	.byte		N06   , Dn3 , v050
+	.byte		N06   , Fs3 , v050
+	.byte		N06   , An3 , v050
+	.byte		N06   , Bn3 , v050
+	.byte	W24
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , Gs3 , v050
+	.byte	W12
+	.byte		N06   , Gs3 , v050
+	.byte	W06
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , An3 , v050
+	.byte	W18
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , An3 , v050
+	.byte	W06
+	.byte		N06   , Fs4 , v050
+	.byte	W06
+@ 022   ----------------------------------------
+	.byte		N06   , Dn3 , v050
+	.byte		N06   , Fs3 , v050
+	.byte		N06   , An3 , v050
+	.byte		N06   , Cs4 , v050
+	.byte	W18
+	.byte		N06   , Dn3 , v050
+	.byte		N06   , Fs3 , v050
+	.byte		N06   , An3 , v050
+	.byte		N06   , Bn3 , v050
+	.byte	W30
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , Gs3 , v050
+	.byte	W12
+	.byte		N06   , Gs3 , v050
+	.byte	W06
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , An3 , v050
+	.byte	W18
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , An3 , v050
+	.byte	W06
+	.byte		N06   , Fs4 , v050
+	.byte	W06
+@ 023   ----------------------------------------
+	.byte		N06   , Dn3 , v050
+	.byte		N06   , Fs3 , v050
+	.byte		N06   , An3 , v050
+	.byte		N06   , Cs4 , v050
+	.byte	W24
+	.byte		N06   , Dn3 , v050
+	.byte		N06   , Fs3 , v050
+	.byte		N06   , An3 , v050
+	.byte		N06   , Bn3 , v050
+	.byte	W24
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , Gs3 , v050
+	.byte	W12
+	.byte		N06   , Gs3 , v050
+	.byte	W06
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , An3 , v050
+	.byte	W18
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , An3 , v050
+	.byte	W06
+	.byte		N06   , Fs4 , v050
+	.byte	W06
+@ 024   ----------------------------------------
+	.byte		N06   , Dn3 , v050
+	.byte		N06   , Fs3 , v050
+	.byte		N06   , An3 , v050
+	.byte		N06   , Cs4 , v050
+	.byte	W18
+	.byte		N06   , Dn3 , v050
+	.byte		N06   , Fs3 , v050
+	.byte		N06   , An3 , v050
+	.byte		N06   , Bn3 , v050
+	.byte	W18
+	.byte		N06   , Dn3 , v050
+	.byte		N06   , Fs3 , v050
+	.byte		N06   , An3 , v050
+	.byte	W12
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , Gs3 , v050
+	.byte	W12
+	.byte		N06   , Gs3 , v050
+	.byte	W06
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , An3 , v050
+	.byte	W18
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , An3 , v050
+	.byte	W06
+	.byte		N06   , Fs4 , v050
+	.byte	W06
+@ 025   ----------------------------------------
+	.byte		N06   , Dn3 , v050
+	.byte		N06   , Fs3 , v050
+	.byte		N06   , An3 , v050
+	.byte		N06   , Cs4 , v050
+	.byte	W24
+	.byte		N06   , Dn3 , v050
+	.byte		N06   , Fs3 , v050
+	.byte		N06   , An3 , v050
+	.byte		N06   , Bn3 , v050
+	.byte	W24
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , Gs3 , v050
+	.byte	W12
+	.byte		N06   , Gs3 , v050
+	.byte	W06
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , An3 , v050
+	.byte	W18
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , An3 , v050
+	.byte	W06
+	.byte		N06   , Fs4 , v050
+	.byte	W06
+@ 026   ----------------------------------------
+	.byte		N06   , Dn3 , v050
+	.byte		N06   , Fs3 , v050
+	.byte		N06   , An3 , v050
+	.byte		N06   , Cs4 , v050
+	.byte	W18
+	.byte		N06   , Dn3 , v050
+	.byte		N06   , Fs3 , v050
+	.byte		N06   , An3 , v050
+	.byte		N06   , Bn3 , v050
+	.byte	W30
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , Gs3 , v050
+	.byte	W12
+	.byte		N06   , Gs3 , v050
+	.byte	W06
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , An3 , v050
+	.byte	W18
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , An3 , v050
+	.byte	W06
+	.byte		N06   , Fs4 , v050
+	.byte	W06
+@ 027   ----------------------------------------
+	.byte		N06   , Dn3 , v050
+	.byte		N06   , Fs3 , v050
+	.byte		N06   , An3 , v050
+	.byte		N06   , Cs4 , v050
+	.byte	W24
+	.byte		N06   , Dn3 , v050
+	.byte		N06   , Fs3 , v050
+	.byte		N06   , An3 , v050
+	.byte		N06   , Bn3 , v050
+	.byte	W24
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , Gs3 , v050
+	.byte	W12
+	.byte		N06   , Gs3 , v050
+	.byte	W06
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , An3 , v050
+	.byte	W18
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , An3 , v050
+	.byte	W06
+	.byte		N06   , Fs4 , v050
+	.byte	W06
+@ 028   ----------------------------------------
+	.byte		N06   , Dn3 , v050
+	.byte		N06   , Fs3 , v050
+	.byte		N06   , An3 , v050
+	.byte		N06   , Cs4 , v050
+	.byte	W18
+	.byte		N06   , Dn3 , v050
+	.byte		N06   , Fs3 , v050
+	.byte		N06   , An3 , v050
+	.byte		N06   , Bn3 , v050
+	.byte	W18
+	.byte		N06   , Dn3 , v050
+	.byte		N06   , Fs3 , v050
+	.byte		N06   , An3 , v050
+	.byte	W12
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , Gs3 , v050
+	.byte	W12
+	.byte		N06   , Gs3 , v050
+	.byte	W06
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , An3 , v050
+	.byte	W18
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , An3 , v050
+	.byte	W06
+	.byte		N06   , Fs4 , v050
+	.byte	W06
+@ 029   ----------------------------------------
+	.byte		N06   , Dn3 , v050
+	.byte		N06   , Fs3 , v050
+	.byte		N06   , An3 , v050
+	.byte		N06   , Cs4 , v050
+	.byte	W24
+	.byte		N06   , Dn3 , v050
+	.byte		N06   , Fs3 , v050
+	.byte		N06   , An3 , v050
+	.byte		N06   , Bn3 , v050
+	.byte	W24
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , Gs3 , v050
+	.byte	W12
+	.byte		N06   , Gs3 , v050
+	.byte	W06
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , An3 , v050
+	.byte	W18
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , An3 , v050
+	.byte	W06
+	.byte		N06   , Fs4 , v050
+	.byte	W06
+@ 030   ----------------------------------------
+	.byte		N06   , Dn3 , v050
+	.byte		N06   , Fs3 , v050
+	.byte		N06   , An3 , v050
+	.byte		N06   , Cs4 , v050
+	.byte	W18
+	.byte		N06   , Dn3 , v050
+	.byte		N06   , Fs3 , v050
+	.byte		N06   , An3 , v050
+	.byte		N06   , Bn3 , v050
+	.byte	W30
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , Gs3 , v050
+	.byte	W12
+	.byte		N06   , Gs3 , v050
+	.byte	W06
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , An3 , v050
+	.byte	W18
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , An3 , v050
+	.byte	W06
+	.byte		N06   , Fs4 , v050
+	.byte	W06
+@ 031   ----------------------------------------
+	.byte		N06   , Dn3 , v050
+	.byte		N06   , Fs3 , v050
+	.byte		N06   , An3 , v050
+	.byte		N06   , Cs4 , v050
+	.byte	W24
+	.byte		N06   , Dn3 , v050
+	.byte		N06   , Fs3 , v050
+	.byte		N06   , An3 , v050
+	.byte		N06   , Bn3 , v050
+	.byte	W24
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , Gs3 , v050
+	.byte	W12
+	.byte		N06   , Gs3 , v050
+	.byte	W06
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , An3 , v050
+	.byte	W18
+	.byte		N06   , Cs3 , v050
+	.byte		N06   , En3 , v050
+	.byte		N06   , An3 , v050
+	.byte	W06
+	.byte		N06   , Fs4 , v050
+	.byte	W06
+@ 032   ----------------------------------------
+	.byte	FINE
+
+@**************** Track 2 (Midi-Chn.2) ****************@
+
+mus_assumption_2:
+	.byte	KEYSH , mus_assumption_key+0
+@ 000   ----------------------------------------
+	.byte		VOICE , 2
+	.byte		VOL   , 127*mus_assumption_mvl/mxv
+	.byte		N06   , Bn0 , v081
+	.byte	W18
+	.byte		N06   , Bn0 , v081
+	.byte	W18
+	.byte		N06   , Bn0 , v081
+	.byte	W12
+	.byte		N10   , Cs1 , v081
+	.byte	W12
+	.byte		N06   , Cs1 , v081
+	.byte	W36
+@ 001   ----------------------------------------
+	.byte		N12   , Ds0 , v081
+	.byte	W24
+	.byte		N12   , Ds0 , v081
+	.byte	W18
+	.byte		N06   , Fs0 , v081
+	.byte	W06
+	.byte		N06   , Fs0 , v081
+	.byte	W12
+	.byte		N06   , Fs0 , v081
+	.byte	W06
+	.byte		N06   , Fs0 , v081
+	.byte	W12
+	.byte		N06   , Fs1 , v081
+	.byte	W06
+	.byte		N06   , Cs1 , v081
+	.byte	W12
+@ 002   ----------------------------------------
+	.byte		N06   , Bn0 , v081
+	.byte	W18
+	.byte		N06   , Bn0 , v081
+	.byte	W18
+	.byte		N06   , Bn0 , v081
+	.byte	W06
+	.byte		N06   , Cn1 , v081
+	.byte	W06
+	.byte		N10   , Cs1 , v081
+	.byte	W12
+	.byte		N06   , Cs1 , v081
+	.byte	W36
+@ 003   ----------------------------------------
+	.byte		N12   , Ds0 , v081
+	.byte	W24
+	.byte		N12   , Ds0 , v081
+	.byte	W18
+	.byte		N06   , Fs0 , v081
+	.byte	W06
+	.byte		N06   , Fs0 , v081
+	.byte	W12
+	.byte		N06   , Fs0 , v081
+	.byte	W06
+	.byte		N06   , Fs0 , v081
+	.byte	W12
+	.byte		N06   , Fs1 , v081
+	.byte	W06
+	.byte		N06   , Cs1 , v081
+	.byte	W12
+@ 004   ----------------------------------------
+	.byte		N06   , Bn0 , v081
+	.byte	W18
+	.byte		N06   , Bn0 , v081
+	.byte	W18
+	.byte		N06   , Bn0 , v081
+	.byte	W12
+	.byte		N10   , Cs1 , v081
+	.byte	W12
+	.byte		N06   , Cs1 , v081
+	.byte	W36
+@ 005   ----------------------------------------
+	.byte		N12   , Ds0 , v081
+	.byte	W24
+	.byte		N12   , Ds0 , v081
+	.byte	W18
+	.byte		N06   , Fs0 , v081
+	.byte	W06
+	.byte		N06   , Fs0 , v081
+	.byte	W12
+	.byte		N06   , Fs0 , v081
+	.byte	W06
+	.byte		N06   , Fs0 , v081
+	.byte	W12
+	.byte		N06   , Fs1 , v081
+	.byte	W06
+	.byte		N06   , Cs1 , v081
+	.byte	W12
+@ 006   ----------------------------------------
+	.byte		N06   , Bn0 , v081
+	.byte	W18
+	.byte		N06   , Bn0 , v081
+	.byte	W18
+	.byte		N06   , Bn0 , v081
+	.byte	W06
+	.byte		N06   , Cn1 , v081
+	.byte	W06
+	.byte		N10   , Cs1 , v081
+	.byte	W12
+	.byte		N06   , Cs1 , v081
+	.byte	W36
+@ 007   ----------------------------------------
+	.byte		N12   , Ds0 , v081
+	.byte	W24
+	.byte		N12   , Ds0 , v081
+	.byte	W18
+	.byte		N06   , Fs0 , v081
+	.byte	W06
+	.byte		N06   , Fs0 , v081
+	.byte	W12
+	.byte		N06   , Fs0 , v081
+	.byte	W06
+	.byte		N06   , Fs0 , v081
+	.byte	W12
+	.byte		N06   , Fs1 , v081
+	.byte	W06
+	.byte		N06   , Cs1 , v081
+	.byte	W12
+@ 008   ----------------------------------------
+	.byte		N06   , Bn0 , v081
+	.byte	W18
+	.byte		N06   , Bn0 , v081
+	.byte	W18
+	.byte		N06   , Bn0 , v081
+	.byte	W12
+	.byte		N10   , Cs1 , v081
+	.byte	W12
+	.byte		N06   , Cs1 , v081
+	.byte	W36
+@ 009   ----------------------------------------
+	.byte		N12   , Ds0 , v081
+	.byte	W24
+	.byte		N12   , Ds0 , v081
+	.byte	W18
+	.byte		N06   , Fs0 , v081
+	.byte	W06
+	.byte		N06   , Fs0 , v081
+	.byte	W12
+	.byte		N06   , Fs0 , v081
+	.byte	W06
+	.byte		N06   , Fs0 , v081
+	.byte	W12
+	.byte		N06   , Fs1 , v081
+	.byte	W06
+	.byte		N06   , Cs1 , v081
+	.byte	W12
+@ 010   ----------------------------------------
+	.byte		N06   , Bn0 , v081
+	.byte	W18
+	.byte		N06   , Bn0 , v081
+	.byte	W18
+	.byte		N06   , Bn0 , v081
+	.byte	W06
+	.byte		N06   , Cn1 , v081
+	.byte	W06
+	.byte		N10   , Cs1 , v081
+	.byte	W12
+	.byte		N06   , Cs1 , v081
+	.byte	W36
+@ 011   ----------------------------------------
+	.byte		N12   , Ds0 , v081
+	.byte	W24
+	.byte		N12   , Ds0 , v081
+	.byte	W18
+	.byte		N06   , Fs0 , v081
+	.byte	W06
+	.byte		N06   , Fs0 , v081
+	.byte	W12
+	.byte		N06   , Fs0 , v081
+	.byte	W06
+	.byte		N06   , Fs0 , v081
+	.byte	W12
+	.byte		N06   , Fs1 , v081
+	.byte	W06
+	.byte		N06   , Cs1 , v081
+	.byte	W12
+@ 012   ----------------------------------------
+	.byte		N06   , Bn0 , v081
+	.byte	W18
+	.byte		N06   , Bn0 , v081
+	.byte	W18
+	.byte		N06   , Bn0 , v081
+	.byte	W12
+	.byte		N10   , Cs1 , v081
+	.byte	W12
+	.byte		N06   , Cs1 , v081
+	.byte	W36
+@ 013   ----------------------------------------
+	.byte		N12   , Ds0 , v081
+	.byte	W24
+	.byte		N12   , Ds0 , v081
+	.byte	W18
+	.byte		N06   , Fs0 , v081
+	.byte	W06
+	.byte		N06   , Fs0 , v081
+	.byte	W12
+	.byte		N06   , Fs0 , v081
+	.byte	W06
+	.byte		N06   , Fs0 , v081
+	.byte	W12
+	.byte		N06   , Fs1 , v081
+	.byte	W06
+	.byte		N06   , Cs1 , v081
+	.byte	W12
+@ 014   ----------------------------------------
+	.byte		N06   , Bn0 , v081
+	.byte	W18
+	.byte		N06   , Bn0 , v081
+	.byte	W18
+	.byte		N06   , Bn0 , v081
+	.byte	W06
+	.byte		N06   , Cn1 , v081
+	.byte	W06
+	.byte		N10   , Cs1 , v081
+	.byte	W12
+	.byte		N06   , Cs1 , v081
+	.byte	W36
+@ 015   ----------------------------------------
+	.byte		N12   , Ds0 , v081
+	.byte	W24
+	.byte		N12   , Ds0 , v081
+	.byte	W18
+	.byte		N06   , Fs0 , v081
+	.byte	W06
+	.byte		N06   , Fs0 , v081
+	.byte	W12
+	.byte		N06   , Fs0 , v081
+	.byte	W06
+	.byte		N06   , Fs0 , v081
+	.byte	W12
+	.byte		N06   , Fs1 , v081
+	.byte	W06
+	.byte		N06   , Cs1 , v081
+	.byte	W12
+@ 016   ----------------------------------------
+	.byte		N06   , Bn0 , v081
+	.byte	W18
+	.byte		N06   , Bn0 , v081
+	.byte	W18
+	.byte		N06   , Bn0 , v081
+	.byte	W12
+	.byte		N10   , Cs1 , v081
+	.byte	W12
+	.byte		N06   , Cs1 , v081
+	.byte	W36
+@ 017   ----------------------------------------
+	.byte		N12   , Ds0 , v081
+	.byte	W24
+	.byte		N12   , Ds0 , v081
+	.byte	W18
+	.byte		N06   , Fs0 , v081
+	.byte	W06
+	.byte		N06   , Fs0 , v081
+	.byte	W12
+	.byte		N06   , Fs0 , v081
+	.byte	W06
+	.byte		N06   , Fs0 , v081
+	.byte	W12
+	.byte		N06   , Fs1 , v081
+	.byte	W06
+	.byte		N06   , Cs1 , v081
+	.byte	W12
+@ 018   ----------------------------------------
+	.byte		N06   , Bn0 , v081
+	.byte	W18
+	.byte		N06   , Bn0 , v081
+	.byte	W18
+	.byte		N06   , Bn0 , v081
+	.byte	W06
+	.byte		N06   , Cn1 , v081
+	.byte	W06
+	.byte		N10   , Cs1 , v081
+	.byte	W12
+	.byte		N06   , Cs1 , v081
+	.byte	W36
+@ 019   ----------------------------------------
+	.byte		N12   , Ds0 , v081
+	.byte	W24
+	.byte		N12   , Ds0 , v081
+	.byte	W18
+	.byte		N06   , Fs0 , v081
+	.byte	W06
+	.byte		N06   , Fs0 , v081
+	.byte	W12
+	.byte		N06   , Fs0 , v081
+	.byte	W06
+	.byte		N06   , Fs0 , v081
+	.byte	W12
+	.byte		N06   , Fs1 , v081
+	.byte	W06
+	.byte		N06   , Cs1 , v081
+	.byte	W12
+@ 020   ----------------------------------------
+	.byte		N06   , Bn0 , v081
+	.byte	W18
+	.byte		N06   , Bn0 , v081
+	.byte	W18
+	.byte		N06   , Bn0 , v081
+	.byte	W12
+	.byte		N10   , Cs1 , v081
+	.byte	W12
+	.byte		N06   , Cs1 , v081
+	.byte	W36
+@ 021   ----------------------------------------
+	.byte		N12   , Ds0 , v081
+	.byte	W24
+	.byte		N12   , Ds0 , v081
+	.byte	W18
+	.byte		N06   , Fs0 , v081
+	.byte	W06
+	.byte		N06   , Fs0 , v081
+	.byte	W12
+	.byte		N06   , Fs0 , v081
+	.byte	W06
+	.byte		N06   , Fs0 , v081
+	.byte	W12
+	.byte		N06   , Fs1 , v081
+	.byte	W06
+	.byte		N06   , Cs1 , v081
+	.byte	W12
+@ 022   ----------------------------------------
+	.byte		N06   , Bn0 , v081
+	.byte	W18
+	.byte		N06   , Bn0 , v081
+	.byte	W18
+	.byte		N06   , Bn0 , v081
+	.byte	W06
+	.byte		N06   , Cn1 , v081
+	.byte	W06
+	.byte		N10   , Cs1 , v081
+	.byte	W12
+	.byte		N06   , Cs1 , v081
+	.byte	W36
+@ 023   ----------------------------------------
+	.byte		N12   , Ds0 , v081
+	.byte	W24
+	.byte		N12   , Ds0 , v081
+	.byte	W18
+	.byte		N06   , Fs0 , v081
+	.byte	W06
+	.byte		N06   , Fs0 , v081
+	.byte	W12
+	.byte		N06   , Fs0 , v081
+	.byte	W06
+	.byte		N06   , Fs0 , v081
+	.byte	W12
+	.byte		N06   , Fs1 , v081
+	.byte	W06
+	.byte		N06   , Cs1 , v081
+	.byte	W12
+@ 024   ----------------------------------------
+	.byte		N06   , Bn0 , v081
+	.byte	W18
+	.byte		N06   , Bn0 , v081
+	.byte	W18
+	.byte		N06   , Bn0 , v081
+	.byte	W12
+	.byte		N10   , Cs1 , v081
+	.byte	W12
+	.byte		N06   , Cs1 , v081
+	.byte	W36
+@ 025   ----------------------------------------
+	.byte		N12   , Ds0 , v081
+	.byte	W24
+	.byte		N12   , Ds0 , v081
+	.byte	W18
+	.byte		N06   , Fs0 , v081
+	.byte	W06
+	.byte		N06   , Fs0 , v081
+	.byte	W12
+	.byte		N06   , Fs0 , v081
+	.byte	W06
+	.byte		N06   , Fs0 , v081
+	.byte	W12
+	.byte		N06   , Fs1 , v081
+	.byte	W06
+	.byte		N06   , Cs1 , v081
+	.byte	W12
+@ 026   ----------------------------------------
+	.byte		N06   , Bn0 , v081
+	.byte	W18
+	.byte		N06   , Bn0 , v081
+	.byte	W18
+	.byte		N06   , Bn0 , v081
+	.byte	W06
+	.byte		N06   , Cn1 , v081
+	.byte	W06
+	.byte		N10   , Cs1 , v081
+	.byte	W12
+	.byte		N06   , Cs1 , v081
+	.byte	W36
+@ 027   ----------------------------------------
+	.byte		N12   , Ds0 , v081
+	.byte	W24
+	.byte		N12   , Ds0 , v081
+	.byte	W18
+	.byte		N06   , Fs0 , v081
+	.byte	W06
+	.byte		N06   , Fs0 , v081
+	.byte	W12
+	.byte		N06   , Fs0 , v081
+	.byte	W06
+	.byte		N06   , Fs0 , v081
+	.byte	W12
+	.byte		N06   , Fs1 , v081
+	.byte	W06
+	.byte		N06   , Cs1 , v081
+	.byte	W12
+@ 028   ----------------------------------------
+	.byte		N06   , Bn0 , v081
+	.byte	W18
+	.byte		N06   , Bn0 , v081
+	.byte	W18
+	.byte		N06   , Bn0 , v081
+	.byte	W12
+	.byte		N10   , Cs1 , v081
+	.byte	W12
+	.byte		N06   , Cs1 , v081
+	.byte	W36
+@ 029   ----------------------------------------
+	.byte		N12   , Ds0 , v081
+	.byte	W24
+	.byte		N12   , Ds0 , v081
+	.byte	W18
+	.byte		N06   , Fs0 , v081
+	.byte	W06
+	.byte		N06   , Fs0 , v081
+	.byte	W12
+	.byte		N06   , Fs0 , v081
+	.byte	W06
+	.byte		N06   , Fs0 , v081
+	.byte	W12
+	.byte		N06   , Fs1 , v081
+	.byte	W06
+	.byte		N06   , Cs1 , v081
+	.byte	W12
+@ 030   ----------------------------------------
+	.byte		N06   , Bn0 , v081
+	.byte	W18
+	.byte		N06   , Bn0 , v081
+	.byte	W18
+	.byte		N06   , Bn0 , v081
+	.byte	W06
+	.byte		N06   , Cn1 , v081
+	.byte	W06
+	.byte		N10   , Cs1 , v081
+	.byte	W12
+	.byte		N06   , Cs1 , v081
+	.byte	W36
+@ 031   ----------------------------------------
+	.byte		N12   , Ds0 , v081
+	.byte	W24
+	.byte		N12   , Ds0 , v081
+	.byte	W18
+	.byte		N06   , Fs0 , v081
+	.byte	W06
+	.byte		N06   , Fs0 , v081
+	.byte	W12
+	.byte		N06   , Fs0 , v081
+	.byte	W06
+	.byte		N06   , Fs0 , v081
+	.byte	W12
+	.byte		N06   , Fs1 , v081
+	.byte	W06
+	.byte		N06   , Cs1 , v081
+	.byte	W06
+	.byte	FINE
+
+@**************** Track 3 (Midi-Chn.3) ****************@
+
+mus_assumption_3:
+	.byte	KEYSH , mus_assumption_key+0
+@ 000   ----------------------------------------
+	.byte		VOICE , 3
+	.byte		VOL   , 127*mus_assumption_mvl/mxv
+	.byte	W96
+@ 001   ----------------------------------------
+	.byte	W96
+@ 002   ----------------------------------------
+	.byte	W96
+@ 003   ----------------------------------------
+	.byte	W96
+@ 004   ----------------------------------------
+	.byte	W96
+@ 005   ----------------------------------------
+	.byte	W96
+@ 006   ----------------------------------------
+	.byte	W96
+@ 007   ----------------------------------------
+	.byte	W72
+	.byte		N06   , Gs4 , v073
+	.byte	W06
+	.byte		N18   , An4 , v073
+	.byte	W18
+@ 008   ----------------------------------------
+	.byte		N12   , Cs5 , v073
+	.byte	W18
+	.byte		N18   , Bn4 , v073
+	.byte	W18
+	.byte		N12   , An4 , v073
+	.byte	W12
+	.byte		N18   , Bn4 , v073
+	.byte	W48
+@ 009   ----------------------------------------
+	.byte	W12
+	.byte		N12   , En4 , v073
+	.byte	W12
+	.byte		N12   , En4 , v073
+	.byte	W12
+	.byte		N12   , Fs4 , v073
+	.byte	W12
+	.byte		N24   , Gs4 , v073
+	.byte	W24
+	.byte		N12   , An4 , v073
+	.byte	W12
+	.byte		N36   , En4 , v073
+	.byte	W12
+@ 010   ----------------------------------------
+	.byte	W96
+@ 011   ----------------------------------------
+	.byte	W60
+	.byte		N12   , En4 , v073
+	.byte	W12
+	.byte		N12   , En4 , v073
+	.byte	W12
+	.byte		N12   , Fs4 , v073
+	.byte	W12
+@ 012   ----------------------------------------
+	.byte		N12   , Cs5 , v073
+	.byte	W12
+	.byte		N12   , Bn4 , v073
+	.byte	W12
+	.byte		N12   , Bn4 , v073
+	.byte	W12
+	.byte		N12   , An4 , v073
+	.byte	W12
+	.byte		N18   , Bn4 , v073
+	.byte	W24
+	.byte		N12   , En4 , v073
+	.byte	W24
+@ 013   ----------------------------------------
+	.byte	W24
+	.byte		N12   , En4 , v073
+	.byte	W12
+	.byte		N12   , Fs4 , v073
+	.byte	W12
+	.byte		N24   , Gs4 , v073
+	.byte	W24
+	.byte		N12   , An4 , v073
+	.byte	W12
+	.byte		N36   , En4 , v073
+	.byte	W12
+@ 014   ----------------------------------------
+	.byte	W96
+@ 015   ----------------------------------------
+	.byte	W72
+	.byte		N06   , Gs4 , v073
+	.byte	W06
+	.byte		N18   , An4 , v073
+	.byte	W18
+@ 016   ----------------------------------------
+	.byte		N12   , Cs5 , v073
+	.byte	W18
+	.byte		N18   , Bn4 , v073
+	.byte	W18
+	.byte		N12   , An4 , v073
+	.byte	W12
+	.byte		N18   , Bn4 , v073
+	.byte	W48
+@ 017   ----------------------------------------
+	.byte	W12
+	.byte		N12   , En4 , v073
+	.byte	W12
+	.byte		N12   , En4 , v073
+	.byte	W12
+	.byte		N12   , Fs4 , v073
+	.byte	W12
+	.byte		N24   , Gs4 , v073
+	.byte	W24
+	.byte		N12   , An4 , v073
+	.byte	W12
+	.byte		N36   , En4 , v073
+	.byte	W12
+@ 018   ----------------------------------------
+	.byte	W36
+	.byte		N06   , Cs4 , v073
+	.byte	W06
+	.byte		N06   , Dn4 , v073
+	.byte	W06
+	.byte		N48   , Cs4 , v073
+	.byte	W48
+@ 019   ----------------------------------------
+	.byte	W60
+	.byte		N12   , En4 , v073
+	.byte	W12
+	.byte		N12   , En4 , v073
+	.byte	W12
+	.byte		N12   , Fs4 , v073
+	.byte	W12
+@ 020   ----------------------------------------
+	.byte		N12   , Cs5 , v073
+	.byte	W12
+	.byte		N12   , Bn4 , v073
+	.byte	W12
+	.byte		N12   , Bn4 , v073
+	.byte	W12
+	.byte		N12   , An4 , v073
+	.byte	W12
+	.byte		N18   , Bn4 , v073
+	.byte	W24
+	.byte		N12   , En4 , v073
+	.byte	W24
+@ 021   ----------------------------------------
+	.byte	W24
+	.byte		N12   , En4 , v073
+	.byte	W12
+	.byte		N12   , Fs4 , v073
+	.byte	W12
+	.byte		N24   , Gs4 , v073
+	.byte	W24
+	.byte		N12   , An4 , v073
+	.byte	W12
+	.byte		N36   , En4 , v073
+	.byte	W12
+@ 022   ----------------------------------------
+	.byte	W24
+	.byte	FINE
+
+@**************** Track 4 (Midi-Chn.4) ****************@
+
+mus_assumption_4:
+	.byte	KEYSH , mus_assumption_key+0
+@ 000   ----------------------------------------
+	.byte		VOICE , 4
+	.byte		VOL   , 127*mus_assumption_mvl/mxv
+	.byte	W96
+@ 001   ----------------------------------------
+	.byte	W96
+@ 002   ----------------------------------------
+	.byte	W96
+@ 003   ----------------------------------------
+	.byte	W96
+@ 004   ----------------------------------------
+	.byte	W96
+@ 005   ----------------------------------------
+	.byte	W96
+@ 006   ----------------------------------------
+	.byte	W96
+@ 007   ----------------------------------------
+	.byte	W96
+@ 008   ----------------------------------------
+	.byte	W96
+@ 009   ----------------------------------------
+	.byte	W96
+@ 010   ----------------------------------------
+	.byte	W96
+@ 011   ----------------------------------------
+	.byte	W96
+@ 012   ----------------------------------------
+	.byte	W96
+@ 013   ----------------------------------------
+	.byte	W96
+@ 014   ----------------------------------------
+	.byte	W96
+@ 015   ----------------------------------------
+	.byte	W96
+@ 016   ----------------------------------------
+	.byte	W96
+@ 017   ----------------------------------------
+	.byte	W96
+@ 018   ----------------------------------------
+	.byte	W96
+@ 019   ----------------------------------------
+	.byte	W96
+@ 020   ----------------------------------------
+	.byte	W24
+	.byte		N06   , En5 , v023
+	.byte	W24
+	.byte		N06   , Cs5 , v023
+	.byte	W36
+	.byte		N06   , An4 , v023
+	.byte	W12
+@ 021   ----------------------------------------
+	.byte	W24
+	.byte		N06   , Bn4 , v023
+	.byte	W36
+	.byte		N06   , Fs4 , v023
+	.byte	W36
+@ 022   ----------------------------------------
+	.byte		N06   , En4 , v023
+	.byte	W36
+	.byte		N06   , Cs4 , v023
+	.byte	W36
+	.byte		N06   , Bn3 , v023
+	.byte	W24
+@ 023   ----------------------------------------
+	.byte	W12
+	.byte		N06   , An3 , v023
+	.byte	W48
+	.byte		N06   , En3 , v023
+	.byte	W12
+	.byte		N06   , Fs3 , v023
+	.byte	W24
+@ 024   ----------------------------------------
+	.byte	W12
+	.byte		N06   , Cs3 , v023
+	.byte	W12
+	.byte		N06   , En3 , v023
+	.byte	W36
+	.byte		N06   , Bn2 , v023
+	.byte	W12
+	.byte		N06   , Cs3 , v023
+	.byte	W06
+	.byte	FINE
+
+@**************** Track 5 (Midi-Chn.5) ****************@
+
+mus_assumption_5:
+	.byte	KEYSH , mus_assumption_key+0
+@ 000   ----------------------------------------
+	.byte		VOICE , 5
+	.byte		VOL   , 127*mus_assumption_mvl/mxv
+	.byte	W12
+	.byte		N12   , Fs3 , v016
+	.byte	W12
+	.byte		N12   , An3 , v016
+	.byte	W12
+	.byte		N12   , Fs3 , v016
+	.byte	W24
+	.byte		N12   , En3 , v016
+	.byte	W12
+	.byte		N12   , Gs3 , v016
+	.byte	W12
+	.byte		N12   , En3 , v016
+	.byte	W12
+@ 001   ----------------------------------------
+	.byte	W12
+	.byte		N12   , Cs3 , v016
+	.byte	W12
+	.byte		N12   , En3 , v016
+	.byte	W12
+	.byte		N12   , Cs3 , v016
+	.byte	W24
+	.byte		N12   , An2 , v016
+	.byte	W12
+	.byte		N12   , Cs3 , v016
+	.byte	W12
+	.byte		N12   , An2 , v016
+	.byte	W12
+@ 002   ----------------------------------------
+	.byte	W12
+	.byte		N12   , En3 , v016
+	.byte	W12
+	.byte		N12   , Gs3 , v016
+	.byte	W12
+	.byte		N12   , En3 , v016
+	.byte	W24
+	.byte		N12   , Cs3 , v016
+	.byte	W12
+	.byte		N12   , En3 , v016
+	.byte	W12
+	.byte		N12   , Cs3 , v016
+	.byte	W12
+@ 003   ----------------------------------------
+	.byte	W12
+	.byte		N12   , An2 , v016
+	.byte	W12
+	.byte		N12   , Cs3 , v016
+	.byte	W12
+	.byte		N12   , An2 , v016
+	.byte	W24
+	.byte		N12   , Gs2 , v016
+	.byte	W12
+	.byte		N12   , Bn2 , v016
+	.byte	W12
+	.byte		N12   , Gs2 , v016
+	.byte	W12
+@ 004   ----------------------------------------
+	.byte	W12
+	.byte		N12   , Fs3 , v016
+	.byte	W12
+	.byte		N12   , An3 , v016
+	.byte	W12
+	.byte		N12   , Fs3 , v016
+	.byte	W24
+	.byte		N12   , En3 , v016
+	.byte	W12
+	.byte		N12   , Gs3 , v016
+	.byte	W12
+	.byte		N12   , En3 , v016
+	.byte	W12
+@ 005   ----------------------------------------
+	.byte	W12
+	.byte		N12   , Cs3 , v016
+	.byte	W12
+	.byte		N12   , En3 , v016
+	.byte	W12
+	.byte		N12   , Cs3 , v016
+	.byte	W24
+	.byte		N12   , An2 , v016
+	.byte	W12
+	.byte		N12   , Cs3 , v016
+	.byte	W12
+	.byte		N12   , An2 , v016
+	.byte	W12
+@ 006   ----------------------------------------
+	.byte	W12
+	.byte		N12   , En3 , v016
+	.byte	W12
+	.byte		N12   , Gs3 , v016
+	.byte	W12
+	.byte		N12   , En3 , v016
+	.byte	W24
+	.byte		N12   , Cs3 , v016
+	.byte	W12
+	.byte		N12   , En3 , v016
+	.byte	W12
+	.byte		N12   , Cs3 , v016
+	.byte	W12
+@ 007   ----------------------------------------
+	.byte	W12
+	.byte		N12   , An2 , v016
+	.byte	W12
+	.byte		N12   , Cs3 , v016
+	.byte	W12
+	.byte		N12   , An2 , v016
+	.byte	W24
+	.byte		N12   , Gs2 , v016
+	.byte	W12
+	.byte		N12   , Bn2 , v016
+	.byte	W12
+	.byte		N12   , Gs2 , v016
+	.byte	W12
+@ 008   ----------------------------------------
+	.byte	W12
+	.byte		N12   , Fs3 , v016
+	.byte	W12
+	.byte		N12   , An3 , v016
+	.byte	W12
+	.byte		N12   , Fs3 , v016
+	.byte	W24
+	.byte		N12   , En3 , v016
+	.byte	W12
+	.byte		N12   , Gs3 , v016
+	.byte	W12
+	.byte		N12   , En3 , v016
+	.byte	W12
+@ 009   ----------------------------------------
+	.byte	W12
+	.byte		N12   , Cs3 , v016
+	.byte	W12
+	.byte		N12   , En3 , v016
+	.byte	W12
+	.byte		N12   , Cs3 , v016
+	.byte	W24
+	.byte		N12   , An2 , v016
+	.byte	W12
+	.byte		N12   , Cs3 , v016
+	.byte	W12
+	.byte		N12   , An2 , v016
+	.byte	W12
+@ 010   ----------------------------------------
+	.byte	W12
+	.byte		N12   , En3 , v016
+	.byte	W12
+	.byte		N12   , Gs3 , v016
+	.byte	W12
+	.byte		N12   , En3 , v016
+	.byte	W24
+	.byte		N12   , Cs3 , v016
+	.byte	W12
+	.byte		N12   , En3 , v016
+	.byte	W12
+	.byte		N12   , Cs3 , v016
+	.byte	W12
+@ 011   ----------------------------------------
+	.byte	W12
+	.byte		N12   , An2 , v016
+	.byte	W12
+	.byte		N12   , Cs3 , v016
+	.byte	W12
+	.byte		N12   , An2 , v016
+	.byte	W24
+	.byte		N12   , Gs2 , v016
+	.byte	W12
+	.byte		N12   , Bn2 , v016
+	.byte	W12
+	.byte		N12   , Gs2 , v016
+	.byte	W12
+@ 012   ----------------------------------------
+	.byte	W12
+	.byte		N12   , Fs3 , v016
+	.byte	W12
+	.byte		N12   , An3 , v016
+	.byte	W12
+	.byte		N12   , Fs3 , v016
+	.byte	W24
+	.byte		N12   , En3 , v016
+	.byte	W12
+	.byte		N12   , Gs3 , v016
+	.byte	W12
+	.byte		N12   , En3 , v016
+	.byte	W12
+@ 013   ----------------------------------------
+	.byte	W12
+	.byte		N12   , Cs3 , v016
+	.byte	W12
+	.byte		N12   , En3 , v016
+	.byte	W12
+	.byte		N12   , Cs3 , v016
+	.byte	W24
+	.byte		N12   , An2 , v016
+	.byte	W12
+	.byte		N12   , Cs3 , v016
+	.byte	W12
+	.byte		N12   , An2 , v016
+	.byte	W12
+@ 014   ----------------------------------------
+	.byte	W12
+	.byte		N12   , En3 , v016
+	.byte	W12
+	.byte		N12   , Gs3 , v016
+	.byte	W12
+	.byte		N12   , En3 , v016
+	.byte	W24
+	.byte		N12   , Cs3 , v016
+	.byte	W12
+	.byte		N12   , En3 , v016
+	.byte	W12
+	.byte		N12   , Cs3 , v016
+	.byte	W12
+@ 015   ----------------------------------------
+	.byte	W12
+	.byte		N12   , An2 , v016
+	.byte	W12
+	.byte		N12   , Cs3 , v016
+	.byte	W12
+	.byte		N12   , An2 , v016
+	.byte	W24
+	.byte		N12   , Gs2 , v016
+	.byte	W12
+	.byte		N12   , Bn2 , v016
+	.byte	W12
+	.byte		N12   , Gs2 , v016
+	.byte	W12
+@ 016   ----------------------------------------
+	.byte	W12
+	.byte		N12   , Fs3 , v016
+	.byte	W12
+	.byte		N12   , An3 , v016
+	.byte	W12
+	.byte		N12   , Fs3 , v016
+	.byte	W24
+	.byte		N12   , En3 , v016
+	.byte	W12
+	.byte		N12   , Gs3 , v016
+	.byte	W12
+	.byte		N12   , En3 , v016
+	.byte	W12
+@ 017   ----------------------------------------
+	.byte	W12
+	.byte		N12   , Cs3 , v016
+	.byte	W12
+	.byte		N12   , En3 , v016
+	.byte	W12
+	.byte		N12   , Cs3 , v016
+	.byte	W24
+	.byte		N12   , An2 , v016
+	.byte	W12
+	.byte		N12   , Cs3 , v016
+	.byte	W12
+	.byte		N12   , An2 , v016
+	.byte	W12
+@ 018   ----------------------------------------
+	.byte	W12
+	.byte		N12   , En3 , v016
+	.byte	W12
+	.byte		N12   , Gs3 , v016
+	.byte	W12
+	.byte		N12   , En3 , v016
+	.byte	W24
+	.byte		N12   , Cs3 , v016
+	.byte	W12
+	.byte		N12   , En3 , v016
+	.byte	W12
+	.byte		N12   , Cs3 , v016
+	.byte	W12
+@ 019   ----------------------------------------
+	.byte	W12
+	.byte		N12   , An2 , v016
+	.byte	W12
+	.byte		N12   , Cs3 , v016
+	.byte	W12
+	.byte		N12   , An2 , v016
+	.byte	W24
+	.byte		N12   , Gs2 , v016
+	.byte	W12
+	.byte		N12   , Bn2 , v016
+	.byte	W12
+	.byte		N12   , Gs2 , v016
+	.byte	W12
+@ 020   ----------------------------------------
+	.byte	W12
+	.byte		N12   , Fs3 , v016
+	.byte	W12
+	.byte		N12   , An3 , v016
+	.byte	W12
+	.byte		N12   , Fs3 , v016
+	.byte	W24
+	.byte		N12   , En3 , v016
+	.byte	W12
+	.byte		N12   , Gs3 , v016
+	.byte	W12
+	.byte		N12   , En3 , v016
+	.byte	W12
+@ 021   ----------------------------------------
+	.byte	W12
+	.byte		N12   , Cs3 , v016
+	.byte	W12
+	.byte		N12   , En3 , v016
+	.byte	W12
+	.byte		N12   , Cs3 , v016
+	.byte	W24
+	.byte		N12   , An2 , v016
+	.byte	W12
+	.byte		N12   , Cs3 , v016
+	.byte	W12
+	.byte		N12   , An2 , v016
+	.byte	W12
+@ 022   ----------------------------------------
+	.byte	W12
+	.byte		N12   , En3 , v016
+	.byte	W12
+	.byte		N12   , Gs3 , v016
+	.byte	W12
+	.byte		N12   , En3 , v016
+	.byte	W24
+	.byte		N12   , Cs3 , v016
+	.byte	W12
+	.byte		N12   , En3 , v016
+	.byte	W12
+	.byte		N12   , Cs3 , v016
+	.byte	W12
+@ 023   ----------------------------------------
+	.byte	W12
+	.byte		N12   , An2 , v016
+	.byte	W12
+	.byte		N12   , Cs3 , v016
+	.byte	W12
+	.byte		N12   , An2 , v016
+	.byte	W24
+	.byte		N12   , Gs2 , v016
+	.byte	W12
+	.byte		N12   , Bn2 , v016
+	.byte	W12
+	.byte		N12   , Gs2 , v016
+	.byte	W12
+@ 024   ----------------------------------------
+	.byte	W12
+	.byte		N12   , Fs3 , v016
+	.byte	W12
+	.byte		N12   , An3 , v016
+	.byte	W12
+	.byte		N12   , Fs3 , v016
+	.byte	W24
+	.byte		N12   , En3 , v016
+	.byte	W12
+	.byte		N12   , Gs3 , v016
+	.byte	W12
+	.byte		N12   , En3 , v016
+	.byte	W12
+@ 025   ----------------------------------------
+	.byte	W12
+	.byte		N12   , Cs3 , v016
+	.byte	W12
+	.byte		N12   , En3 , v016
+	.byte	W12
+	.byte		N12   , Cs3 , v016
+	.byte	W24
+	.byte		N12   , An2 , v016
+	.byte	W12
+	.byte		N12   , Cs3 , v016
+	.byte	W12
+	.byte		N12   , An2 , v016
+	.byte	W12
+@ 026   ----------------------------------------
+	.byte	W12
+	.byte		N12   , En3 , v016
+	.byte	W12
+	.byte		N12   , Gs3 , v016
+	.byte	W12
+	.byte		N12   , En3 , v016
+	.byte	W24
+	.byte		N12   , Cs3 , v016
+	.byte	W12
+	.byte		N12   , En3 , v016
+	.byte	W12
+	.byte		N12   , Cs3 , v016
+	.byte	W12
+@ 027   ----------------------------------------
+	.byte	W12
+	.byte		N12   , An2 , v016
+	.byte	W12
+	.byte		N12   , Cs3 , v016
+	.byte	W12
+	.byte		N12   , An2 , v016
+	.byte	W24
+	.byte		N12   , Gs2 , v016
+	.byte	W12
+	.byte		N12   , Bn2 , v016
+	.byte	W12
+	.byte		N12   , Gs2 , v016
+	.byte	W12
+@ 028   ----------------------------------------
+	.byte	W12
+	.byte		N12   , Fs3 , v016
+	.byte	W12
+	.byte		N12   , An3 , v016
+	.byte	W12
+	.byte		N12   , Fs3 , v016
+	.byte	W24
+	.byte		N12   , En3 , v016
+	.byte	W12
+	.byte		N12   , Gs3 , v016
+	.byte	W12
+	.byte		N12   , En3 , v016
+	.byte	W12
+@ 029   ----------------------------------------
+	.byte	W12
+	.byte		N12   , Cs3 , v016
+	.byte	W12
+	.byte		N12   , En3 , v016
+	.byte	W12
+	.byte		N12   , Cs3 , v016
+	.byte	W24
+	.byte		N12   , An2 , v016
+	.byte	W12
+	.byte		N12   , Cs3 , v016
+	.byte	W12
+	.byte		N12   , An2 , v016
+	.byte	W12
+@ 030   ----------------------------------------
+	.byte	W12
+	.byte		N12   , En3 , v016
+	.byte	W12
+	.byte		N12   , Gs3 , v016
+	.byte	W12
+	.byte		N12   , En3 , v016
+	.byte	W24
+	.byte		N12   , Cs3 , v016
+	.byte	W12
+	.byte		N12   , En3 , v016
+	.byte	W12
+	.byte		N12   , Cs3 , v016
+	.byte	W12
+@ 031   ----------------------------------------
+	.byte	W12
+	.byte		N12   , An2 , v016
+	.byte	W12
+	.byte		N12   , Cs3 , v016
+	.byte	W12
+	.byte		N12   , An2 , v016
+	.byte	W24
+	.byte		N12   , Gs2 , v016
+	.byte	W12
+	.byte		N12   , Bn2 , v016
+	.byte	W12
+	.byte		N12   , Gs2 , v016
+	.byte	W12
+@ 032   ----------------------------------------
+	.byte	FINE
+
+@**************** Track 6 (Midi-Chn.6) ****************@
+
+mus_assumption_6:
+	.byte	KEYSH , mus_assumption_key+0
+@ 000   ----------------------------------------
+	.byte		VOICE , 6
+	.byte		VOL   , 127*mus_assumption_mvl/mxv
+	.byte		N06   , Dn2 , v039
+	.byte		N06   , Fs2 , v039
+	.byte		N06   , An2 , v039
+	.byte		N06   , Cs3 , v039
+	.byte	W18
+	.byte		N06   , Dn2 , v039
+	.byte		N06   , Fs2 , v039
+	.byte		N06   , An2 , v039
+	.byte		N06   , Bn2 , v039
+	.byte	W18
+	.byte		N06   , Dn2 , v039
+	.byte		N06   , Fs2 , v039
+	.byte		N06   , An2 , v039
+	.byte	W12
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , Gs2 , v039
+	.byte	W12
+	.byte		N06   , Gs2 , v039
+	.byte	W06
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , An2 , v039
+	.byte	W18
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , An2 , v039
+	.byte	W06
+	.byte		N06   , Fs3 , v039
+	.byte	W06
+@ 001   ----------------------------------------
+	.byte		N06   , Dn2 , v039
+	.byte		N06   , Fs2 , v039
+	.byte		N06   , An2 , v039
+	.byte		N06   , Cs3 , v039
+	.byte	W24
+	.byte		N06   , Dn2 , v039
+	.byte		N06   , Fs2 , v039
+	.byte		N06   , An2 , v039
+	.byte		N06   , Bn2 , v039
+	.byte	W24
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , Gs2 , v039
+	.byte	W12
+	.byte		N06   , Gs2 , v039
+	.byte	W06
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , An2 , v039
+	.byte	W18
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , An2 , v039
+	.byte	W06
+	.byte		N06   , Fs3 , v039
+	.byte	W06
+@ 002   ----------------------------------------
+	.byte		N06   , Dn2 , v039
+	.byte		N06   , Fs2 , v039
+	.byte		N06   , An2 , v039
+	.byte		N06   , Cs3 , v039
+	.byte	W18
+	.byte		N06   , Dn2 , v039
+	.byte		N06   , Fs2 , v039
+	.byte		N06   , An2 , v039
+	.byte		N06   , Bn2 , v039
+	.byte	W30
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , Gs2 , v039
+	.byte	W12
+	.byte		N06   , Gs2 , v039
+	.byte	W06
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , An2 , v039
+	.byte	W18
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , An2 , v039
+	.byte	W06
+	.byte		N06   , Fs3 , v039
+	.byte	W06
+@ 003   ----------------------------------------
+	.byte		N06   , Dn2 , v039
+	.byte		N06   , Fs2 , v039
+	.byte		N06   , An2 , v039
+	.byte		N06   , Cs3 , v039
+	.byte	W24
+	.byte		N06   , Dn2 , v039
+	.byte		N06   , Fs2 , v039
+	.byte		N06   , An2 , v039
+	.byte		N06   , Bn2 , v039
+	.byte	W24
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , Gs2 , v039
+	.byte	W12
+	.byte		N06   , Gs2 , v039
+	.byte	W06
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , An2 , v039
+	.byte	W18
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , An2 , v039
+	.byte	W06
+	.byte		N06   , Fs3 , v039
+	.byte	W06
+@ 004   ----------------------------------------
+	.byte		N06   , Dn2 , v039
+	.byte		N06   , Fs2 , v039
+	.byte		N06   , An2 , v039
+	.byte		N06   , Cs3 , v039
+	.byte	W18
+	.byte		N06   , Dn2 , v039
+	.byte		N06   , Fs2 , v039
+	.byte		N06   , An2 , v039
+	.byte		N06   , Bn2 , v039
+	.byte	W18
+	.byte		N06   , Dn2 , v039
+	.byte		N06   , Fs2 , v039
+	.byte		N06   , An2 , v039
+	.byte	W12
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , Gs2 , v039
+	.byte	W12
+	.byte		N06   , Gs2 , v039
+	.byte	W06
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , An2 , v039
+	.byte	W18
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , An2 , v039
+	.byte	W06
+	.byte		N06   , Fs3 , v039
+	.byte	W06
+@ 005   ----------------------------------------
+	.byte		N06   , Dn2 , v039
+	.byte		N06   , Fs2 , v039
+	.byte		N06   , An2 , v039
+	.byte		N06   , Cs3 , v039
+	.byte	W24
+	.byte		N06   , Dn2 , v039
+	.byte		N06   , Fs2 , v039
+	.byte		N06   , An2 , v039
+	.byte		N06   , Bn2 , v039
+	.byte	W24
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , Gs2 , v039
+	.byte	W12
+	.byte		N06   , Gs2 , v039
+	.byte	W06
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , An2 , v039
+	.byte	W18
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , An2 , v039
+	.byte	W06
+	.byte		N06   , Fs3 , v039
+	.byte	W06
+@ 006   ----------------------------------------
+	.byte		N06   , Dn2 , v039
+	.byte		N06   , Fs2 , v039
+	.byte		N06   , An2 , v039
+	.byte		N06   , Cs3 , v039
+	.byte	W18
+	.byte		N06   , Dn2 , v039
+	.byte		N06   , Fs2 , v039
+	.byte		N06   , An2 , v039
+	.byte		N06   , Bn2 , v039
+	.byte	W30
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , Gs2 , v039
+	.byte	W12
+	.byte		N06   , Gs2 , v039
+	.byte	W06
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , An2 , v039
+	.byte	W18
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , An2 , v039
+	.byte	W06
+	.byte		N06   , Fs3 , v039
+	.byte	W06
+@ 007   ----------------------------------------
+	.byte		N06   , Dn2 , v039
+	.byte		N06   , Fs2 , v039
+	.byte		N06   , An2 , v039
+	.byte		N06   , Cs3 , v039
+	.byte	W24
+	.byte		N06   , Dn2 , v039
+	.byte		N06   , Fs2 , v039
+	.byte		N06   , An2 , v039
+	.byte		N06   , Bn2 , v039
+	.byte	W24
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , Gs2 , v039
+	.byte	W12
+	.byte		N06   , Gs2 , v039
+	.byte	W06
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , An2 , v039
+	.byte	W18
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , An2 , v039
+	.byte	W06
+	.byte		N06   , Fs3 , v039
+	.byte	W06
+@ 008   ----------------------------------------
+	.byte		N06   , Dn2 , v039
+	.byte		N06   , Fs2 , v039
+	.byte		N06   , An2 , v039
+	.byte		N06   , Cs3 , v039
+	.byte	W18
+	.byte		N06   , Dn2 , v039
+	.byte		N06   , Fs2 , v039
+	.byte		N06   , An2 , v039
+	.byte		N06   , Bn2 , v039
+	.byte	W18
+	.byte		N06   , Dn2 , v039
+	.byte		N06   , Fs2 , v039
+	.byte		N06   , An2 , v039
+	.byte	W12
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , Gs2 , v039
+	.byte	W12
+	.byte		N06   , Gs2 , v039
+	.byte	W06
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , An2 , v039
+	.byte	W18
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , An2 , v039
+	.byte	W06
+	.byte		N06   , Fs3 , v039
+	.byte	W06
+@ 009   ----------------------------------------
+	.byte		N06   , Dn2 , v039
+	.byte		N06   , Fs2 , v039
+	.byte		N06   , An2 , v039
+	.byte		N06   , Cs3 , v039
+	.byte	W24
+	.byte		N06   , Dn2 , v039
+	.byte		N06   , Fs2 , v039
+	.byte		N06   , An2 , v039
+	.byte		N06   , Bn2 , v039
+	.byte	W24
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , Gs2 , v039
+	.byte	W12
+	.byte		N06   , Gs2 , v039
+	.byte	W06
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , An2 , v039
+	.byte	W18
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , An2 , v039
+	.byte	W06
+	.byte		N06   , Fs3 , v039
+	.byte	W06
+@ 010   ----------------------------------------
+	.byte		N06   , Dn2 , v039
+	.byte		N06   , Fs2 , v039
+	.byte		N06   , An2 , v039
+	.byte		N06   , Cs3 , v039
+	.byte	W18
+	.byte		N06   , Dn2 , v039
+	.byte		N06   , Fs2 , v039
+	.byte		N06   , An2 , v039
+	.byte		N06   , Bn2 , v039
+	.byte	W30
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , Gs2 , v039
+	.byte	W12
+	.byte		N06   , Gs2 , v039
+	.byte	W06
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , An2 , v039
+	.byte	W18
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , An2 , v039
+	.byte	W06
+	.byte		N06   , Fs3 , v039
+	.byte	W06
+@ 011   ----------------------------------------
+	.byte		N06   , Dn2 , v039
+	.byte		N06   , Fs2 , v039
+	.byte		N06   , An2 , v039
+	.byte		N06   , Cs3 , v039
+	.byte	W24
+	.byte		N06   , Dn2 , v039
+	.byte		N06   , Fs2 , v039
+	.byte		N06   , An2 , v039
+	.byte		N06   , Bn2 , v039
+	.byte	W24
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , Gs2 , v039
+	.byte	W12
+	.byte		N06   , Gs2 , v039
+	.byte	W06
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , An2 , v039
+	.byte	W18
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , An2 , v039
+	.byte	W06
+	.byte		N06   , Fs3 , v039
+	.byte	W06
+@ 012   ----------------------------------------
+	.byte		N06   , Dn2 , v039
+	.byte		N06   , Fs2 , v039
+	.byte		N06   , An2 , v039
+	.byte		N06   , Cs3 , v039
+	.byte	W18
+	.byte		N06   , Dn2 , v039
+	.byte		N06   , Fs2 , v039
+	.byte		N06   , An2 , v039
+	.byte		N06   , Bn2 , v039
+	.byte	W18
+	.byte		N06   , Dn2 , v039
+	.byte		N06   , Fs2 , v039
+	.byte		N06   , An2 , v039
+	.byte	W12
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , Gs2 , v039
+	.byte	W12
+	.byte		N06   , Gs2 , v039
+	.byte	W06
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , An2 , v039
+	.byte	W18
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , An2 , v039
+	.byte	W06
+	.byte		N06   , Fs3 , v039
+	.byte	W06
+@ 013   ----------------------------------------
+	.byte		N06   , Dn2 , v039
+	.byte		N06   , Fs2 , v039
+	.byte		N06   , An2 , v039
+	.byte		N06   , Cs3 , v039
+	.byte	W24
+	.byte		N06   , Dn2 , v039
+	.byte		N06   , Fs2 , v039
+	.byte		N06   , An2 , v039
+	.byte		N06   , Bn2 , v039
+	.byte	W24
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , Gs2 , v039
+	.byte	W12
+	.byte		N06   , Gs2 , v039
+	.byte	W06
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , An2 , v039
+	.byte	W18
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , An2 , v039
+	.byte	W06
+	.byte		N06   , Fs3 , v039
+	.byte	W06
+@ 014   ----------------------------------------
+	.byte		N06   , Dn2 , v039
+	.byte		N06   , Fs2 , v039
+	.byte		N06   , An2 , v039
+	.byte		N06   , Cs3 , v039
+	.byte	W18
+	.byte		N06   , Dn2 , v039
+	.byte		N06   , Fs2 , v039
+	.byte		N06   , An2 , v039
+	.byte		N06   , Bn2 , v039
+	.byte	W30
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , Gs2 , v039
+	.byte	W12
+	.byte		N06   , Gs2 , v039
+	.byte	W06
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , An2 , v039
+	.byte	W18
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , An2 , v039
+	.byte	W06
+	.byte		N06   , Fs3 , v039
+	.byte	W06
+@ 015   ----------------------------------------
+	.byte		N06   , Dn2 , v039
+	.byte		N06   , Fs2 , v039
+	.byte		N06   , An2 , v039
+	.byte		N06   , Cs3 , v039
+	.byte	W24
+	.byte		N06   , Dn2 , v039
+	.byte		N06   , Fs2 , v039
+	.byte		N06   , An2 , v039
+	.byte		N06   , Bn2 , v039
+	.byte	W24
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , Gs2 , v039
+	.byte	W12
+	.byte		N06   , Gs2 , v039
+	.byte	W06
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , An2 , v039
+	.byte	W18
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , An2 , v039
+	.byte	W06
+	.byte		N06   , Fs3 , v039
+	.byte	W06
+@ 016   ----------------------------------------
+	.byte		N06   , Dn2 , v039
+	.byte		N06   , Fs2 , v039
+	.byte		N06   , An2 , v039
+	.byte		N06   , Cs3 , v039
+	.byte	W18
+	.byte		N06   , Dn2 , v039
+	.byte		N06   , Fs2 , v039
+	.byte		N06   , An2 , v039
+	.byte		N06   , Bn2 , v039
+	.byte	W18
+	.byte		N06   , Dn2 , v039
+	.byte		N06   , Fs2 , v039
+	.byte		N06   , An2 , v039
+	.byte	W12
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , Gs2 , v039
+	.byte	W12
+	.byte		N06   , Gs2 , v039
+	.byte	W06
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , An2 , v039
+	.byte	W18
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , An2 , v039
+	.byte	W06
+	.byte		N06   , Fs3 , v039
+	.byte	W06
+@ 017   ----------------------------------------
+	.byte		N06   , Dn2 , v039
+	.byte		N06   , Fs2 , v039
+	.byte		N06   , An2 , v039
+	.byte		N06   , Cs3 , v039
+	.byte	W24
+	.byte		N06   , Dn2 , v039
+	.byte		N06   , Fs2 , v039
+	.byte		N06   , An2 , v039
+	.byte		N06   , Bn2 , v039
+	.byte	W24
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , Gs2 , v039
+	.byte	W12
+	.byte		N06   , Gs2 , v039
+	.byte	W06
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , An2 , v039
+	.byte	W18
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , An2 , v039
+	.byte	W06
+	.byte		N06   , Fs3 , v039
+	.byte	W06
+@ 018   ----------------------------------------
+	.byte		N06   , Dn2 , v039
+	.byte		N06   , Fs2 , v039
+	.byte		N06   , An2 , v039
+	.byte		N06   , Cs3 , v039
+	.byte	W18
+	.byte		N06   , Dn2 , v039
+	.byte		N06   , Fs2 , v039
+	.byte		N06   , An2 , v039
+	.byte		N06   , Bn2 , v039
+	.byte	W30
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , Gs2 , v039
+	.byte	W12
+	.byte		N06   , Gs2 , v039
+	.byte	W06
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , An2 , v039
+	.byte	W18
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , An2 , v039
+	.byte	W06
+	.byte		N06   , Fs3 , v039
+	.byte	W06
+@ 019   ----------------------------------------
+	.byte		N06   , Dn2 , v039
+	.byte		N06   , Fs2 , v039
+	.byte		N06   , An2 , v039
+	.byte		N06   , Cs3 , v039
+	.byte	W24
+	.byte		N06   , Dn2 , v039
+	.byte		N06   , Fs2 , v039
+	.byte		N06   , An2 , v039
+	.byte		N06   , Bn2 , v039
+	.byte	W24
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , Gs2 , v039
+	.byte	W12
+	.byte		N06   , Gs2 , v039
+	.byte	W06
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , An2 , v039
+	.byte	W18
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , An2 , v039
+	.byte	W06
+	.byte		N06   , Fs3 , v039
+	.byte	W06
+@ 020   ----------------------------------------
+	.byte		N06   , Dn2 , v039
+	.byte		N06   , Fs2 , v039
+	.byte		N06   , An2 , v039
+	.byte		N06   , Cs3 , v039
+	.byte	W18
+	.byte		N06   , Dn2 , v039
+	.byte		N06   , Fs2 , v039
+	.byte		N06   , An2 , v039
+	.byte		N06   , Bn2 , v039
+	.byte	W18
+	.byte		N06   , Dn2 , v039
+	.byte		N06   , Fs2 , v039
+	.byte		N06   , An2 , v039
+	.byte	W12
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , Gs2 , v039
+	.byte	W12
+	.byte		N06   , Gs2 , v039
+	.byte	W06
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , An2 , v039
+	.byte	W18
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , An2 , v039
+	.byte	W06
+	.byte		N06   , Fs3 , v039
+	.byte	W06
+@ 021   ----------------------------------------
+	.byte		N06   , Dn2 , v039
+	.byte		N06   , Fs2 , v039
+	.byte		N06   , An2 , v039
+	.byte		N06   , Cs3 , v039
+	.byte	W24
+	.byte		N06   , Dn2 , v039
+	.byte		N06   , Fs2 , v039
+	.byte		N06   , An2 , v039
+	.byte		N06   , Bn2 , v039
+	.byte	W24
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , Gs2 , v039
+	.byte	W12
+	.byte		N06   , Gs2 , v039
+	.byte	W06
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , An2 , v039
+	.byte	W18
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , An2 , v039
+	.byte	W06
+	.byte		N06   , Fs3 , v039
+	.byte	W06
+@ 022   ----------------------------------------
+	.byte		N06   , Dn2 , v039
+	.byte		N06   , Fs2 , v039
+	.byte		N06   , An2 , v039
+	.byte		N06   , Cs3 , v039
+	.byte	W18
+	.byte		N06   , Dn2 , v039
+	.byte		N06   , Fs2 , v039
+	.byte		N06   , An2 , v039
+	.byte		N06   , Bn2 , v039
+	.byte	W30
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , Gs2 , v039
+	.byte	W12
+	.byte		N06   , Gs2 , v039
+	.byte	W06
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , An2 , v039
+	.byte	W18
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , An2 , v039
+	.byte	W06
+	.byte		N06   , Fs3 , v039
+	.byte	W06
+@ 023   ----------------------------------------
+	.byte		N06   , Dn2 , v039
+	.byte		N06   , Fs2 , v039
+	.byte		N06   , An2 , v039
+	.byte		N06   , Cs3 , v039
+	.byte	W24
+	.byte		N06   , Dn2 , v039
+	.byte		N06   , Fs2 , v039
+	.byte		N06   , An2 , v039
+	.byte		N06   , Bn2 , v039
+	.byte	W24
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , Gs2 , v039
+	.byte	W12
+	.byte		N06   , Gs2 , v039
+	.byte	W06
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , An2 , v039
+	.byte	W18
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , An2 , v039
+	.byte	W06
+	.byte		N06   , Fs3 , v039
+	.byte	W06
+@ 024   ----------------------------------------
+	.byte		N06   , Dn2 , v039
+	.byte		N06   , Fs2 , v039
+	.byte		N06   , An2 , v039
+	.byte		N06   , Cs3 , v039
+	.byte	W18
+	.byte		N06   , Dn2 , v039
+	.byte		N06   , Fs2 , v039
+	.byte		N06   , An2 , v039
+	.byte		N06   , Bn2 , v039
+	.byte	W18
+	.byte		N06   , Dn2 , v039
+	.byte		N06   , Fs2 , v039
+	.byte		N06   , An2 , v039
+	.byte	W12
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , Gs2 , v039
+	.byte	W12
+	.byte		N06   , Gs2 , v039
+	.byte	W06
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , An2 , v039
+	.byte	W18
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , An2 , v039
+	.byte	W06
+	.byte		N06   , Fs3 , v039
+	.byte	W06
+@ 025   ----------------------------------------
+	.byte		N06   , Dn2 , v039
+	.byte		N06   , Fs2 , v039
+	.byte		N06   , An2 , v039
+	.byte		N06   , Cs3 , v039
+	.byte	W24
+	.byte		N06   , Dn2 , v039
+	.byte		N06   , Fs2 , v039
+	.byte		N06   , An2 , v039
+	.byte		N06   , Bn2 , v039
+	.byte	W24
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , Gs2 , v039
+	.byte	W12
+	.byte		N06   , Gs2 , v039
+	.byte	W06
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , An2 , v039
+	.byte	W18
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , An2 , v039
+	.byte	W06
+	.byte		N06   , Fs3 , v039
+	.byte	W06
+@ 026   ----------------------------------------
+	.byte		N06   , Dn2 , v039
+	.byte		N06   , Fs2 , v039
+	.byte		N06   , An2 , v039
+	.byte		N06   , Cs3 , v039
+	.byte	W18
+	.byte		N06   , Dn2 , v039
+	.byte		N06   , Fs2 , v039
+	.byte		N06   , An2 , v039
+	.byte		N06   , Bn2 , v039
+	.byte	W30
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , Gs2 , v039
+	.byte	W12
+	.byte		N06   , Gs2 , v039
+	.byte	W06
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , An2 , v039
+	.byte	W18
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , An2 , v039
+	.byte	W06
+	.byte		N06   , Fs3 , v039
+	.byte	W06
+@ 027   ----------------------------------------
+	.byte		N06   , Dn2 , v039
+	.byte		N06   , Fs2 , v039
+	.byte		N06   , An2 , v039
+	.byte		N06   , Cs3 , v039
+	.byte	W24
+	.byte		N06   , Dn2 , v039
+	.byte		N06   , Fs2 , v039
+	.byte		N06   , An2 , v039
+	.byte		N06   , Bn2 , v039
+	.byte	W24
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , Gs2 , v039
+	.byte	W12
+	.byte		N06   , Gs2 , v039
+	.byte	W06
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , An2 , v039
+	.byte	W18
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , An2 , v039
+	.byte	W06
+	.byte		N06   , Fs3 , v039
+	.byte	W06
+@ 028   ----------------------------------------
+	.byte		N06   , Dn2 , v039
+	.byte		N06   , Fs2 , v039
+	.byte		N06   , An2 , v039
+	.byte		N06   , Cs3 , v039
+	.byte	W18
+	.byte		N06   , Dn2 , v039
+	.byte		N06   , Fs2 , v039
+	.byte		N06   , An2 , v039
+	.byte		N06   , Bn2 , v039
+	.byte	W18
+	.byte		N06   , Dn2 , v039
+	.byte		N06   , Fs2 , v039
+	.byte		N06   , An2 , v039
+	.byte	W12
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , Gs2 , v039
+	.byte	W12
+	.byte		N06   , Gs2 , v039
+	.byte	W06
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , An2 , v039
+	.byte	W18
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , An2 , v039
+	.byte	W06
+	.byte		N06   , Fs3 , v039
+	.byte	W06
+@ 029   ----------------------------------------
+	.byte		N06   , Dn2 , v039
+	.byte		N06   , Fs2 , v039
+	.byte		N06   , An2 , v039
+	.byte		N06   , Cs3 , v039
+	.byte	W24
+	.byte		N06   , Dn2 , v039
+	.byte		N06   , Fs2 , v039
+	.byte		N06   , An2 , v039
+	.byte		N06   , Bn2 , v039
+	.byte	W24
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , Gs2 , v039
+	.byte	W12
+	.byte		N06   , Gs2 , v039
+	.byte	W06
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , An2 , v039
+	.byte	W18
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , An2 , v039
+	.byte	W06
+	.byte		N06   , Fs3 , v039
+	.byte	W06
+@ 030   ----------------------------------------
+	.byte		N06   , Dn2 , v039
+	.byte		N06   , Fs2 , v039
+	.byte		N06   , An2 , v039
+	.byte		N06   , Cs3 , v039
+	.byte	W18
+	.byte		N06   , Dn2 , v039
+	.byte		N06   , Fs2 , v039
+	.byte		N06   , An2 , v039
+	.byte		N06   , Bn2 , v039
+	.byte	W30
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , Gs2 , v039
+	.byte	W12
+	.byte		N06   , Gs2 , v039
+	.byte	W06
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , An2 , v039
+	.byte	W18
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , An2 , v039
+	.byte	W06
+	.byte		N06   , Fs3 , v039
+	.byte	W06
+@ 031   ----------------------------------------
+	.byte		N06   , Dn2 , v039
+	.byte		N06   , Fs2 , v039
+	.byte		N06   , An2 , v039
+	.byte		N06   , Cs3 , v039
+	.byte	W24
+	.byte		N06   , Dn2 , v039
+	.byte		N06   , Fs2 , v039
+	.byte		N06   , An2 , v039
+	.byte		N06   , Bn2 , v039
+	.byte	W24
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , Gs2 , v039
+	.byte	W12
+	.byte		N06   , Gs2 , v039
+	.byte	W06
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , An2 , v039
+	.byte	W18
+	.byte		N06   , Cs2 , v039
+	.byte		N06   , En2 , v039
+	.byte		N06   , An2 , v039
+	.byte	W06
+	.byte		N06   , Fs3 , v039
+	.byte	W06
+@ 032   ----------------------------------------
+	.byte	FINE
+
+@**************** Track 7 (Midi-Chn.10) ****************@
+
+mus_assumption_7:
+	.byte	KEYSH , mus_assumption_key+0
+@ 000   ----------------------------------------
+	.byte		VOICE , 0
+	.byte		VOL   , 127*mus_assumption_mvl/mxv
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte		N06   , Cs2 , v050
+	.byte		N06   , Ds2 , v057
+	.byte		N06   , An2 , v057
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+@ 001   ----------------------------------------
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte	W10
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , As1 , v057
+	.byte	W02
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte	W10
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , As1 , v057
+	.byte	W02
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte	W06
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte	W04
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , As1 , v057
+	.byte	W02
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+@ 002   ----------------------------------------
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+@ 003   ----------------------------------------
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte	W10
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , As1 , v057
+	.byte	W02
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte	W10
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , As1 , v057
+	.byte	W02
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte	W06
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte	W04
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , As1 , v057
+	.byte	W02
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+@ 004   ----------------------------------------
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte		N06   , Cs2 , v050
+	.byte		N06   , Ds2 , v057
+	.byte		N06   , An2 , v057
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+@ 005   ----------------------------------------
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte	W10
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , As1 , v057
+	.byte	W02
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte	W10
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , As1 , v057
+	.byte	W02
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte	W06
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte	W04
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , As1 , v057
+	.byte	W02
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+@ 006   ----------------------------------------
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+@ 007   ----------------------------------------
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte	W10
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , As1 , v057
+	.byte	W02
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte	W10
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , As1 , v057
+	.byte	W02
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte	W06
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte	W04
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , As1 , v057
+	.byte	W02
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+@ 008   ----------------------------------------
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte		N06   , Cs2 , v050
+	.byte		N06   , Ds2 , v057
+	.byte		N06   , An2 , v057
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+@ 009   ----------------------------------------
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte	W10
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , As1 , v057
+	.byte	W02
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte	W10
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , As1 , v057
+	.byte	W02
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte	W06
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte	W04
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , As1 , v057
+	.byte	W02
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+@ 010   ----------------------------------------
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+@ 011   ----------------------------------------
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte	W10
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , As1 , v057
+	.byte	W02
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte	W10
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , As1 , v057
+	.byte	W02
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte	W06
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte	W04
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , As1 , v057
+	.byte	W02
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+@ 012   ----------------------------------------
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte		N06   , Cs2 , v050
+	.byte		N06   , Ds2 , v057
+	.byte		N06   , An2 , v057
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+@ 013   ----------------------------------------
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte	W10
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , As1 , v057
+	.byte	W02
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte	W10
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , As1 , v057
+	.byte	W02
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte	W06
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte	W04
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , As1 , v057
+	.byte	W02
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+@ 014   ----------------------------------------
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+@ 015   ----------------------------------------
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte	W10
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , As1 , v057
+	.byte	W02
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte	W10
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , As1 , v057
+	.byte	W02
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte	W06
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte	W04
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , As1 , v057
+	.byte	W02
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+@ 016   ----------------------------------------
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte		N06   , Cs2 , v050
+	.byte		N06   , Ds2 , v057
+	.byte		N06   , An2 , v057
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+@ 017   ----------------------------------------
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte	W10
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , As1 , v057
+	.byte	W02
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte	W10
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , As1 , v057
+	.byte	W02
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte	W06
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte	W04
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , As1 , v057
+	.byte	W02
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+@ 018   ----------------------------------------
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+@ 019   ----------------------------------------
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte	W10
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , As1 , v057
+	.byte	W02
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte	W10
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , As1 , v057
+	.byte	W02
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte	W06
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte	W04
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , As1 , v057
+	.byte	W02
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+@ 020   ----------------------------------------
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte		N06   , Cs2 , v050
+	.byte		N06   , Ds2 , v057
+	.byte		N06   , An2 , v057
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+@ 021   ----------------------------------------
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte	W10
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , As1 , v057
+	.byte	W02
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte	W10
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , As1 , v057
+	.byte	W02
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte	W06
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte	W04
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , As1 , v057
+	.byte	W02
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+@ 022   ----------------------------------------
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+@ 023   ----------------------------------------
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte	W10
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , As1 , v057
+	.byte	W02
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte	W10
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , As1 , v057
+	.byte	W02
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte	W06
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte	W04
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , As1 , v057
+	.byte	W02
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+@ 024   ----------------------------------------
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte		N06   , Cs2 , v050
+	.byte		N06   , Ds2 , v057
+	.byte		N06   , An2 , v057
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+@ 025   ----------------------------------------
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte	W10
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , As1 , v057
+	.byte	W02
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte	W10
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , As1 , v057
+	.byte	W02
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte	W06
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte	W04
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , As1 , v057
+	.byte	W02
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+@ 026   ----------------------------------------
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+@ 027   ----------------------------------------
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte	W10
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , As1 , v057
+	.byte	W02
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte	W10
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , As1 , v057
+	.byte	W02
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte	W06
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte	W04
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , As1 , v057
+	.byte	W02
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+@ 028   ----------------------------------------
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte		N06   , Cs2 , v050
+	.byte		N06   , Ds2 , v057
+	.byte		N06   , An2 , v057
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+@ 029   ----------------------------------------
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte	W10
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , As1 , v057
+	.byte	W02
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte	W10
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , As1 , v057
+	.byte	W02
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte	W06
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte	W04
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , As1 , v057
+	.byte	W02
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+@ 030   ----------------------------------------
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+@ 031   ----------------------------------------
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte	W10
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , As1 , v057
+	.byte	W02
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte	W10
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , As1 , v057
+	.byte	W02
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte	W06
+	.byte		N06   , Ds0 , v041
+	.byte		N06   , Bn0 , v025
+	.byte		N06   , Bn0 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte	W04
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , As1 , v057
+	.byte	W02
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+@ 032   ----------------------------------------
+	.byte	FINE
+
+@******************************************************@
+	.align	2
+
+mus_assumption:
+	.byte	7	@ NumTrks
+	.byte	0	@ NumBlks
+	.byte	mus_assumption_pri	@ Priority
+	.byte	mus_assumption_rev	@ Reverb.
+
+	.word	mus_assumption_grp
+
+	.word	mus_assumption_1
+	.word	mus_assumption_2
+	.word	mus_assumption_3
+	.word	mus_assumption_4
+	.word	mus_assumption_5
+	.word	mus_assumption_6
+	.word	mus_assumption_7
+
+	.end
@@ -0,0 +1,7466 @@
+	.include "MPlayDef.s"
+
+	.equ	mus_sm3dw_beachlevel_grp, voicegroup_test
+	.equ	mus_sm3dw_beachlevel_pri, 0
+	.equ	mus_sm3dw_beachlevel_rev, reverb_set+50
+	.equ	mus_sm3dw_beachlevel_mvl, 90
+	.equ	mus_sm3dw_beachlevel_key, 0
+	.equ	mus_sm3dw_beachlevel_tbs, 1
+	.equ	mus_sm3dw_beachlevel_exg, 1
+	.equ	mus_sm3dw_beachlevel_cmp, 1
+
+	.section .rodata
+	.global	mus_sm3dw_beachlevel
+	.align	2
+
+@**************** Track 1 (Midi-Chn.1) ****************@
+
+mus_sm3dw_beachlevel_1:
+	.byte	KEYSH , mus_sm3dw_beachlevel_key+0
+@ 000   ----------------------------------------
+	.byte	TEMPO , 110*mus_sm3dw_beachlevel_tbs/2
+	.byte		VOICE , 1
+	.byte		VOL   , 127*mus_sm3dw_beachlevel_mvl/mxv
+	.byte	W12
+	.byte		N02   , Bn5 , v127
+	.byte	W02
+	.byte		N10   , Cn6 , v127
+	.byte	W10
+	.byte		N06   , Bn5 , v127
+	.byte	W06
+	.byte		N06   , Gn5 , v127
+	.byte	W06
+	.byte		N06   , Dn5 , v127
+	.byte	W06
+	.byte		N48   , En5 , v127
+	.byte	W54
+@ 001   ----------------------------------------
+	.byte	W12
+	.byte		N02   , En5 , v127
+	.byte	W02
+	.byte		N10   , Fn5 , v127
+	.byte	W10
+	.byte		N06   , En5 , v127
+	.byte	W06
+	.byte		N06   , Cn5 , v127
+	.byte	W06
+	.byte		N06   , An4 , v127
+	.byte	W06
+	.byte		N48   , Gn4 , v127
+	.byte	W54
+@ 002   ----------------------------------------
+	.byte	W12
+	.byte		N02   , Bn5 , v127
+	.byte	W02
+	.byte		N10   , Cn6 , v127
+	.byte	W10
+	.byte		N06   , Bn5 , v127
+	.byte	W06
+	.byte		N06   , Gn5 , v127
+	.byte	W06
+	.byte		N06   , Dn5 , v127
+	.byte	W06
+	.byte		N48   , En5 , v127
+	.byte	W54
+@ 003   ----------------------------------------
+	.byte		N02   , Cn5 , v127
+	.byte	W02
+	.byte		N01   , Cs5 , v127
+	.byte	W01
+	.byte		N84   , Dn5 , v127 , gtp3
+	.byte	W84
+	.byte	W03
+	.byte	FINE
+
+@**************** Track 2 (Midi-Chn.2) ****************@
+
+mus_sm3dw_beachlevel_2:
+	.byte	KEYSH , mus_sm3dw_beachlevel_key+0
+@ 000   ----------------------------------------
+	.byte		VOICE , 2
+	.byte		VOL   , 127*mus_sm3dw_beachlevel_mvl/mxv
+	.byte	W18
+	.byte		N02   , Bn5 , v127
+	.byte	W02
+	.byte		N10   , Cn6 , v127
+	.byte	W10
+	.byte		N06   , Bn5 , v127
+	.byte	W06
+	.byte		N06   , Gn5 , v127
+	.byte	W06
+	.byte		N06   , Dn5 , v127
+	.byte	W06
+	.byte		N48   , En5 , v127
+	.byte	W48
+@ 001   ----------------------------------------
+	.byte	W18
+	.byte		N02   , En5 , v127
+	.byte	W02
+	.byte		N10   , Fn5 , v127
+	.byte	W10
+	.byte		N06   , En5 , v127
+	.byte	W06
+	.byte		N06   , Cn5 , v127
+	.byte	W06
+	.byte		N06   , An4 , v127
+	.byte	W06
+	.byte		N48   , Gn4 , v127
+	.byte	W48
+@ 002   ----------------------------------------
+	.byte	W18
+	.byte		N02   , Bn5 , v127
+	.byte	W02
+	.byte		N10   , Cn6 , v127
+	.byte	W10
+	.byte		N06   , Bn5 , v127
+	.byte	W06
+	.byte		N06   , Gn5 , v127
+	.byte	W06
+	.byte		N06   , Dn5 , v127
+	.byte	W06
+	.byte		N48   , En5 , v127
+	.byte	W48
+@ 003   ----------------------------------------
+	.byte	W06
+	.byte		N02   , Cn5 , v127
+	.byte	W02
+	.byte		N01   , Cs5 , v127
+	.byte	W01
+	.byte		N84   , Dn5 , v127 , gtp3
+	.byte	W84
+	.byte	W03
+@ 004   ----------------------------------------
+	.byte	FINE
+
+@**************** Track 3 (Midi-Chn.3) ****************@
+
+mus_sm3dw_beachlevel_3:
+	.byte	KEYSH , mus_sm3dw_beachlevel_key+0
+@ 000   ----------------------------------------
+	.byte		VOICE , 3
+	.byte		VOL   , 127*mus_sm3dw_beachlevel_mvl/mxv
+	.byte		N06   , Bn2 , v127
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , Dn3 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , Gn3 , v127
+	.byte	W06
+	.byte		N18   , Bn2 , v127
+	.byte		N18   , Cn3 , v127
+	.byte		N18   , Dn3 , v127
+	.byte		N18   , En3 , v127
+	.byte		N18   , Gn3 , v127
+	.byte	W18
+	.byte		N12   , Bn2 , v127
+	.byte		N12   , Cn3 , v127
+	.byte		N12   , Dn3 , v127
+	.byte		N12   , En3 , v127
+	.byte		N12   , Gn3 , v127
+	.byte	W12
+	.byte		N54   , Bn2 , v127
+	.byte		N54   , Cn3 , v127
+	.byte		N54   , Dn3 , v127
+	.byte		N54   , En3 , v127
+	.byte		N54   , Gn3 , v127
+	.byte	W60
+@ 001   ----------------------------------------
+	.byte		N06   , Dn3 , v127
+	.byte		N06   , Fn3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Cn4 , v127
+	.byte	W06
+	.byte		N18   , Dn3 , v127
+	.byte		N18   , Fn3 , v127
+	.byte		N18   , An3 , v127
+	.byte		N18   , Cn4 , v127
+	.byte	W18
+	.byte		N12   , Dn3 , v127
+	.byte		N12   , Fn3 , v127
+	.byte		N12   , An3 , v127
+	.byte		N12   , Cn4 , v127
+	.byte	W12
+	.byte		N54   , Dn3 , v127
+	.byte		N54   , Fn3 , v127
+	.byte		N54   , An3 , v127
+	.byte		N54   , Cn4 , v127
+	.byte	W60
+@ 002   ----------------------------------------
+	.byte		N06   , Bn2 , v127
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , Dn3 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , Gn3 , v127
+	.byte	W06
+	.byte		N18   , Bn2 , v127
+	.byte		N18   , Cn3 , v127
+	.byte		N18   , Dn3 , v127
+	.byte		N18   , En3 , v127
+	.byte		N18   , Gn3 , v127
+	.byte	W18
+	.byte		N12   , Bn2 , v127
+	.byte		N12   , Cn3 , v127
+	.byte		N12   , Dn3 , v127
+	.byte		N12   , En3 , v127
+	.byte		N12   , Gn3 , v127
+	.byte	W12
+	.byte		N54   , Bn2 , v127
+	.byte		N54   , Cn3 , v127
+	.byte		N54   , Dn3 , v127
+	.byte		N54   , En3 , v127
+	.byte		N54   , Gn3 , v127
+	.byte	W60
+@ 003   ----------------------------------------
+	.byte		N24   , Dn3 , v127
+	.byte		N24   , Fn3 , v127
+	.byte		N24   , An3 , v127
+	.byte		N24   , Cn4 , v127
+	.byte	W24
+	.byte		N12   , Dn3 , v127
+	.byte		N12   , Fn3 , v127
+	.byte		N12   , An3 , v127
+	.byte		N12   , Cn4 , v127
+	.byte	W12
+	.byte		N36   , Dn3 , v127
+	.byte		N36   , Fn3 , v127
+	.byte		N36   , An3 , v127
+	.byte		N36   , Cn4 , v127
+	.byte	W36
+	.byte		N24   , Dn3 , v127
+	.byte		N24   , Fn3 , v127
+	.byte		N24   , Gn3 , v127
+	.byte		N24   , Bn3 , v127
+	.byte	W24
+@ 004   ----------------------------------------
+	.byte		N06   , Bn2 , v127
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , Gn3 , v127
+	.byte	W06
+	.byte		N18   , Bn2 , v127
+	.byte		N18   , Cn3 , v127
+	.byte		N18   , En3 , v127
+	.byte		N18   , Gn3 , v127
+	.byte	W18
+	.byte		N12   , Bn2 , v127
+	.byte		N12   , Cn3 , v127
+	.byte		N12   , En3 , v127
+	.byte		N12   , Gn3 , v127
+	.byte	W12
+	.byte		N24   , Bn2 , v127
+	.byte		N24   , Cn3 , v127
+	.byte		N24   , En3 , v127
+	.byte		N24   , Gn3 , v127
+	.byte	W24
+	.byte		N12   , Bn2 , v127
+	.byte		N12   , Cn3 , v127
+	.byte		N12   , En3 , v127
+	.byte		N12   , Gn3 , v127
+	.byte	W12
+	.byte		N06   , Bn2 , v127
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , Gn3 , v127
+	.byte	W06
+	.byte		N18   , Bn2 , v127
+	.byte		N18   , Cn3 , v127
+	.byte		N18   , En3 , v127
+	.byte		N18   , Gn3 , v127
+	.byte	W18
+@ 005   ----------------------------------------
+	.byte		N06   , Fn3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Cn4 , v127
+	.byte	W06
+	.byte		N18   , Fn3 , v127
+	.byte		N18   , An3 , v127
+	.byte		N18   , Cn4 , v127
+	.byte	W18
+	.byte		N12   , Fn3 , v127
+	.byte		N12   , An3 , v127
+	.byte		N12   , Cn4 , v127
+	.byte	W12
+	.byte		N24   , Fn3 , v127
+	.byte		N24   , An3 , v127
+	.byte		N24   , Cn4 , v127
+	.byte	W24
+	.byte		N12   , Fn3 , v127
+	.byte		N12   , An3 , v127
+	.byte		N12   , Cn4 , v127
+	.byte	W12
+	.byte		N06   , Fn3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Cn4 , v127
+	.byte	W06
+	.byte		N18   , Fn3 , v127
+	.byte		N18   , An3 , v127
+	.byte		N18   , Cn4 , v127
+	.byte	W18
+@ 006   ----------------------------------------
+	.byte		N06   , Bn2 , v127
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , Gn3 , v127
+	.byte	W06
+	.byte		N18   , Bn2 , v127
+	.byte		N18   , Cn3 , v127
+	.byte		N18   , En3 , v127
+	.byte		N18   , Gn3 , v127
+	.byte	W18
+	.byte		N12   , Bn2 , v127
+	.byte		N12   , Cn3 , v127
+	.byte		N12   , En3 , v127
+	.byte		N12   , Gn3 , v127
+	.byte	W12
+	.byte		N24   , Bn2 , v127
+	.byte		N24   , Cn3 , v127
+	.byte		N24   , En3 , v127
+	.byte		N24   , Gn3 , v127
+	.byte	W24
+	.byte		N12   , Bn2 , v127
+	.byte		N12   , Cn3 , v127
+	.byte		N12   , En3 , v127
+	.byte		N12   , Gn3 , v127
+	.byte	W12
+	.byte		N06   , Bn2 , v127
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , Gn3 , v127
+	.byte	W06
+	.byte		N18   , Bn2 , v127
+	.byte		N18   , Cn3 , v127
+	.byte		N18   , En3 , v127
+	.byte		N18   , Gn3 , v127
+	.byte	W18
+@ 007   ----------------------------------------
+	.byte		N06   , Fn3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Cn4 , v127
+	.byte	W06
+	.byte		N18   , Fn3 , v127
+	.byte		N18   , An3 , v127
+	.byte		N18   , Cn4 , v127
+	.byte	W18
+	.byte		N12   , Fn3 , v127
+	.byte		N12   , An3 , v127
+	.byte		N12   , Cn4 , v127
+	.byte	W12
+	.byte		N24   , Fn3 , v127
+	.byte		N24   , An3 , v127
+	.byte		N24   , Cn4 , v127
+	.byte	W24
+	.byte		N12   , Fn3 , v127
+	.byte		N12   , An3 , v127
+	.byte		N12   , Cn4 , v127
+	.byte	W12
+	.byte		N06   , Fn3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Cn4 , v127
+	.byte	W06
+	.byte		N18   , Fn3 , v127
+	.byte		N18   , An3 , v127
+	.byte		N18   , Cn4 , v127
+	.byte	W18
+@ 008   ----------------------------------------
+	.byte		N06   , Bn2 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , Gn3 , v127
+	.byte	W06
+	.byte		N18   , Bn2 , v127
+	.byte		N18   , En3 , v127
+	.byte		N18   , Gn3 , v127
+	.byte	W18
+	.byte		N12   , Bn2 , v127
+	.byte		N12   , En3 , v127
+	.byte		N12   , Gn3 , v127
+	.byte	W12
+	.byte		N24   , Bn2 , v127
+	.byte		N24   , En3 , v127
+	.byte		N24   , Gn3 , v127
+	.byte	W24
+	.byte		N12   , En3 , v127
+	.byte		N12   , An3 , v127
+	.byte		N12   , Cn4 , v127
+	.byte	W12
+	.byte		N06   , En3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Cn4 , v127
+	.byte	W06
+	.byte		N18   , En3 , v127
+	.byte		N18   , An3 , v127
+	.byte		N18   , Cn4 , v127
+	.byte	W18
+@ 009   ----------------------------------------
+	.byte		N06   , An2 , v127
+	.byte		N06   , Dn3 , v127
+	.byte		N06   , Fn3 , v127
+	.byte	W06
+	.byte		N18   , An2 , v127
+	.byte		N18   , Dn3 , v127
+	.byte		N18   , Fn3 , v127
+	.byte	W18
+	.byte		N12   , An2 , v127
+	.byte		N12   , Dn3 , v127
+	.byte		N12   , Fn3 , v127
+	.byte	W12
+	.byte		N24   , An2 , v127
+	.byte		N24   , Dn3 , v127
+	.byte		N24   , Fn3 , v127
+	.byte	W24
+	.byte		N12   , Dn3 , v127
+	.byte		N12   , Gn3 , v127
+	.byte		N12   , Bn3 , v127
+	.byte	W12
+	.byte		N06   , Dn3 , v127
+	.byte		N06   , Gn3 , v127
+	.byte		N06   , Bn3 , v127
+	.byte	W06
+	.byte		N06   , Dn3 , v127
+	.byte		N06   , Gn3 , v127
+	.byte		N06   , Bn3 , v127
+	.byte	W06
+	.byte		N06   , Dn3 , v127
+	.byte		N06   , Gn3 , v127
+	.byte		N06   , Bn3 , v127
+	.byte	W06
+	.byte		N06   , Dn3 , v127
+	.byte		N06   , Gn3 , v127
+	.byte		N06   , Bn3 , v127
+	.byte	W06
+@ 010   ----------------------------------------
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , Cs3 , v127
+	.byte		N06   , Fn3 , v127
+	.byte		N06   , Gs3 , v127
+	.byte	W06
+	.byte		N18   , Cn3 , v127
+	.byte		N18   , Cs3 , v127
+	.byte		N18   , Fn3 , v127
+	.byte		N18   , Gs3 , v127
+	.byte	W18
+	.byte		N12   , Cn3 , v127
+	.byte		N12   , Cs3 , v127
+	.byte		N12   , Fn3 , v127
+	.byte		N12   , Gs3 , v127
+	.byte	W12
+	.byte		N24   , Cn3 , v127
+	.byte		N24   , Cs3 , v127
+	.byte		N24   , Fn3 , v127
+	.byte		N24   , Gs3 , v127
+	.byte	W24
+	.byte		N12   , Cn3 , v127
+	.byte		N12   , Cs3 , v127
+	.byte		N12   , Fn3 , v127
+	.byte		N12   , Gs3 , v127
+	.byte	W12
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , Cs3 , v127
+	.byte		N06   , Fn3 , v127
+	.byte		N06   , Gs3 , v127
+	.byte	W06
+	.byte		N18   , Cn3 , v127
+	.byte		N18   , Cs3 , v127
+	.byte		N18   , Fn3 , v127
+	.byte		N18   , Gs3 , v127
+	.byte	W18
+@ 011   ----------------------------------------
+	.byte		N06   , Fs3 , v127
+	.byte		N06   , As3 , v127
+	.byte		N06   , Cs4 , v127
+	.byte	W06
+	.byte		N18   , Fs3 , v127
+	.byte		N18   , As3 , v127
+	.byte		N18   , Cs4 , v127
+	.byte	W18
+	.byte		N12   , Fs3 , v127
+	.byte		N12   , As3 , v127
+	.byte		N12   , Cs4 , v127
+	.byte	W12
+	.byte		N24   , Fs3 , v127
+	.byte		N24   , As3 , v127
+	.byte		N24   , Cs4 , v127
+	.byte	W24
+	.byte		N12   , Fs3 , v127
+	.byte		N12   , As3 , v127
+	.byte		N12   , Cs4 , v127
+	.byte	W12
+	.byte		N06   , Fs3 , v127
+	.byte		N06   , As3 , v127
+	.byte		N06   , Cs4 , v127
+	.byte	W06
+	.byte		N18   , Fs3 , v127
+	.byte		N18   , As3 , v127
+	.byte		N18   , Cs4 , v127
+	.byte	W18
+@ 012   ----------------------------------------
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , Cs3 , v127
+	.byte		N06   , Fn3 , v127
+	.byte		N06   , Gs3 , v127
+	.byte	W06
+	.byte		N18   , Cn3 , v127
+	.byte		N18   , Cs3 , v127
+	.byte		N18   , Fn3 , v127
+	.byte		N18   , Gs3 , v127
+	.byte	W18
+	.byte		N12   , Cn3 , v127
+	.byte		N12   , Cs3 , v127
+	.byte		N12   , Fn3 , v127
+	.byte		N12   , Gs3 , v127
+	.byte	W12
+	.byte		N24   , Cn3 , v127
+	.byte		N24   , Cs3 , v127
+	.byte		N24   , Fn3 , v127
+	.byte		N24   , Gs3 , v127
+	.byte	W24
+	.byte		N12   , Cn3 , v127
+	.byte		N12   , Cs3 , v127
+	.byte		N12   , Fn3 , v127
+	.byte		N12   , Gs3 , v127
+	.byte	W12
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , Cs3 , v127
+	.byte		N06   , Fn3 , v127
+	.byte		N06   , Gs3 , v127
+	.byte	W06
+	.byte		N18   , Cn3 , v127
+	.byte		N18   , Cs3 , v127
+	.byte		N18   , Fn3 , v127
+	.byte		N18   , Gs3 , v127
+	.byte	W18
+@ 013   ----------------------------------------
+	.byte		N06   , Fs3 , v127
+	.byte		N06   , As3 , v127
+	.byte		N06   , Cs4 , v127
+	.byte	W06
+	.byte		N18   , Fs3 , v127
+	.byte		N18   , As3 , v127
+	.byte		N18   , Cs4 , v127
+	.byte	W18
+	.byte		N12   , Fs3 , v127
+	.byte		N12   , As3 , v127
+	.byte		N12   , Cs4 , v127
+	.byte	W12
+	.byte		N24   , Fs3 , v127
+	.byte		N24   , As3 , v127
+	.byte		N24   , Cs4 , v127
+	.byte	W24
+	.byte		N12   , Fs3 , v127
+	.byte		N12   , As3 , v127
+	.byte		N12   , Cs4 , v127
+	.byte	W12
+	.byte		N06   , Fs3 , v127
+	.byte		N06   , As3 , v127
+	.byte		N06   , Cs4 , v127
+	.byte	W06
+	.byte		N18   , Fs3 , v127
+	.byte		N18   , As3 , v127
+	.byte		N18   , Cs4 , v127
+	.byte	W18
+@ 014   ----------------------------------------
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , Fn3 , v127
+	.byte		N06   , Gs3 , v127
+	.byte	W06
+	.byte		N18   , Cn3 , v127
+	.byte		N18   , Fn3 , v127
+	.byte		N18   , Gs3 , v127
+	.byte	W18
+	.byte		N12   , Cn3 , v127
+	.byte		N12   , Fn3 , v127
+	.byte		N12   , Gs3 , v127
+	.byte	W12
+	.byte		N24   , Cn3 , v127
+	.byte		N24   , Fn3 , v127
+	.byte		N24   , Gs3 , v127
+	.byte	W24
+	.byte		N12   , Fn3 , v127
+	.byte		N12   , As3 , v127
+	.byte		N12   , Cs4 , v127
+	.byte	W12
+	.byte		N06   , Fn3 , v127
+	.byte		N06   , As3 , v127
+	.byte		N06   , Cs4 , v127
+	.byte	W06
+	.byte		N18   , Fn3 , v127
+	.byte		N18   , As3 , v127
+	.byte		N18   , Cs4 , v127
+	.byte	W18
+@ 015   ----------------------------------------
+	.byte		N06   , As2 , v127
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , Fs3 , v127
+	.byte	W06
+	.byte		N18   , As2 , v127
+	.byte		N18   , Ds3 , v127
+	.byte		N18   , Fs3 , v127
+	.byte	W18
+	.byte		N12   , As2 , v127
+	.byte		N12   , Ds3 , v127
+	.byte		N12   , Fs3 , v127
+	.byte	W12
+	.byte		N24   , As2 , v127
+	.byte		N24   , Ds3 , v127
+	.byte		N24   , Fs3 , v127
+	.byte	W24
+	.byte		N12   , Ds3 , v127
+	.byte		N12   , Gs3 , v127
+	.byte		N12   , Cn4 , v127
+	.byte	W12
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , Gs3 , v127
+	.byte		N06   , Cn4 , v127
+	.byte	W06
+	.byte		N18   , Ds3 , v127
+	.byte		N18   , Gs3 , v127
+	.byte		N18   , Cn4 , v127
+	.byte	W18
+@ 016   ----------------------------------------
+	.byte		N06   , Gs2 , v127
+	.byte		N06   , Cs3 , v127
+	.byte		N06   , Fn3 , v127
+	.byte	W06
+	.byte		N18   , Gs2 , v127
+	.byte		N18   , Cs3 , v127
+	.byte		N18   , Fn3 , v127
+	.byte	W18
+	.byte		N12   , Gs2 , v127
+	.byte		N12   , Cs3 , v127
+	.byte		N12   , Fn3 , v127
+	.byte	W12
+	.byte		N24   , Gs2 , v127
+	.byte		N24   , Cs3 , v127
+	.byte		N24   , Fn3 , v127
+	.byte	W24
+	.byte		N12   , Gs2 , v127
+	.byte		N12   , Cs3 , v127
+	.byte		N12   , Fn3 , v127
+	.byte	W12
+	.byte		N06   , Gs2 , v127
+	.byte		N06   , Cs3 , v127
+	.byte		N06   , Fn3 , v127
+	.byte	W06
+	.byte		N18   , Gs2 , v127
+	.byte		N18   , Cs3 , v127
+	.byte		N18   , Fn3 , v127
+	.byte	W18
+@ 017   ----------------------------------------
+	.byte		N06   , Gs2 , v127
+	.byte		N06   , Bn2 , v127
+	.byte		N06   , Fn3 , v127
+	.byte	W06
+	.byte		N18   , Gs2 , v127
+	.byte		N18   , Bn2 , v127
+	.byte		N18   , Fn3 , v127
+	.byte	W18
+	.byte		N12   , Gs2 , v127
+	.byte		N12   , Bn2 , v127
+	.byte		N12   , Fn3 , v127
+	.byte	W12
+	.byte		N24   , Gs2 , v127
+	.byte		N24   , Bn2 , v127
+	.byte		N24   , Fn3 , v127
+	.byte	W24
+	.byte		N12   , Gs2 , v127
+	.byte		N12   , Bn2 , v127
+	.byte		N12   , Fn3 , v127
+	.byte	W12
+	.byte		N06   , Gs2 , v127
+	.byte		N06   , Bn2 , v127
+	.byte		N06   , Fn3 , v127
+	.byte	W06
+	.byte		N18   , Gs2 , v127
+	.byte		N18   , Bn2 , v127
+	.byte		N18   , Fn3 , v127
+	.byte	W18
+@ 018   ----------------------------------------
+	.byte		N06   , As2 , v127
+	.byte		N06   , Cs3 , v127
+	.byte		N06   , Fn3 , v127
+	.byte	W06
+	.byte		N18   , As2 , v127
+	.byte		N18   , Cs3 , v127
+	.byte		N18   , Fn3 , v127
+	.byte	W18
+	.byte		N12   , As2 , v127
+	.byte		N12   , Cs3 , v127
+	.byte		N12   , Fn3 , v127
+	.byte	W12
+	.byte		N24   , As2 , v127
+	.byte		N24   , Cs3 , v127
+	.byte		N24   , Fn3 , v127
+	.byte	W24
+	.byte		N12   , As2 , v127
+	.byte		N12   , Cs3 , v127
+	.byte		N12   , Fn3 , v127
+	.byte	W12
+	.byte		N06   , As2 , v127
+	.byte		N06   , Cs3 , v127
+	.byte		N06   , Fn3 , v127
+	.byte	W06
+	.byte		N18   , As2 , v127
+	.byte		N18   , Cs3 , v127
+	.byte		N18   , Fn3 , v127
+	.byte	W18
+@ 019   ----------------------------------------
+	.byte		N06   , En2 , v127
+	.byte		N06   , An2 , v127
+	.byte		N06   , Cs3 , v127
+	.byte	W06
+	.byte		N18   , En2 , v127
+	.byte		N18   , An2 , v127
+	.byte		N18   , Cs3 , v127
+	.byte	W18
+	.byte		N12   , En2 , v127
+	.byte		N12   , An2 , v127
+	.byte		N12   , Cs3 , v127
+	.byte	W12
+	.byte		N24   , En2 , v127
+	.byte		N24   , An2 , v127
+	.byte		N24   , Cs3 , v127
+	.byte	W24
+	.byte		N12   , En2 , v127
+	.byte		N12   , An2 , v127
+	.byte		N12   , Cs3 , v127
+	.byte	W12
+	.byte		N06   , En2 , v127
+	.byte		N06   , An2 , v127
+	.byte		N06   , Cs3 , v127
+	.byte	W06
+	.byte		N18   , En2 , v127
+	.byte		N18   , An2 , v127
+	.byte		N18   , Cs3 , v127
+	.byte	W18
+@ 020   ----------------------------------------
+	.byte		N06   , Gs2 , v127
+	.byte		N06   , Cs3 , v127
+	.byte		N06   , Fn3 , v127
+	.byte	W06
+	.byte		N18   , Gs2 , v127
+	.byte		N18   , Cs3 , v127
+	.byte		N18   , Fn3 , v127
+	.byte	W18
+	.byte		N12   , Gs2 , v127
+	.byte		N12   , Cs3 , v127
+	.byte		N12   , Fn3 , v127
+	.byte	W12
+	.byte		N24   , Gs2 , v127
+	.byte		N24   , Cs3 , v127
+	.byte		N24   , Fn3 , v127
+	.byte	W24
+	.byte		N12   , Gs2 , v127
+	.byte		N12   , Cs3 , v127
+	.byte		N12   , Fn3 , v127
+	.byte	W12
+	.byte		N06   , Gs2 , v127
+	.byte		N06   , Cs3 , v127
+	.byte		N06   , Fn3 , v127
+	.byte	W06
+	.byte		N18   , Gs2 , v127
+	.byte		N18   , Cs3 , v127
+	.byte		N18   , Fn3 , v127
+	.byte	W18
+@ 021   ----------------------------------------
+	.byte		N06   , Fs3 , v127
+	.byte		N06   , As3 , v127
+	.byte		N06   , Cs4 , v127
+	.byte	W06
+	.byte		N18   , Fs3 , v127
+	.byte		N18   , As3 , v127
+	.byte		N18   , Cs4 , v127
+	.byte	W18
+	.byte		N12   , Fs3 , v127
+	.byte		N12   , As3 , v127
+	.byte		N12   , Cs4 , v127
+	.byte	W12
+	.byte		N24   , Gs2 , v127
+	.byte		N24   , Ds3 , v127
+	.byte		N24   , Fs3 , v127
+	.byte	W24
+	.byte		N12   , Gs2 , v127
+	.byte		N12   , Ds3 , v127
+	.byte		N12   , Fs3 , v127
+	.byte	W12
+	.byte		N06   , Gs2 , v127
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , Fs3 , v127
+	.byte	W06
+	.byte		N18   , Gs2 , v127
+	.byte		N18   , Cn3 , v127
+	.byte		N18   , Fs3 , v127
+	.byte	W18
+@ 022   ----------------------------------------
+	.byte		N06   , Cs3 , v127
+	.byte		N06   , Fn3 , v127
+	.byte		N06   , Gs3 , v127
+	.byte	W06
+	.byte		N18   , Cs3 , v127
+	.byte		N18   , Fn3 , v127
+	.byte		N18   , Gs3 , v127
+	.byte	W18
+	.byte		N12   , Cs3 , v127
+	.byte		N12   , Fn3 , v127
+	.byte		N12   , Gs3 , v127
+	.byte	W12
+	.byte		N24   , Cs3 , v127
+	.byte		N24   , Fn3 , v127
+	.byte		N24   , Gs3 , v127
+	.byte	W24
+	.byte		N12   , Gs2 , v127
+	.byte		N12   , Cs3 , v127
+	.byte		N12   , Fn3 , v127
+	.byte	W12
+	.byte		N06   , Gs2 , v127
+	.byte		N06   , Cs3 , v127
+	.byte		N06   , Fn3 , v127
+	.byte	W06
+	.byte		N18   , Gs2 , v127
+	.byte		N18   , Cs3 , v127
+	.byte		N18   , Fn3 , v127
+	.byte	W18
+@ 023   ----------------------------------------
+	.byte		N06   , Fn3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Cn4 , v127
+	.byte	W06
+	.byte		N18   , Fn3 , v127
+	.byte		N18   , An3 , v127
+	.byte		N18   , Cn4 , v127
+	.byte	W18
+	.byte		N12   , Fn3 , v127
+	.byte		N12   , An3 , v127
+	.byte		N12   , Cn4 , v127
+	.byte	W12
+	.byte		N24   , Fn3 , v127
+	.byte		N24   , Gn3 , v127
+	.byte		N24   , Bn3 , v127
+	.byte	W24
+	.byte		N12   , Fn3 , v127
+	.byte		N12   , Gn3 , v127
+	.byte		N12   , Bn3 , v127
+	.byte	W12
+	.byte		N06   , Fn3 , v127
+	.byte		N06   , Gn3 , v127
+	.byte		N06   , Bn3 , v127
+	.byte	W06
+	.byte		N18   , Fn3 , v127
+	.byte		N18   , Gn3 , v127
+	.byte		N18   , Bn3 , v127
+	.byte	W18
+@ 024   ----------------------------------------
+	.byte		N06   , Bn2 , v127
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , Dn3 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , Gn3 , v127
+	.byte	W06
+	.byte		N18   , Bn2 , v127
+	.byte		N18   , Cn3 , v127
+	.byte		N18   , Dn3 , v127
+	.byte		N18   , En3 , v127
+	.byte		N18   , Gn3 , v127
+	.byte	W18
+	.byte		N12   , Bn2 , v127
+	.byte		N12   , Cn3 , v127
+	.byte		N12   , Dn3 , v127
+	.byte		N12   , En3 , v127
+	.byte		N12   , Gn3 , v127
+	.byte	W12
+	.byte		N54   , Bn2 , v127
+	.byte		N54   , Cn3 , v127
+	.byte		N54   , Dn3 , v127
+	.byte		N54   , En3 , v127
+	.byte		N54   , Gn3 , v127
+	.byte	W60
+@ 025   ----------------------------------------
+	.byte		N06   , Dn3 , v127
+	.byte		N06   , Fn3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Cn4 , v127
+	.byte	W06
+	.byte		N18   , Dn3 , v127
+	.byte		N18   , Fn3 , v127
+	.byte		N18   , An3 , v127
+	.byte		N18   , Cn4 , v127
+	.byte	W18
+	.byte		N12   , Dn3 , v127
+	.byte		N12   , Fn3 , v127
+	.byte		N12   , An3 , v127
+	.byte		N12   , Cn4 , v127
+	.byte	W12
+	.byte		N54   , Dn3 , v127
+	.byte		N54   , Fn3 , v127
+	.byte		N54   , An3 , v127
+	.byte		N54   , Cn4 , v127
+	.byte	W60
+@ 026   ----------------------------------------
+	.byte		N06   , Bn2 , v127
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , Dn3 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , Gn3 , v127
+	.byte	W06
+	.byte		N18   , Bn2 , v127
+	.byte		N18   , Cn3 , v127
+	.byte		N18   , Dn3 , v127
+	.byte		N18   , En3 , v127
+	.byte		N18   , Gn3 , v127
+	.byte	W18
+	.byte		N12   , Bn2 , v127
+	.byte		N12   , Cn3 , v127
+	.byte		N12   , Dn3 , v127
+	.byte		N12   , En3 , v127
+	.byte		N12   , Gn3 , v127
+	.byte	W12
+	.byte		N54   , Bn2 , v127
+	.byte		N54   , Cn3 , v127
+	.byte		N54   , Dn3 , v127
+	.byte		N54   , En3 , v127
+	.byte		N54   , Gn3 , v127
+	.byte	W60
+@ 027   ----------------------------------------
+	.byte		N06   , Dn3 , v127
+	.byte		N06   , Fn3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Cn4 , v127
+	.byte	W06
+	.byte		N18   , Dn3 , v127
+	.byte		N18   , Fn3 , v127
+	.byte		N18   , An3 , v127
+	.byte		N18   , Cn4 , v127
+	.byte	W18
+	.byte		N12   , Dn3 , v127
+	.byte		N12   , Fn3 , v127
+	.byte		N12   , An3 , v127
+	.byte		N12   , Cn4 , v127
+	.byte	W12
+	.byte		N54   , Dn3 , v127
+	.byte		N54   , Fn3 , v127
+	.byte		N54   , An3 , v127
+	.byte		N54   , Cn4 , v127
+	.byte	W60
+@ 028   ----------------------------------------
+	.byte		N06   , Bn2 , v127
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , Dn3 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , Gn3 , v127
+	.byte	W06
+	.byte		N18   , Bn2 , v127
+	.byte		N18   , Cn3 , v127
+	.byte		N18   , Dn3 , v127
+	.byte		N18   , En3 , v127
+	.byte		N18   , Gn3 , v127
+	.byte	W18
+	.byte		N12   , Bn2 , v127
+	.byte		N12   , Cn3 , v127
+	.byte		N12   , Dn3 , v127
+	.byte		N12   , En3 , v127
+	.byte		N12   , Gn3 , v127
+	.byte	W12
+	.byte		N54   , Bn2 , v127
+	.byte		N54   , Cn3 , v127
+	.byte		N54   , Dn3 , v127
+	.byte		N54   , En3 , v127
+	.byte		N54   , Gn3 , v127
+	.byte	W60
+@ 029   ----------------------------------------
+	.byte		N06   , Dn3 , v127
+	.byte		N06   , Fn3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Cn4 , v127
+	.byte	W06
+	.byte		N18   , Dn3 , v127
+	.byte		N18   , Fn3 , v127
+	.byte		N18   , An3 , v127
+	.byte		N18   , Cn4 , v127
+	.byte	W18
+	.byte		N12   , Dn3 , v127
+	.byte		N12   , Fn3 , v127
+	.byte		N12   , An3 , v127
+	.byte		N12   , Cn4 , v127
+	.byte	W12
+	.byte		N54   , Dn3 , v127
+	.byte		N54   , Fn3 , v127
+	.byte		N54   , An3 , v127
+	.byte		N54   , Cn4 , v127
+	.byte	W60
+@ 030   ----------------------------------------
+	.byte		N06   , Bn2 , v127
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , Dn3 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , Gn3 , v127
+	.byte	W06
+	.byte		N18   , Bn2 , v127
+	.byte		N18   , Cn3 , v127
+	.byte		N18   , Dn3 , v127
+	.byte		N18   , En3 , v127
+	.byte		N18   , Gn3 , v127
+	.byte	W18
+	.byte		N12   , Bn2 , v127
+	.byte		N12   , Cn3 , v127
+	.byte		N12   , Dn3 , v127
+	.byte		N12   , En3 , v127
+	.byte		N12   , Gn3 , v127
+	.byte	W12
+	.byte		N54   , Bn2 , v127
+	.byte		N54   , Cn3 , v127
+	.byte		N54   , Dn3 , v127
+	.byte		N54   , En3 , v127
+	.byte		N54   , Gn3 , v127
+	.byte	W60
+@ 031   ----------------------------------------
+	.byte		N24   , Dn3 , v127
+	.byte		N24   , Fn3 , v127
+	.byte		N24   , An3 , v127
+	.byte		N24   , Cn4 , v127
+	.byte	W24
+	.byte		N12   , Dn3 , v127
+	.byte		N12   , Fn3 , v127
+	.byte		N12   , An3 , v127
+	.byte		N12   , Cn4 , v127
+	.byte	W12
+	.byte		N36   , Dn3 , v127
+	.byte		N36   , Fn3 , v127
+	.byte		N36   , An3 , v127
+	.byte		N36   , Cn4 , v127
+	.byte	W36
+	.byte		N24   , Dn3 , v127
+	.byte		N24   , Fn3 , v127
+	.byte		N24   , Gn3 , v127
+	.byte		N24   , Bn3 , v127
+	.byte	W24
+@ 032   ----------------------------------------
+	.byte		N06   , Bn2 , v127
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , Gn3 , v127
+	.byte	W06
+	.byte		N18   , Bn2 , v127
+	.byte		N18   , Cn3 , v127
+	.byte		N18   , En3 , v127
+	.byte		N18   , Gn3 , v127
+	.byte	W18
+	.byte		N12   , Bn2 , v127
+	.byte		N12   , Cn3 , v127
+	.byte		N12   , En3 , v127
+	.byte		N12   , Gn3 , v127
+	.byte	W12
+	.byte		N24   , Bn2 , v127
+	.byte		N24   , Cn3 , v127
+	.byte		N24   , En3 , v127
+	.byte		N24   , Gn3 , v127
+	.byte	W24
+	.byte		N12   , Bn2 , v127
+	.byte		N12   , Cn3 , v127
+	.byte		N12   , En3 , v127
+	.byte		N12   , Gn3 , v127
+	.byte	W12
+	.byte		N06   , Bn2 , v127
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , Gn3 , v127
+	.byte	W06
+	.byte		N18   , Bn2 , v127
+	.byte		N18   , Cn3 , v127
+	.byte		N18   , En3 , v127
+	.byte		N18   , Gn3 , v127
+	.byte	W18
+@ 033   ----------------------------------------
+	.byte		N06   , Fn3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Cn4 , v127
+	.byte	W06
+	.byte		N18   , Fn3 , v127
+	.byte		N18   , An3 , v127
+	.byte		N18   , Cn4 , v127
+	.byte	W18
+	.byte		N12   , Fn3 , v127
+	.byte		N12   , An3 , v127
+	.byte		N12   , Cn4 , v127
+	.byte	W12
+	.byte		N24   , Fn3 , v127
+	.byte		N24   , An3 , v127
+	.byte		N24   , Cn4 , v127
+	.byte	W24
+	.byte		N12   , Fn3 , v127
+	.byte		N12   , An3 , v127
+	.byte		N12   , Cn4 , v127
+	.byte	W12
+	.byte		N06   , Fn3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Cn4 , v127
+	.byte	W06
+	.byte		N18   , Fn3 , v127
+	.byte		N18   , An3 , v127
+	.byte		N18   , Cn4 , v127
+	.byte	W18
+@ 034   ----------------------------------------
+	.byte		N06   , Bn2 , v127
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , Gn3 , v127
+	.byte	W06
+	.byte		N18   , Bn2 , v127
+	.byte		N18   , Cn3 , v127
+	.byte		N18   , En3 , v127
+	.byte		N18   , Gn3 , v127
+	.byte	W18
+	.byte		N12   , Bn2 , v127
+	.byte		N12   , Cn3 , v127
+	.byte		N12   , En3 , v127
+	.byte		N12   , Gn3 , v127
+	.byte	W12
+	.byte		N24   , Bn2 , v127
+	.byte		N24   , Cn3 , v127
+	.byte		N24   , En3 , v127
+	.byte		N24   , Gn3 , v127
+	.byte	W24
+	.byte		N12   , Bn2 , v127
+	.byte		N12   , Cn3 , v127
+	.byte		N12   , En3 , v127
+	.byte		N12   , Gn3 , v127
+	.byte	W12
+	.byte		N06   , Bn2 , v127
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , Gn3 , v127
+	.byte	W06
+	.byte		N18   , Bn2 , v127
+	.byte		N18   , Cn3 , v127
+	.byte		N18   , En3 , v127
+	.byte		N18   , Gn3 , v127
+	.byte	W18
+@ 035   ----------------------------------------
+	.byte		N06   , Fn3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Cn4 , v127
+	.byte	W06
+	.byte		N18   , Fn3 , v127
+	.byte		N18   , An3 , v127
+	.byte		N18   , Cn4 , v127
+	.byte	W18
+	.byte		N12   , Fn3 , v127
+	.byte		N12   , An3 , v127
+	.byte		N12   , Cn4 , v127
+	.byte	W12
+	.byte		N24   , Fn3 , v127
+	.byte		N24   , An3 , v127
+	.byte		N24   , Cn4 , v127
+	.byte	W24
+	.byte		N12   , Fn3 , v127
+	.byte		N12   , An3 , v127
+	.byte		N12   , Cn4 , v127
+	.byte	W12
+	.byte		N06   , Fn3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Cn4 , v127
+	.byte	W06
+	.byte		N18   , Fn3 , v127
+	.byte		N18   , An3 , v127
+	.byte		N18   , Cn4 , v127
+	.byte	W18
+@ 036   ----------------------------------------
+	.byte		N06   , Bn2 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , Gn3 , v127
+	.byte	W06
+	.byte		N18   , Bn2 , v127
+	.byte		N18   , En3 , v127
+	.byte		N18   , Gn3 , v127
+	.byte	W18
+	.byte		N12   , Bn2 , v127
+	.byte		N12   , En3 , v127
+	.byte		N12   , Gn3 , v127
+	.byte	W12
+	.byte		N24   , Bn2 , v127
+	.byte		N24   , En3 , v127
+	.byte		N24   , Gn3 , v127
+	.byte	W24
+	.byte		N12   , En3 , v127
+	.byte		N12   , An3 , v127
+	.byte		N12   , Cn4 , v127
+	.byte	W12
+	.byte		N06   , En3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Cn4 , v127
+	.byte	W06
+	.byte		N18   , En3 , v127
+	.byte		N18   , An3 , v127
+	.byte		N18   , Cn4 , v127
+	.byte	W18
+@ 037   ----------------------------------------
+	.byte		N06   , An2 , v127
+	.byte		N06   , Dn3 , v127
+	.byte		N06   , Fn3 , v127
+	.byte	W06
+	.byte		N18   , An2 , v127
+	.byte		N18   , Dn3 , v127
+	.byte		N18   , Fn3 , v127
+	.byte	W18
+	.byte		N12   , An2 , v127
+	.byte		N12   , Dn3 , v127
+	.byte		N12   , Fn3 , v127
+	.byte	W12
+	.byte		N24   , An2 , v127
+	.byte		N24   , Dn3 , v127
+	.byte		N24   , Fn3 , v127
+	.byte	W24
+	.byte		N12   , Dn3 , v127
+	.byte		N12   , Gn3 , v127
+	.byte		N12   , Bn3 , v127
+	.byte	W12
+	.byte		N06   , Dn3 , v127
+	.byte		N06   , Gn3 , v127
+	.byte		N06   , Bn3 , v127
+	.byte	W06
+	.byte		N06   , Dn3 , v127
+	.byte		N06   , Gn3 , v127
+	.byte		N06   , Bn3 , v127
+	.byte	W06
+	.byte		N06   , Dn3 , v127
+	.byte		N06   , Gn3 , v127
+	.byte		N06   , Bn3 , v127
+	.byte	W06
+	.byte		N06   , Dn3 , v127
+	.byte		N06   , Gn3 , v127
+	.byte		N06   , Bn3 , v127
+	.byte	W06
+@ 038   ----------------------------------------
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , Cs3 , v127
+	.byte		N06   , Fn3 , v127
+	.byte		N06   , Gs3 , v127
+	.byte	W06
+	.byte		N18   , Cn3 , v127
+	.byte		N18   , Cs3 , v127
+	.byte		N18   , Fn3 , v127
+	.byte		N18   , Gs3 , v127
+	.byte	W18
+	.byte		N12   , Cn3 , v127
+	.byte		N12   , Cs3 , v127
+	.byte		N12   , Fn3 , v127
+	.byte		N12   , Gs3 , v127
+	.byte	W12
+	.byte		N24   , Cn3 , v127
+	.byte		N24   , Cs3 , v127
+	.byte		N24   , Fn3 , v127
+	.byte		N24   , Gs3 , v127
+	.byte	W24
+	.byte		N12   , Cn3 , v127
+	.byte		N12   , Cs3 , v127
+	.byte		N12   , Fn3 , v127
+	.byte		N12   , Gs3 , v127
+	.byte	W12
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , Cs3 , v127
+	.byte		N06   , Fn3 , v127
+	.byte		N06   , Gs3 , v127
+	.byte	W06
+	.byte		N18   , Cn3 , v127
+	.byte		N18   , Cs3 , v127
+	.byte		N18   , Fn3 , v127
+	.byte		N18   , Gs3 , v127
+	.byte	W18
+@ 039   ----------------------------------------
+	.byte		N06   , Fs3 , v127
+	.byte		N06   , As3 , v127
+	.byte		N06   , Cs4 , v127
+	.byte	W06
+	.byte		N18   , Fs3 , v127
+	.byte		N18   , As3 , v127
+	.byte		N18   , Cs4 , v127
+	.byte	W18
+	.byte		N12   , Fs3 , v127
+	.byte		N12   , As3 , v127
+	.byte		N12   , Cs4 , v127
+	.byte	W12
+	.byte		N24   , Fs3 , v127
+	.byte		N24   , As3 , v127
+	.byte		N24   , Cs4 , v127
+	.byte	W24
+	.byte		N12   , Fs3 , v127
+	.byte		N12   , As3 , v127
+	.byte		N12   , Cs4 , v127
+	.byte	W12
+	.byte		N06   , Fs3 , v127
+	.byte		N06   , As3 , v127
+	.byte		N06   , Cs4 , v127
+	.byte	W06
+	.byte		N18   , Fs3 , v127
+	.byte		N18   , As3 , v127
+	.byte		N18   , Cs4 , v127
+	.byte	W18
+@ 040   ----------------------------------------
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , Cs3 , v127
+	.byte		N06   , Fn3 , v127
+	.byte		N06   , Gs3 , v127
+	.byte	W06
+	.byte		N18   , Cn3 , v127
+	.byte		N18   , Cs3 , v127
+	.byte		N18   , Fn3 , v127
+	.byte		N18   , Gs3 , v127
+	.byte	W18
+	.byte		N12   , Cn3 , v127
+	.byte		N12   , Cs3 , v127
+	.byte		N12   , Fn3 , v127
+	.byte		N12   , Gs3 , v127
+	.byte	W12
+	.byte		N24   , Cn3 , v127
+	.byte		N24   , Cs3 , v127
+	.byte		N24   , Fn3 , v127
+	.byte		N24   , Gs3 , v127
+	.byte	W24
+	.byte		N12   , Cn3 , v127
+	.byte		N12   , Cs3 , v127
+	.byte		N12   , Fn3 , v127
+	.byte		N12   , Gs3 , v127
+	.byte	W12
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , Cs3 , v127
+	.byte		N06   , Fn3 , v127
+	.byte		N06   , Gs3 , v127
+	.byte	W06
+	.byte		N18   , Cn3 , v127
+	.byte		N18   , Cs3 , v127
+	.byte		N18   , Fn3 , v127
+	.byte		N18   , Gs3 , v127
+	.byte	W18
+@ 041   ----------------------------------------
+	.byte		N06   , Fs3 , v127
+	.byte		N06   , As3 , v127
+	.byte		N06   , Cs4 , v127
+	.byte	W06
+	.byte		N18   , Fs3 , v127
+	.byte		N18   , As3 , v127
+	.byte		N18   , Cs4 , v127
+	.byte	W18
+	.byte		N12   , Fs3 , v127
+	.byte		N12   , As3 , v127
+	.byte		N12   , Cs4 , v127
+	.byte	W12
+	.byte		N24   , Fs3 , v127
+	.byte		N24   , As3 , v127
+	.byte		N24   , Cs4 , v127
+	.byte	W24
+	.byte		N12   , Fs3 , v127
+	.byte		N12   , As3 , v127
+	.byte		N12   , Cs4 , v127
+	.byte	W12
+	.byte		N06   , Fs3 , v127
+	.byte		N06   , As3 , v127
+	.byte		N06   , Cs4 , v127
+	.byte	W06
+	.byte		N18   , Fs3 , v127
+	.byte		N18   , As3 , v127
+	.byte		N18   , Cs4 , v127
+	.byte	W18
+@ 042   ----------------------------------------
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , Fn3 , v127
+	.byte		N06   , Gs3 , v127
+	.byte	W06
+	.byte		N18   , Cn3 , v127
+	.byte		N18   , Fn3 , v127
+	.byte		N18   , Gs3 , v127
+	.byte	W18
+	.byte		N12   , Cn3 , v127
+	.byte		N12   , Fn3 , v127
+	.byte		N12   , Gs3 , v127
+	.byte	W12
+	.byte		N24   , Cn3 , v127
+	.byte		N24   , Fn3 , v127
+	.byte		N24   , Gs3 , v127
+	.byte	W24
+	.byte		N12   , Fn3 , v127
+	.byte		N12   , As3 , v127
+	.byte		N12   , Cs4 , v127
+	.byte	W12
+	.byte		N06   , Fn3 , v127
+	.byte		N06   , As3 , v127
+	.byte		N06   , Cs4 , v127
+	.byte	W06
+	.byte		N18   , Fn3 , v127
+	.byte		N18   , As3 , v127
+	.byte		N18   , Cs4 , v127
+	.byte	W18
+@ 043   ----------------------------------------
+	.byte		N06   , As2 , v127
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , Fs3 , v127
+	.byte	W06
+	.byte		N18   , As2 , v127
+	.byte		N18   , Ds3 , v127
+	.byte		N18   , Fs3 , v127
+	.byte	W18
+	.byte		N12   , As2 , v127
+	.byte		N12   , Ds3 , v127
+	.byte		N12   , Fs3 , v127
+	.byte	W12
+	.byte		N24   , As2 , v127
+	.byte		N24   , Ds3 , v127
+	.byte		N24   , Fs3 , v127
+	.byte	W24
+	.byte		N12   , Ds3 , v127
+	.byte		N12   , Gs3 , v127
+	.byte		N12   , Cn4 , v127
+	.byte	W12
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , Gs3 , v127
+	.byte		N06   , Cn4 , v127
+	.byte	W06
+	.byte		N18   , Ds3 , v127
+	.byte		N18   , Gs3 , v127
+	.byte		N18   , Cn4 , v127
+	.byte	W18
+@ 044   ----------------------------------------
+	.byte		N06   , Gs2 , v127
+	.byte		N06   , Cs3 , v127
+	.byte		N06   , Fn3 , v127
+	.byte	W06
+	.byte		N18   , Gs2 , v127
+	.byte		N18   , Cs3 , v127
+	.byte		N18   , Fn3 , v127
+	.byte	W18
+	.byte		N12   , Gs2 , v127
+	.byte		N12   , Cs3 , v127
+	.byte		N12   , Fn3 , v127
+	.byte	W12
+	.byte		N24   , Gs2 , v127
+	.byte		N24   , Cs3 , v127
+	.byte		N24   , Fn3 , v127
+	.byte	W24
+	.byte		N12   , Gs2 , v127
+	.byte		N12   , Cs3 , v127
+	.byte		N12   , Fn3 , v127
+	.byte	W12
+	.byte		N06   , Gs2 , v127
+	.byte		N06   , Cs3 , v127
+	.byte		N06   , Fn3 , v127
+	.byte	W06
+	.byte		N18   , Gs2 , v127
+	.byte		N18   , Cs3 , v127
+	.byte		N18   , Fn3 , v127
+	.byte	W18
+@ 045   ----------------------------------------
+	.byte		N06   , Gs2 , v127
+	.byte		N06   , Bn2 , v127
+	.byte		N06   , Fn3 , v127
+	.byte	W06
+	.byte		N18   , Gs2 , v127
+	.byte		N18   , Bn2 , v127
+	.byte		N18   , Fn3 , v127
+	.byte	W18
+	.byte		N12   , Gs2 , v127
+	.byte		N12   , Bn2 , v127
+	.byte		N12   , Fn3 , v127
+	.byte	W12
+	.byte		N24   , Gs2 , v127
+	.byte		N24   , Bn2 , v127
+	.byte		N24   , Fn3 , v127
+	.byte	W24
+	.byte		N12   , Gs2 , v127
+	.byte		N12   , Bn2 , v127
+	.byte		N12   , Fn3 , v127
+	.byte	W12
+	.byte		N06   , Gs2 , v127
+	.byte		N06   , Bn2 , v127
+	.byte		N06   , Fn3 , v127
+	.byte	W06
+	.byte		N18   , Gs2 , v127
+	.byte		N18   , Bn2 , v127
+	.byte		N18   , Fn3 , v127
+	.byte	W18
+@ 046   ----------------------------------------
+	.byte		N06   , As2 , v127
+	.byte		N06   , Cs3 , v127
+	.byte		N06   , Fn3 , v127
+	.byte	W06
+	.byte		N18   , As2 , v127
+	.byte		N18   , Cs3 , v127
+	.byte		N18   , Fn3 , v127
+	.byte	W18
+	.byte		N12   , As2 , v127
+	.byte		N12   , Cs3 , v127
+	.byte		N12   , Fn3 , v127
+	.byte	W12
+	.byte		N24   , As2 , v127
+	.byte		N24   , Cs3 , v127
+	.byte		N24   , Fn3 , v127
+	.byte	W24
+	.byte		N12   , As2 , v127
+	.byte		N12   , Cs3 , v127
+	.byte		N12   , Fn3 , v127
+	.byte	W12
+	.byte		N06   , As2 , v127
+	.byte		N06   , Cs3 , v127
+	.byte		N06   , Fn3 , v127
+	.byte	W06
+	.byte		N18   , As2 , v127
+	.byte		N18   , Cs3 , v127
+	.byte		N18   , Fn3 , v127
+	.byte	W18
+@ 047   ----------------------------------------
+	.byte		N06   , En2 , v127
+	.byte		N06   , An2 , v127
+	.byte		N06   , Cs3 , v127
+	.byte	W06
+	.byte		N18   , En2 , v127
+	.byte		N18   , An2 , v127
+	.byte		N18   , Cs3 , v127
+	.byte	W18
+	.byte		N12   , En2 , v127
+	.byte		N12   , An2 , v127
+	.byte		N12   , Cs3 , v127
+	.byte	W12
+	.byte		N24   , En2 , v127
+	.byte		N24   , An2 , v127
+	.byte		N24   , Cs3 , v127
+	.byte	W24
+	.byte		N12   , En2 , v127
+	.byte		N12   , An2 , v127
+	.byte		N12   , Cs3 , v127
+	.byte	W12
+	.byte		N06   , En2 , v127
+	.byte		N06   , An2 , v127
+	.byte		N06   , Cs3 , v127
+	.byte	W06
+	.byte		N18   , En2 , v127
+	.byte		N18   , An2 , v127
+	.byte		N18   , Cs3 , v127
+	.byte	W18
+@ 048   ----------------------------------------
+	.byte		N06   , Gs2 , v127
+	.byte		N06   , Cs3 , v127
+	.byte		N06   , Fn3 , v127
+	.byte	W06
+	.byte		N18   , Gs2 , v127
+	.byte		N18   , Cs3 , v127
+	.byte		N18   , Fn3 , v127
+	.byte	W18
+	.byte		N12   , Gs2 , v127
+	.byte		N12   , Cs3 , v127
+	.byte		N12   , Fn3 , v127
+	.byte	W12
+	.byte		N24   , Gs2 , v127
+	.byte		N24   , Cs3 , v127
+	.byte		N24   , Fn3 , v127
+	.byte	W24
+	.byte		N12   , Gs2 , v127
+	.byte		N12   , Cs3 , v127
+	.byte		N12   , Fn3 , v127
+	.byte	W12
+	.byte		N06   , Gs2 , v127
+	.byte		N06   , Cs3 , v127
+	.byte		N06   , Fn3 , v127
+	.byte	W06
+	.byte		N18   , Gs2 , v127
+	.byte		N18   , Cs3 , v127
+	.byte		N18   , Fn3 , v127
+	.byte	W18
+@ 049   ----------------------------------------
+	.byte		N06   , Fs3 , v127
+	.byte		N06   , As3 , v127
+	.byte		N06   , Cs4 , v127
+	.byte	W06
+	.byte		N18   , Fs3 , v127
+	.byte		N18   , As3 , v127
+	.byte		N18   , Cs4 , v127
+	.byte	W18
+	.byte		N12   , Fs3 , v127
+	.byte		N12   , As3 , v127
+	.byte		N12   , Cs4 , v127
+	.byte	W12
+	.byte		N24   , Gs2 , v127
+	.byte		N24   , Ds3 , v127
+	.byte		N24   , Fs3 , v127
+	.byte	W24
+	.byte		N12   , Gs2 , v127
+	.byte		N12   , Ds3 , v127
+	.byte		N12   , Fs3 , v127
+	.byte	W12
+	.byte		N06   , Gs2 , v127
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , Fs3 , v127
+	.byte	W06
+	.byte		N18   , Gs2 , v127
+	.byte		N18   , Cn3 , v127
+	.byte		N18   , Fs3 , v127
+	.byte	W18
+@ 050   ----------------------------------------
+	.byte		N06   , Cs3 , v127
+	.byte		N06   , Fn3 , v127
+	.byte		N06   , Gs3 , v127
+	.byte	W06
+	.byte		N18   , Cs3 , v127
+	.byte		N18   , Fn3 , v127
+	.byte		N18   , Gs3 , v127
+	.byte	W18
+	.byte		N12   , Cs3 , v127
+	.byte		N12   , Fn3 , v127
+	.byte		N12   , Gs3 , v127
+	.byte	W12
+	.byte		N24   , Cs3 , v127
+	.byte		N24   , Fn3 , v127
+	.byte		N24   , Gs3 , v127
+	.byte	W24
+	.byte		N12   , Gs2 , v127
+	.byte		N12   , Cs3 , v127
+	.byte		N12   , Fn3 , v127
+	.byte	W12
+	.byte		N06   , Gs2 , v127
+	.byte		N06   , Cs3 , v127
+	.byte		N06   , Fn3 , v127
+	.byte	W06
+	.byte		N18   , Gs2 , v127
+	.byte		N18   , Cs3 , v127
+	.byte		N18   , Fn3 , v127
+	.byte	W18
+@ 051   ----------------------------------------
+	.byte		N06   , Fn3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Cn4 , v127
+	.byte	W06
+	.byte		N18   , Fn3 , v127
+	.byte		N18   , An3 , v127
+	.byte		N18   , Cn4 , v127
+	.byte	W18
+	.byte		N12   , Fn3 , v127
+	.byte		N12   , An3 , v127
+	.byte		N12   , Cn4 , v127
+	.byte	W12
+	.byte		N24   , Fn3 , v127
+	.byte		N24   , Gn3 , v127
+	.byte		N24   , Bn3 , v127
+	.byte	W24
+	.byte		N12   , Fn3 , v127
+	.byte		N12   , Gn3 , v127
+	.byte		N12   , Bn3 , v127
+	.byte	W12
+	.byte		N06   , Fn3 , v127
+	.byte		N06   , Gn3 , v127
+	.byte		N06   , Bn3 , v127
+	.byte	W06
+	.byte		N18   , Fn3 , v127
+	.byte		N18   , Gn3 , v127
+	.byte		N18   , Bn3 , v127
+	.byte	W18
+@ 052   ----------------------------------------
+	.byte		N06   , Bn2 , v127
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , Dn3 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , Gn3 , v127
+	.byte	W06
+	.byte		N18   , Bn2 , v127
+	.byte		N18   , Cn3 , v127
+	.byte		N18   , Dn3 , v127
+	.byte		N18   , En3 , v127
+	.byte		N18   , Gn3 , v127
+	.byte	W18
+	.byte		N12   , Bn2 , v127
+	.byte		N12   , Cn3 , v127
+	.byte		N12   , Dn3 , v127
+	.byte		N12   , En3 , v127
+	.byte		N12   , Gn3 , v127
+	.byte	W12
+	.byte		N54   , Bn2 , v127
+	.byte		N54   , Cn3 , v127
+	.byte		N54   , Dn3 , v127
+	.byte		N54   , En3 , v127
+	.byte		N54   , Gn3 , v127
+	.byte	W60
+@ 053   ----------------------------------------
+	.byte		N06   , Dn3 , v127
+	.byte		N06   , Fn3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Cn4 , v127
+	.byte	W06
+	.byte		N18   , Dn3 , v127
+	.byte		N18   , Fn3 , v127
+	.byte		N18   , An3 , v127
+	.byte		N18   , Cn4 , v127
+	.byte	W18
+	.byte		N12   , Dn3 , v127
+	.byte		N12   , Fn3 , v127
+	.byte		N12   , An3 , v127
+	.byte		N12   , Cn4 , v127
+	.byte	W12
+	.byte		N54   , Dn3 , v127
+	.byte		N54   , Fn3 , v127
+	.byte		N54   , An3 , v127
+	.byte		N54   , Cn4 , v127
+	.byte	W60
+@ 054   ----------------------------------------
+	.byte		N06   , Bn2 , v127
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , Dn3 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , Gn3 , v127
+	.byte	W06
+	.byte		N18   , Bn2 , v127
+	.byte		N18   , Cn3 , v127
+	.byte		N18   , Dn3 , v127
+	.byte		N18   , En3 , v127
+	.byte		N18   , Gn3 , v127
+	.byte	W18
+	.byte		N12   , Bn2 , v127
+	.byte		N12   , Cn3 , v127
+	.byte		N12   , Dn3 , v127
+	.byte		N12   , En3 , v127
+	.byte		N12   , Gn3 , v127
+	.byte	W12
+	.byte		N54   , Bn2 , v127
+	.byte		N54   , Cn3 , v127
+	.byte		N54   , Dn3 , v127
+	.byte		N54   , En3 , v127
+	.byte		N54   , Gn3 , v127
+	.byte	W60
+@ 055   ----------------------------------------
+	.byte		N06   , Dn3 , v127
+	.byte		N06   , Fn3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Cn4 , v127
+	.byte	W06
+	.byte		N18   , Dn3 , v127
+	.byte		N18   , Fn3 , v127
+	.byte		N18   , An3 , v127
+	.byte		N18   , Cn4 , v127
+	.byte	W18
+	.byte		N12   , Dn3 , v127
+	.byte		N12   , Fn3 , v127
+	.byte		N12   , An3 , v127
+	.byte		N12   , Cn4 , v127
+	.byte	W12
+	.byte		N54   , Dn3 , v127
+	.byte		N54   , Fn3 , v127
+	.byte		N54   , An3 , v127
+	.byte		N54   , Cn4 , v127
+	.byte	W60
+@ 056   ----------------------------------------
+	.byte		N06   , Bn2 , v127
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , Dn3 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , Gn3 , v127
+	.byte	W06
+	.byte		N18   , Bn2 , v127
+	.byte		N18   , Cn3 , v127
+	.byte		N18   , Dn3 , v127
+	.byte		N18   , En3 , v127
+	.byte		N18   , Gn3 , v127
+	.byte	W18
+	.byte		N12   , Bn2 , v127
+	.byte		N12   , Cn3 , v127
+	.byte		N12   , Dn3 , v127
+	.byte		N12   , En3 , v127
+	.byte		N12   , Gn3 , v127
+	.byte	W12
+	.byte		N54   , Bn2 , v127
+	.byte		N54   , Cn3 , v127
+	.byte		N54   , Dn3 , v127
+	.byte		N54   , En3 , v127
+	.byte		N54   , Gn3 , v127
+	.byte	W60
+@ 057   ----------------------------------------
+	.byte		N06   , Dn3 , v127
+	.byte		N06   , Fn3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Cn4 , v127
+	.byte	W06
+	.byte		N18   , Dn3 , v127
+	.byte		N18   , Fn3 , v127
+	.byte		N18   , An3 , v127
+	.byte		N18   , Cn4 , v127
+	.byte	W18
+	.byte		N12   , Dn3 , v127
+	.byte		N12   , Fn3 , v127
+	.byte		N12   , An3 , v127
+	.byte		N12   , Cn4 , v127
+	.byte	W12
+	.byte		N54   , Dn3 , v127
+	.byte		N54   , Fn3 , v127
+	.byte		N54   , An3 , v127
+	.byte		N54   , Cn4 , v127
+	.byte	W60
+@ 058   ----------------------------------------
+	.byte		N06   , Bn2 , v127
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , Dn3 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , Gn3 , v127
+	.byte	W06
+	.byte		N18   , Bn2 , v127
+	.byte		N18   , Cn3 , v127
+	.byte		N18   , Dn3 , v127
+	.byte		N18   , En3 , v127
+	.byte		N18   , Gn3 , v127
+	.byte	W18
+	.byte		N12   , Bn2 , v127
+	.byte		N12   , Cn3 , v127
+	.byte		N12   , Dn3 , v127
+	.byte		N12   , En3 , v127
+	.byte		N12   , Gn3 , v127
+	.byte	W12
+	.byte		N54   , Bn2 , v127
+	.byte		N54   , Cn3 , v127
+	.byte		N54   , Dn3 , v127
+	.byte		N54   , En3 , v127
+	.byte		N54   , Gn3 , v127
+	.byte	W60
+@ 059   ----------------------------------------
+	.byte		N24   , Dn3 , v127
+	.byte		N24   , Fn3 , v127
+	.byte		N24   , An3 , v127
+	.byte		N24   , Cn4 , v127
+	.byte	W24
+	.byte		N12   , Dn3 , v127
+	.byte		N12   , Fn3 , v127
+	.byte		N12   , An3 , v127
+	.byte		N12   , Cn4 , v127
+	.byte	W12
+	.byte		N36   , Dn3 , v127
+	.byte		N36   , Fn3 , v127
+	.byte		N36   , An3 , v127
+	.byte		N36   , Cn4 , v127
+	.byte	W36
+	.byte		N24   , Dn3 , v127
+	.byte		N24   , Fn3 , v127
+	.byte		N24   , Gn3 , v127
+	.byte		N24   , Bn3 , v127
+	.byte	W24
+@ 060   ----------------------------------------
+	.byte	FINE
+
+@**************** Track 4 (Midi-Chn.4) ****************@
+
+mus_sm3dw_beachlevel_4:
+	.byte	KEYSH , mus_sm3dw_beachlevel_key+0
+@ 000   ----------------------------------------
+	.byte		VOICE , 4
+	.byte		VOL   , 127*mus_sm3dw_beachlevel_mvl/mxv
+	.byte		N12   , Cn1 , v127
+	.byte	W18
+	.byte		N18   , Cn1 , v127
+	.byte	W18
+	.byte		N18   , Cn1 , v127
+	.byte	W18
+	.byte		N06   , Cn1 , v127
+	.byte	W06
+	.byte		N12   , Cn1 , v127
+	.byte	W12
+	.byte		N12   , Cn1 , v127
+	.byte	W24
+@ 001   ----------------------------------------
+	.byte		N12   , Cn1 , v127
+	.byte	W18
+	.byte		N18   , Cn1 , v127
+	.byte	W18
+	.byte		N18   , Cn1 , v127
+	.byte	W18
+	.byte		N06   , Cn1 , v127
+	.byte	W06
+	.byte		N12   , Cn1 , v127
+	.byte	W12
+	.byte		N12   , Cn1 , v127
+	.byte	W24
+@ 002   ----------------------------------------
+	.byte		N12   , Cn1 , v127
+	.byte	W18
+	.byte		N18   , Cn1 , v127
+	.byte	W18
+	.byte		N18   , Cn1 , v127
+	.byte	W18
+	.byte		N06   , Cn1 , v127
+	.byte	W06
+	.byte		N12   , Cn1 , v127
+	.byte	W12
+	.byte		N12   , Cn1 , v127
+	.byte	W24
+@ 003   ----------------------------------------
+	.byte		N12   , Cn1 , v127
+	.byte	W18
+	.byte		N18   , Cn1 , v127
+	.byte	W18
+	.byte		N18   , Cn1 , v127
+	.byte	W24
+	.byte		N12   , En1 , v127
+	.byte	W12
+	.byte		N12   , Dn1 , v127
+	.byte	W12
+	.byte		N12   , Gn1 , v127
+	.byte	W12
+@ 004   ----------------------------------------
+	.byte		N18   , Cn1 , v127
+	.byte	W18
+	.byte		N06   , Cn1 , v127
+	.byte	W06
+	.byte		N12   , Gn1 , v127
+	.byte	W12
+	.byte		N18   , Cn2 , v127
+	.byte	W24
+	.byte		N12   , Cn1 , v127
+	.byte	W12
+	.byte		N12   , Gn1 , v127
+	.byte	W12
+	.byte		N12   , Cn2 , v127
+	.byte	W12
+@ 005   ----------------------------------------
+	.byte		N18   , Fn0 , v127
+	.byte	W18
+	.byte		N06   , Fn0 , v127
+	.byte	W06
+	.byte		N12   , Cn1 , v127
+	.byte	W12
+	.byte		N24   , Fn1 , v127
+	.byte	W24
+	.byte		N12   , Cn1 , v127
+	.byte	W12
+	.byte		N12   , Cn1 , v127
+	.byte	W24
+@ 006   ----------------------------------------
+	.byte		N18   , Cn1 , v127
+	.byte	W18
+	.byte		N06   , Cn1 , v127
+	.byte	W06
+	.byte		N12   , Gn1 , v127
+	.byte	W12
+	.byte		N18   , Cn2 , v127
+	.byte	W24
+	.byte		N12   , Cn1 , v127
+	.byte	W12
+	.byte		N12   , Gn1 , v127
+	.byte	W12
+	.byte		N12   , Cn2 , v127
+	.byte	W12
+@ 007   ----------------------------------------
+	.byte		N18   , Fn0 , v127
+	.byte	W18
+	.byte		N06   , Fn0 , v127
+	.byte	W06
+	.byte		N12   , Cn1 , v127
+	.byte	W12
+	.byte		N24   , Fn1 , v127
+	.byte	W24
+	.byte		N12   , Cn1 , v127
+	.byte	W12
+	.byte		N12   , Fn1 , v127
+	.byte	W12
+	.byte		N12   , Dn1 , v127
+	.byte	W12
+@ 008   ----------------------------------------
+	.byte		N06   , En1 , v127
+	.byte	W06
+	.byte		N12   , En1 , v127
+	.byte	W12
+	.byte		N06   , En1 , v127
+	.byte	W06
+	.byte		N12   , Bn0 , v127
+	.byte	W12
+	.byte		N24   , En1 , v127
+	.byte	W24
+	.byte		N12   , An0 , v127
+	.byte	W12
+	.byte		N12   , En1 , v127
+	.byte	W12
+	.byte		N12   , Cn1 , v127
+	.byte	W12
+@ 009   ----------------------------------------
+	.byte		N18   , Dn1 , v127
+	.byte	W18
+	.byte		N06   , Dn1 , v127
+	.byte	W06
+	.byte		N12   , An0 , v127
+	.byte	W12
+	.byte		N12   , Dn1 , v127
+	.byte	W12
+	.byte		N12   , Gn0 , v127
+	.byte	W12
+	.byte		N12   , Bn0 , v127
+	.byte	W12
+	.byte		N12   , Dn1 , v127
+	.byte	W12
+	.byte		N12   , En1 , v127
+	.byte	W12
+@ 010   ----------------------------------------
+	.byte		N18   , Cs1 , v127
+	.byte	W18
+	.byte		N06   , Cs1 , v127
+	.byte	W06
+	.byte		N12   , Gs1 , v127
+	.byte	W12
+	.byte		N24   , Cs2 , v127
+	.byte	W24
+	.byte		N12   , Gs1 , v127
+	.byte	W12
+	.byte		N12   , Cs2 , v127
+	.byte	W12
+	.byte		N12   , Cs1 , v127
+	.byte	W12
+@ 011   ----------------------------------------
+	.byte		N18   , Fs0 , v127
+	.byte	W18
+	.byte		N06   , Fs0 , v127
+	.byte	W06
+	.byte		N12   , Cs1 , v127
+	.byte	W12
+	.byte		N24   , Fs1 , v127
+	.byte	W24
+	.byte		N12   , Cs1 , v127
+	.byte	W12
+	.byte		N12   , Gs1 , v127
+	.byte	W12
+	.byte		N12   , Cs1 , v127
+	.byte	W12
+@ 012   ----------------------------------------
+	.byte		N18   , Cs1 , v127
+	.byte	W18
+	.byte		N06   , Cs1 , v127
+	.byte	W06
+	.byte		N12   , Gs1 , v127
+	.byte	W12
+	.byte		N24   , Cs2 , v127
+	.byte	W24
+	.byte		N12   , Gs1 , v127
+	.byte	W12
+	.byte		N12   , Cs2 , v127
+	.byte	W12
+	.byte		N12   , Cs1 , v127
+	.byte	W12
+@ 013   ----------------------------------------
+	.byte		N18   , Fs0 , v127
+	.byte	W18
+	.byte		N06   , Fs0 , v127
+	.byte	W06
+	.byte		N12   , Cs1 , v127
+	.byte	W12
+	.byte		N24   , Fs1 , v127
+	.byte	W24
+	.byte		N12   , Cs1 , v127
+	.byte	W12
+	.byte		N06   , Fs1 , v127
+	.byte	W06
+	.byte		N06   , Cs1 , v127
+	.byte	W06
+	.byte		N12   , Fs0 , v127
+	.byte	W12
+@ 014   ----------------------------------------
+	.byte		N06   , Fn1 , v127
+	.byte	W06
+	.byte		N12   , Fn1 , v127
+	.byte	W12
+	.byte		N06   , Fn1 , v127
+	.byte	W06
+	.byte		N12   , Cn1 , v127
+	.byte	W12
+	.byte		N24   , Fn1 , v127
+	.byte	W24
+	.byte		N12   , As0 , v127
+	.byte	W12
+	.byte		N12   , Fn1 , v127
+	.byte	W12
+	.byte		N12   , Cs1 , v127
+	.byte	W12
+@ 015   ----------------------------------------
+	.byte		N06   , Ds1 , v127
+	.byte	W06
+	.byte		N12   , Ds1 , v127
+	.byte	W12
+	.byte		N06   , Ds1 , v127
+	.byte	W06
+	.byte		N12   , As0 , v127
+	.byte	W12
+	.byte		N06   , Ds1 , v127
+	.byte	W06
+	.byte		N18   , Gs0 , v127
+	.byte	W18
+	.byte		N12   , Gs0 , v127
+	.byte	W12
+	.byte		N12   , Gs0 , v127
+	.byte	W12
+	.byte		N12   , Cn1 , v127
+	.byte	W12
+@ 016   ----------------------------------------
+	.byte		N06   , Cs1 , v127
+	.byte	W06
+	.byte		N12   , Cs1 , v127
+	.byte	W12
+	.byte		N06   , Cs1 , v127
+	.byte	W06
+	.byte		N12   , Gs1 , v127
+	.byte	W12
+	.byte		N24   , Cs2 , v127
+	.byte	W24
+	.byte		N12   , Gs1 , v127
+	.byte	W12
+	.byte		N12   , Cs2 , v127
+	.byte	W12
+	.byte		N12   , Cs1 , v127
+	.byte	W12
+@ 017   ----------------------------------------
+	.byte		N06   , Bn0 , v127
+	.byte	W06
+	.byte		N12   , Bn0 , v127
+	.byte	W12
+	.byte		N06   , Bn0 , v127
+	.byte	W06
+	.byte		N12   , Gs1 , v127
+	.byte	W12
+	.byte		N24   , Cs2 , v127
+	.byte	W24
+	.byte		N12   , Cs2 , v127
+	.byte	W12
+	.byte		N12   , Gs2 , v127
+	.byte	W12
+	.byte		N12   , Cs2 , v127
+	.byte	W12
+@ 018   ----------------------------------------
+	.byte		N06   , As0 , v127
+	.byte	W06
+	.byte		N12   , As0 , v127
+	.byte	W12
+	.byte		N06   , As0 , v127
+	.byte	W06
+	.byte		N12   , Fn1 , v127
+	.byte	W12
+	.byte		N24   , As0 , v127
+	.byte	W24
+	.byte		N12   , Fn1 , v127
+	.byte	W12
+	.byte		N12   , As1 , v127
+	.byte	W12
+	.byte		N12   , As0 , v127
+	.byte	W12
+@ 019   ----------------------------------------
+	.byte		N06   , An0 , v127
+	.byte	W06
+	.byte		N12   , An0 , v127
+	.byte	W12
+	.byte		N06   , An0 , v127
+	.byte	W06
+	.byte		N12   , Cs1 , v127
+	.byte	W12
+	.byte		N24   , An1 , v127
+	.byte	W24
+	.byte		N12   , Cs1 , v127
+	.byte	W12
+	.byte		N12   , An1 , v127
+	.byte	W12
+	.byte		N12   , Cs1 , v127
+	.byte	W12
+@ 020   ----------------------------------------
+	.byte		N06   , Gs0 , v127
+	.byte	W06
+	.byte		N12   , Gs0 , v127
+	.byte	W12
+	.byte		N06   , Gs0 , v127
+	.byte	W06
+	.byte		N12   , Cs1 , v127
+	.byte	W12
+	.byte		N24   , Gs1 , v127
+	.byte	W24
+	.byte		N12   , Gs0 , v127
+	.byte	W12
+	.byte		N12   , Cs1 , v127
+	.byte	W12
+	.byte		N12   , Gs1 , v127
+	.byte	W12
+@ 021   ----------------------------------------
+	.byte		N18   , Ds1 , v127
+	.byte	W18
+	.byte		N06   , Ds1 , v127
+	.byte	W06
+	.byte		N12   , As1 , v127
+	.byte	W12
+	.byte		N24   , Gs0 , v127
+	.byte	W24
+	.byte		N12   , Gs1 , v127
+	.byte	W12
+	.byte		N12   , Ds1 , v127
+	.byte	W12
+	.byte		N12   , Gs1 , v127
+	.byte	W12
+@ 022   ----------------------------------------
+	.byte		N18   , Cs1 , v127
+	.byte	W18
+	.byte		N06   , Cs1 , v127
+	.byte	W06
+	.byte		N12   , Gs1 , v127
+	.byte	W12
+	.byte		N24   , Cs2 , v127
+	.byte	W24
+	.byte		N12   , Gs1 , v127
+	.byte	W12
+	.byte		N12   , Cs2 , v127
+	.byte	W12
+	.byte		N12   , Cs1 , v127
+	.byte	W12
+@ 023   ----------------------------------------
+	.byte		N06   , Dn1 , v127
+	.byte	W06
+	.byte		N12   , Dn1 , v127
+	.byte	W12
+	.byte		N06   , Dn1 , v127
+	.byte	W06
+	.byte		N12   , Dn1 , v127
+	.byte	W12
+	.byte		N24   , Cs1 , v127
+	.byte	W24
+	.byte		N12   , Gn1 , v127
+	.byte	W12
+	.byte		N12   , Gn0 , v127
+	.byte	W12
+	.byte		N12   , Bn0 , v127
+	.byte	W12
+@ 024   ----------------------------------------
+	.byte		N24   , Cn1 , v127
+	.byte	W36
+	.byte		N24   , Cn1 , v127
+	.byte	W24
+	.byte		N12   , Cn1 , v127
+	.byte	W12
+	.byte		N12   , Cn1 , v127
+	.byte	W24
+@ 025   ----------------------------------------
+	.byte		N24   , Cn1 , v127
+	.byte	W36
+	.byte		N18   , Cn1 , v127
+	.byte	W18
+	.byte		N06   , Cn1 , v127
+	.byte	W06
+	.byte		N12   , Cn1 , v127
+	.byte	W12
+	.byte		N12   , Cn1 , v127
+	.byte	W24
+@ 026   ----------------------------------------
+	.byte		N24   , Cn1 , v127
+	.byte	W36
+	.byte		N24   , Cn1 , v127
+	.byte	W24
+	.byte		N12   , Cn1 , v127
+	.byte	W12
+	.byte		N12   , Cn1 , v127
+	.byte	W24
+@ 027   ----------------------------------------
+	.byte		N24   , Cn1 , v127
+	.byte	W36
+	.byte		N18   , Cn1 , v127
+	.byte	W18
+	.byte		N06   , Cn1 , v127
+	.byte	W06
+	.byte		N12   , Cn1 , v127
+	.byte	W12
+	.byte		N12   , Cn1 , v127
+	.byte	W24
+@ 028   ----------------------------------------
+	.byte		N24   , Cn1 , v127
+	.byte	W36
+	.byte		N24   , Cn1 , v127
+	.byte	W24
+	.byte		N12   , Cn1 , v127
+	.byte	W12
+	.byte		N12   , Cn1 , v127
+	.byte	W24
+@ 029   ----------------------------------------
+	.byte		N24   , Cn1 , v127
+	.byte	W36
+	.byte		N18   , Cn1 , v127
+	.byte	W18
+	.byte		N06   , Cn1 , v127
+	.byte	W06
+	.byte		N12   , Cn1 , v127
+	.byte	W12
+	.byte		N12   , Cn1 , v127
+	.byte	W24
+@ 030   ----------------------------------------
+	.byte		N24   , Cn1 , v127
+	.byte	W36
+	.byte		N24   , Cn1 , v127
+	.byte	W24
+	.byte		N12   , Cn1 , v127
+	.byte	W12
+	.byte		N12   , Cn1 , v127
+	.byte	W24
+@ 031   ----------------------------------------
+	.byte		N24   , Cn1 , v127
+	.byte	W36
+	.byte		N24   , Cn1 , v127
+	.byte	W24
+	.byte		N12   , Cn1 , v127
+	.byte	W12
+	.byte		N12   , Gn1 , v127
+	.byte	W12
+	.byte		N12   , Gn0 , v127
+	.byte	W12
+@ 032   ----------------------------------------
+	.byte		N18   , Cn1 , v127
+	.byte	W18
+	.byte		N06   , Cn1 , v127
+	.byte	W06
+	.byte		N12   , Gn1 , v127
+	.byte	W12
+	.byte		N18   , Cn2 , v127
+	.byte	W24
+	.byte		N12   , Cn1 , v127
+	.byte	W12
+	.byte		N12   , Gn1 , v127
+	.byte	W12
+	.byte		N12   , Cn2 , v127
+	.byte	W12
+@ 033   ----------------------------------------
+	.byte		N18   , Fn0 , v127
+	.byte	W18
+	.byte		N06   , Fn0 , v127
+	.byte	W06
+	.byte		N12   , Cn1 , v127
+	.byte	W12
+	.byte		N24   , Fn1 , v127
+	.byte	W24
+	.byte		N12   , Cn1 , v127
+	.byte	W12
+	.byte		N12   , Cn1 , v127
+	.byte	W24
+@ 034   ----------------------------------------
+	.byte		N18   , Cn1 , v127
+	.byte	W18
+	.byte		N06   , Cn1 , v127
+	.byte	W06
+	.byte		N12   , Gn1 , v127
+	.byte	W12
+	.byte		N18   , Cn2 , v127
+	.byte	W24
+	.byte		N12   , Cn1 , v127
+	.byte	W12
+	.byte		N12   , Gn1 , v127
+	.byte	W12
+	.byte		N12   , Cn2 , v127
+	.byte	W12
+@ 035   ----------------------------------------
+	.byte		N18   , Fn0 , v127
+	.byte	W18
+	.byte		N06   , Fn0 , v127
+	.byte	W06
+	.byte		N12   , Cn1 , v127
+	.byte	W12
+	.byte		N24   , Fn1 , v127
+	.byte	W24
+	.byte		N12   , Cn1 , v127
+	.byte	W12
+	.byte		N12   , Fn1 , v127
+	.byte	W12
+	.byte		N12   , Dn1 , v127
+	.byte	W12
+@ 036   ----------------------------------------
+	.byte		N06   , En1 , v127
+	.byte	W06
+	.byte		N12   , En1 , v127
+	.byte	W12
+	.byte		N06   , En1 , v127
+	.byte	W06
+	.byte		N12   , Bn0 , v127
+	.byte	W12
+	.byte		N24   , En1 , v127
+	.byte	W24
+	.byte		N12   , An0 , v127
+	.byte	W12
+	.byte		N12   , En1 , v127
+	.byte	W12
+	.byte		N12   , Cn1 , v127
+	.byte	W12
+@ 037   ----------------------------------------
+	.byte		N18   , Dn1 , v127
+	.byte	W18
+	.byte		N06   , Dn1 , v127
+	.byte	W06
+	.byte		N12   , An0 , v127
+	.byte	W12
+	.byte		N12   , Dn1 , v127
+	.byte	W12
+	.byte		N12   , Gn0 , v127
+	.byte	W12
+	.byte		N12   , Bn0 , v127
+	.byte	W12
+	.byte		N12   , Dn1 , v127
+	.byte	W12
+	.byte		N12   , En1 , v127
+	.byte	W12
+@ 038   ----------------------------------------
+	.byte		N18   , Cs1 , v127
+	.byte	W18
+	.byte		N06   , Cs1 , v127
+	.byte	W06
+	.byte		N12   , Gs1 , v127
+	.byte	W12
+	.byte		N24   , Cs2 , v127
+	.byte	W24
+	.byte		N12   , Gs1 , v127
+	.byte	W12
+	.byte		N12   , Cs2 , v127
+	.byte	W12
+	.byte		N12   , Cs1 , v127
+	.byte	W12
+@ 039   ----------------------------------------
+	.byte		N18   , Fs0 , v127
+	.byte	W18
+	.byte		N06   , Fs0 , v127
+	.byte	W06
+	.byte		N12   , Cs1 , v127
+	.byte	W12
+	.byte		N24   , Fs1 , v127
+	.byte	W24
+	.byte		N12   , Cs1 , v127
+	.byte	W12
+	.byte		N12   , Gs1 , v127
+	.byte	W12
+	.byte		N12   , Cs1 , v127
+	.byte	W12
+@ 040   ----------------------------------------
+	.byte		N18   , Cs1 , v127
+	.byte	W18
+	.byte		N06   , Cs1 , v127
+	.byte	W06
+	.byte		N12   , Gs1 , v127
+	.byte	W12
+	.byte		N24   , Cs2 , v127
+	.byte	W24
+	.byte		N12   , Gs1 , v127
+	.byte	W12
+	.byte		N12   , Cs2 , v127
+	.byte	W12
+	.byte		N12   , Cs1 , v127
+	.byte	W12
+@ 041   ----------------------------------------
+	.byte		N18   , Fs0 , v127
+	.byte	W18
+	.byte		N06   , Fs0 , v127
+	.byte	W06
+	.byte		N12   , Cs1 , v127
+	.byte	W12
+	.byte		N24   , Fs1 , v127
+	.byte	W24
+	.byte		N12   , Cs1 , v127
+	.byte	W12
+	.byte		N06   , Fs1 , v127
+	.byte	W06
+	.byte		N06   , Cs1 , v127
+	.byte	W06
+	.byte		N12   , Fs0 , v127
+	.byte	W12
+@ 042   ----------------------------------------
+	.byte		N06   , Fn1 , v127
+	.byte	W06
+	.byte		N12   , Fn1 , v127
+	.byte	W12
+	.byte		N06   , Fn1 , v127
+	.byte	W06
+	.byte		N12   , Cn1 , v127
+	.byte	W12
+	.byte		N24   , Fn1 , v127
+	.byte	W24
+	.byte		N12   , As0 , v127
+	.byte	W12
+	.byte		N12   , Fn1 , v127
+	.byte	W12
+	.byte		N12   , Cs1 , v127
+	.byte	W12
+@ 043   ----------------------------------------
+	.byte		N06   , Ds1 , v127
+	.byte	W06
+	.byte		N12   , Ds1 , v127
+	.byte	W12
+	.byte		N06   , Ds1 , v127
+	.byte	W06
+	.byte		N12   , As0 , v127
+	.byte	W12
+	.byte		N06   , Ds1 , v127
+	.byte	W06
+	.byte		N18   , Gs0 , v127
+	.byte	W18
+	.byte		N12   , Gs0 , v127
+	.byte	W12
+	.byte		N12   , Gs0 , v127
+	.byte	W12
+	.byte		N12   , Cn1 , v127
+	.byte	W12
+@ 044   ----------------------------------------
+	.byte		N06   , Cs1 , v127
+	.byte	W06
+	.byte		N12   , Cs1 , v127
+	.byte	W12
+	.byte		N06   , Cs1 , v127
+	.byte	W06
+	.byte		N12   , Gs1 , v127
+	.byte	W12
+	.byte		N24   , Cs2 , v127
+	.byte	W24
+	.byte		N12   , Gs1 , v127
+	.byte	W12
+	.byte		N12   , Cs2 , v127
+	.byte	W12
+	.byte		N12   , Cs1 , v127
+	.byte	W12
+@ 045   ----------------------------------------
+	.byte		N06   , Bn0 , v127
+	.byte	W06
+	.byte		N12   , Bn0 , v127
+	.byte	W12
+	.byte		N06   , Bn0 , v127
+	.byte	W06
+	.byte		N12   , Gs1 , v127
+	.byte	W12
+	.byte		N24   , Cs2 , v127
+	.byte	W24
+	.byte		N12   , Cs2 , v127
+	.byte	W12
+	.byte		N12   , Gs2 , v127
+	.byte	W12
+	.byte		N12   , Cs2 , v127
+	.byte	W12
+@ 046   ----------------------------------------
+	.byte		N06   , As0 , v127
+	.byte	W06
+	.byte		N12   , As0 , v127
+	.byte	W12
+	.byte		N06   , As0 , v127
+	.byte	W06
+	.byte		N12   , Fn1 , v127
+	.byte	W12
+	.byte		N24   , As0 , v127
+	.byte	W24
+	.byte		N12   , Fn1 , v127
+	.byte	W12
+	.byte		N12   , As1 , v127
+	.byte	W12
+	.byte		N12   , As0 , v127
+	.byte	W12
+@ 047   ----------------------------------------
+	.byte		N06   , An0 , v127
+	.byte	W06
+	.byte		N12   , An0 , v127
+	.byte	W12
+	.byte		N06   , An0 , v127
+	.byte	W06
+	.byte		N12   , Cs1 , v127
+	.byte	W12
+	.byte		N24   , An1 , v127
+	.byte	W24
+	.byte		N12   , Cs1 , v127
+	.byte	W12
+	.byte		N12   , An1 , v127
+	.byte	W12
+	.byte		N12   , Cs1 , v127
+	.byte	W12
+@ 048   ----------------------------------------
+	.byte		N06   , Gs0 , v127
+	.byte	W06
+	.byte		N12   , Gs0 , v127
+	.byte	W12
+	.byte		N06   , Gs0 , v127
+	.byte	W06
+	.byte		N12   , Cs1 , v127
+	.byte	W12
+	.byte		N24   , Gs1 , v127
+	.byte	W24
+	.byte		N12   , Gs0 , v127
+	.byte	W12
+	.byte		N12   , Cs1 , v127
+	.byte	W12
+	.byte		N12   , Gs1 , v127
+	.byte	W12
+@ 049   ----------------------------------------
+	.byte		N18   , Ds1 , v127
+	.byte	W18
+	.byte		N06   , Ds1 , v127
+	.byte	W06
+	.byte		N12   , As1 , v127
+	.byte	W12
+	.byte		N24   , Gs0 , v127
+	.byte	W24
+	.byte		N12   , Gs1 , v127
+	.byte	W12
+	.byte		N12   , Ds1 , v127
+	.byte	W12
+	.byte		N12   , Gs1 , v127
+	.byte	W12
+@ 050   ----------------------------------------
+	.byte		N18   , Cs1 , v127
+	.byte	W18
+	.byte		N06   , Cs1 , v127
+	.byte	W06
+	.byte		N12   , Gs1 , v127
+	.byte	W12
+	.byte		N24   , Cs2 , v127
+	.byte	W24
+	.byte		N12   , Gs1 , v127
+	.byte	W12
+	.byte		N12   , Cs2 , v127
+	.byte	W12
+	.byte		N12   , Cs1 , v127
+	.byte	W12
+@ 051   ----------------------------------------
+	.byte		N06   , Dn1 , v127
+	.byte	W06
+	.byte		N12   , Dn1 , v127
+	.byte	W12
+	.byte		N06   , Dn1 , v127
+	.byte	W06
+	.byte		N12   , Dn1 , v127
+	.byte	W12
+	.byte		N24   , Cs1 , v127
+	.byte	W24
+	.byte		N12   , Gn1 , v127
+	.byte	W12
+	.byte		N12   , Gn0 , v127
+	.byte	W12
+	.byte		N12   , Bn0 , v127
+	.byte	W12
+@ 052   ----------------------------------------
+	.byte		N24   , Cn1 , v127
+	.byte	W36
+	.byte		N24   , Cn1 , v127
+	.byte	W24
+	.byte		N12   , Cn1 , v127
+	.byte	W12
+	.byte		N12   , Cn1 , v127
+	.byte	W24
+@ 053   ----------------------------------------
+	.byte		N24   , Cn1 , v127
+	.byte	W36
+	.byte		N18   , Cn1 , v127
+	.byte	W18
+	.byte		N06   , Cn1 , v127
+	.byte	W06
+	.byte		N12   , Cn1 , v127
+	.byte	W12
+	.byte		N12   , Cn1 , v127
+	.byte	W24
+@ 054   ----------------------------------------
+	.byte		N24   , Cn1 , v127
+	.byte	W36
+	.byte		N24   , Cn1 , v127
+	.byte	W24
+	.byte		N12   , Cn1 , v127
+	.byte	W12
+	.byte		N12   , Cn1 , v127
+	.byte	W24
+@ 055   ----------------------------------------
+	.byte		N24   , Cn1 , v127
+	.byte	W36
+	.byte		N18   , Cn1 , v127
+	.byte	W18
+	.byte		N06   , Cn1 , v127
+	.byte	W06
+	.byte		N12   , Cn1 , v127
+	.byte	W12
+	.byte		N12   , Cn1 , v127
+	.byte	W24
+@ 056   ----------------------------------------
+	.byte		N24   , Cn1 , v127
+	.byte	W36
+	.byte		N24   , Cn1 , v127
+	.byte	W24
+	.byte		N12   , Cn1 , v127
+	.byte	W12
+	.byte		N12   , Cn1 , v127
+	.byte	W24
+@ 057   ----------------------------------------
+	.byte		N24   , Cn1 , v127
+	.byte	W36
+	.byte		N18   , Cn1 , v127
+	.byte	W18
+	.byte		N06   , Cn1 , v127
+	.byte	W06
+	.byte		N12   , Cn1 , v127
+	.byte	W12
+	.byte		N12   , Cn1 , v127
+	.byte	W24
+@ 058   ----------------------------------------
+	.byte		N24   , Cn1 , v127
+	.byte	W36
+	.byte		N24   , Cn1 , v127
+	.byte	W24
+	.byte		N12   , Cn1 , v127
+	.byte	W12
+	.byte		N12   , Cn1 , v127
+	.byte	W24
+@ 059   ----------------------------------------
+	.byte		N24   , Cn1 , v127
+	.byte	W36
+	.byte		N24   , Cn1 , v127
+	.byte	W24
+	.byte		N12   , Cn1 , v127
+	.byte	W12
+	.byte		N12   , Gn1 , v127
+	.byte	W12
+	.byte		N12   , Gn0 , v127
+	.byte	W12
+@ 060   ----------------------------------------
+	.byte	FINE
+
+@**************** Track 5 (Midi-Chn.5) ****************@
+
+mus_sm3dw_beachlevel_5:
+	.byte	KEYSH , mus_sm3dw_beachlevel_key+0
+@ 000   ----------------------------------------
+	.byte		VOICE , 5
+	.byte		VOL   , 127*mus_sm3dw_beachlevel_mvl/mxv
+	.byte	W96
+@ 001   ----------------------------------------
+	.byte	W96
+@ 002   ----------------------------------------
+	.byte	W96
+@ 003   ----------------------------------------
+	.byte	W96
+@ 004   ----------------------------------------
+	.byte		N18   , Gn3 , v127
+	.byte	W18
+	.byte		N18   , Cn4 , v127
+	.byte	W18
+	.byte		N96   , Gn4 , v127
+	.byte	W60
+@ 005   ----------------------------------------
+	.byte	W36
+	.byte		N06   , An4 , v127
+	.byte	W06
+	.byte		N12   , Gn4 , v127
+	.byte	W12
+	.byte		N18   , Fn4 , v127
+	.byte	W18
+	.byte		N12   , En4 , v127
+	.byte	W12
+	.byte		N12   , Fn4 , v127
+	.byte	W12
+@ 006   ----------------------------------------
+	.byte		N18   , En4 , v127
+	.byte	W18
+	.byte		N18   , Cn4 , v127
+	.byte	W18
+	.byte		N96   , Gn3 , v127
+	.byte	W60
+@ 007   ----------------------------------------
+	.byte	W36
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N12   , Gn3 , v127
+	.byte	W12
+	.byte		N18   , Fn3 , v127
+	.byte	W18
+	.byte		N12   , En3 , v127
+	.byte	W12
+	.byte		N12   , Fn3 , v127
+	.byte	W12
+@ 008   ----------------------------------------
+	.byte		N18   , En3 , v127
+	.byte	W18
+	.byte		N18   , Gn3 , v127
+	.byte	W18
+	.byte		N24   , Cn4 , v127
+	.byte	W24
+	.byte		N36   , En4 , v127
+	.byte	W36
+@ 009   ----------------------------------------
+	.byte		N02   , En4 , v127
+	.byte	W02
+	.byte		N16   , Fn4 , v127
+	.byte	W16
+	.byte		N18   , En4 , v127
+	.byte	W18
+	.byte		N12   , Dn4 , v127
+	.byte	W12
+	.byte		N24   , Cn4 , v127
+	.byte	W24
+	.byte		N24   , Dn4 , v127
+	.byte	W24
+@ 010   ----------------------------------------
+	.byte		N18   , Gs3 , v127
+	.byte	W18
+	.byte		N18   , Cs4 , v127
+	.byte	W18
+	.byte		N96   , Gs4 , v127
+	.byte	W60
+@ 011   ----------------------------------------
+	.byte	W36
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N12   , Gs4 , v127
+	.byte	W12
+	.byte		N18   , Fs4 , v127
+	.byte	W18
+	.byte		N12   , Fn4 , v127
+	.byte	W12
+	.byte		N12   , Fs4 , v127
+	.byte	W12
+@ 012   ----------------------------------------
+	.byte		N18   , Fn4 , v127
+	.byte	W18
+	.byte		N18   , Cs4 , v127
+	.byte	W18
+	.byte		N96   , Gs3 , v127
+	.byte	W60
+@ 013   ----------------------------------------
+	.byte	W36
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N12   , Gs3 , v127
+	.byte	W12
+	.byte		N18   , Fs3 , v127
+	.byte	W18
+	.byte		N12   , Fn3 , v127
+	.byte	W12
+	.byte		N12   , Fs3 , v127
+	.byte	W12
+@ 014   ----------------------------------------
+	.byte		N18   , Fn3 , v127
+	.byte	W18
+	.byte		N18   , Gs3 , v127
+	.byte	W18
+	.byte		N02   , Ds4 , v127
+	.byte	W02
+	.byte		N01   , En4 , v127
+	.byte	W01
+	.byte		N21   , Fn4 , v127
+	.byte	W21
+	.byte		N36   , Cs4 , v127
+	.byte	W36
+@ 015   ----------------------------------------
+	.byte		N02   , Fn4 , v127
+	.byte	W02
+	.byte		N16   , Fs4 , v127
+	.byte	W16
+	.byte		N18   , Fn4 , v127
+	.byte	W18
+	.byte		N12   , Cs4 , v127
+	.byte	W12
+	.byte		N24   , As3 , v127
+	.byte	W24
+	.byte		N24   , Cn4 , v127
+	.byte	W24
+@ 016   ----------------------------------------
+	.byte		N03   , Cs4 , v127
+	.byte	W03
+	.byte		N15   , Ds4 , v127
+	.byte	W15
+	.byte		N18   , Cs4 , v127
+	.byte	W18
+	.byte		N36   , Cs4 , v127
+	.byte	W48
+	.byte		N06   , Gs3 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+@ 017   ----------------------------------------
+	.byte		N06   , Cs4 , v127
+	.byte	W06
+	.byte		N12   , Cs4 , v127
+	.byte	W12
+	.byte		N15   , Cs4 , v127
+	.byte	W15
+	.byte		N03   , Dn4 , v127
+	.byte	W03
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N42   , Cs4 , v127
+	.byte	W54
+@ 018   ----------------------------------------
+	.byte		N03   , Dn4 , v127
+	.byte	W03
+	.byte		N15   , Ds4 , v127
+	.byte	W15
+	.byte		N15   , Cs4 , v127
+	.byte	W15
+	.byte		N03   , En4 , v127
+	.byte	W03
+	.byte		N12   , Fn4 , v127
+	.byte	W12
+	.byte		N36   , Cs4 , v127
+	.byte	W36
+	.byte		N06   , Gs3 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+@ 019   ----------------------------------------
+	.byte		N06   , Cs4 , v127
+	.byte	W06
+	.byte		N12   , Cs4 , v127
+	.byte	W12
+	.byte		N18   , Cs4 , v127
+	.byte	W18
+	.byte		N12   , Ds4 , v127
+	.byte	W12
+	.byte		N03   , En4 , v127
+	.byte	W03
+	.byte		N21   , Fn4 , v127
+	.byte	W21
+	.byte		N18   , Fs4 , v127
+	.byte	W24
+@ 020   ----------------------------------------
+	.byte		N06   , Fn4 , v127
+	.byte	W06
+	.byte		N12   , Fs4 , v127
+	.byte	W12
+	.byte		N12   , Fn4 , v127
+	.byte	W12
+	.byte		N12   , Cs4 , v127
+	.byte	W12
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N36   , Gs3 , v127
+	.byte	W48
+@ 021   ----------------------------------------
+	.byte		N18   , Fn3 , v127
+	.byte	W18
+	.byte		N18   , Fs3 , v127
+	.byte	W18
+	.byte		N12   , As3 , v127
+	.byte	W12
+	.byte		N18   , Cs4 , v127
+	.byte	W18
+	.byte		N06   , En4 , v127
+	.byte	W06
+	.byte		N18   , Ds4 , v127
+	.byte	W24
+@ 022   ----------------------------------------
+	.byte		TIE   , Cs4 , v127
+	.byte	W96
+@ 023   ----------------------------------------
+	.byte	W48
+	.byte		EOT   , Cs4
+	.byte	W48
+@ 024   ----------------------------------------
+	.byte	W96
+@ 025   ----------------------------------------
+	.byte	W96
+@ 026   ----------------------------------------
+	.byte	W96
+@ 027   ----------------------------------------
+	.byte	W96
+@ 028   ----------------------------------------
+	.byte	W96
+@ 029   ----------------------------------------
+	.byte	W96
+@ 030   ----------------------------------------
+	.byte	W96
+@ 031   ----------------------------------------
+	.byte	W96
+@ 032   ----------------------------------------
+	.byte		N18   , Gn3 , v127
+	.byte	W18
+	.byte		N18   , Cn4 , v127
+	.byte	W18
+	.byte		N96   , Gn4 , v127
+	.byte	W60
+@ 033   ----------------------------------------
+	.byte	W36
+	.byte		N06   , An4 , v127
+	.byte	W06
+	.byte		N12   , Gn4 , v127
+	.byte	W12
+	.byte		N18   , Fn4 , v127
+	.byte	W18
+	.byte		N12   , En4 , v127
+	.byte	W12
+	.byte		N12   , Fn4 , v127
+	.byte	W12
+@ 034   ----------------------------------------
+	.byte		N18   , En4 , v127
+	.byte	W18
+	.byte		N18   , Cn4 , v127
+	.byte	W18
+	.byte		N96   , Gn3 , v127
+	.byte	W60
+@ 035   ----------------------------------------
+	.byte	W36
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N12   , Gn3 , v127
+	.byte	W12
+	.byte		N18   , Fn3 , v127
+	.byte	W18
+	.byte		N12   , En3 , v127
+	.byte	W12
+	.byte		N12   , Fn3 , v127
+	.byte	W12
+@ 036   ----------------------------------------
+	.byte		N18   , En3 , v127
+	.byte	W18
+	.byte		N18   , Gn3 , v127
+	.byte	W18
+	.byte		N24   , Cn4 , v127
+	.byte	W24
+	.byte		N36   , En4 , v127
+	.byte	W36
+@ 037   ----------------------------------------
+	.byte		N02   , En4 , v127
+	.byte	W02
+	.byte		N16   , Fn4 , v127
+	.byte	W16
+	.byte		N18   , En4 , v127
+	.byte	W18
+	.byte		N12   , Dn4 , v127
+	.byte	W12
+	.byte		N24   , Cn4 , v127
+	.byte	W24
+	.byte		N24   , Dn4 , v127
+	.byte	W24
+@ 038   ----------------------------------------
+	.byte		N18   , Gs3 , v127
+	.byte	W18
+	.byte		N18   , Cs4 , v127
+	.byte	W18
+	.byte		N96   , Gs4 , v127
+	.byte	W60
+@ 039   ----------------------------------------
+	.byte	W36
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N12   , Gs4 , v127
+	.byte	W12
+	.byte		N18   , Fs4 , v127
+	.byte	W18
+	.byte		N12   , Fn4 , v127
+	.byte	W12
+	.byte		N12   , Fs4 , v127
+	.byte	W12
+@ 040   ----------------------------------------
+	.byte		N18   , Fn4 , v127
+	.byte	W18
+	.byte		N18   , Cs4 , v127
+	.byte	W18
+	.byte		N96   , Gs3 , v127
+	.byte	W60
+@ 041   ----------------------------------------
+	.byte	W36
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N12   , Gs3 , v127
+	.byte	W12
+	.byte		N18   , Fs3 , v127
+	.byte	W18
+	.byte		N12   , Fn3 , v127
+	.byte	W12
+	.byte		N12   , Fs3 , v127
+	.byte	W12
+@ 042   ----------------------------------------
+	.byte		N18   , Fn3 , v127
+	.byte	W18
+	.byte		N18   , Gs3 , v127
+	.byte	W18
+	.byte		N02   , Ds4 , v127
+	.byte	W02
+	.byte		N01   , En4 , v127
+	.byte	W01
+	.byte		N21   , Fn4 , v127
+	.byte	W21
+	.byte		N36   , Cs4 , v127
+	.byte	W36
+@ 043   ----------------------------------------
+	.byte		N02   , Fn4 , v127
+	.byte	W02
+	.byte		N16   , Fs4 , v127
+	.byte	W16
+	.byte		N18   , Fn4 , v127
+	.byte	W18
+	.byte		N12   , Cs4 , v127
+	.byte	W12
+	.byte		N24   , As3 , v127
+	.byte	W24
+	.byte		N24   , Cn4 , v127
+	.byte	W24
+@ 044   ----------------------------------------
+	.byte		N03   , Cs4 , v127
+	.byte	W03
+	.byte		N15   , Ds4 , v127
+	.byte	W15
+	.byte		N18   , Cs4 , v127
+	.byte	W18
+	.byte		N36   , Cs4 , v127
+	.byte	W48
+	.byte		N06   , Gs3 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+@ 045   ----------------------------------------
+	.byte		N06   , Cs4 , v127
+	.byte	W06
+	.byte		N12   , Cs4 , v127
+	.byte	W12
+	.byte		N15   , Cs4 , v127
+	.byte	W15
+	.byte		N03   , Dn4 , v127
+	.byte	W03
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N42   , Cs4 , v127
+	.byte	W54
+@ 046   ----------------------------------------
+	.byte		N03   , Dn4 , v127
+	.byte	W03
+	.byte		N15   , Ds4 , v127
+	.byte	W15
+	.byte		N15   , Cs4 , v127
+	.byte	W15
+	.byte		N03   , En4 , v127
+	.byte	W03
+	.byte		N12   , Fn4 , v127
+	.byte	W12
+	.byte		N36   , Cs4 , v127
+	.byte	W36
+	.byte		N06   , Gs3 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+@ 047   ----------------------------------------
+	.byte		N06   , Cs4 , v127
+	.byte	W06
+	.byte		N12   , Cs4 , v127
+	.byte	W12
+	.byte		N18   , Cs4 , v127
+	.byte	W18
+	.byte		N12   , Ds4 , v127
+	.byte	W12
+	.byte		N03   , En4 , v127
+	.byte	W03
+	.byte		N21   , Fn4 , v127
+	.byte	W21
+	.byte		N18   , Fs4 , v127
+	.byte	W24
+@ 048   ----------------------------------------
+	.byte		N06   , Fn4 , v127
+	.byte	W06
+	.byte		N12   , Fs4 , v127
+	.byte	W12
+	.byte		N12   , Fn4 , v127
+	.byte	W12
+	.byte		N12   , Cs4 , v127
+	.byte	W12
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N36   , Gs3 , v127
+	.byte	W48
+@ 049   ----------------------------------------
+	.byte		N18   , Fn3 , v127
+	.byte	W18
+	.byte		N18   , Fs3 , v127
+	.byte	W18
+	.byte		N12   , As3 , v127
+	.byte	W12
+	.byte		N18   , Cs4 , v127
+	.byte	W18
+	.byte		N06   , En4 , v127
+	.byte	W06
+	.byte		N18   , Ds4 , v127
+	.byte	W24
+@ 050   ----------------------------------------
+	.byte		TIE   , Cs4 , v127
+	.byte	W96
+@ 051   ----------------------------------------
+	.byte	W48
+	.byte		EOT   , Cs4
+	.byte	FINE
+
+@**************** Track 6 (Midi-Chn.6) ****************@
+
+mus_sm3dw_beachlevel_6:
+	.byte	KEYSH , mus_sm3dw_beachlevel_key+0
+@ 000   ----------------------------------------
+	.byte		VOICE , 6
+	.byte		VOL   , 127*mus_sm3dw_beachlevel_mvl/mxv
+	.byte	W96
+@ 001   ----------------------------------------
+	.byte	W96
+@ 002   ----------------------------------------
+	.byte	W96
+@ 003   ----------------------------------------
+	.byte	W96
+@ 004   ----------------------------------------
+	.byte	W06
+	.byte		N18   , Gn3 , v127
+	.byte	W18
+	.byte		N18   , Cn4 , v127
+	.byte	W18
+	.byte		N96   , Gn4 , v127
+	.byte	W54
+@ 005   ----------------------------------------
+	.byte	W42
+	.byte		N06   , An4 , v127
+	.byte	W06
+	.byte		N12   , Gn4 , v127
+	.byte	W12
+	.byte		N18   , Fn4 , v127
+	.byte	W18
+	.byte		N12   , En4 , v127
+	.byte	W12
+	.byte		N12   , Fn4 , v127
+	.byte	W06
+@ 006   ----------------------------------------
+	.byte	W06
+	.byte		N18   , En4 , v127
+	.byte	W18
+	.byte		N18   , Cn4 , v127
+	.byte	W18
+	.byte		N96   , Gn3 , v127
+	.byte	W54
+@ 007   ----------------------------------------
+	.byte	W42
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N12   , Gn3 , v127
+	.byte	W12
+	.byte		N18   , Fn3 , v127
+	.byte	W18
+	.byte		N12   , En3 , v127
+	.byte	W12
+	.byte		N12   , Fn3 , v127
+	.byte	W06
+@ 008   ----------------------------------------
+	.byte	W06
+	.byte		N18   , En3 , v127
+	.byte	W18
+	.byte		N18   , Gn3 , v127
+	.byte	W18
+	.byte		N24   , Cn4 , v127
+	.byte	W24
+	.byte		N36   , En4 , v127
+	.byte	W30
+@ 009   ----------------------------------------
+	.byte	W06
+	.byte		N02   , En4 , v127
+	.byte	W02
+	.byte		N16   , Fn4 , v127
+	.byte	W16
+	.byte		N18   , En4 , v127
+	.byte	W18
+	.byte		N12   , Dn4 , v127
+	.byte	W12
+	.byte		N24   , Cn4 , v127
+	.byte	W24
+	.byte		N24   , Dn4 , v127
+	.byte	W18
+@ 010   ----------------------------------------
+	.byte	W06
+	.byte		N18   , Gs3 , v127
+	.byte	W18
+	.byte		N18   , Cs4 , v127
+	.byte	W18
+	.byte		N96   , Gs4 , v127
+	.byte	W54
+@ 011   ----------------------------------------
+	.byte	W42
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N12   , Gs4 , v127
+	.byte	W12
+	.byte		N18   , Fs4 , v127
+	.byte	W18
+	.byte		N12   , Fn4 , v127
+	.byte	W12
+	.byte		N12   , Fs4 , v127
+	.byte	W06
+@ 012   ----------------------------------------
+	.byte	W06
+	.byte		N18   , Fn4 , v127
+	.byte	W18
+	.byte		N18   , Cs4 , v127
+	.byte	W18
+	.byte		N96   , Gs3 , v127
+	.byte	W54
+@ 013   ----------------------------------------
+	.byte	W42
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N12   , Gs3 , v127
+	.byte	W12
+	.byte		N18   , Fs3 , v127
+	.byte	W18
+	.byte		N12   , Fn3 , v127
+	.byte	W12
+	.byte		N12   , Fs3 , v127
+	.byte	W06
+@ 014   ----------------------------------------
+	.byte	W06
+	.byte		N18   , Fn3 , v127
+	.byte	W18
+	.byte		N18   , Gs3 , v127
+	.byte	W18
+	.byte		N02   , Ds4 , v127
+	.byte	W02
+	.byte		N01   , En4 , v127
+	.byte	W01
+	.byte		N21   , Fn4 , v127
+	.byte	W21
+	.byte		N36   , Cs4 , v127
+	.byte	W30
+@ 015   ----------------------------------------
+	.byte	W06
+	.byte		N02   , Fn4 , v127
+	.byte	W02
+	.byte		N16   , Fs4 , v127
+	.byte	W16
+	.byte		N18   , Fn4 , v127
+	.byte	W18
+	.byte		N12   , Cs4 , v127
+	.byte	W12
+	.byte		N24   , As3 , v127
+	.byte	W24
+	.byte		N24   , Cn4 , v127
+	.byte	W18
+@ 016   ----------------------------------------
+	.byte	W06
+	.byte		N03   , Cs4 , v127
+	.byte	W03
+	.byte		N15   , Ds4 , v127
+	.byte	W15
+	.byte		N18   , Cs4 , v127
+	.byte	W18
+	.byte		N36   , Cs4 , v127
+	.byte	W48
+	.byte		N06   , Gs3 , v127
+	.byte	W06
+@ 017   ----------------------------------------
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , Cs4 , v127
+	.byte	W06
+	.byte		N12   , Cs4 , v127
+	.byte	W12
+	.byte		N15   , Cs4 , v127
+	.byte	W15
+	.byte		N03   , Dn4 , v127
+	.byte	W03
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N42   , Cs4 , v127
+	.byte	W48
+@ 018   ----------------------------------------
+	.byte	W06
+	.byte		N03   , Dn4 , v127
+	.byte	W03
+	.byte		N15   , Ds4 , v127
+	.byte	W15
+	.byte		N15   , Cs4 , v127
+	.byte	W15
+	.byte		N03   , En4 , v127
+	.byte	W03
+	.byte		N12   , Fn4 , v127
+	.byte	W12
+	.byte		N36   , Cs4 , v127
+	.byte	W36
+	.byte		N06   , Gs3 , v127
+	.byte	W06
+@ 019   ----------------------------------------
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , Cs4 , v127
+	.byte	W06
+	.byte		N12   , Cs4 , v127
+	.byte	W12
+	.byte		N18   , Cs4 , v127
+	.byte	W18
+	.byte		N12   , Ds4 , v127
+	.byte	W12
+	.byte		N03   , En4 , v127
+	.byte	W03
+	.byte		N21   , Fn4 , v127
+	.byte	W21
+	.byte		N18   , Fs4 , v127
+	.byte	W18
+@ 020   ----------------------------------------
+	.byte	W06
+	.byte		N06   , Fn4 , v127
+	.byte	W06
+	.byte		N12   , Fs4 , v127
+	.byte	W12
+	.byte		N12   , Fn4 , v127
+	.byte	W12
+	.byte		N12   , Cs4 , v127
+	.byte	W12
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N36   , Gs3 , v127
+	.byte	W42
+@ 021   ----------------------------------------
+	.byte	W06
+	.byte		N18   , Fn3 , v127
+	.byte	W18
+	.byte		N18   , Fs3 , v127
+	.byte	W18
+	.byte		N12   , As3 , v127
+	.byte	W12
+	.byte		N18   , Cs4 , v127
+	.byte	W18
+	.byte		N06   , En4 , v127
+	.byte	W06
+	.byte		N18   , Ds4 , v127
+	.byte	W18
+@ 022   ----------------------------------------
+	.byte	W06
+	.byte		TIE   , Cs4 , v127
+	.byte	W90
+@ 023   ----------------------------------------
+	.byte	W54
+	.byte		EOT   , Cs4
+	.byte	W42
+@ 024   ----------------------------------------
+	.byte	W96
+@ 025   ----------------------------------------
+	.byte	W96
+@ 026   ----------------------------------------
+	.byte	W96
+@ 027   ----------------------------------------
+	.byte	W96
+@ 028   ----------------------------------------
+	.byte	W96
+@ 029   ----------------------------------------
+	.byte	W96
+@ 030   ----------------------------------------
+	.byte	W96
+@ 031   ----------------------------------------
+	.byte	W96
+@ 032   ----------------------------------------
+	.byte	W06
+	.byte		N18   , Gn3 , v127
+	.byte	W18
+	.byte		N18   , Cn4 , v127
+	.byte	W18
+	.byte		N96   , Gn4 , v127
+	.byte	W54
+@ 033   ----------------------------------------
+	.byte	W42
+	.byte		N06   , An4 , v127
+	.byte	W06
+	.byte		N12   , Gn4 , v127
+	.byte	W12
+	.byte		N18   , Fn4 , v127
+	.byte	W18
+	.byte		N12   , En4 , v127
+	.byte	W12
+	.byte		N12   , Fn4 , v127
+	.byte	W06
+@ 034   ----------------------------------------
+	.byte	W06
+	.byte		N18   , En4 , v127
+	.byte	W18
+	.byte		N18   , Cn4 , v127
+	.byte	W18
+	.byte		N96   , Gn3 , v127
+	.byte	W54
+@ 035   ----------------------------------------
+	.byte	W42
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N12   , Gn3 , v127
+	.byte	W12
+	.byte		N18   , Fn3 , v127
+	.byte	W18
+	.byte		N12   , En3 , v127
+	.byte	W12
+	.byte		N12   , Fn3 , v127
+	.byte	W06
+@ 036   ----------------------------------------
+	.byte	W06
+	.byte		N18   , En3 , v127
+	.byte	W18
+	.byte		N18   , Gn3 , v127
+	.byte	W18
+	.byte		N24   , Cn4 , v127
+	.byte	W24
+	.byte		N36   , En4 , v127
+	.byte	W30
+@ 037   ----------------------------------------
+	.byte	W06
+	.byte		N02   , En4 , v127
+	.byte	W02
+	.byte		N16   , Fn4 , v127
+	.byte	W16
+	.byte		N18   , En4 , v127
+	.byte	W18
+	.byte		N12   , Dn4 , v127
+	.byte	W12
+	.byte		N24   , Cn4 , v127
+	.byte	W24
+	.byte		N24   , Dn4 , v127
+	.byte	W18
+@ 038   ----------------------------------------
+	.byte	W06
+	.byte		N18   , Gs3 , v127
+	.byte	W18
+	.byte		N18   , Cs4 , v127
+	.byte	W18
+	.byte		N96   , Gs4 , v127
+	.byte	W54
+@ 039   ----------------------------------------
+	.byte	W42
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N12   , Gs4 , v127
+	.byte	W12
+	.byte		N18   , Fs4 , v127
+	.byte	W18
+	.byte		N12   , Fn4 , v127
+	.byte	W12
+	.byte		N12   , Fs4 , v127
+	.byte	W06
+@ 040   ----------------------------------------
+	.byte	W06
+	.byte		N18   , Fn4 , v127
+	.byte	W18
+	.byte		N18   , Cs4 , v127
+	.byte	W18
+	.byte		N96   , Gs3 , v127
+	.byte	W54
+@ 041   ----------------------------------------
+	.byte	W42
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N12   , Gs3 , v127
+	.byte	W12
+	.byte		N18   , Fs3 , v127
+	.byte	W18
+	.byte		N12   , Fn3 , v127
+	.byte	W12
+	.byte		N12   , Fs3 , v127
+	.byte	W06
+@ 042   ----------------------------------------
+	.byte	W06
+	.byte		N18   , Fn3 , v127
+	.byte	W18
+	.byte		N18   , Gs3 , v127
+	.byte	W18
+	.byte		N02   , Ds4 , v127
+	.byte	W02
+	.byte		N01   , En4 , v127
+	.byte	W01
+	.byte		N21   , Fn4 , v127
+	.byte	W21
+	.byte		N36   , Cs4 , v127
+	.byte	W30
+@ 043   ----------------------------------------
+	.byte	W06
+	.byte		N02   , Fn4 , v127
+	.byte	W02
+	.byte		N16   , Fs4 , v127
+	.byte	W16
+	.byte		N18   , Fn4 , v127
+	.byte	W18
+	.byte		N12   , Cs4 , v127
+	.byte	W12
+	.byte		N24   , As3 , v127
+	.byte	W24
+	.byte		N24   , Cn4 , v127
+	.byte	W18
+@ 044   ----------------------------------------
+	.byte	W06
+	.byte		N03   , Cs4 , v127
+	.byte	W03
+	.byte		N15   , Ds4 , v127
+	.byte	W15
+	.byte		N18   , Cs4 , v127
+	.byte	W18
+	.byte		N36   , Cs4 , v127
+	.byte	W48
+	.byte		N06   , Gs3 , v127
+	.byte	W06
+@ 045   ----------------------------------------
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , Cs4 , v127
+	.byte	W06
+	.byte		N12   , Cs4 , v127
+	.byte	W12
+	.byte		N15   , Cs4 , v127
+	.byte	W15
+	.byte		N03   , Dn4 , v127
+	.byte	W03
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N42   , Cs4 , v127
+	.byte	W48
+@ 046   ----------------------------------------
+	.byte	W06
+	.byte		N03   , Dn4 , v127
+	.byte	W03
+	.byte		N15   , Ds4 , v127
+	.byte	W15
+	.byte		N15   , Cs4 , v127
+	.byte	W15
+	.byte		N03   , En4 , v127
+	.byte	W03
+	.byte		N12   , Fn4 , v127
+	.byte	W12
+	.byte		N36   , Cs4 , v127
+	.byte	W36
+	.byte		N06   , Gs3 , v127
+	.byte	W06
+@ 047   ----------------------------------------
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , Cs4 , v127
+	.byte	W06
+	.byte		N12   , Cs4 , v127
+	.byte	W12
+	.byte		N18   , Cs4 , v127
+	.byte	W18
+	.byte		N12   , Ds4 , v127
+	.byte	W12
+	.byte		N03   , En4 , v127
+	.byte	W03
+	.byte		N21   , Fn4 , v127
+	.byte	W21
+	.byte		N18   , Fs4 , v127
+	.byte	W18
+@ 048   ----------------------------------------
+	.byte	W06
+	.byte		N06   , Fn4 , v127
+	.byte	W06
+	.byte		N12   , Fs4 , v127
+	.byte	W12
+	.byte		N12   , Fn4 , v127
+	.byte	W12
+	.byte		N12   , Cs4 , v127
+	.byte	W12
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N36   , Gs3 , v127
+	.byte	W42
+@ 049   ----------------------------------------
+	.byte	W06
+	.byte		N18   , Fn3 , v127
+	.byte	W18
+	.byte		N18   , Fs3 , v127
+	.byte	W18
+	.byte		N12   , As3 , v127
+	.byte	W12
+	.byte		N18   , Cs4 , v127
+	.byte	W18
+	.byte		N06   , En4 , v127
+	.byte	W06
+	.byte		N18   , Ds4 , v127
+	.byte	W18
+@ 050   ----------------------------------------
+	.byte	W06
+	.byte		TIE   , Cs4 , v127
+	.byte	W90
+@ 051   ----------------------------------------
+	.byte	W54
+	.byte		EOT   , Cs4
+	.byte	FINE
+
+@**************** Track 7 (Midi-Chn.7) ****************@
+
+mus_sm3dw_beachlevel_7:
+	.byte	KEYSH , mus_sm3dw_beachlevel_key+0
+@ 000   ----------------------------------------
+	.byte		VOICE , 7
+	.byte		VOL   , 127*mus_sm3dw_beachlevel_mvl/mxv
+	.byte	W96
+@ 001   ----------------------------------------
+	.byte	W96
+@ 002   ----------------------------------------
+	.byte	W96
+@ 003   ----------------------------------------
+	.byte	W96
+@ 004   ----------------------------------------
+	.byte	W96
+@ 005   ----------------------------------------
+	.byte	W96
+@ 006   ----------------------------------------
+	.byte	W96
+@ 007   ----------------------------------------
+	.byte	W96
+@ 008   ----------------------------------------
+	.byte	W96
+@ 009   ----------------------------------------
+	.byte	W96
+@ 010   ----------------------------------------
+	.byte	W96
+@ 011   ----------------------------------------
+	.byte		N18   , Gs2 , v127
+	.byte	W18
+	.byte		N18   , Cs3 , v127
+	.byte	W18
+	.byte		TIE   , Gs3 , v127
+	.byte	W60
+@ 012   ----------------------------------------
+	.byte	W84
+	.byte		EOT   , Gs3
+	.byte		N12   , Fs3 , v127
+	.byte	W12
+@ 013   ----------------------------------------
+	.byte		N03   , En3 , v127
+	.byte	W03
+	.byte		N15   , Fn3 , v127
+	.byte	W15
+	.byte		N18   , Cs3 , v127
+	.byte	W18
+	.byte		N48   , Gs2 , v127
+	.byte	W60
+@ 014   ----------------------------------------
+	.byte		N36   , Cn3 , v127
+	.byte	W36
+	.byte		N48   , As2 , v127
+	.byte	W60
+@ 015   ----------------------------------------
+	.byte		N36   , As2 , v127
+	.byte	W36
+	.byte		N48   , Gs2 , v127
+	.byte	W60
+@ 016   ----------------------------------------
+	.byte		N84   , Gs2 , v127
+	.byte		N84   , Cs3 , v127
+	.byte	W96
+@ 017   ----------------------------------------
+	.byte		N84   , Fs2 , v127
+	.byte		N84   , Bn2 , v127
+	.byte	W96
+@ 018   ----------------------------------------
+	.byte		N84   , Fn2 , v127
+	.byte		N84   , As2 , v127
+	.byte	W96
+@ 019   ----------------------------------------
+	.byte		N84   , En2 , v127
+	.byte		N84   , An2 , v127
+	.byte	W96
+@ 020   ----------------------------------------
+	.byte	W48
+	.byte		N06   , Fn3 , v127
+	.byte	W06
+	.byte		N12   , Fs3 , v127
+	.byte	W12
+	.byte		N12   , Fn3 , v127
+	.byte	W12
+	.byte		N12   , Cs3 , v127
+	.byte	W12
+	.byte		N06   , As2 , v127
+	.byte	W06
+@ 021   ----------------------------------------
+	.byte		N84   , Gs2 , v127
+	.byte	W96
+@ 022   ----------------------------------------
+	.byte		N84   , Gs2 , v127
+	.byte	W72
+	.byte		N24   , Fn2 , v127
+	.byte	W24
+@ 023   ----------------------------------------
+	.byte		N36   , An2 , v127
+	.byte		N36   , Cn3 , v127
+	.byte	W36
+	.byte		N60   , Fn2 , v127
+	.byte		N60   , Gn2 , v127
+	.byte		N60   , Bn2 , v127
+	.byte	W60
+@ 024   ----------------------------------------
+	.byte	W96
+@ 025   ----------------------------------------
+	.byte	W96
+@ 026   ----------------------------------------
+	.byte	W96
+@ 027   ----------------------------------------
+	.byte	W96
+@ 028   ----------------------------------------
+	.byte	W96
+@ 029   ----------------------------------------
+	.byte	W96
+@ 030   ----------------------------------------
+	.byte	W96
+@ 031   ----------------------------------------
+	.byte	W96
+@ 032   ----------------------------------------
+	.byte	W96
+@ 033   ----------------------------------------
+	.byte	W96
+@ 034   ----------------------------------------
+	.byte	W96
+@ 035   ----------------------------------------
+	.byte	W96
+@ 036   ----------------------------------------
+	.byte	W96
+@ 037   ----------------------------------------
+	.byte	W96
+@ 038   ----------------------------------------
+	.byte	W96
+@ 039   ----------------------------------------
+	.byte		N18   , Gs2 , v127
+	.byte	W18
+	.byte		N18   , Cs3 , v127
+	.byte	W18
+	.byte		TIE   , Gs3 , v127
+	.byte	W60
+@ 040   ----------------------------------------
+	.byte	W84
+	.byte		EOT   , Gs3
+	.byte		N12   , Fs3 , v127
+	.byte	W12
+@ 041   ----------------------------------------
+	.byte		N03   , En3 , v127
+	.byte	W03
+	.byte		N15   , Fn3 , v127
+	.byte	W15
+	.byte		N18   , Cs3 , v127
+	.byte	W18
+	.byte		N48   , Gs2 , v127
+	.byte	W60
+@ 042   ----------------------------------------
+	.byte		N36   , Cn3 , v127
+	.byte	W36
+	.byte		N48   , As2 , v127
+	.byte	W60
+@ 043   ----------------------------------------
+	.byte		N36   , As2 , v127
+	.byte	W36
+	.byte		N48   , Gs2 , v127
+	.byte	W60
+@ 044   ----------------------------------------
+	.byte		N84   , Gs2 , v127
+	.byte		N84   , Cs3 , v127
+	.byte	W96
+@ 045   ----------------------------------------
+	.byte		N84   , Fs2 , v127
+	.byte		N84   , Bn2 , v127
+	.byte	W96
+@ 046   ----------------------------------------
+	.byte		N84   , Fn2 , v127
+	.byte		N84   , As2 , v127
+	.byte	W96
+@ 047   ----------------------------------------
+	.byte		N84   , En2 , v127
+	.byte		N84   , An2 , v127
+	.byte	W96
+@ 048   ----------------------------------------
+	.byte	W48
+	.byte		N06   , Fn3 , v127
+	.byte	W06
+	.byte		N12   , Fs3 , v127
+	.byte	W12
+	.byte		N12   , Fn3 , v127
+	.byte	W12
+	.byte		N12   , Cs3 , v127
+	.byte	W12
+	.byte		N06   , As2 , v127
+	.byte	W06
+@ 049   ----------------------------------------
+	.byte		N84   , Gs2 , v127
+	.byte	W96
+@ 050   ----------------------------------------
+	.byte		N84   , Gs2 , v127
+	.byte	W72
+	.byte		N24   , Fn2 , v127
+	.byte	W24
+@ 051   ----------------------------------------
+	.byte		N36   , An2 , v127
+	.byte		N36   , Cn3 , v127
+	.byte	W36
+	.byte		N60   , Fn2 , v127
+	.byte		N60   , Gn2 , v127
+	.byte		N60   , Bn2 , v127
+	.byte	W60
+@ 052   ----------------------------------------
+	.byte	FINE
+
+@**************** Track 8 (Midi-Chn.8) ****************@
+
+mus_sm3dw_beachlevel_8:
+	.byte	KEYSH , mus_sm3dw_beachlevel_key+0
+@ 000   ----------------------------------------
+	.byte		VOICE , 8
+	.byte		VOL   , 127*mus_sm3dw_beachlevel_mvl/mxv
+	.byte	W96
+@ 001   ----------------------------------------
+	.byte	W96
+@ 002   ----------------------------------------
+	.byte	W96
+@ 003   ----------------------------------------
+	.byte	W96
+@ 004   ----------------------------------------
+	.byte	W96
+@ 005   ----------------------------------------
+	.byte	W96
+@ 006   ----------------------------------------
+	.byte	W96
+@ 007   ----------------------------------------
+	.byte	W96
+@ 008   ----------------------------------------
+	.byte	W96
+@ 009   ----------------------------------------
+	.byte	W96
+@ 010   ----------------------------------------
+	.byte	W96
+@ 011   ----------------------------------------
+	.byte	W96
+@ 012   ----------------------------------------
+	.byte	W96
+@ 013   ----------------------------------------
+	.byte	W96
+@ 014   ----------------------------------------
+	.byte	W96
+@ 015   ----------------------------------------
+	.byte	W96
+@ 016   ----------------------------------------
+	.byte	W96
+@ 017   ----------------------------------------
+	.byte	W96
+@ 018   ----------------------------------------
+	.byte	W96
+@ 019   ----------------------------------------
+	.byte	W96
+@ 020   ----------------------------------------
+	.byte	W96
+@ 021   ----------------------------------------
+	.byte	W96
+@ 022   ----------------------------------------
+	.byte	W96
+@ 023   ----------------------------------------
+	.byte	W48
+	.byte		N06   , En3 , v127
+	.byte	W06
+	.byte		N12   , Fn3 , v127
+	.byte	W12
+	.byte		N18   , An3 , v127
+	.byte	W18
+	.byte		N12   , Bn3 , v127
+	.byte	W12
+@ 024   ----------------------------------------
+	.byte		N18   , Bn3 , v127
+	.byte	W18
+	.byte		N18   , Gn3 , v127
+	.byte	W18
+	.byte		N36   , Gn3 , v127
+	.byte	W60
+@ 025   ----------------------------------------
+	.byte	W24
+	.byte		N06   , En3 , v127
+	.byte	W06
+	.byte		N12   , Fn3 , v127
+	.byte	W12
+	.byte		N18   , An3 , v127
+	.byte	W18
+	.byte		N12   , Bn3 , v127
+	.byte	W12
+	.byte		N12   , Bn3 , v127
+	.byte	W12
+	.byte		N12   , Cn4 , v127
+	.byte	W12
+@ 026   ----------------------------------------
+	.byte		N18   , Bn3 , v127
+	.byte	W18
+	.byte		N18   , Gn3 , v127
+	.byte	W18
+	.byte		N24   , Gn3 , v127
+	.byte	W24
+	.byte		N18   , Dn4 , v127
+	.byte	W18
+	.byte		N18   , Bn3 , v127
+	.byte	W18
+@ 027   ----------------------------------------
+	.byte		N48   , Gn3 , v127
+	.byte	W96
+@ 028   ----------------------------------------
+	.byte		N06   , En3 , v127
+	.byte	W06
+	.byte		N12   , Fn3 , v127
+	.byte	W12
+	.byte		N18   , An3 , v127
+	.byte	W18
+	.byte		N12   , Bn3 , v127
+	.byte	W12
+	.byte		N18   , Bn3 , v127
+	.byte	W18
+	.byte		N18   , Cn4 , v127
+	.byte	W18
+	.byte		N06   , Dn4 , v127
+	.byte	W06
+	.byte		N06   , En4 , v127
+	.byte	W06
+@ 029   ----------------------------------------
+	.byte		N48   , Gn4 , v127
+	.byte	W60
+	.byte		N24   , Fn4 , v127
+	.byte	W24
+	.byte		N06   , En4 , v127
+	.byte	W06
+	.byte		N06   , Fn4 , v127
+	.byte	W06
+@ 030   ----------------------------------------
+	.byte		N03   , En4 , v127
+	.byte	W03
+	.byte		N03   , Bn3 , v127
+	.byte	W03
+	.byte		N03   , En4 , v127
+	.byte	W03
+	.byte		N03   , Bn3 , v127
+	.byte	W03
+	.byte		N03   , En4 , v127
+	.byte	W03
+	.byte		N03   , Bn3 , v127
+	.byte	W03
+	.byte		N03   , En4 , v127
+	.byte	W03
+	.byte		N03   , Bn3 , v127
+	.byte	W03
+	.byte		N03   , En4 , v127
+	.byte	W03
+	.byte		N03   , Bn3 , v127
+	.byte	W03
+	.byte		N03   , En4 , v127
+	.byte	W03
+	.byte		N03   , Bn3 , v127
+	.byte	W03
+	.byte		N03   , En4 , v127
+	.byte	W03
+	.byte		N03   , Bn3 , v127
+	.byte	W03
+	.byte		N03   , En4 , v127
+	.byte	W03
+	.byte		N03   , Bn3 , v127
+	.byte	W03
+	.byte		N03   , En4 , v127
+	.byte	W03
+	.byte		N03   , Bn3 , v127
+	.byte	W03
+	.byte		N03   , En4 , v127
+	.byte	W03
+	.byte		N03   , Bn3 , v127
+	.byte	W03
+	.byte		N03   , En4 , v127
+	.byte	W03
+	.byte		N03   , Bn3 , v127
+	.byte	W03
+	.byte		N03   , En4 , v127
+	.byte	W03
+	.byte		N03   , Bn3 , v127
+	.byte	W03
+	.byte		N03   , En4 , v127
+	.byte	W03
+	.byte		N03   , Bn3 , v127
+	.byte	W03
+	.byte		N03   , En4 , v127
+	.byte	W03
+	.byte		N03   , Bn3 , v127
+	.byte	W03
+	.byte		N03   , En4 , v127
+	.byte	W03
+	.byte		N03   , Bn3 , v127
+	.byte	W09
+@ 031   ----------------------------------------
+	.byte		N03   , An3 , v127
+	.byte	W03
+	.byte		N03   , Dn4 , v127
+	.byte	W03
+	.byte		N03   , An3 , v127
+	.byte	W03
+	.byte		N03   , Dn4 , v127
+	.byte	W03
+	.byte		N03   , An3 , v127
+	.byte	W03
+	.byte		N03   , Dn4 , v127
+	.byte	W03
+	.byte		N03   , An3 , v127
+	.byte	W03
+	.byte		N03   , Dn4 , v127
+	.byte	W03
+	.byte		N03   , An3 , v127
+	.byte	W03
+	.byte		N03   , Dn4 , v127
+	.byte	W03
+	.byte		N03   , An3 , v127
+	.byte	W03
+	.byte		N03   , Dn4 , v127
+	.byte	W03
+	.byte		N03   , An3 , v127
+	.byte	W03
+	.byte		N03   , Dn4 , v127
+	.byte	W03
+	.byte		N03   , An3 , v127
+	.byte	W03
+	.byte		N03   , Dn4 , v127
+	.byte	W03
+	.byte		N03   , An3 , v127
+	.byte	W03
+	.byte		N03   , Dn4 , v127
+	.byte	W03
+	.byte		N03   , An3 , v127
+	.byte	W03
+	.byte		N03   , Dn4 , v127
+	.byte	W03
+	.byte		N03   , An3 , v127
+	.byte	W03
+	.byte		N03   , Dn4 , v127
+	.byte	W03
+	.byte		N03   , An3 , v127
+	.byte	W03
+	.byte		N03   , Dn4 , v127
+	.byte	W03
+	.byte		N03   , An3 , v127
+	.byte	W03
+	.byte		N03   , Dn4 , v127
+	.byte	W03
+	.byte		N03   , An3 , v127
+	.byte	W03
+	.byte		N03   , Dn4 , v127
+	.byte	W03
+	.byte		N03   , An3 , v127
+	.byte	W12
+@ 032   ----------------------------------------
+	.byte	W96
+@ 033   ----------------------------------------
+	.byte	W96
+@ 034   ----------------------------------------
+	.byte	W96
+@ 035   ----------------------------------------
+	.byte	W96
+@ 036   ----------------------------------------
+	.byte	W96
+@ 037   ----------------------------------------
+	.byte	W96
+@ 038   ----------------------------------------
+	.byte	W96
+@ 039   ----------------------------------------
+	.byte	W96
+@ 040   ----------------------------------------
+	.byte	W96
+@ 041   ----------------------------------------
+	.byte	W96
+@ 042   ----------------------------------------
+	.byte	W96
+@ 043   ----------------------------------------
+	.byte	W96
+@ 044   ----------------------------------------
+	.byte	W96
+@ 045   ----------------------------------------
+	.byte	W96
+@ 046   ----------------------------------------
+	.byte	W96
+@ 047   ----------------------------------------
+	.byte	W96
+@ 048   ----------------------------------------
+	.byte	W96
+@ 049   ----------------------------------------
+	.byte	W96
+@ 050   ----------------------------------------
+	.byte	W96
+@ 051   ----------------------------------------
+	.byte	W48
+	.byte		N06   , En3 , v127
+	.byte	W06
+	.byte		N12   , Fn3 , v127
+	.byte	W12
+	.byte		N18   , An3 , v127
+	.byte	W18
+	.byte		N12   , Bn3 , v127
+	.byte	W12
+@ 052   ----------------------------------------
+	.byte		N18   , Bn3 , v127
+	.byte	W18
+	.byte		N18   , Gn3 , v127
+	.byte	W18
+	.byte		N36   , Gn3 , v127
+	.byte	W60
+@ 053   ----------------------------------------
+	.byte	W24
+	.byte		N06   , En3 , v127
+	.byte	W06
+	.byte		N12   , Fn3 , v127
+	.byte	W12
+	.byte		N18   , An3 , v127
+	.byte	W18
+	.byte		N12   , Bn3 , v127
+	.byte	W12
+	.byte		N12   , Bn3 , v127
+	.byte	W12
+	.byte		N12   , Cn4 , v127
+	.byte	W12
+@ 054   ----------------------------------------
+	.byte		N18   , Bn3 , v127
+	.byte	W18
+	.byte		N18   , Gn3 , v127
+	.byte	W18
+	.byte		N24   , Gn3 , v127
+	.byte	W24
+	.byte		N18   , Dn4 , v127
+	.byte	W18
+	.byte		N18   , Bn3 , v127
+	.byte	W18
+@ 055   ----------------------------------------
+	.byte		N48   , Gn3 , v127
+	.byte	W96
+@ 056   ----------------------------------------
+	.byte		N06   , En3 , v127
+	.byte	W06
+	.byte		N12   , Fn3 , v127
+	.byte	W12
+	.byte		N18   , An3 , v127
+	.byte	W18
+	.byte		N12   , Bn3 , v127
+	.byte	W12
+	.byte		N18   , Bn3 , v127
+	.byte	W18
+	.byte		N18   , Cn4 , v127
+	.byte	W18
+	.byte		N06   , Dn4 , v127
+	.byte	W06
+	.byte		N06   , En4 , v127
+	.byte	W06
+@ 057   ----------------------------------------
+	.byte		N48   , Gn4 , v127
+	.byte	W60
+	.byte		N24   , Fn4 , v127
+	.byte	W24
+	.byte		N06   , En4 , v127
+	.byte	W06
+	.byte		N06   , Fn4 , v127
+	.byte	W06
+@ 058   ----------------------------------------
+	.byte		N03   , En4 , v127
+	.byte	W03
+	.byte		N03   , Bn3 , v127
+	.byte	W03
+	.byte		N03   , En4 , v127
+	.byte	W03
+	.byte		N03   , Bn3 , v127
+	.byte	W03
+	.byte		N03   , En4 , v127
+	.byte	W03
+	.byte		N03   , Bn3 , v127
+	.byte	W03
+	.byte		N03   , En4 , v127
+	.byte	W03
+	.byte		N03   , Bn3 , v127
+	.byte	W03
+	.byte		N03   , En4 , v127
+	.byte	W03
+	.byte		N03   , Bn3 , v127
+	.byte	W03
+	.byte		N03   , En4 , v127
+	.byte	W03
+	.byte		N03   , Bn3 , v127
+	.byte	W03
+	.byte		N03   , En4 , v127
+	.byte	W03
+	.byte		N03   , Bn3 , v127
+	.byte	W03
+	.byte		N03   , En4 , v127
+	.byte	W03
+	.byte		N03   , Bn3 , v127
+	.byte	W03
+	.byte		N03   , En4 , v127
+	.byte	W03
+	.byte		N03   , Bn3 , v127
+	.byte	W03
+	.byte		N03   , En4 , v127
+	.byte	W03
+	.byte		N03   , Bn3 , v127
+	.byte	W03
+	.byte		N03   , En4 , v127
+	.byte	W03
+	.byte		N03   , Bn3 , v127
+	.byte	W03
+	.byte		N03   , En4 , v127
+	.byte	W03
+	.byte		N03   , Bn3 , v127
+	.byte	W03
+	.byte		N03   , En4 , v127
+	.byte	W03
+	.byte		N03   , Bn3 , v127
+	.byte	W03
+	.byte		N03   , En4 , v127
+	.byte	W03
+	.byte		N03   , Bn3 , v127
+	.byte	W03
+	.byte		N03   , En4 , v127
+	.byte	W03
+	.byte		N03   , Bn3 , v127
+	.byte	W09
+@ 059   ----------------------------------------
+	.byte		N03   , An3 , v127
+	.byte	W03
+	.byte		N03   , Dn4 , v127
+	.byte	W03
+	.byte		N03   , An3 , v127
+	.byte	W03
+	.byte		N03   , Dn4 , v127
+	.byte	W03
+	.byte		N03   , An3 , v127
+	.byte	W03
+	.byte		N03   , Dn4 , v127
+	.byte	W03
+	.byte		N03   , An3 , v127
+	.byte	W03
+	.byte		N03   , Dn4 , v127
+	.byte	W03
+	.byte		N03   , An3 , v127
+	.byte	W03
+	.byte		N03   , Dn4 , v127
+	.byte	W03
+	.byte		N03   , An3 , v127
+	.byte	W03
+	.byte		N03   , Dn4 , v127
+	.byte	W03
+	.byte		N03   , An3 , v127
+	.byte	W03
+	.byte		N03   , Dn4 , v127
+	.byte	W03
+	.byte		N03   , An3 , v127
+	.byte	W03
+	.byte		N03   , Dn4 , v127
+	.byte	W03
+	.byte		N03   , An3 , v127
+	.byte	W03
+	.byte		N03   , Dn4 , v127
+	.byte	W03
+	.byte		N03   , An3 , v127
+	.byte	W03
+	.byte		N03   , Dn4 , v127
+	.byte	W03
+	.byte		N03   , An3 , v127
+	.byte	W03
+	.byte		N03   , Dn4 , v127
+	.byte	W03
+	.byte		N03   , An3 , v127
+	.byte	W03
+	.byte		N03   , Dn4 , v127
+	.byte	W03
+	.byte		N03   , An3 , v127
+	.byte	W03
+	.byte		N03   , Dn4 , v127
+	.byte	W03
+	.byte		N03   , An3 , v127
+	.byte	W03
+	.byte		N03   , Dn4 , v127
+	.byte	W03
+	.byte		N03   , An3 , v127
+	.byte	W03
+	.byte	FINE
+
+@**************** Track 9 (Midi-Chn.9) ****************@
+
+mus_sm3dw_beachlevel_9:
+	.byte	KEYSH , mus_sm3dw_beachlevel_key+0
+@ 000   ----------------------------------------
+	.byte		VOICE , 9
+	.byte		VOL   , 127*mus_sm3dw_beachlevel_mvl/mxv
+	.byte	W96
+@ 001   ----------------------------------------
+	.byte	W96
+@ 002   ----------------------------------------
+	.byte	W96
+@ 003   ----------------------------------------
+	.byte	W96
+@ 004   ----------------------------------------
+	.byte	W96
+@ 005   ----------------------------------------
+	.byte	W96
+@ 006   ----------------------------------------
+	.byte	W96
+@ 007   ----------------------------------------
+	.byte	W96
+@ 008   ----------------------------------------
+	.byte	W96
+@ 009   ----------------------------------------
+	.byte	W96
+@ 010   ----------------------------------------
+	.byte	W96
+@ 011   ----------------------------------------
+	.byte	W96
+@ 012   ----------------------------------------
+	.byte	W96
+@ 013   ----------------------------------------
+	.byte	W96
+@ 014   ----------------------------------------
+	.byte	W96
+@ 015   ----------------------------------------
+	.byte	W96
+@ 016   ----------------------------------------
+	.byte	W96
+@ 017   ----------------------------------------
+	.byte	W96
+@ 018   ----------------------------------------
+	.byte	W96
+@ 019   ----------------------------------------
+	.byte	W96
+@ 020   ----------------------------------------
+	.byte	W96
+@ 021   ----------------------------------------
+	.byte	W96
+@ 022   ----------------------------------------
+	.byte	W96
+@ 023   ----------------------------------------
+	.byte	W54
+	.byte		N06   , En3 , v127
+	.byte	W06
+	.byte		N12   , Fn3 , v127
+	.byte	W12
+	.byte		N18   , An3 , v127
+	.byte	W18
+	.byte		N12   , Bn3 , v127
+	.byte	W06
+@ 024   ----------------------------------------
+	.byte	W06
+	.byte		N18   , Bn3 , v127
+	.byte	W18
+	.byte		N18   , Gn3 , v127
+	.byte	W18
+	.byte		N36   , Gn3 , v127
+	.byte	W54
+@ 025   ----------------------------------------
+	.byte	W30
+	.byte		N06   , En3 , v127
+	.byte	W06
+	.byte		N12   , Fn3 , v127
+	.byte	W12
+	.byte		N18   , An3 , v127
+	.byte	W18
+	.byte		N12   , Bn3 , v127
+	.byte	W12
+	.byte		N12   , Bn3 , v127
+	.byte	W12
+	.byte		N12   , Cn4 , v127
+	.byte	W06
+@ 026   ----------------------------------------
+	.byte	W06
+	.byte		N18   , Bn3 , v127
+	.byte	W18
+	.byte		N18   , Gn3 , v127
+	.byte	W18
+	.byte		N24   , Gn3 , v127
+	.byte	W24
+	.byte		N18   , Dn4 , v127
+	.byte	W18
+	.byte		N18   , Bn3 , v127
+	.byte	W12
+@ 027   ----------------------------------------
+	.byte	W06
+	.byte		N48   , Gn3 , v127
+	.byte	W90
+@ 028   ----------------------------------------
+	.byte	W06
+	.byte		N06   , En3 , v127
+	.byte	W06
+	.byte		N12   , Fn3 , v127
+	.byte	W12
+	.byte		N18   , An3 , v127
+	.byte	W18
+	.byte		N12   , Bn3 , v127
+	.byte	W12
+	.byte		N18   , Bn3 , v127
+	.byte	W18
+	.byte		N18   , Cn4 , v127
+	.byte	W18
+	.byte		N06   , Dn4 , v127
+	.byte	W06
+@ 029   ----------------------------------------
+	.byte		N06   , En4 , v127
+	.byte	W06
+	.byte		N48   , Gn4 , v127
+	.byte	W60
+	.byte		N24   , Fn4 , v127
+	.byte	W24
+	.byte		N06   , En4 , v127
+	.byte	W06
+@ 030   ----------------------------------------
+	.byte		N06   , Fn4 , v127
+	.byte	W06
+	.byte		N03   , En4 , v127
+	.byte	W03
+	.byte		N03   , Bn3 , v127
+	.byte	W03
+	.byte		N03   , En4 , v127
+	.byte	W03
+	.byte		N03   , Bn3 , v127
+	.byte	W03
+	.byte		N03   , En4 , v127
+	.byte	W03
+	.byte		N03   , Bn3 , v127
+	.byte	W03
+	.byte		N03   , En4 , v127
+	.byte	W03
+	.byte		N03   , Bn3 , v127
+	.byte	W03
+	.byte		N03   , En4 , v127
+	.byte	W03
+	.byte		N03   , Bn3 , v127
+	.byte	W03
+	.byte		N03   , En4 , v127
+	.byte	W03
+	.byte		N03   , Bn3 , v127
+	.byte	W03
+	.byte		N03   , En4 , v127
+	.byte	W03
+	.byte		N03   , Bn3 , v127
+	.byte	W03
+	.byte		N03   , En4 , v127
+	.byte	W03
+	.byte		N03   , Bn3 , v127
+	.byte	W03
+	.byte		N03   , En4 , v127
+	.byte	W03
+	.byte		N03   , Bn3 , v127
+	.byte	W03
+	.byte		N03   , En4 , v127
+	.byte	W03
+	.byte		N03   , Bn3 , v127
+	.byte	W03
+	.byte		N03   , En4 , v127
+	.byte	W03
+	.byte		N03   , Bn3 , v127
+	.byte	W03
+	.byte		N03   , En4 , v127
+	.byte	W03
+	.byte		N03   , Bn3 , v127
+	.byte	W03
+	.byte		N03   , En4 , v127
+	.byte	W03
+	.byte		N03   , Bn3 , v127
+	.byte	W03
+	.byte		N03   , En4 , v127
+	.byte	W03
+	.byte		N03   , Bn3 , v127
+	.byte	W03
+	.byte		N03   , En4 , v127
+	.byte	W03
+	.byte		N03   , Bn3 , v127
+	.byte	W03
+@ 031   ----------------------------------------
+	.byte	W06
+	.byte		N03   , An3 , v127
+	.byte	W03
+	.byte		N03   , Dn4 , v127
+	.byte	W03
+	.byte		N03   , An3 , v127
+	.byte	W03
+	.byte		N03   , Dn4 , v127
+	.byte	W03
+	.byte		N03   , An3 , v127
+	.byte	W03
+	.byte		N03   , Dn4 , v127
+	.byte	W03
+	.byte		N03   , An3 , v127
+	.byte	W03
+	.byte		N03   , Dn4 , v127
+	.byte	W03
+	.byte		N03   , An3 , v127
+	.byte	W03
+	.byte		N03   , Dn4 , v127
+	.byte	W03
+	.byte		N03   , An3 , v127
+	.byte	W03
+	.byte		N03   , Dn4 , v127
+	.byte	W03
+	.byte		N03   , An3 , v127
+	.byte	W03
+	.byte		N03   , Dn4 , v127
+	.byte	W03
+	.byte		N03   , An3 , v127
+	.byte	W03
+	.byte		N03   , Dn4 , v127
+	.byte	W03
+	.byte		N03   , An3 , v127
+	.byte	W03
+	.byte		N03   , Dn4 , v127
+	.byte	W03
+	.byte		N03   , An3 , v127
+	.byte	W03
+	.byte		N03   , Dn4 , v127
+	.byte	W03
+	.byte		N03   , An3 , v127
+	.byte	W03
+	.byte		N03   , Dn4 , v127
+	.byte	W03
+	.byte		N03   , An3 , v127
+	.byte	W03
+	.byte		N03   , Dn4 , v127
+	.byte	W03
+	.byte		N03   , An3 , v127
+	.byte	W03
+	.byte		N03   , Dn4 , v127
+	.byte	W03
+	.byte		N03   , An3 , v127
+	.byte	W03
+	.byte		N03   , Dn4 , v127
+	.byte	W03
+	.byte		N03   , An3 , v127
+	.byte	W06
+@ 032   ----------------------------------------
+	.byte	W96
+@ 033   ----------------------------------------
+	.byte	W96
+@ 034   ----------------------------------------
+	.byte	W96
+@ 035   ----------------------------------------
+	.byte	W96
+@ 036   ----------------------------------------
+	.byte	W96
+@ 037   ----------------------------------------
+	.byte	W96
+@ 038   ----------------------------------------
+	.byte	W96
+@ 039   ----------------------------------------
+	.byte	W96
+@ 040   ----------------------------------------
+	.byte	W96
+@ 041   ----------------------------------------
+	.byte	W96
+@ 042   ----------------------------------------
+	.byte	W96
+@ 043   ----------------------------------------
+	.byte	W96
+@ 044   ----------------------------------------
+	.byte	W96
+@ 045   ----------------------------------------
+	.byte	W96
+@ 046   ----------------------------------------
+	.byte	W96
+@ 047   ----------------------------------------
+	.byte	W96
+@ 048   ----------------------------------------
+	.byte	W96
+@ 049   ----------------------------------------
+	.byte	W96
+@ 050   ----------------------------------------
+	.byte	W96
+@ 051   ----------------------------------------
+	.byte	W54
+	.byte		N06   , En3 , v127
+	.byte	W06
+	.byte		N12   , Fn3 , v127
+	.byte	W12
+	.byte		N18   , An3 , v127
+	.byte	W18
+	.byte		N12   , Bn3 , v127
+	.byte	W06
+@ 052   ----------------------------------------
+	.byte	W06
+	.byte		N18   , Bn3 , v127
+	.byte	W18
+	.byte		N18   , Gn3 , v127
+	.byte	W18
+	.byte		N36   , Gn3 , v127
+	.byte	W54
+@ 053   ----------------------------------------
+	.byte	W30
+	.byte		N06   , En3 , v127
+	.byte	W06
+	.byte		N12   , Fn3 , v127
+	.byte	W12
+	.byte		N18   , An3 , v127
+	.byte	W18
+	.byte		N12   , Bn3 , v127
+	.byte	W12
+	.byte		N12   , Bn3 , v127
+	.byte	W12
+	.byte		N12   , Cn4 , v127
+	.byte	W06
+@ 054   ----------------------------------------
+	.byte	W06
+	.byte		N18   , Bn3 , v127
+	.byte	W18
+	.byte		N18   , Gn3 , v127
+	.byte	W18
+	.byte		N24   , Gn3 , v127
+	.byte	W24
+	.byte		N18   , Dn4 , v127
+	.byte	W18
+	.byte		N18   , Bn3 , v127
+	.byte	W12
+@ 055   ----------------------------------------
+	.byte	W06
+	.byte		N48   , Gn3 , v127
+	.byte	W90
+@ 056   ----------------------------------------
+	.byte	W06
+	.byte		N06   , En3 , v127
+	.byte	W06
+	.byte		N12   , Fn3 , v127
+	.byte	W12
+	.byte		N18   , An3 , v127
+	.byte	W18
+	.byte		N12   , Bn3 , v127
+	.byte	W12
+	.byte		N18   , Bn3 , v127
+	.byte	W18
+	.byte		N18   , Cn4 , v127
+	.byte	W18
+	.byte		N06   , Dn4 , v127
+	.byte	W06
+@ 057   ----------------------------------------
+	.byte		N06   , En4 , v127
+	.byte	W06
+	.byte		N48   , Gn4 , v127
+	.byte	W60
+	.byte		N24   , Fn4 , v127
+	.byte	W24
+	.byte		N06   , En4 , v127
+	.byte	W06
+@ 058   ----------------------------------------
+	.byte		N06   , Fn4 , v127
+	.byte	W06
+	.byte		N03   , En4 , v127
+	.byte	W03
+	.byte		N03   , Bn3 , v127
+	.byte	W03
+	.byte		N03   , En4 , v127
+	.byte	W03
+	.byte		N03   , Bn3 , v127
+	.byte	W03
+	.byte		N03   , En4 , v127
+	.byte	W03
+	.byte		N03   , Bn3 , v127
+	.byte	W03
+	.byte		N03   , En4 , v127
+	.byte	W03
+	.byte		N03   , Bn3 , v127
+	.byte	W03
+	.byte		N03   , En4 , v127
+	.byte	W03
+	.byte		N03   , Bn3 , v127
+	.byte	W03
+	.byte		N03   , En4 , v127
+	.byte	W03
+	.byte		N03   , Bn3 , v127
+	.byte	W03
+	.byte		N03   , En4 , v127
+	.byte	W03
+	.byte		N03   , Bn3 , v127
+	.byte	W03
+	.byte		N03   , En4 , v127
+	.byte	W03
+	.byte		N03   , Bn3 , v127
+	.byte	W03
+	.byte		N03   , En4 , v127
+	.byte	W03
+	.byte		N03   , Bn3 , v127
+	.byte	W03
+	.byte		N03   , En4 , v127
+	.byte	W03
+	.byte		N03   , Bn3 , v127
+	.byte	W03
+	.byte		N03   , En4 , v127
+	.byte	W03
+	.byte		N03   , Bn3 , v127
+	.byte	W03
+	.byte		N03   , En4 , v127
+	.byte	W03
+	.byte		N03   , Bn3 , v127
+	.byte	W03
+	.byte		N03   , En4 , v127
+	.byte	W03
+	.byte		N03   , Bn3 , v127
+	.byte	W03
+	.byte		N03   , En4 , v127
+	.byte	W03
+	.byte		N03   , Bn3 , v127
+	.byte	W03
+	.byte		N03   , En4 , v127
+	.byte	W03
+	.byte		N03   , Bn3 , v127
+	.byte	W03
+@ 059   ----------------------------------------
+	.byte	W06
+	.byte		N03   , An3 , v127
+	.byte	W03
+	.byte		N03   , Dn4 , v127
+	.byte	W03
+	.byte		N03   , An3 , v127
+	.byte	W03
+	.byte		N03   , Dn4 , v127
+	.byte	W03
+	.byte		N03   , An3 , v127
+	.byte	W03
+	.byte		N03   , Dn4 , v127
+	.byte	W03
+	.byte		N03   , An3 , v127
+	.byte	W03
+	.byte		N03   , Dn4 , v127
+	.byte	W03
+	.byte		N03   , An3 , v127
+	.byte	W03
+	.byte		N03   , Dn4 , v127
+	.byte	W03
+	.byte		N03   , An3 , v127
+	.byte	W03
+	.byte		N03   , Dn4 , v127
+	.byte	W03
+	.byte		N03   , An3 , v127
+	.byte	W03
+	.byte		N03   , Dn4 , v127
+	.byte	W03
+	.byte		N03   , An3 , v127
+	.byte	W03
+	.byte		N03   , Dn4 , v127
+	.byte	W03
+	.byte		N03   , An3 , v127
+	.byte	W03
+	.byte		N03   , Dn4 , v127
+	.byte	W03
+	.byte		N03   , An3 , v127
+	.byte	W03
+	.byte		N03   , Dn4 , v127
+	.byte	W03
+	.byte		N03   , An3 , v127
+	.byte	W03
+	.byte		N03   , Dn4 , v127
+	.byte	W03
+	.byte		N03   , An3 , v127
+	.byte	W03
+	.byte		N03   , Dn4 , v127
+	.byte	W03
+	.byte		N03   , An3 , v127
+	.byte	W03
+	.byte		N03   , Dn4 , v127
+	.byte	W03
+	.byte		N03   , An3 , v127
+	.byte	W03
+	.byte		N03   , Dn4 , v127
+	.byte	W03
+	.byte		N03   , An3 , v127
+	.byte	W03
+	.byte	FINE
+
+@**************** Track 10 (Midi-Chn.10) ****************@
+
+mus_sm3dw_beachlevel_10:
+	.byte	KEYSH , mus_sm3dw_beachlevel_key+0
+@ 000   ----------------------------------------
+	.byte		VOICE , 0
+	.byte		VOL   , 127*mus_sm3dw_beachlevel_mvl/mxv
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W18
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W12
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W12
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte	W12
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W12
+	.byte		N06   , Ds3 , v127
+	.byte	W12
+@ 001   ----------------------------------------
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W18
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , An3 , v127
+	.byte	W12
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W12
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte	W06
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , An3 , v127
+	.byte	W06
+@ 002   ----------------------------------------
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W18
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W12
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W12
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte	W12
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W12
+	.byte		N06   , Ds3 , v127
+	.byte	W12
+@ 003   ----------------------------------------
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W18
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , An3 , v127
+	.byte	W12
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W12
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , Fn3 , v127
+	.byte	W06
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , Fn3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , Fs3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , Fs3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , Fs3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Fs3 , v127
+	.byte		N06   , As3 , v127
+	.byte	W06
+@ 004   ----------------------------------------
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W12
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , Ds4 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+@ 005   ----------------------------------------
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W12
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , Ds4 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+@ 006   ----------------------------------------
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W12
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , Ds4 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+@ 007   ----------------------------------------
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W12
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , Ds4 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+@ 008   ----------------------------------------
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W12
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , Ds4 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+@ 009   ----------------------------------------
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W12
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , Ds4 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+@ 010   ----------------------------------------
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W12
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , Ds4 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+@ 011   ----------------------------------------
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W12
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , Ds4 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+@ 012   ----------------------------------------
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W12
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , Ds4 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+@ 013   ----------------------------------------
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , Ds4 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+@ 014   ----------------------------------------
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W12
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , Ds4 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+@ 015   ----------------------------------------
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W12
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , Fn3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , Ds4 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , Fn3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , Fs3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , Fs3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , Fs3 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Fs3 , v127
+	.byte		N06   , As3 , v127
+	.byte	W06
+@ 016   ----------------------------------------
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W12
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , Ds4 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+@ 017   ----------------------------------------
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W12
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , Ds4 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+@ 018   ----------------------------------------
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W12
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , Ds4 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+@ 019   ----------------------------------------
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte	W12
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+@ 020   ----------------------------------------
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W12
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , Ds4 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+@ 021   ----------------------------------------
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte	W12
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+@ 022   ----------------------------------------
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W12
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , Ds4 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+@ 023   ----------------------------------------
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W12
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , Fs3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , Fs3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , Fs3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , Fs3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , Fs3 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Fs3 , v127
+	.byte		N06   , As3 , v127
+	.byte	W06
+@ 024   ----------------------------------------
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W18
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W12
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte	W12
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W12
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+@ 025   ----------------------------------------
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W18
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , An3 , v127
+	.byte	W12
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte	W06
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W12
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+@ 026   ----------------------------------------
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W18
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W12
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte	W12
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W12
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+@ 027   ----------------------------------------
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W18
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , An3 , v127
+	.byte	W12
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W12
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W12
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+@ 028   ----------------------------------------
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W18
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W12
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte	W06
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W12
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+@ 029   ----------------------------------------
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W18
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , An3 , v127
+	.byte	W12
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte	W06
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+@ 030   ----------------------------------------
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W18
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W12
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte	W12
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W12
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+@ 031   ----------------------------------------
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W18
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W12
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , Fs3 , v127
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , Fs3 , v127
+	.byte	W06
+	.byte		N06   , Fs3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , Fs3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Fs3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , Fs3 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+@ 032   ----------------------------------------
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , Fs3 , v127
+	.byte		N06   , As3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W12
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , Ds4 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+@ 033   ----------------------------------------
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W12
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , Ds4 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+@ 034   ----------------------------------------
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W12
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , Ds4 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+@ 035   ----------------------------------------
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W12
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , Ds4 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+@ 036   ----------------------------------------
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W12
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , Ds4 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+@ 037   ----------------------------------------
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W12
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , Ds4 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+@ 038   ----------------------------------------
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W12
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , Ds4 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+@ 039   ----------------------------------------
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W12
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , Ds4 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+@ 040   ----------------------------------------
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W12
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , Ds4 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+@ 041   ----------------------------------------
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , Ds4 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+@ 042   ----------------------------------------
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W12
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , Ds4 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+@ 043   ----------------------------------------
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W12
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , Fn3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , Ds4 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , Fn3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , Fs3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , Fs3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , Fs3 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Fs3 , v127
+	.byte		N06   , As3 , v127
+	.byte	W06
+@ 044   ----------------------------------------
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W12
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , Ds4 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+@ 045   ----------------------------------------
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W12
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , Ds4 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+@ 046   ----------------------------------------
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W12
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , Ds4 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+@ 047   ----------------------------------------
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte	W12
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+@ 048   ----------------------------------------
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W12
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , Ds4 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+@ 049   ----------------------------------------
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte	W12
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+@ 050   ----------------------------------------
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W12
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , Ds4 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+@ 051   ----------------------------------------
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W12
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , Fs3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , Fs3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , Fs3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , Fs3 , v127
+	.byte	W06
+	.byte		N06   , Fs2 , v127
+	.byte		N06   , En3 , v127
+	.byte		N06   , Fs3 , v127
+	.byte		N06   , As4 , v127
+	.byte	W06
+	.byte		N06   , Fs3 , v127
+	.byte		N06   , As3 , v127
+	.byte	W06
+@ 052   ----------------------------------------
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W18
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W12
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte	W12
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W12
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+@ 053   ----------------------------------------
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W18
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , An3 , v127
+	.byte	W12
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte	W06
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W12
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+@ 054   ----------------------------------------
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W18
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W12
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte	W12
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W12
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+@ 055   ----------------------------------------
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W18
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , An3 , v127
+	.byte	W12
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W12
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W12
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+@ 056   ----------------------------------------
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W18
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W12
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte	W06
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W12
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+@ 057   ----------------------------------------
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W18
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , An3 , v127
+	.byte	W12
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte	W06
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+@ 058   ----------------------------------------
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W18
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W12
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte	W12
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W12
+	.byte		N06   , Ds3 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+@ 059   ----------------------------------------
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , As3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W18
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W12
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , Fs3 , v127
+	.byte		N06   , As3 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , Fs3 , v127
+	.byte	W06
+	.byte		N06   , Fs3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Cn3 , v127
+	.byte		N06   , Fs3 , v127
+	.byte		N06   , An3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , An3 , v127
+	.byte		N06   , Ds4 , v127
+	.byte	W06
+	.byte		N06   , Fs3 , v127
+	.byte	W06
+	.byte		N06   , Ds3 , v127
+	.byte		N06   , Fs3 , v127
+	.byte	W06
+	.byte		N06   , As3 , v127
+	.byte	W06
+@ 060   ----------------------------------------
+	.byte	FINE
+
+@******************************************************@
+	.align	2
+
+mus_sm3dw_beachlevel:
+	.byte	10	@ NumTrks
+	.byte	0	@ NumBlks
+	.byte	mus_sm3dw_beachlevel_pri	@ Priority
+	.byte	mus_sm3dw_beachlevel_rev	@ Reverb.
+
+	.word	mus_sm3dw_beachlevel_grp
+
+	.word	mus_sm3dw_beachlevel_1
+	.word	mus_sm3dw_beachlevel_2
+	.word	mus_sm3dw_beachlevel_3
+	.word	mus_sm3dw_beachlevel_4
+	.word	mus_sm3dw_beachlevel_5
+	.word	mus_sm3dw_beachlevel_6
+	.word	mus_sm3dw_beachlevel_7
+	.word	mus_sm3dw_beachlevel_8
+	.word	mus_sm3dw_beachlevel_9
+	.word	mus_sm3dw_beachlevel_10
+
+	.end
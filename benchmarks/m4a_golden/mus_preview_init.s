@@ -0,0 +1,1536 @@
+	.include "MPlayDef.s"
+
+	.equ	mus_preview_init_grp, voicegroup_test
+	.equ	mus_preview_init_pri, 0
+	.equ	mus_preview_init_rev, reverb_set+50
+	.equ	mus_preview_init_mvl, 90
+	.equ	mus_preview_init_key, 0
+	.equ	mus_preview_init_tbs, 1
+	.equ	mus_preview_init_exg, 1
+	.equ	mus_preview_init_cmp, 1
+
+	.section .rodata
+	.global	mus_preview_init
+	.align	2
+
+@**************** Track 1 (Midi-Chn.10) ****************@
+
+mus_preview_init_1:
+	.byte	KEYSH , mus_preview_init_key+0
+@ 000   ----------------------------------------
+	.byte	TEMPO , 126*mus_preview_init_tbs/2
+	.byte		VOICE , 0
+	.byte		VOL   , 127*mus_preview_init_mvl/mxv
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte		N06   , Ds2 , v057
+	.byte		N06   , Fs2 , v041
+	.byte		N06   , Gn2 , v057
+	.byte		N06   , Gn2 , v050
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Fs2 , v041
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte		N06   , Fs2 , v041
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Fs2 , v041
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+@ 001   ----------------------------------------
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte		N06   , Fs2 , v041
+	.byte	W10
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , Fs1 , v057
+	.byte	W02
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Fs2 , v041
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte		N06   , Fs2 , v041
+	.byte	W10
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , Fs1 , v057
+	.byte	W02
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte	W06
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Fs2 , v041
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte	W04
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , Fs1 , v057
+	.byte	W02
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+@ 002   ----------------------------------------
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte		N06   , Fs2 , v041
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Fs2 , v041
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte		N06   , Fs2 , v041
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Fs2 , v041
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+@ 003   ----------------------------------------
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte		N06   , Fs2 , v041
+	.byte	W10
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , Fs1 , v057
+	.byte	W02
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Fs2 , v041
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte		N06   , Fs2 , v041
+	.byte	W10
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , Fs1 , v057
+	.byte	W02
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte	W06
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Fs2 , v041
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte	W04
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , Fs1 , v057
+	.byte	W02
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+@ 004   ----------------------------------------
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte		N06   , Ds2 , v057
+	.byte		N06   , Fs2 , v041
+	.byte		N06   , Gn2 , v057
+	.byte		N06   , Gn2 , v050
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Fs2 , v041
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte		N06   , Fs2 , v041
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Fs2 , v041
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+@ 005   ----------------------------------------
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte		N06   , Fs2 , v041
+	.byte	W10
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , Fs1 , v057
+	.byte	W02
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Fs2 , v041
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte		N06   , Fs2 , v041
+	.byte	W10
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , Fs1 , v057
+	.byte	W02
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte	W06
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Fs2 , v041
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte	W04
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , Fs1 , v057
+	.byte	W02
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+@ 006   ----------------------------------------
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte		N06   , Fs2 , v041
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Fs2 , v041
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte		N06   , Fs2 , v041
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Fs2 , v041
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+@ 007   ----------------------------------------
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte		N06   , Fs2 , v041
+	.byte	W10
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , Fs1 , v057
+	.byte	W02
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Fs2 , v041
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte		N06   , Fs2 , v041
+	.byte	W10
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , Fs1 , v057
+	.byte	W02
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte	W06
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Fs2 , v041
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte	W04
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , Fs1 , v057
+	.byte	W02
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+@ 008   ----------------------------------------
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte		N06   , Ds2 , v057
+	.byte		N06   , Fs2 , v041
+	.byte		N06   , Gn2 , v057
+	.byte		N06   , Gn2 , v050
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Fs2 , v041
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte		N06   , Fs2 , v041
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Fs2 , v041
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+@ 009   ----------------------------------------
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte		N06   , Fs2 , v041
+	.byte	W10
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , Fs1 , v057
+	.byte	W02
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Fs2 , v041
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte		N06   , Fs2 , v041
+	.byte	W10
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , Fs1 , v057
+	.byte	W02
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte	W06
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Fs2 , v041
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte	W04
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , Fs1 , v057
+	.byte	W02
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+@ 010   ----------------------------------------
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte		N06   , Fs2 , v041
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Fs2 , v041
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte		N06   , Fs2 , v041
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Fs2 , v041
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+@ 011   ----------------------------------------
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte		N06   , Fs2 , v041
+	.byte	W10
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , Fs1 , v057
+	.byte	W02
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Fs2 , v041
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte		N06   , Fs2 , v041
+	.byte	W10
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , Fs1 , v057
+	.byte	W02
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte	W06
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Fs2 , v041
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte	W04
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , Fs1 , v057
+	.byte	W02
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+@ 012   ----------------------------------------
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte		N06   , Ds2 , v057
+	.byte		N06   , Fs2 , v041
+	.byte		N06   , Gn2 , v057
+	.byte		N06   , Gn2 , v050
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Fs2 , v041
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte		N06   , Fs2 , v041
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Fs2 , v041
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+@ 013   ----------------------------------------
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte		N06   , Fs2 , v041
+	.byte	W10
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , Fs1 , v057
+	.byte	W02
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Fs2 , v041
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte		N06   , Fs2 , v041
+	.byte	W10
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , Fs1 , v057
+	.byte	W02
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte	W06
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Fs2 , v041
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte	W04
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , Fs1 , v057
+	.byte	W02
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+@ 014   ----------------------------------------
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte		N06   , Fs2 , v041
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Fs2 , v041
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte		N06   , Fs2 , v041
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Fs2 , v041
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+@ 015   ----------------------------------------
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte		N06   , Fs2 , v041
+	.byte	W10
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , Fs1 , v057
+	.byte	W02
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Fs2 , v041
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte		N06   , Fs2 , v041
+	.byte	W10
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , Fs1 , v057
+	.byte	W02
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte	W06
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Fs2 , v041
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte	W04
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , Fs1 , v057
+	.byte	W02
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+@ 016   ----------------------------------------
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte		N06   , Ds2 , v057
+	.byte		N06   , Fs2 , v041
+	.byte		N06   , Gn2 , v057
+	.byte		N06   , Gn2 , v050
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Fs2 , v041
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte		N06   , Fs2 , v041
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Fs2 , v041
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+@ 017   ----------------------------------------
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte		N06   , Fs2 , v041
+	.byte	W10
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , Fs1 , v057
+	.byte	W02
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Fs2 , v041
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte		N06   , Fs2 , v041
+	.byte	W10
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , Fs1 , v057
+	.byte	W02
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte	W06
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Fs2 , v041
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte	W04
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , Fs1 , v057
+	.byte	W02
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+@ 018   ----------------------------------------
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte		N06   , Fs2 , v041
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Fs2 , v041
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte		N06   , Fs2 , v041
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Fs2 , v041
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+@ 019   ----------------------------------------
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte		N06   , Fs2 , v041
+	.byte	W10
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , Fs1 , v057
+	.byte	W02
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Fs2 , v041
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte		N06   , Fs2 , v041
+	.byte	W10
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , Fs1 , v057
+	.byte	W02
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte	W06
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Fs2 , v041
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte	W04
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , Fs1 , v057
+	.byte	W02
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+@ 020   ----------------------------------------
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte		N06   , Ds2 , v057
+	.byte		N06   , Fs2 , v041
+	.byte		N06   , Gn2 , v057
+	.byte		N06   , Gn2 , v050
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Fs2 , v041
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte		N06   , Fs2 , v041
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Fs2 , v041
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+@ 021   ----------------------------------------
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte		N06   , Fs2 , v041
+	.byte	W10
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , Fs1 , v057
+	.byte	W02
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Fs2 , v041
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte		N06   , Fs2 , v041
+	.byte	W10
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , Fs1 , v057
+	.byte	W02
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte	W06
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Fs2 , v041
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte	W04
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , Fs1 , v057
+	.byte	W02
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+@ 022   ----------------------------------------
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte		N06   , Fs2 , v041
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Fs2 , v041
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte		N06   , Fs2 , v041
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Fs2 , v041
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+@ 023   ----------------------------------------
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte		N06   , Fs2 , v041
+	.byte	W10
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , Fs1 , v057
+	.byte	W02
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Fs2 , v041
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte		N06   , Fs2 , v041
+	.byte	W10
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , Fs1 , v057
+	.byte	W02
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte	W06
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Fs2 , v041
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte	W04
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , Fs1 , v057
+	.byte	W02
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+@ 024   ----------------------------------------
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte		N06   , Ds2 , v057
+	.byte		N06   , Fs2 , v041
+	.byte		N06   , Gn2 , v057
+	.byte		N06   , Gn2 , v050
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Fs2 , v041
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte		N06   , Fs2 , v041
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Fs2 , v041
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+@ 025   ----------------------------------------
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte		N06   , Fs2 , v041
+	.byte	W10
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , Fs1 , v057
+	.byte	W02
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Fs2 , v041
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte		N06   , Fs2 , v041
+	.byte	W10
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , Fs1 , v057
+	.byte	W02
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte	W06
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Fs2 , v041
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte	W04
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , Fs1 , v057
+	.byte	W02
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+@ 026   ----------------------------------------
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte		N06   , Fs2 , v041
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Fs2 , v041
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte		N06   , Fs2 , v041
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Fs2 , v041
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+@ 027   ----------------------------------------
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte		N06   , Fs2 , v041
+	.byte	W10
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , Fs1 , v057
+	.byte	W02
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Fs2 , v041
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte		N06   , Fs2 , v041
+	.byte	W10
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , Fs1 , v057
+	.byte	W02
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte	W06
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Fs2 , v041
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte	W04
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , Fs1 , v057
+	.byte	W02
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+@ 028   ----------------------------------------
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte		N06   , Ds2 , v057
+	.byte		N06   , Fs2 , v041
+	.byte		N06   , Gn2 , v057
+	.byte		N06   , Gn2 , v050
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Fs2 , v041
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte		N06   , Fs2 , v041
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Fs2 , v041
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+@ 029   ----------------------------------------
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte		N06   , Fs2 , v041
+	.byte	W10
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , Fs1 , v057
+	.byte	W02
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Fs2 , v041
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte		N06   , Fs2 , v041
+	.byte	W10
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , Fs1 , v057
+	.byte	W02
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte	W06
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Fs2 , v041
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte	W04
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , Fs1 , v057
+	.byte	W02
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+@ 030   ----------------------------------------
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte		N06   , Fs2 , v041
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Fs2 , v041
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte		N06   , Fs2 , v041
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Fs2 , v041
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+@ 031   ----------------------------------------
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte		N06   , Fs2 , v041
+	.byte	W10
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , Fs1 , v057
+	.byte	W02
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Fs2 , v041
+	.byte	W12
+	.byte		N06   , Fs1 , v040
+	.byte	W12
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Fn1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Gn1 , v050
+	.byte		N06   , Fs2 , v041
+	.byte	W10
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , Fs1 , v057
+	.byte	W02
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte	W06
+	.byte		N06   , Cn1 , v025
+	.byte		N06   , Cn1 , v050
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Dn1 , v025
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte		N06   , Fs2 , v041
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte	W04
+	.byte		N03   , Fs1 , v057
+	.byte		N03   , Fs1 , v057
+	.byte	W02
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+	.byte		N06   , Ds1 , v050
+	.byte		N06   , Fs1 , v040
+	.byte	W06
+@ 032   ----------------------------------------
+	.byte	FINE
+
+@******************************************************@
+	.align	2
+
+mus_preview_init:
+	.byte	1	@ NumTrks
+	.byte	0	@ NumBlks
+	.byte	mus_preview_init_pri	@ Priority
+	.byte	mus_preview_init_rev	@ Reverb.
+
+	.word	mus_preview_init_grp
+
+	.word	mus_preview_init_1
+
+	.end
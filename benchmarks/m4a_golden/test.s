@@ -0,0 +1,2127 @@
+	.include "MPlayDef.s"
+
+	.equ	mus_test_grp, voicegroup_test
+	.equ	mus_test_pri, 0
+	.equ	mus_test_rev, reverb_set+50
+	.equ	mus_test_mvl, 90
+	.equ	mus_test_key, 0
+	.equ	mus_test_tbs, 1
+	.equ	mus_test_exg, 1
+	.equ	mus_test_cmp, 1
+
+	.section .rodata
+	.global	mus_test
+	.align	2
+
+@**************** Track 1 (Midi-Chn.1) ****************@
+
+mus_test_1:
+	.byte	KEYSH , mus_test_key+0
+@ 000   ----------------------------------------
+	.byte	TEMPO , 132*mus_test_tbs/2
+	.byte		VOICE , 1
+	.byte		VOL   , 127*mus_test_mvl/mxv
+	.byte	W12
+	.byte		N12   , Fs2 , v072
+	.byte	W18
+	.byte		N06   , Cs2 , v076
+	.byte	W18
+	.byte		N12   , Fs2 , v072
+	.byte	W24
+	.byte		N12   , Fs2 , v072
+	.byte	W24
+@ 001   ----------------------------------------
+	.byte		N06   , Fs2 , v072
+	.byte	W06
+	.byte		N06   , As2 , v072
+	.byte	W06
+	.byte		N36   , Cs3 , v072
+	.byte	W36
+	.byte		N24   , Bn2 , v072
+	.byte	W24
+	.byte		N06   , Gs2 , v072
+	.byte	W12
+	.byte		N06   , Bn2 , v072
+	.byte	W12
+@ 002   ----------------------------------------
+	.byte		N06   , Gs2 , v072
+	.byte	W12
+	.byte		N12   , Fs2 , v072
+	.byte	W18
+	.byte		N06   , Cs2 , v076
+	.byte	W18
+	.byte		N12   , Fs2 , v072
+	.byte	W24
+	.byte		N12   , Fs2 , v072
+	.byte	W24
+@ 003   ----------------------------------------
+	.byte		N06   , Fs2 , v072
+	.byte	W06
+	.byte		N06   , As2 , v072
+	.byte	W06
+	.byte		N24   , Cs3 , v072
+	.byte	W24
+	.byte		N06   , Fn3 , v072
+	.byte	W06
+	.byte		N06   , Fs3 , v072
+	.byte	W06
+	.byte		N24   , Gs3 , v072
+	.byte	W24
+	.byte		N24   , Fn3 , v072
+	.byte	W24
+@ 004   ----------------------------------------
+	.byte		N12   , Gs3 , v072
+	.byte	W12
+	.byte		N12   , As3 , v076
+	.byte	W18
+	.byte		N03   , Fs3 , v076
+	.byte	W06
+	.byte		N24   , Fs3 , v076
+	.byte	W36
+	.byte		N09   , As3 , v072
+	.byte	W12
+	.byte		N09   , Bn3 , v072
+	.byte	W12
+@ 005   ----------------------------------------
+	.byte		N12   , As3 , v072
+	.byte	W12
+	.byte		N30   , Gs3 , v072
+	.byte	W36
+	.byte		N06   , Fn3 , v072
+	.byte	W06
+	.byte		N06   , Gs3 , v072
+	.byte	W06
+	.byte		N44   , Fn3 , v072
+	.byte	W36
+@ 006   ----------------------------------------
+	.byte	W12
+	.byte		N12   , Ds3 , v076
+	.byte	W18
+	.byte		N03   , Fn3 , v076
+	.byte	W06
+	.byte		N24   , Fs3 , v076
+	.byte	W36
+	.byte		N09   , Fs4 , v068
+	.byte	W12
+	.byte		N09   , Fn4 , v068
+	.byte	W12
+@ 007   ----------------------------------------
+	.byte		N12   , Ds4 , v068
+	.byte	W12
+	.byte		N30   , Fs4 , v068
+	.byte	W36
+	.byte		N06   , Gs4 , v068
+	.byte	W06
+	.byte		N06   , Fs4 , v068
+	.byte	W06
+	.byte		N42   , Fn4 , v068
+	.byte	W36
+@ 008   ----------------------------------------
+	.byte	W12
+	.byte		N12   , As3 , v076
+	.byte	W18
+	.byte		N03   , Fs3 , v076
+	.byte	W06
+	.byte		N24   , Fs3 , v076
+	.byte	W24
+	.byte		N12   , As3 , v076
+	.byte	W18
+	.byte		N03   , Fs3 , v076
+	.byte	W06
+	.byte		N24   , Fs3 , v076
+	.byte	W12
+@ 009   ----------------------------------------
+	.byte	W12
+	.byte		N21   , Fn3 , v076
+	.byte	W24
+	.byte		N21   , Fs3 , v076
+	.byte	W24
+	.byte		N21   , Gs3 , v076
+	.byte	W24
+	.byte		N21   , Fn3 , v076
+	.byte	W12
+@ 010   ----------------------------------------
+	.byte	W12
+	.byte		N12   , Fs3 , v076
+	.byte	W18
+	.byte		N03   , Fn3 , v076
+	.byte	W06
+	.byte		N24   , Ds3 , v076
+	.byte	W24
+	.byte		N12   , Fs3 , v076
+	.byte	W18
+	.byte		N06   , Fn3 , v076
+	.byte	W06
+	.byte		N24   , Ds3 , v076
+	.byte	W12
+@ 011   ----------------------------------------
+	.byte	W12
+	.byte		N03   , Cs2 , v060
+	.byte	W06
+	.byte		N03   , Cs2 , v060
+	.byte	W06
+	.byte		N06   , Cs2 , v060
+	.byte	W12
+	.byte		N06   , Gs2 , v088
+	.byte	W12
+	.byte		N03   , Cs2 , v060
+	.byte	W06
+	.byte		N03   , Cs2 , v060
+	.byte	W06
+	.byte		N06   , Cs2 , v060
+	.byte	W12
+	.byte		N12   , Gs3 , v100
+	.byte	W12
+	.byte		N12   , As3 , v100
+	.byte	W12
+@ 012   ----------------------------------------
+	.byte		N12   , Bn3 , v100
+	.byte	W12
+	.byte		N06   , Fs3 , v056
+	.byte	W06
+	.byte		N06   , As3 , v056
+	.byte	W06
+	.byte		N06   , Cs4 , v060
+	.byte	W06
+	.byte		N06   , As3 , v064
+	.byte	W06
+	.byte		N06   , Fs4 , v052
+	.byte	W06
+	.byte		N06   , As4 , v056
+	.byte	W06
+	.byte		N06   , Cs5 , v060
+	.byte	W06
+	.byte		N06   , As4 , v064
+	.byte	W06
+	.byte		N06   , Fs5 , v076
+	.byte	W06
+	.byte		N06   , Fn5 , v072
+	.byte	W06
+	.byte		N06   , Cs5 , v068
+	.byte	W06
+	.byte		N06   , As4 , v064
+	.byte	W06
+	.byte		N06   , Fs4 , v060
+	.byte	W06
+	.byte		N06   , Fn4 , v056
+	.byte	W06
+@ 013   ----------------------------------------
+	.byte		N06   , Cs4 , v052
+	.byte	W06
+	.byte		N06   , As3 , v048
+	.byte	W06
+	.byte		N06   , Fn3 , v056
+	.byte	W06
+	.byte		N06   , Gs3 , v056
+	.byte	W06
+	.byte		N06   , Cs4 , v060
+	.byte	W06
+	.byte		N06   , Gs3 , v064
+	.byte	W06
+	.byte		N06   , Fn4 , v052
+	.byte	W06
+	.byte		N06   , Gs4 , v056
+	.byte	W06
+	.byte		N06   , Cs5 , v060
+	.byte	W06
+	.byte		N06   , Gs4 , v064
+	.byte	W06
+	.byte		N06   , Fn5 , v076
+	.byte	W06
+	.byte		N06   , Ds5 , v072
+	.byte	W06
+	.byte		N06   , Cs5 , v068
+	.byte	W06
+	.byte		N06   , Gs4 , v064
+	.byte	W06
+	.byte		N06   , Fn4 , v060
+	.byte	W06
+	.byte		N06   , Ds4 , v056
+	.byte	W06
+@ 014   ----------------------------------------
+	.byte		N06   , Cs4 , v052
+	.byte	W06
+	.byte		N06   , Gs3 , v048
+	.byte	W06
+	.byte		N06   , En3 , v056
+	.byte	W06
+	.byte		N06   , Gs3 , v056
+	.byte	W06
+	.byte		N06   , Cs4 , v060
+	.byte	W06
+	.byte		N06   , Gs3 , v064
+	.byte	W06
+	.byte		N06   , En4 , v052
+	.byte	W06
+	.byte		N06   , Gs4 , v056
+	.byte	W06
+	.byte		N06   , Cs5 , v060
+	.byte	W06
+	.byte		N06   , Gs4 , v064
+	.byte	W06
+	.byte		N06   , En5 , v076
+	.byte	W06
+	.byte		N06   , Ds5 , v072
+	.byte	W06
+	.byte		N06   , Cs5 , v068
+	.byte	W06
+	.byte		N06   , Gs4 , v064
+	.byte	W06
+	.byte		N06   , En4 , v060
+	.byte	W06
+	.byte		N06   , Ds4 , v056
+	.byte	W06
+@ 015   ----------------------------------------
+	.byte		N06   , Cs4 , v052
+	.byte	W06
+	.byte		N06   , Gs3 , v048
+	.byte	W06
+	.byte		N06   , Ds3 , v056
+	.byte	W06
+	.byte		N06   , Fs3 , v056
+	.byte	W06
+	.byte		N06   , Bn3 , v060
+	.byte	W06
+	.byte		N06   , Fs3 , v064
+	.byte	W06
+	.byte		N06   , Ds4 , v052
+	.byte	W06
+	.byte		N06   , Fs4 , v056
+	.byte	W06
+	.byte		N06   , Bn4 , v060
+	.byte	W06
+	.byte		N06   , Fs4 , v064
+	.byte	W06
+	.byte		N06   , Ds5 , v076
+	.byte	W06
+	.byte		N06   , Cs5 , v072
+	.byte	W06
+	.byte		N06   , Bn4 , v068
+	.byte	W06
+	.byte		N06   , Fs4 , v064
+	.byte	W06
+	.byte		N06   , Ds4 , v060
+	.byte	W06
+	.byte		N06   , Cs4 , v056
+	.byte	W06
+@ 016   ----------------------------------------
+	.byte		N06   , Bn3 , v052
+	.byte	W06
+	.byte		N06   , Fs3 , v048
+	.byte	W06
+	.byte	FINE
+
+@**************** Track 2 (Midi-Chn.2) ****************@
+
+mus_test_2:
+	.byte	KEYSH , mus_test_key+0
+@ 000   ----------------------------------------
+	.byte		VOICE , 2
+	.byte		VOL   , 127*mus_test_mvl/mxv
+	.byte	W12
+	.byte		N24   , Fs3 , v108
+	.byte	W30
+	.byte		N06   , Cs3 , v108
+	.byte	W06
+	.byte		N06   , Fs3 , v108
+	.byte	W06
+	.byte		N06   , Cs4 , v108
+	.byte	W06
+	.byte		N21   , Fs4 , v108
+	.byte	W24
+	.byte		N09   , Fn4 , v108
+	.byte	W12
+@ 001   ----------------------------------------
+	.byte		N09   , Cs4 , v108
+	.byte	W12
+	.byte		N90   , Gs3 , v108
+	.byte	W84
+@ 002   ----------------------------------------
+	.byte	W12
+	.byte		N24   , Fs3 , v108
+	.byte	W30
+	.byte		N06   , Cs3 , v108
+	.byte	W06
+	.byte		N06   , Fs3 , v108
+	.byte	W06
+	.byte		N06   , Cs4 , v108
+	.byte	W06
+	.byte		N21   , Fs4 , v108
+	.byte	W24
+	.byte		N09   , Fn4 , v108
+	.byte	W12
+@ 003   ----------------------------------------
+	.byte		N09   , Cs4 , v108
+	.byte	W12
+	.byte		N90   , Gs4 , v108
+	.byte	W84
+@ 004   ----------------------------------------
+	.byte	W12
+	.byte		N12   , As4 , v108
+	.byte	W18
+	.byte		N03   , Fs4 , v108
+	.byte	W06
+	.byte		N24   , Fs4 , v108
+	.byte	W36
+	.byte		N09   , Fs4 , v108
+	.byte	W12
+	.byte		N09   , Gs4 , v108
+	.byte	W12
+@ 005   ----------------------------------------
+	.byte		N12   , Fs4 , v108
+	.byte	W12
+	.byte		N30   , Fn4 , v108
+	.byte	W36
+	.byte		N06   , Ds4 , v108
+	.byte	W06
+	.byte		N06   , Fn4 , v108
+	.byte	W06
+	.byte		N36   , Cs4 , v108
+	.byte	W36
+@ 006   ----------------------------------------
+	.byte	W12
+	.byte		N12   , Ds4 , v108
+	.byte	W18
+	.byte		N03   , Fn4 , v108
+	.byte	W06
+	.byte		N24   , Fs4 , v108
+	.byte	W36
+	.byte		N09   , Bn4 , v108
+	.byte	W12
+	.byte		N09   , As4 , v108
+	.byte	W12
+@ 007   ----------------------------------------
+	.byte		N12   , Gs4 , v108
+	.byte	W12
+	.byte		N30   , As4 , v108
+	.byte	W36
+	.byte		N06   , Bn4 , v108
+	.byte	W06
+	.byte		N06   , As4 , v108
+	.byte	W06
+	.byte		N42   , Gs4 , v108
+	.byte	W36
+@ 008   ----------------------------------------
+	.byte	W12
+	.byte		N12   , As4 , v108
+	.byte	W18
+	.byte		N03   , Fs4 , v108
+	.byte	W06
+	.byte		N24   , Fs4 , v108
+	.byte	W36
+	.byte		N09   , Fs4 , v108
+	.byte	W12
+	.byte		N09   , Gs4 , v108
+	.byte	W12
+@ 009   ----------------------------------------
+	.byte		N12   , Fs4 , v108
+	.byte	W12
+	.byte		N30   , Fn4 , v108
+	.byte	W36
+	.byte		N06   , Ds4 , v108
+	.byte	W06
+	.byte		N06   , Fn4 , v108
+	.byte	W06
+	.byte		N24   , Cs4 , v108
+	.byte	W24
+	.byte		N24   , Gs4 , v108
+	.byte	W12
+@ 010   ----------------------------------------
+	.byte	W12
+	.byte		N12   , Fs4 , v108
+	.byte	W18
+	.byte		N03   , Fn4 , v108
+	.byte	W06
+	.byte		N24   , Ds4 , v108
+	.byte	W36
+	.byte		N09   , Ds4 , v108
+	.byte	W12
+	.byte		N09   , Fn4 , v108
+	.byte	W12
+@ 011   ----------------------------------------
+	.byte		N12   , Fs4 , v108
+	.byte	W12
+	.byte		N30   , Fn4 , v108
+	.byte	W36
+	.byte		N06   , Fn4 , v108
+	.byte	W06
+	.byte		N06   , Fs4 , v108
+	.byte	W06
+	.byte		N44   , Gs4 , v108
+	.byte	W36
+@ 012   ----------------------------------------
+	.byte	W12
+	.byte		N12   , As3 , v108
+	.byte	W18
+	.byte		N06   , Bn3 , v108
+	.byte	W06
+	.byte		N30   , Cs4 , v108
+	.byte	W36
+	.byte		N09   , Cs4 , v108
+	.byte	W12
+	.byte		N09   , Ds4 , v108
+	.byte	W12
+@ 013   ----------------------------------------
+	.byte		N09   , Cs4 , v108
+	.byte	W12
+	.byte		N32   , Gs3 , v108
+	.byte	W36
+	.byte		N06   , Fs3 , v108
+	.byte	W06
+	.byte		N06   , Gs3 , v108
+	.byte	W06
+	.byte		N42   , Cs3 , v108
+	.byte	W36
+@ 014   ----------------------------------------
+	.byte	W12
+	.byte		N12   , As3 , v108
+	.byte	W18
+	.byte		N06   , Bn3 , v108
+	.byte	W06
+	.byte		N30   , Cs4 , v108
+	.byte	W36
+	.byte		N09   , Gs3 , v108
+	.byte	W12
+	.byte		N09   , Cs4 , v108
+	.byte	W12
+@ 015   ----------------------------------------
+	.byte		N09   , En4 , v108
+	.byte	W12
+	.byte		N32   , Ds4 , v108
+	.byte	W36
+	.byte		N06   , Cs4 , v108
+	.byte	W06
+	.byte		N06   , Ds4 , v108
+	.byte	W06
+	.byte		N44   , Bn3 , v108
+	.byte	W36
+@ 016   ----------------------------------------
+	.byte	W12
+	.byte		N12   , Bn3 , v108
+	.byte	W18
+	.byte		N06   , Cs4 , v108
+	.byte	W06
+	.byte		N32   , Dn4 , v108
+	.byte	W36
+	.byte		N09   , Dn4 , v108
+	.byte	W12
+	.byte		N09   , En4 , v108
+	.byte	W12
+@ 017   ----------------------------------------
+	.byte		N12   , Dn4 , v108
+	.byte	W12
+	.byte		N36   , Cs4 , v108
+	.byte	W36
+	.byte		N06   , Cn4 , v108
+	.byte	W06
+	.byte		N06   , Bn3 , v108
+	.byte	W06
+	.byte		N42   , As3 , v108
+	.byte	W36
+@ 018   ----------------------------------------
+	.byte	W12
+	.byte		N09   , Gs3 , v108
+	.byte	W18
+	.byte		N06   , As3 , v108
+	.byte	W06
+	.byte		N68   , Bn3 , v108
+	.byte	W60
+@ 019   ----------------------------------------
+	.byte	W12
+	.byte		N12   , Cs4 , v108
+	.byte	W18
+	.byte		N06   , Ds4 , v108
+	.byte	W06
+	.byte		N68   , Fn4 , v108
+	.byte	W60
+@ 020   ----------------------------------------
+	.byte	W08
+	.byte	FINE
+
+@**************** Track 3 (Midi-Chn.3) ****************@
+
+mus_test_3:
+	.byte	KEYSH , mus_test_key+0
+@ 000   ----------------------------------------
+	.byte		VOICE , 3
+	.byte		VOL   , 127*mus_test_mvl/mxv
+	.byte	W96
+@ 001   ----------------------------------------
+	.byte	W12
+	.byte		N18   , Cs4 , v056
+	.byte	W18
+	.byte		N18   , Ds4 , v056
+	.byte	W18
+	.byte		N12   , Fn4 , v056
+	.byte	W12
+	.byte		N36   , Gs3 , v056
+	.byte	W36
+@ 002   ----------------------------------------
+	.byte	W96
+@ 003   ----------------------------------------
+	.byte	W12
+	.byte		N18   , Fn4 , v056
+	.byte	W18
+	.byte		N18   , Ds4 , v056
+	.byte	W18
+	.byte		N12   , Cs4 , v056
+	.byte	W12
+	.byte		N36   , Gs4 , v056
+	.byte	W36
+@ 004   ----------------------------------------
+	.byte	W96
+@ 005   ----------------------------------------
+	.byte	W12
+	.byte		N03   , Cs2 , v060
+	.byte	W06
+	.byte		N03   , Cs2 , v060
+	.byte	W06
+	.byte		N06   , Cs2 , v060
+	.byte	W24
+	.byte		N03   , Cs2 , v060
+	.byte	W06
+	.byte		N03   , Cs2 , v060
+	.byte	W06
+	.byte		N06   , Cs2 , v060
+	.byte	W24
+	.byte		N24   , Cs3 , v064
+	.byte	W12
+@ 006   ----------------------------------------
+	.byte	W12
+	.byte		N12   , Bn2 , v064
+	.byte	W18
+	.byte		N03   , Cs3 , v064
+	.byte	W06
+	.byte		N24   , Ds3 , v064
+	.byte	W60
+@ 007   ----------------------------------------
+	.byte	W12
+	.byte		N03   , Cs2 , v060
+	.byte	W06
+	.byte		N03   , Cs2 , v060
+	.byte	W06
+	.byte		N06   , Cs2 , v060
+	.byte	W24
+	.byte		N06   , Cs3 , v064
+	.byte	W06
+	.byte		N06   , As3 , v064
+	.byte	W06
+	.byte		N12   , Bn3 , v064
+	.byte	W18
+	.byte		N06   , As3 , v064
+	.byte	W06
+	.byte		N24   , Gs3 , v064
+	.byte	W12
+@ 008   ----------------------------------------
+	.byte	W96
+@ 009   ----------------------------------------
+	.byte	W12
+	.byte		N06   , Cs3 , v076
+	.byte	W06
+	.byte		N06   , Fn3 , v056
+	.byte	W06
+	.byte		N06   , Gs3 , v060
+	.byte	W06
+	.byte		N06   , Fn3 , v064
+	.byte	W06
+	.byte		N06   , Gs3 , v064
+	.byte	W06
+	.byte		N06   , Cs4 , v068
+	.byte	W06
+	.byte		N06   , Gs4 , v072
+	.byte	W06
+	.byte		N06   , Cs5 , v072
+	.byte	W06
+	.byte		N06   , Gs3 , v076
+	.byte	W06
+	.byte		N06   , Cs4 , v056
+	.byte	W06
+	.byte		N06   , Fn4 , v056
+	.byte	W06
+	.byte		N06   , Gs4 , v060
+	.byte	W06
+	.byte		N06   , Fn4 , v064
+	.byte	W06
+	.byte		N06   , Gs4 , v068
+	.byte	W06
+@ 010   ----------------------------------------
+	.byte		N06   , Cs5 , v072
+	.byte	W06
+	.byte		N06   , Gs5 , v076
+	.byte	W06
+	.byte		N12   , Ds3 , v064
+	.byte	W18
+	.byte		N03   , Cs3 , v064
+	.byte	W06
+	.byte		N24   , Bn2 , v064
+	.byte	W36
+	.byte		N09   , Bn3 , v068
+	.byte	W12
+	.byte		N09   , Cs4 , v068
+	.byte	W12
+@ 011   ----------------------------------------
+	.byte		N12   , Ds4 , v068
+	.byte	W12
+	.byte		N30   , Cs4 , v068
+	.byte	W36
+	.byte		N06   , Cs4 , v068
+	.byte	W06
+	.byte		N06   , Ds4 , v068
+	.byte	W06
+	.byte		N44   , Fn4 , v068
+	.byte	W36
+@ 012   ----------------------------------------
+	.byte	W96
+@ 013   ----------------------------------------
+	.byte	W60
+	.byte		N18   , Gs3 , v072
+	.byte	W18
+	.byte		N18   , Fn4 , v056
+	.byte	W18
+@ 014   ----------------------------------------
+	.byte		N12   , Cs4 , v072
+	.byte	W12
+	.byte		N36   , En4 , v072
+	.byte	W60
+	.byte		N09   , En4 , v052
+	.byte	W12
+	.byte		N09   , Gs4 , v052
+	.byte	W12
+@ 015   ----------------------------------------
+	.byte		N09   , Cs5 , v052
+	.byte	W12
+	.byte		N32   , Bn4 , v052
+	.byte	W36
+	.byte		N06   , As4 , v052
+	.byte	W06
+	.byte		N06   , Bn4 , v052
+	.byte	W06
+	.byte		N44   , Fs4 , v052
+	.byte	W36
+@ 016   ----------------------------------------
+	.byte	W36
+	.byte		N48   , Fs4 , v072
+	.byte	W60
+@ 017   ----------------------------------------
+	.byte		N12   , Dn4 , v072
+	.byte	W12
+	.byte		N36   , Fs4 , v072
+	.byte	W48
+	.byte		N36   , Cs4 , v072
+	.byte	W36
+@ 018   ----------------------------------------
+	.byte	W12
+	.byte		N09   , Cs3 , v072
+	.byte	W18
+	.byte		N06   , Fs3 , v072
+	.byte	W06
+	.byte		N68   , Gs3 , v072
+	.byte	W60
+@ 019   ----------------------------------------
+	.byte	W12
+	.byte		N12   , Gs3 , v072
+	.byte	W18
+	.byte		N06   , As3 , v072
+	.byte	W06
+	.byte		N68   , Bn3 , v072
+	.byte	W60
+@ 020   ----------------------------------------
+	.byte	W08
+	.byte	FINE
+
+@**************** Track 4 (Midi-Chn.4) ****************@
+
+mus_test_4:
+	.byte	KEYSH , mus_test_key+0
+@ 000   ----------------------------------------
+	.byte		VOICE , 4
+	.byte		VOL   , 127*mus_test_mvl/mxv
+	.byte	W12
+	.byte		N12   , Cs3 , v052
+	.byte	W24
+	.byte		N06   , As2 , v052
+	.byte	W12
+	.byte		N12   , Cs3 , v052
+	.byte	W24
+	.byte		N12   , Cs3 , v052
+	.byte	W12
+	.byte		N06   , As2 , v052
+	.byte	W12
+@ 001   ----------------------------------------
+	.byte		N12   , Cs3 , v052
+	.byte	W12
+	.byte		N12   , Gs2 , v052
+	.byte	W24
+	.byte		N06   , Fn3 , v052
+	.byte	W12
+	.byte		N12   , Gs2 , v052
+	.byte	W24
+	.byte		N12   , Gs2 , v052
+	.byte	W12
+	.byte		N06   , Fn3 , v052
+	.byte	W12
+@ 002   ----------------------------------------
+	.byte		N12   , Gs2 , v052
+	.byte	W12
+	.byte		N12   , Cs3 , v052
+	.byte	W24
+	.byte		N06   , As2 , v052
+	.byte	W12
+	.byte		N12   , Cs3 , v052
+	.byte	W24
+	.byte		N12   , Cs3 , v052
+	.byte	W12
+	.byte		N06   , As2 , v052
+	.byte	W12
+@ 003   ----------------------------------------
+	.byte		N12   , Cs3 , v052
+	.byte	W12
+	.byte		N12   , Cs3 , v052
+	.byte	W24
+	.byte		N06   , Fn3 , v052
+	.byte	W12
+	.byte		N12   , Cs3 , v052
+	.byte	W24
+	.byte		N24   , Cs4 , v052
+	.byte	W24
+@ 004   ----------------------------------------
+	.byte		N12   , Fn4 , v052
+	.byte	W12
+	.byte		N12   , Fs4 , v052
+	.byte	W18
+	.byte		N03   , Cs4 , v052
+	.byte	W06
+	.byte		N30   , Cs4 , v052
+	.byte	W36
+	.byte		N09   , Cs3 , v052
+	.byte	W12
+	.byte		N09   , Ds3 , v052
+	.byte	W12
+@ 005   ----------------------------------------
+	.byte		N12   , Cs3 , v052
+	.byte	W12
+	.byte		N03   , Cs3 , v052
+	.byte	W06
+	.byte		N03   , Cs3 , v052
+	.byte	W06
+	.byte		N06   , Cs3 , v052
+	.byte	W12
+	.byte		N06   , Gs3 , v052
+	.byte	W12
+	.byte		N06   , Cs3 , v052
+	.byte	W06
+	.byte		N06   , Gs2 , v052
+	.byte	W06
+	.byte		N06   , Cs3 , v052
+	.byte	W06
+	.byte		N06   , Fn3 , v052
+	.byte	W06
+	.byte		N06   , Gs3 , v052
+	.byte	W06
+	.byte		N06   , Cs4 , v052
+	.byte	W06
+	.byte		N06   , Gs4 , v052
+	.byte	W06
+	.byte		N06   , Fn4 , v052
+	.byte	W06
+@ 006   ----------------------------------------
+	.byte		N06   , Cs4 , v052
+	.byte	W06
+	.byte		N06   , Gs3 , v052
+	.byte	W06
+	.byte		N12   , Bn3 , v052
+	.byte	W18
+	.byte		N03   , Cs4 , v052
+	.byte	W06
+	.byte		N30   , Ds4 , v052
+	.byte	W36
+	.byte		N09   , Ds3 , v052
+	.byte	W12
+	.byte		N09   , Fn3 , v052
+	.byte	W12
+@ 007   ----------------------------------------
+	.byte		N12   , Fs3 , v052
+	.byte	W12
+	.byte		N03   , Cs3 , v052
+	.byte	W06
+	.byte		N03   , Cs3 , v052
+	.byte	W06
+	.byte		N06   , Cs3 , v052
+	.byte	W12
+	.byte		N06   , As3 , v052
+	.byte	W12
+	.byte		N06   , Gs3 , v052
+	.byte	W06
+	.byte		N06   , Fs3 , v052
+	.byte	W06
+	.byte		N12   , Gs3 , v052
+	.byte	W18
+	.byte		N03   , Fs3 , v052
+	.byte	W06
+	.byte		N24   , Fn3 , v052
+	.byte	W12
+@ 008   ----------------------------------------
+	.byte	W12
+	.byte		N12   , Fs4 , v052
+	.byte	W18
+	.byte		N03   , Cs4 , v052
+	.byte	W06
+	.byte		N30   , Cs4 , v052
+	.byte	W36
+	.byte		N09   , Cs3 , v052
+	.byte	W12
+	.byte		N09   , Ds3 , v052
+	.byte	W12
+@ 009   ----------------------------------------
+	.byte		N12   , Cs3 , v052
+	.byte	W12
+	.byte		N03   , Gs2 , v052
+	.byte	W06
+	.byte		N03   , Gs2 , v052
+	.byte	W06
+	.byte		N06   , Gs2 , v052
+	.byte	W12
+	.byte		N06   , Cs3 , v052
+	.byte	W12
+	.byte		N12   , Gs2 , v052
+	.byte	W12
+	.byte		N12   , Cs3 , v052
+	.byte	W18
+	.byte		N15   , Fn3 , v052
+	.byte	W18
+@ 010   ----------------------------------------
+	.byte		N12   , Cs4 , v052
+	.byte	W12
+	.byte		N12   , Ds4 , v052
+	.byte	W18
+	.byte		N03   , Cs4 , v052
+	.byte	W06
+	.byte		N30   , Bn3 , v052
+	.byte	W36
+	.byte		N09   , Bn2 , v052
+	.byte	W12
+	.byte		N09   , Cs3 , v052
+	.byte	W12
+@ 011   ----------------------------------------
+	.byte		N12   , Ds3 , v052
+	.byte	W12
+	.byte		N03   , Cs3 , v052
+	.byte	W06
+	.byte		N03   , Cs3 , v052
+	.byte	W06
+	.byte		N06   , Cs3 , v052
+	.byte	W12
+	.byte		N06   , Fn3 , v052
+	.byte	W12
+	.byte		N06   , Cs3 , v052
+	.byte	W06
+	.byte		N06   , Ds3 , v052
+	.byte	W06
+	.byte		N48   , Fn3 , v060
+	.byte	W36
+@ 012   ----------------------------------------
+	.byte	W12
+	.byte		N12   , Fs3 , v052
+	.byte	W24
+	.byte		N06   , As2 , v052
+	.byte	W12
+	.byte		N12   , Fs3 , v052
+	.byte	W24
+	.byte		N12   , Fs3 , v052
+	.byte	W12
+	.byte		N06   , As2 , v052
+	.byte	W12
+@ 013   ----------------------------------------
+	.byte		N12   , Fs3 , v052
+	.byte	W12
+	.byte		N12   , Fn3 , v052
+	.byte	W24
+	.byte		N06   , Gs2 , v052
+	.byte	W12
+	.byte		N12   , Cs3 , v052
+	.byte	W12
+	.byte		N12   , Fn3 , v052
+	.byte	W18
+	.byte		N12   , Fn3 , v052
+	.byte	W18
+@ 014   ----------------------------------------
+	.byte		N12   , Fn3 , v052
+	.byte	W12
+	.byte		N12   , En3 , v052
+	.byte	W24
+	.byte		N06   , Gs2 , v052
+	.byte	W12
+	.byte		N12   , En3 , v052
+	.byte	W24
+	.byte		N12   , En3 , v052
+	.byte	W12
+	.byte		N06   , Gs2 , v052
+	.byte	W12
+@ 015   ----------------------------------------
+	.byte		N12   , En3 , v052
+	.byte	W12
+	.byte		N12   , Ds3 , v052
+	.byte	W24
+	.byte		N06   , Fs2 , v052
+	.byte	W12
+	.byte		N12   , Ds3 , v052
+	.byte	W24
+	.byte		N36   , Fs3 , v052
+	.byte	W24
+@ 016   ----------------------------------------
+	.byte	W12
+	.byte		N12   , Dn3 , v040
+	.byte	W18
+	.byte		N06   , En3 , v040
+	.byte	W06
+	.byte		N32   , Fs3 , v040
+	.byte	W36
+	.byte		N09   , Fs3 , v040
+	.byte	W12
+	.byte		N09   , Gs3 , v040
+	.byte	W12
+@ 017   ----------------------------------------
+	.byte		N09   , Fs3 , v040
+	.byte	W12
+	.byte		N36   , As3 , v040
+	.byte	W36
+	.byte		N06   , Gs3 , v040
+	.byte	W06
+	.byte		N06   , Gn3 , v040
+	.byte	W06
+	.byte		N42   , Fs3 , v040
+	.byte	W36
+@ 018   ----------------------------------------
+	.byte	W12
+	.byte		N03   , Gs2 , v052
+	.byte	W06
+	.byte		N03   , Gs2 , v052
+	.byte	W06
+	.byte		N06   , Gs2 , v052
+	.byte	W12
+	.byte		N06   , Cs3 , v052
+	.byte	W12
+	.byte		N03   , Gs2 , v052
+	.byte	W06
+	.byte		N03   , Gs2 , v052
+	.byte	W06
+	.byte		N06   , Gs2 , v052
+	.byte	W18
+	.byte		N03   , Gs2 , v052
+	.byte	W06
+	.byte		N06   , Cs3 , v052
+	.byte	W12
+@ 019   ----------------------------------------
+	.byte		N12   , Gs2 , v052
+	.byte	W12
+	.byte		N03   , Gs2 , v052
+	.byte	W06
+	.byte		N03   , Gs2 , v052
+	.byte	W06
+	.byte		N06   , Gs2 , v052
+	.byte	W12
+	.byte		N06   , Cs3 , v052
+	.byte	W12
+	.byte		N03   , Gs2 , v052
+	.byte	W06
+	.byte		N03   , Gs2 , v052
+	.byte	W06
+	.byte		N06   , Gs2 , v052
+	.byte	W12
+	.byte		N36   , Cs3 , v060
+	.byte	W24
+@ 020   ----------------------------------------
+	.byte	W12
+	.byte	FINE
+
+@**************** Track 5 (Midi-Chn.5) ****************@
+
+mus_test_5:
+	.byte	KEYSH , mus_test_key+0
+@ 000   ----------------------------------------
+	.byte		VOICE , 5
+	.byte		VOL   , 127*mus_test_mvl/mxv
+	.byte	W12
+	.byte		N12   , As2 , v052
+	.byte	W24
+	.byte		N06   , Fs2 , v052
+	.byte	W12
+	.byte		N12   , As2 , v052
+	.byte	W24
+	.byte		N12   , As2 , v052
+	.byte	W12
+	.byte		N06   , Fs2 , v052
+	.byte	W12
+@ 001   ----------------------------------------
+	.byte		N12   , As2 , v052
+	.byte	W12
+	.byte		N12   , Fn2 , v052
+	.byte	W24
+	.byte		N06   , Cs3 , v052
+	.byte	W12
+	.byte		N12   , Fn2 , v052
+	.byte	W24
+	.byte		N12   , Fn2 , v052
+	.byte	W12
+	.byte		N06   , Cs3 , v052
+	.byte	W12
+@ 002   ----------------------------------------
+	.byte		N12   , Fn2 , v052
+	.byte	W12
+	.byte		N12   , As2 , v052
+	.byte	W24
+	.byte		N06   , Fs2 , v052
+	.byte	W12
+	.byte		N12   , As2 , v052
+	.byte	W24
+	.byte		N12   , As2 , v052
+	.byte	W12
+	.byte		N06   , Fs2 , v052
+	.byte	W12
+@ 003   ----------------------------------------
+	.byte		N12   , As2 , v052
+	.byte	W12
+	.byte		N12   , Gs2 , v052
+	.byte	W24
+	.byte		N06   , Cs3 , v052
+	.byte	W12
+	.byte		N12   , Gs2 , v052
+	.byte	W24
+	.byte		N24   , Gs3 , v052
+	.byte	W24
+@ 004   ----------------------------------------
+	.byte		N12   , Bn3 , v052
+	.byte	W12
+	.byte		N12   , Cs4 , v052
+	.byte	W18
+	.byte		N03   , As3 , v052
+	.byte	W06
+	.byte		N30   , As3 , v052
+	.byte	W36
+	.byte		N09   , As2 , v052
+	.byte	W12
+	.byte		N09   , Bn2 , v052
+	.byte	W12
+@ 005   ----------------------------------------
+	.byte		N12   , As2 , v052
+	.byte	W12
+	.byte		N03   , Gs2 , v052
+	.byte	W06
+	.byte		N03   , Gs2 , v052
+	.byte	W06
+	.byte		N06   , Gs2 , v052
+	.byte	W12
+	.byte		N06   , Fn3 , v052
+	.byte	W12
+	.byte		N06   , Gs2 , v052
+	.byte	W06
+	.byte		N06   , Fn2 , v052
+	.byte	W06
+	.byte		N06   , Gs2 , v052
+	.byte	W06
+	.byte		N06   , Cs3 , v052
+	.byte	W06
+	.byte		N06   , Fn3 , v052
+	.byte	W06
+	.byte		N06   , Gs3 , v052
+	.byte	W06
+	.byte		N06   , Fn4 , v052
+	.byte	W06
+	.byte		N06   , Cs4 , v052
+	.byte	W06
+@ 006   ----------------------------------------
+	.byte		N06   , Gs3 , v052
+	.byte	W06
+	.byte		N06   , Fn3 , v052
+	.byte	W06
+	.byte		N12   , Fs3 , v052
+	.byte	W18
+	.byte		N03   , As3 , v052
+	.byte	W06
+	.byte		N30   , Bn3 , v052
+	.byte	W36
+	.byte		N09   , Fs2 , v052
+	.byte	W12
+	.byte		N09   , As2 , v052
+	.byte	W12
+@ 007   ----------------------------------------
+	.byte		N12   , Bn2 , v052
+	.byte	W12
+	.byte		N03   , As2 , v052
+	.byte	W06
+	.byte		N03   , As2 , v052
+	.byte	W06
+	.byte		N06   , As2 , v052
+	.byte	W12
+	.byte		N06   , Fs3 , v052
+	.byte	W12
+	.byte		N06   , Ds3 , v052
+	.byte	W06
+	.byte		N06   , Cs3 , v052
+	.byte	W06
+	.byte		N12   , Fn3 , v052
+	.byte	W18
+	.byte		N03   , Ds3 , v052
+	.byte	W06
+	.byte		N24   , Cs3 , v052
+	.byte	W12
+@ 008   ----------------------------------------
+	.byte	W12
+	.byte		N12   , Cs4 , v052
+	.byte	W18
+	.byte		N03   , As3 , v052
+	.byte	W06
+	.byte		N30   , As3 , v052
+	.byte	W36
+	.byte		N09   , As2 , v052
+	.byte	W12
+	.byte		N09   , Bn2 , v052
+	.byte	W12
+@ 009   ----------------------------------------
+	.byte		N12   , As2 , v052
+	.byte	W12
+	.byte		N03   , Fn2 , v052
+	.byte	W06
+	.byte		N03   , Fn2 , v052
+	.byte	W06
+	.byte		N06   , Fn2 , v052
+	.byte	W12
+	.byte		N06   , Gs2 , v052
+	.byte	W12
+	.byte		N12   , Fn2 , v052
+	.byte	W12
+	.byte		N12   , Gs2 , v052
+	.byte	W18
+	.byte		N15   , Cs3 , v052
+	.byte	W18
+@ 010   ----------------------------------------
+	.byte		N12   , Gs3 , v052
+	.byte	W12
+	.byte		N12   , Bn3 , v052
+	.byte	W18
+	.byte		N03   , As3 , v052
+	.byte	W06
+	.byte		N30   , Fs3 , v052
+	.byte	W36
+	.byte		N09   , Fs2 , v052
+	.byte	W12
+	.byte		N09   , As2 , v052
+	.byte	W12
+@ 011   ----------------------------------------
+	.byte		N12   , Bn2 , v052
+	.byte	W12
+	.byte		N03   , Gs2 , v052
+	.byte	W06
+	.byte		N03   , Gs2 , v052
+	.byte	W06
+	.byte		N06   , Gs2 , v052
+	.byte	W12
+	.byte		N06   , Cs3 , v052
+	.byte	W12
+	.byte		N06   , Gs2 , v052
+	.byte	W06
+	.byte		N06   , Bn2 , v052
+	.byte	W06
+	.byte		N12   , Cs3 , v060
+	.byte	W12
+	.byte		N12   , Cs3 , v060
+	.byte	W12
+	.byte		N12   , Cs3 , v060
+	.byte	W12
+@ 012   ----------------------------------------
+	.byte		N12   , Cs3 , v060
+	.byte	W12
+	.byte		N12   , Cs3 , v052
+	.byte	W24
+	.byte		N06   , Fs2 , v052
+	.byte	W12
+	.byte		N12   , Cs3 , v052
+	.byte	W24
+	.byte		N12   , Cs3 , v052
+	.byte	W12
+	.byte		N06   , Fs2 , v052
+	.byte	W12
+@ 013   ----------------------------------------
+	.byte		N12   , Cs3 , v052
+	.byte	W12
+	.byte		N12   , Cs3 , v052
+	.byte	W24
+	.byte		N06   , Fn2 , v052
+	.byte	W12
+	.byte		N12   , Gs2 , v052
+	.byte	W12
+	.byte		N12   , Cs3 , v052
+	.byte	W18
+	.byte		N12   , Cs3 , v052
+	.byte	W18
+@ 014   ----------------------------------------
+	.byte		N12   , Cs3 , v052
+	.byte	W12
+	.byte		N12   , Cs3 , v052
+	.byte	W24
+	.byte		N06   , En2 , v052
+	.byte	W12
+	.byte		N12   , Cs3 , v052
+	.byte	W24
+	.byte		N12   , Cs3 , v052
+	.byte	W12
+	.byte		N06   , En2 , v052
+	.byte	W12
+@ 015   ----------------------------------------
+	.byte		N12   , Cs3 , v052
+	.byte	W12
+	.byte		N12   , Bn2 , v052
+	.byte	W24
+	.byte		N06   , Ds2 , v052
+	.byte	W12
+	.byte		N12   , Bn2 , v052
+	.byte	W24
+	.byte		N36   , Ds3 , v052
+	.byte	W24
+@ 016   ----------------------------------------
+	.byte	W18
+	.byte		N12   , Dn3 , v020
+	.byte	W18
+	.byte		N06   , En3 , v020
+	.byte	W06
+	.byte		N12   , Fs3 , v020
+	.byte	W12
+	.byte		N12   , Fs3 , v020
+	.byte	W12
+	.byte		N09   , Fs3 , v020
+	.byte	W12
+	.byte		N09   , Fs3 , v020
+	.byte	W12
+	.byte		N09   , Gs3 , v020
+	.byte	W06
+@ 017   ----------------------------------------
+	.byte	W06
+	.byte		N09   , Fs3 , v020
+	.byte	W12
+	.byte		N12   , As3 , v020
+	.byte	W12
+	.byte		N12   , As3 , v020
+	.byte	W12
+	.byte		N12   , As3 , v020
+	.byte	W12
+	.byte		N06   , Gs3 , v020
+	.byte	W06
+	.byte		N06   , Gn3 , v020
+	.byte	W06
+	.byte		N12   , Fs3 , v020
+	.byte	W12
+	.byte		N12   , Fs3 , v020
+	.byte	W12
+	.byte		N18   , Fs3 , v020
+	.byte	W06
+@ 018   ----------------------------------------
+	.byte	W12
+	.byte		N03   , Fs2 , v052
+	.byte	W06
+	.byte		N03   , Fs2 , v052
+	.byte	W06
+	.byte		N06   , Fs2 , v052
+	.byte	W12
+	.byte		N06   , Gs2 , v052
+	.byte	W12
+	.byte		N03   , Fs2 , v052
+	.byte	W06
+	.byte		N03   , Fs2 , v052
+	.byte	W06
+	.byte		N06   , Fs2 , v052
+	.byte	W18
+	.byte		N03   , Fs2 , v052
+	.byte	W06
+	.byte		N06   , Gs2 , v052
+	.byte	W12
+@ 019   ----------------------------------------
+	.byte		N12   , Fs2 , v052
+	.byte	W12
+	.byte		N03   , Fn2 , v052
+	.byte	W06
+	.byte		N03   , Fn2 , v052
+	.byte	W06
+	.byte		N06   , Fn2 , v052
+	.byte	W12
+	.byte		N06   , Gs2 , v052
+	.byte	W12
+	.byte		N03   , Fn2 , v052
+	.byte	W06
+	.byte		N03   , Fn2 , v052
+	.byte	W06
+	.byte		N06   , Fn2 , v052
+	.byte	W12
+	.byte		N36   , Bn2 , v060
+	.byte	W24
+@ 020   ----------------------------------------
+	.byte	W12
+	.byte	FINE
+
+@**************** Track 6 (Midi-Chn.6) ****************@
+
+mus_test_6:
+	.byte	KEYSH , mus_test_key+0
+@ 000   ----------------------------------------
+	.byte		VOICE , 6
+	.byte		VOL   , 127*mus_test_mvl/mxv
+	.byte	W12
+	.byte		N12   , Fs1 , v080
+	.byte	W24
+	.byte		N06   , Cs1 , v080
+	.byte	W12
+	.byte		N12   , Fs1 , v080
+	.byte	W24
+	.byte		N12   , Fs1 , v080
+	.byte	W12
+	.byte		N06   , Cs1 , v080
+	.byte	W12
+@ 001   ----------------------------------------
+	.byte		N12   , Fs1 , v080
+	.byte	W12
+	.byte		N12   , Cs1 , v080
+	.byte	W24
+	.byte		N06   , Gs1 , v080
+	.byte	W12
+	.byte		N12   , Cs1 , v080
+	.byte	W24
+	.byte		N12   , Cs1 , v080
+	.byte	W12
+	.byte		N06   , Gs1 , v080
+	.byte	W12
+@ 002   ----------------------------------------
+	.byte		N12   , Cs1 , v080
+	.byte	W12
+	.byte		N12   , Fs1 , v080
+	.byte	W24
+	.byte		N06   , Cs1 , v080
+	.byte	W12
+	.byte		N12   , Fs1 , v080
+	.byte	W24
+	.byte		N12   , Fs1 , v080
+	.byte	W12
+	.byte		N06   , Cs1 , v080
+	.byte	W12
+@ 003   ----------------------------------------
+	.byte		N12   , Fs1 , v080
+	.byte	W12
+	.byte		N12   , Cs1 , v080
+	.byte	W24
+	.byte		N06   , Gs1 , v080
+	.byte	W12
+	.byte		N12   , Cs1 , v080
+	.byte	W24
+	.byte		N24   , Gs1 , v080
+	.byte	W24
+@ 004   ----------------------------------------
+	.byte		N12   , Fn1 , v080
+	.byte	W12
+	.byte		N03   , Fs1 , v080
+	.byte	W06
+	.byte		N03   , Fs1 , v080
+	.byte	W06
+	.byte		N06   , Fs1 , v080
+	.byte	W24
+	.byte		N06   , Fs1 , v080
+	.byte	W12
+	.byte		N12   , Fs1 , v080
+	.byte	W18
+	.byte		N12   , Cs2 , v080
+	.byte	W18
+@ 005   ----------------------------------------
+	.byte		N12   , Cs1 , v080
+	.byte	W12
+	.byte		N03   , Fn1 , v080
+	.byte	W06
+	.byte		N03   , Fn1 , v080
+	.byte	W06
+	.byte		N06   , Fn1 , v080
+	.byte	W24
+	.byte		N03   , Fn1 , v080
+	.byte	W06
+	.byte		N03   , Fn1 , v080
+	.byte	W06
+	.byte		N12   , Fn1 , v080
+	.byte	W18
+	.byte		N15   , Gs1 , v080
+	.byte	W18
+@ 006   ----------------------------------------
+	.byte		N12   , Cs1 , v080
+	.byte	W12
+	.byte		N03   , Ds1 , v080
+	.byte	W06
+	.byte		N03   , Ds1 , v080
+	.byte	W06
+	.byte		N06   , Ds1 , v080
+	.byte	W24
+	.byte		N06   , Ds1 , v080
+	.byte	W12
+	.byte		N12   , Fs1 , v080
+	.byte	W18
+	.byte		N15   , Bn1 , v080
+	.byte	W18
+@ 007   ----------------------------------------
+	.byte		N12   , Ds1 , v080
+	.byte	W12
+	.byte		N03   , Fs1 , v080
+	.byte	W06
+	.byte		N03   , Fs1 , v080
+	.byte	W06
+	.byte		N06   , Fs1 , v080
+	.byte	W24
+	.byte		N03   , Fs1 , v080
+	.byte	W06
+	.byte		N03   , Fs1 , v080
+	.byte	W06
+	.byte		N12   , Cs2 , v080
+	.byte	W18
+	.byte		N06   , Cs2 , v080
+	.byte	W06
+	.byte		N24   , Cs1 , v080
+	.byte	W12
+@ 008   ----------------------------------------
+	.byte	W12
+	.byte		N03   , Fs1 , v080
+	.byte	W06
+	.byte		N03   , Fs1 , v080
+	.byte	W06
+	.byte		N06   , Fs1 , v080
+	.byte	W24
+	.byte		N06   , Fs1 , v080
+	.byte	W12
+	.byte		N12   , Fs1 , v080
+	.byte	W18
+	.byte		N12   , Cs2 , v080
+	.byte	W18
+@ 009   ----------------------------------------
+	.byte		N12   , Cs1 , v080
+	.byte	W12
+	.byte		N03   , Fn1 , v080
+	.byte	W06
+	.byte		N03   , Fn1 , v080
+	.byte	W06
+	.byte		N06   , Fn1 , v080
+	.byte	W24
+	.byte		N06   , Fn1 , v080
+	.byte	W12
+	.byte		N12   , Fn1 , v080
+	.byte	W18
+	.byte		N15   , Gs1 , v080
+	.byte	W18
+@ 010   ----------------------------------------
+	.byte		N12   , Cs1 , v080
+	.byte	W12
+	.byte		N03   , Ds1 , v080
+	.byte	W06
+	.byte		N03   , Ds1 , v080
+	.byte	W06
+	.byte		N06   , Ds1 , v080
+	.byte	W24
+	.byte		N06   , Ds1 , v080
+	.byte	W12
+	.byte		N12   , Fs1 , v080
+	.byte	W18
+	.byte		N15   , Bn1 , v080
+	.byte	W18
+@ 011   ----------------------------------------
+	.byte		N12   , Ds1 , v080
+	.byte	W12
+	.byte		N03   , Cs1 , v080
+	.byte	W06
+	.byte		N03   , Cs1 , v080
+	.byte	W06
+	.byte		N06   , Cs1 , v080
+	.byte	W24
+	.byte		N06   , Cs1 , v080
+	.byte	W12
+	.byte		N06   , Cs1 , v080
+	.byte	W36
+@ 012   ----------------------------------------
+	.byte	W12
+	.byte		N12   , Fs1 , v080
+	.byte	W24
+	.byte		N06   , Cs1 , v080
+	.byte	W12
+	.byte		N12   , Fs1 , v080
+	.byte	W24
+	.byte		N12   , Fs1 , v080
+	.byte	W12
+	.byte		N06   , Cs1 , v080
+	.byte	W12
+@ 013   ----------------------------------------
+	.byte		N12   , Fs1 , v080
+	.byte	W12
+	.byte		N12   , Fn1 , v080
+	.byte	W24
+	.byte		N06   , Cs1 , v080
+	.byte	W12
+	.byte		N12   , Fn1 , v080
+	.byte	W12
+	.byte		N12   , Gs1 , v080
+	.byte	W18
+	.byte		N12   , Fs1 , v080
+	.byte	W18
+@ 014   ----------------------------------------
+	.byte		N12   , Fn1 , v080
+	.byte	W12
+	.byte		N12   , En1 , v080
+	.byte	W24
+	.byte		N06   , Cs1 , v080
+	.byte	W12
+	.byte		N12   , En1 , v080
+	.byte	W24
+	.byte		N12   , En1 , v080
+	.byte	W12
+	.byte		N06   , Cs1 , v080
+	.byte	W12
+@ 015   ----------------------------------------
+	.byte		N12   , En1 , v080
+	.byte	W12
+	.byte		N12   , Ds1 , v080
+	.byte	W24
+	.byte		N06   , Fs1 , v080
+	.byte	W12
+	.byte		N12   , Ds1 , v080
+	.byte	W24
+	.byte		N36   , Bn1 , v080
+	.byte	W24
+@ 016   ----------------------------------------
+	.byte	W12
+	.byte		N18   , Fs2 , v080
+	.byte	W18
+	.byte		N18   , Fn2 , v080
+	.byte	W18
+	.byte		N12   , En2 , v080
+	.byte	W12
+	.byte		N18   , Dn2 , v080
+	.byte	W18
+	.byte		N18   , Cs2 , v080
+	.byte	W18
+@ 017   ----------------------------------------
+	.byte		N12   , Bn1 , v080
+	.byte	W12
+	.byte		N18   , Fs1 , v080
+	.byte	W18
+	.byte		N18   , Gs1 , v080
+	.byte	W18
+	.byte		N12   , Fs1 , v080
+	.byte	W12
+	.byte		N18   , As1 , v080
+	.byte	W18
+	.byte		N18   , Gs1 , v080
+	.byte	W18
+@ 018   ----------------------------------------
+	.byte		N12   , Fs1 , v080
+	.byte	W12
+	.byte		N03   , Cs1 , v080
+	.byte	W06
+	.byte		N03   , Cs1 , v080
+	.byte	W06
+	.byte		N06   , Cs1 , v080
+	.byte	W24
+	.byte		N03   , Cs1 , v080
+	.byte	W06
+	.byte		N03   , Cs1 , v080
+	.byte	W06
+	.byte		N06   , Cs1 , v080
+	.byte	W12
+	.byte		N12   , Gs1 , v080
+	.byte	W12
+	.byte		N12   , Fs1 , v080
+	.byte	W12
+@ 019   ----------------------------------------
+	.byte		N12   , Fn1 , v080
+	.byte	W12
+	.byte		N03   , Cs1 , v080
+	.byte	W06
+	.byte		N03   , Cs1 , v080
+	.byte	W06
+	.byte		N06   , Cs1 , v080
+	.byte	W24
+	.byte		N03   , Cs1 , v080
+	.byte	W06
+	.byte		N03   , Cs1 , v080
+	.byte	W06
+	.byte		N06   , Cs1 , v080
+	.byte	W12
+	.byte		N36   , Gs1 , v080
+	.byte	W24
+@ 020   ----------------------------------------
+	.byte	W12
+	.byte	FINE
+
+@**************** Track 7 (Midi-Chn.7) ****************@
+
+mus_test_7:
+	.byte	KEYSH , mus_test_key+0
+@ 000   ----------------------------------------
+	.byte		VOICE , 7
+	.byte		VOL   , 127*mus_test_mvl/mxv
+	.byte		N06   , Bn1 , v108
+	.byte	W12
+	.byte		N12   , Fs2 , v124
+	.byte	W36
+	.byte		N12   , Fs2 , v124
+	.byte	W24
+	.byte		N12   , Fs2 , v124
+	.byte	W24
+@ 001   ----------------------------------------
+	.byte		N12   , Fs2 , v124
+	.byte	W12
+	.byte		N12   , Cs2 , v124
+	.byte	W36
+	.byte		N12   , Cs2 , v124
+	.byte	W24
+	.byte		N12   , Cs2 , v124
+	.byte	W24
+@ 002   ----------------------------------------
+	.byte		N12   , Cs2 , v124
+	.byte	W12
+	.byte		N12   , Fs2 , v124
+	.byte	W36
+	.byte		N12   , Fs2 , v124
+	.byte	W24
+	.byte		N12   , Fs2 , v124
+	.byte	W24
+@ 003   ----------------------------------------
+	.byte		N12   , Fs2 , v124
+	.byte	W12
+	.byte		N12   , Cs2 , v124
+	.byte	W36
+	.byte		N12   , Cs2 , v124
+	.byte	W24
+	.byte		N12   , Cs2 , v124
+	.byte	W24
+@ 004   ----------------------------------------
+	.byte		N12   , Cs2 , v124
+	.byte	W96
+@ 005   ----------------------------------------
+	.byte	W96
+@ 006   ----------------------------------------
+	.byte	W96
+@ 007   ----------------------------------------
+	.byte	W96
+@ 008   ----------------------------------------
+	.byte	W96
+@ 009   ----------------------------------------
+	.byte	W96
+@ 010   ----------------------------------------
+	.byte	W96
+@ 011   ----------------------------------------
+	.byte	W96
+@ 012   ----------------------------------------
+	.byte	W12
+	.byte		N12   , Fs4 , v052
+	.byte	W36
+	.byte		N09   , Fs4 , v052
+	.byte	W24
+	.byte		N09   , Fs4 , v052
+	.byte	W12
+	.byte		N09   , Gs4 , v052
+	.byte	W12
+@ 013   ----------------------------------------
+	.byte		N09   , Fs4 , v052
+	.byte	W12
+	.byte		N32   , Fn4 , v052
+	.byte	W36
+	.byte		N06   , Cs4 , v052
+	.byte	W06
+	.byte		N06   , Ds4 , v052
+	.byte	W06
+	.byte		N12   , Fn4 , v052
+	.byte	W18
+	.byte		N12   , Fn4 , v052
+	.byte	W18
+@ 014   ----------------------------------------
+	.byte		N12   , Fs4 , v052
+	.byte	W12
+	.byte		N12   , Gs4 , v052
+	.byte	W36
+	.byte		N09   , Gs4 , v052
+	.byte	W48
+@ 015   ----------------------------------------
+	.byte	W72
+	.byte		N03   , Bn1 , v092
+	.byte	W03
+	.byte		N03   , Bn1 , v080
+	.byte	W03
+	.byte		N03   , Bn1 , v080
+	.byte	W03
+	.byte		N03   , Bn1 , v084
+	.byte	W03
+	.byte		N03   , Bn1 , v088
+	.byte	W03
+	.byte		N03   , Bn1 , v088
+	.byte	W03
+	.byte		N03   , Bn1 , v092
+	.byte	W03
+	.byte		N03   , Bn1 , v096
+	.byte	W03
+@ 016   ----------------------------------------
+	.byte		N03   , Bn1 , v096
+	.byte	W03
+	.byte		N03   , Bn1 , v100
+	.byte	W03
+	.byte		N03   , Bn1 , v100
+	.byte	W03
+	.byte		N03   , Bn1 , v104
+	.byte	W03
+	.byte		N24   , Fs2 , v124
+	.byte	W84
+@ 017   ----------------------------------------
+	.byte		N12   , Dn2 , v112
+	.byte	W12
+	.byte		N24   , Fs2 , v124
+	.byte	W84
+@ 018   ----------------------------------------
+	.byte	W12
+	.byte		N24   , Cs2 , v124
+	.byte	W36
+	.byte		N06   , Cs2 , v112
+	.byte	W06
+	.byte		N06   , Cs2 , v112
+	.byte	W06
+	.byte		N24   , Cs2 , v124
+	.byte	W36
+@ 019   ----------------------------------------
+	.byte		N06   , Fs2 , v112
+	.byte	W06
+	.byte		N06   , Fs2 , v112
+	.byte	W06
+	.byte		N24   , Cs2 , v112
+	.byte	W36
+	.byte		N06   , Cs2 , v112
+	.byte	W06
+	.byte		N06   , Cs2 , v112
+	.byte	W06
+	.byte		N12   , Cs2 , v124
+	.byte	W12
+	.byte		N03   , Cs2 , v092
+	.byte	W03
+	.byte		N03   , Cs2 , v080
+	.byte	W03
+	.byte		N03   , Cs2 , v080
+	.byte	W03
+	.byte		N03   , Cs2 , v084
+	.byte	W03
+	.byte		N03   , Cs2 , v088
+	.byte	W03
+	.byte		N03   , Cs2 , v088
+	.byte	W03
+	.byte		N03   , Cs2 , v092
+	.byte	W03
+	.byte		N03   , Cs2 , v096
+	.byte	W03
+@ 020   ----------------------------------------
+	.byte		N03   , Cs2 , v096
+	.byte	W03
+	.byte		N03   , Cs2 , v100
+	.byte	W03
+	.byte		N03   , Cs2 , v100
+	.byte	W03
+	.byte		N03   , Cs2 , v104
+	.byte	W03
+	.byte	FINE
+
+@**************** Track 8 (Midi-Chn.8) ****************@
+
+mus_test_8:
+	.byte	KEYSH , mus_test_key+0
+@ 000   ----------------------------------------
+	.byte		VOICE , 8
+	.byte		VOL   , 127*mus_test_mvl/mxv
+	.byte	W12
+	.byte		N48   , Bn2 , v092
+	.byte	W84
+@ 001   ----------------------------------------
+	.byte	W96
+@ 002   ----------------------------------------
+	.byte	W12
+	.byte		N48   , Bn2 , v092
+	.byte	W84
+@ 003   ----------------------------------------
+	.byte	W96
+@ 004   ----------------------------------------
+	.byte	W12
+	.byte		N96   , Bn2 , v092
+	.byte	W84
+@ 005   ----------------------------------------
+	.byte	W96
+@ 006   ----------------------------------------
+	.byte	W96
+@ 007   ----------------------------------------
+	.byte	W96
+@ 008   ----------------------------------------
+	.byte	W12
+	.byte		N96   , Bn2 , v092
+	.byte	W84
+@ 009   ----------------------------------------
+	.byte	W96
+@ 010   ----------------------------------------
+	.byte	W96
+@ 011   ----------------------------------------
+	.byte	W72
+	.byte		N36   , An2 , v064
+	.byte	W24
+@ 012   ----------------------------------------
+	.byte	W12
+	.byte		N96   , Bn2 , v092
+	.byte	W84
+@ 013   ----------------------------------------
+	.byte	W96
+@ 014   ----------------------------------------
+	.byte	W96
+@ 015   ----------------------------------------
+	.byte	W96
+@ 016   ----------------------------------------
+	.byte	W12
+	.byte		N96   , Bn2 , v092
+	.byte	W84
+@ 017   ----------------------------------------
+	.byte	W12
+	.byte		N96   , Bn2 , v092
+	.byte	W84
+@ 018   ----------------------------------------
+	.byte	W12
+	.byte		N96   , Bn2 , v092
+	.byte	W84
+@ 019   ----------------------------------------
+	.byte	W12
+	.byte		N60   , Bn2 , v092
+	.byte	W60
+	.byte		N36   , An2 , v064
+	.byte	W24
+@ 020   ----------------------------------------
+	.byte	W12
+	.byte	FINE
+
+@**************** Track 9 (Midi-Chn.9) ****************@
+
+mus_test_9:
+	.byte	KEYSH , mus_test_key+0
+@ 000   ----------------------------------------
+	.byte		VOICE , 9
+	.byte		VOL   , 127*mus_test_mvl/mxv
+	.byte	W30
+	.byte		N03   , En1 , v064
+	.byte	W03
+	.byte		N03   , En1 , v064
+	.byte	W03
+	.byte		N06   , En1 , v112
+	.byte	W48
+	.byte		N06   , En1 , v112
+	.byte	W12
+@ 001   ----------------------------------------
+	.byte	W30
+	.byte		N03   , En1 , v064
+	.byte	W03
+	.byte		N03   , En1 , v064
+	.byte	W03
+	.byte		N06   , En1 , v112
+	.byte	W48
+	.byte		N06   , En1 , v112
+	.byte	W12
+@ 002   ----------------------------------------
+	.byte	W30
+	.byte		N03   , En1 , v064
+	.byte	W03
+	.byte		N03   , En1 , v064
+	.byte	W03
+	.byte		N06   , En1 , v112
+	.byte	W48
+	.byte		N06   , En1 , v112
+	.byte	W12
+@ 003   ----------------------------------------
+	.byte	W30
+	.byte		N03   , En1 , v064
+	.byte	W03
+	.byte		N03   , En1 , v064
+	.byte	W03
+	.byte		N06   , En1 , v112
+	.byte	W48
+	.byte		N06   , En1 , v112
+	.byte	W12
+@ 004   ----------------------------------------
+	.byte	W12
+	.byte		N06   , En1 , v080
+	.byte	W18
+	.byte		N06   , En1 , v056
+	.byte	W06
+	.byte		N06   , En1 , v116
+	.byte	W12
+	.byte		N06   , En1 , v060
+	.byte	W12
+	.byte		N06   , En1 , v060
+	.byte	W06
+	.byte		N06   , En1 , v056
+	.byte	W06
+	.byte		N06   , En1 , v060
+	.byte	W12
+	.byte		N06   , En1 , v116
+	.byte	W12
+@ 005   ----------------------------------------
+	.byte		N06   , En1 , v060
+	.byte	W06
+	.byte		N06   , En1 , v060
+	.byte	W06
+	.byte		N06   , En1 , v080
+	.byte	W18
+	.byte		N06   , En1 , v056
+	.byte	W06
+	.byte		N06   , En1 , v116
+	.byte	W12
+	.byte		N06   , En1 , v060
+	.byte	W06
+	.byte		N06   , En1 , v056
+	.byte	W06
+	.byte		N06   , En1 , v060
+	.byte	W12
+	.byte		N06   , En1 , v060
+	.byte	W12
+	.byte		N06   , En1 , v116
+	.byte	W12
+@ 006   ----------------------------------------
+	.byte		N06   , En1 , v080
+	.byte	W06
+	.byte		N06   , En1 , v080
+	.byte	W06
+	.byte		N06   , En1 , v080
+	.byte	W18
+	.byte		N06   , En1 , v056
+	.byte	W06
+	.byte		N06   , En1 , v116
+	.byte	W12
+	.byte		N06   , En1 , v060
+	.byte	W12
+	.byte		N06   , En1 , v060
+	.byte	W06
+	.byte		N06   , En1 , v056
+	.byte	W06
+	.byte		N06   , En1 , v060
+	.byte	W12
+	.byte		N06   , En1 , v116
+	.byte	W12
+@ 007   ----------------------------------------
+	.byte		N06   , En1 , v060
+	.byte	W06
+	.byte		N06   , En1 , v060
+	.byte	W06
+	.byte		N06   , En1 , v080
+	.byte	W18
+	.byte		N06   , En1 , v056
+	.byte	W06
+	.byte		N06   , En1 , v116
+	.byte	W12
+	.byte		N06   , En1 , v060
+	.byte	W06
+	.byte		N06   , En1 , v056
+	.byte	W06
+	.byte		N06   , En1 , v060
+	.byte	W12
+	.byte		N06   , En1 , v060
+	.byte	W12
+	.byte		N06   , En1 , v116
+	.byte	W12
+@ 008   ----------------------------------------
+	.byte		N06   , En1 , v080
+	.byte	W06
+	.byte		N06   , En1 , v080
+	.byte	W06
+	.byte		N06   , En1 , v080
+	.byte	W18
+	.byte		N06   , En1 , v056
+	.byte	W06
+	.byte		N06   , En1 , v116
+	.byte	W12
+	.byte		N06   , En1 , v060
+	.byte	W12
+	.byte		N06   , En1 , v060
+	.byte	W06
+	.byte		N06   , En1 , v056
+	.byte	W06
+	.byte		N06   , En1 , v060
+	.byte	W12
+	.byte		N06   , En1 , v116
+	.byte	W12
+@ 009   ----------------------------------------
+	.byte		N06   , En1 , v060
+	.byte	W06
+	.byte		N06   , En1 , v060
+	.byte	W06
+	.byte		N06   , En1 , v080
+	.byte	W18
+	.byte		N06   , En1 , v056
+	.byte	W06
+	.byte		N06   , En1 , v116
+	.byte	W12
+	.byte		N06   , En1 , v060
+	.byte	W06
+	.byte		N06   , En1 , v056
+	.byte	W06
+	.byte		N06   , En1 , v060
+	.byte	W12
+	.byte		N06   , En1 , v060
+	.byte	W12
+	.byte		N06   , En1 , v116
+	.byte	W12
+@ 010   ----------------------------------------
+	.byte		N06   , En1 , v080
+	.byte	W06
+	.byte		N06   , En1 , v080
+	.byte	W06
+	.byte		N06   , En1 , v080
+	.byte	W18
+	.byte		N06   , En1 , v056
+	.byte	W06
+	.byte		N06   , En1 , v116
+	.byte	W12
+	.byte		N06   , En1 , v060
+	.byte	W12
+	.byte		N06   , En1 , v060
+	.byte	W06
+	.byte		N06   , En1 , v056
+	.byte	W06
+	.byte		N06   , En1 , v060
+	.byte	W12
+	.byte		N06   , En1 , v116
+	.byte	W12
+@ 011   ----------------------------------------
+	.byte		N06   , En1 , v060
+	.byte	W06
+	.byte		N06   , En1 , v060
+	.byte	W06
+	.byte		N06   , En1 , v080
+	.byte	W18
+	.byte		N06   , En1 , v056
+	.byte	W06
+	.byte		N06   , En1 , v116
+	.byte	W12
+	.byte		N06   , En1 , v060
+	.byte	W06
+	.byte		N06   , En1 , v056
+	.byte	W06
+	.byte		N06   , En1 , v116
+	.byte	W06
+	.byte	FINE
+
+@******************************************************@
+	.align	2
+
+mus_test:
+	.byte	9	@ NumTrks
+	.byte	0	@ NumBlks
+	.byte	mus_test_pri	@ Priority
+	.byte	mus_test_rev	@ Reverb.
+
+	.word	mus_test_grp
+
+	.word	mus_test_1
+	.word	mus_test_2
+	.word	mus_test_3
+	.word	mus_test_4
+	.word	mus_test_5
+	.word	mus_test_6
+	.word	mus_test_7
+	.word	mus_test_8
+	.word	mus_test_9
+
+	.end
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+from typing import List
+
+import numpy as np
+
+from midi_editor.smf_writer import (
+    END_OF_TRACK,
+    STATUS_NOTE_OFF,
+    STATUS_NOTE_ON,
+    encode_events,
+    encode_vlq,
+    tempo_event,
+    write_smf,
+)
+
+
+def _track_name_event(name: str) -> bytes:
+    data = name.encode("latin-1")
+    return b"\x00\xff\x03" + encode_vlq(len(data)) + data
+
+
+def generate_smf(
+    out_path: Path,
+    n_notes: int,
+    *,
+    n_tracks: int = 16,
+    n_channels: int = 10,
+    ticks_per_beat: int = 480,
+    seed: int = 0,
+    overlap: float = 0.1,
+) -> Path:
+    """
+    Write a synthetic type-1 SMF with about n_notes notes spread over n_tracks tracks.
+
+    Each track plays one channel (cycling through n_channels, so channel 9 gets drums
+    when n_channels >= 10). Notes are on a 16th grid with random lengths; a fraction
+    `overlap` restrikes a pitch that is still sounding, which exercises the FIFO
+    note pairing. Track 0 carries the tempo. Events use running status.
+    """
+    rng = np.random.default_rng(seed)
+    per_track = np.full(n_tracks, n_notes // n_tracks, dtype=np.int64)
+    per_track[: n_notes % n_tracks] += 1
+    step = ticks_per_beat // 4
+
+    bodies: List[bytes] = []
+    for t in range(n_tracks):
+        n = int(per_track[t])
+        ch = t % n_channels
+        lo, hi = (35, 60) if ch == 9 else (36, 96)
+
+        starts = np.sort(rng.integers(0, max(1, n // 2), n)) * step
+        lengths = rng.integers(1, 8, n) * step
+        pitch = rng.integers(lo, hi, n)
+        restrike = rng.random(n) < overlap
+        # restrikes reuse the previous note's pitch while it is still sounding
+        pitch[1:][restrike[1:]] = pitch[:-1][restrike[1:]]
+        vel = rng.integers(40, 128, n)
+
+        ticks = np.concatenate([starts, starts + lengths])
+        status = np.concatenate([np.full(n, STATUS_NOTE_ON | ch), np.full(n, STATUS_NOTE_OFF | ch)])
+        data1 = np.concatenate([pitch, pitch])
+        data2 = np.concatenate([vel, np.zeros(n, dtype=np.int64)])
+        pri = np.concatenate([np.zeros(n, dtype=np.int8), np.full(n, -1, dtype=np.int8)])
+        order = np.lexsort((pri, ticks))
+
+        head = _track_name_event(f"Track {t} ch{ch}")
+        if t == 0:
+            head = tempo_event(500000) + head
+        bodies.append(head + encode_events(ticks[order], status[order], data1[order], data2[order]) + END_OF_TRACK)
+
+    write_smf(out_path, ticks_per_beat, bodies)
+    return Path(out_path)
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Write a synthetic SMF for benchmarking.")
+    ap.add_argument("out", type=Path)
+    ap.add_argument("--notes", type=int, default=100_000)
+    ap.add_argument("--tracks", type=int, default=16)
+    ap.add_argument("--channels", type=int, default=10)
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--overlap", type=float, default=0.1)
+    args = ap.parse_args()
+
+    generate_smf(
+        args.out,
+        args.notes,
+        n_tracks=args.tracks,
+        n_channels=args.channels,
+        seed=args.seed,
+        overlap=args.overlap,
+    )
+    print(f"Wrote {args.out} (~{args.notes} notes, {args.tracks} tracks)")
+
+
+if __name__ == "__main__":
+    main()
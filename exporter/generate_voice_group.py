@@ -3,9 +3,9 @@ from __future__ import annotations
 
 import argparse
 import json
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
 
 @dataclass(frozen=True)
@@ -14,19 +14,15 @@ class Sample:
     name: str
     bank: Optional[str] = None
     slug: Optional[str] = None
+    id: Optional[int] = None
 
 
-def load_directsound_db(db_path: Path) -> Tuple[Dict[str, Sample], Dict[str, Sample], Dict[str, Sample]]:
-    """
-    Returns three lookup maps:
-      by_symbol: DirectSoundWaveData_* -> Sample
-      by_slug:   slug -> Sample
-      by_name:   lower(name) -> Sample
+# Slot 0 is the drumset, so at most this many picked instruments
+MAX_PICKS = 127
+DEFAULT_DS_PARAMS = (255, 127, 231, 127)
 
-    Supports DB formats:
-      - top-level list: [ {...}, {...} ]
-      - wrapped dict: { "directsound": [ {...}, {...} ] }
-    """
+
+def _load_samples(db_path: Path) -> List[Sample]:
     data = json.loads(db_path.read_text(encoding="utf-8"))
 
     if isinstance(data, list):
@@ -39,10 +35,7 @@ def load_directsound_db(db_path: Path) -> Tuple[Dict[str, Sample], Dict[str, Sam
     if not isinstance(items, list):
         raise ValueError("Invalid DB JSON: expected entries to be a list")
 
-    by_symbol: Dict[str, Sample] = {}
-    by_slug: Dict[str, Sample] = {}
-    by_name: Dict[str, Sample] = {}
-
+    samples: List[Sample] = []
     for it in items:
         if not isinstance(it, dict):
             continue
@@ -50,21 +43,82 @@ def load_directsound_db(db_path: Path) -> Tuple[Dict[str, Sample], Dict[str, Sam
         name = it.get("name")
         if not isinstance(sym, str) or not isinstance(name, str):
             continue
-        sample = Sample(
+        inst_id = it.get("id")
+        samples.append(Sample(
             symbol=sym,
             name=name,
             bank=it.get("bank") if isinstance(it.get("bank"), str) else None,
             slug=it.get("slug") if isinstance(it.get("slug"), str) else None,
-        )
-        by_symbol[sym] = sample
-        if sample.slug:
-            by_slug[sample.slug] = sample
-        by_name[name.strip().lower()] = sample
+            id=int(inst_id) if isinstance(inst_id, int) else None,
+        ))
 
-    if not by_symbol:
+    if not samples:
         raise ValueError("DB JSON contains no valid directsound entries")
+    return samples
+
+
+@dataclass
+class DirectSoundIndex:
+    """All the lookups into one directsound_samples.json, built in a single parse."""
+    by_id: Dict[int, Sample] = field(default_factory=dict)
+    by_symbol: Dict[str, Sample] = field(default_factory=dict)
+    by_slug: Dict[str, Sample] = field(default_factory=dict)
+    by_name: Dict[str, Sample] = field(default_factory=dict)
+
+    @classmethod
+    def from_samples(cls, samples: Iterable[Sample]) -> "DirectSoundIndex":
+        index = cls()
+        for sample in samples:
+            if sample.id is not None:
+                index.by_id.setdefault(sample.id, sample)
+            index.by_symbol[sample.symbol] = sample
+            if sample.slug:
+                index.by_slug[sample.slug] = sample
+            index.by_name[sample.name.strip().lower()] = sample
+        return index
+
+    def resolve(self, token: str) -> Sample:
+        """Sample for a symbol, slug or name (what the CLI's --pick takes)."""
+        return resolve_sample(token, by_symbol=self.by_symbol, by_slug=self.by_slug, by_name=self.by_name)
+
+    def sample_for_id(self, inst_id: int) -> Sample:
+        try:
+            return self.by_id[int(inst_id)]
+        except KeyError:
+            raise KeyError(f"Instrument id not found in DB: {inst_id}") from None
 
-    return by_symbol, by_slug, by_name
+
+# db path -> ((mtime_ns, size), index); reloaded only when the file changes
+_INDEX_CACHE: Dict[Path, Tuple[Tuple[int, int], DirectSoundIndex]] = {}
+
+
+def directsound_index(db_path: Path) -> DirectSoundIndex:
+    """
+    The parsed DB for db_path, kept for the life of the process: repeated
+    previews/exports only stat the file instead of re-reading the JSON.
+    """
+    path = Path(db_path).resolve()
+    st = path.stat()
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _INDEX_CACHE.get(path)
+    if cached is None or cached[0] != stamp:
+        cached = _INDEX_CACHE[path] = (stamp, DirectSoundIndex.from_samples(_load_samples(path)))
+    return cached[1]
+
+
+def load_directsound_db(db_path: Path) -> Tuple[Dict[str, Sample], Dict[str, Sample], Dict[str, Sample]]:
+    """
+    Returns three lookup maps:
+      by_symbol: DirectSoundWaveData_* -> Sample
+      by_slug:   slug -> Sample
+      by_name:   lower(name) -> Sample
+
+    Supports DB formats:
+      - top-level list: [ {...}, {...} ]
+      - wrapped dict: { "directsound": [ {...}, {...} ] }
+    """
+    index = directsound_index(db_path)
+    return index.by_symbol, index.by_slug, index.by_name
 
 
 def resolve_sample(
@@ -112,7 +166,8 @@ def write_voicegroup_file(
     key: int,
     pan: int,
     ds_params: Tuple[int, int, int, int],
-) -> None:
+) -> bool:
+    """Write the voicegroup .inc; returns False if the file already had this content."""
     a, b, c, d = ds_params
 
     lines: List[str] = []
@@ -145,8 +200,47 @@ def write_voicegroup_file(
                 [make_voice_directsound_line(pad_sym, key=key, pan=pan, a=a, b=b, c=c, d=d)] * remaining
             )
 
+    text = "\n".join(lines) + "\n"
+    # Leave an identical file alone so its mtime doesn't trigger a rebuild
+    if out_path.exists() and out_path.read_text(encoding="utf-8") == text:
+        return False
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    out_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    out_path.write_text(text, encoding="utf-8")
+    return True
+
+
+def generate_voicegroup(
+    db_path: Path,
+    group_name: str,
+    instrument_ids: Sequence[int],
+    out_path: Path,
+    *,
+    pad_to_128: bool = True,
+    pad_with_square: bool = True,
+    key: int = 60,
+    pan: int = 0,
+    ds_params: Tuple[int, int, int, int] = DEFAULT_DS_PARAMS,
+) -> List[Sample]:
+    """
+    In-process voicegroup build: instruments are picked by their DB id (slot
+    1 onwards), looked up in the cached index for db_path, and written to
+    out_path. Returns the samples used.
+    """
+    if len(instrument_ids) > MAX_PICKS:
+        raise ValueError(f"Too many picks: {len(instrument_ids)}. Max is {MAX_PICKS} (slot 0 reserved for drumset).")
+    index = directsound_index(db_path)
+    chosen = [index.sample_for_id(i) for i in instrument_ids]
+    write_voicegroup_file(
+        Path(out_path),
+        group_name,
+        chosen,
+        pad_to_128=pad_to_128,
+        pad_with_square=pad_with_square,
+        key=key,
+        pan=pan,
+        ds_params=ds_params,
+    )
+    return chosen
 
 
 def main() -> None:
@@ -172,7 +266,7 @@ def main() -> None:
         type=int,
         nargs=4,
         metavar=("A", "B", "C", "D"),
-        default=(255, 127, 231, 127),
+        default=DEFAULT_DS_PARAMS,
         help="DirectSound params (4 ints). Default is a common flute-like tuple.",
     )
     args = ap.parse_args()
@@ -180,16 +274,12 @@ def main() -> None:
     if not args.pick:
         raise SystemExit("Provide at least one --pick (symbol, slug, or name).")
 
-    by_symbol, by_slug, by_name = load_directsound_db(args.db)
-
-    chosen: List[Sample] = []
-    for tok in args.pick:
-        chosen.append(resolve_sample(tok, by_symbol=by_symbol, by_slug=by_slug, by_name=by_name))
+    index = directsound_index(args.db)
+    chosen = [index.resolve(tok) for tok in args.pick]
 
-    max_picks = 127
-    if len(chosen) > max_picks:
+    if len(chosen) > MAX_PICKS:
         raise SystemExit(
-            f"Too many picks: {len(chosen)}. Max is {max_picks} (slot 0 reserved for drumset)."
+            f"Too many picks: {len(chosen)}. Max is {MAX_PICKS} (slot 0 reserved for drumset)."
         )
 
     if args.out:
@@ -1,23 +1,92 @@
 from __future__ import annotations
 
-import subprocess
 from pathlib import Path
 from typing import Optional
 
 from qtpy import QtCore, QtGui, QtWidgets
 
-from midi_editor.midi_init_injector import inject_init_events
-from midi_editor.config import AppConfig
-from midi_editor.models import MidiProject
-from midi_editor.midi_io import load_midi_as_notes, save_project_to_midi
+from exporter.generate_voice_group import generate_voicegroup
+from midi_editor.config import AppConfig, InstrumentDef
+from midi_editor.history import ProjectHistory
+from midi_editor.density_pyramid import DensityPyramid
+from midi_editor.lod_summary import NoteLodSummary
+from midi_editor.models import MidiProject, NoteChange, ProjectSnapshot
+from midi_editor.m4a_compiler import SongSettings, compile_project_to_song, song_label, symbol_name
+from midi_editor.midi_io import limit_export_channels, save_project_to_midi
+from midi_editor.tracing import TRACER
+from midi_editor.project_file import PROJECT_SUFFIX, load_project_file, project_source_midi, save_project_file
+from gui.ui_midi_loader import LoadedMidi, MidiLoadStatus, MidiLoadWorker, PartialMidi
+from gui.ui_minimap import DensityMinimap
+from gui.ui_preview import PreviewJob, PreviewLogPane, PreviewRequest, PreviewStatus
 from gui.ui_pianoroll import PianoRollView
 
+class InstrumentCatalog:
+    """
+    The DirectSound instrument list as the channel table shows it, built once:
+    display labels, id <-> row lookups, and one list model (created on first
+    use) that every row's combo box shares instead of holding its own items.
+    Searching goes through one completer too, handed to whichever combo has focus.
+    """
+    def __init__(self, instruments: list[InstrumentDef], parent: Optional[QtCore.QObject] = None):
+        self.ids = [inst.id for inst in instruments]
+        self.labels = [f"{inst.name} [{inst.bank}]" if inst.bank else inst.name for inst in instruments]
+        self.row_by_id: dict[int, int] = {}
+        for row, inst_id in enumerate(self.ids):
+            self.row_by_id.setdefault(inst_id, row)
+        self._parent = parent
+        self._model: Optional[QtCore.QStringListModel] = None
+        self._completer: Optional[QtWidgets.QCompleter] = None
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def model(self) -> QtCore.QStringListModel:
+        if self._model is None:
+            self._model = QtCore.QStringListModel(self.labels)
+        return self._model
+
+    def completer(self) -> QtWidgets.QCompleter:
+        """The one search completer (and its filter proxy) over the shared model."""
+        if self._completer is None:
+            self._completer = search_completer(self.model(), self._parent)
+        return self._completer
+
+    def attach_completer(self, combo: QtWidgets.QComboBox) -> QtWidgets.QCompleter:
+        """Move the shared completer to `combo`, taking it off the combo that had it."""
+        comp = self.completer()
+        owner = comp.widget()
+        if owner is not combo:
+            # Through the line edits: QComboBox.setCompleter hooks the completer up
+            # again on every call, so a combo that keeps getting it back would
+            # handle each activation several times
+            if isinstance(owner, QtWidgets.QComboBox) and owner.lineEdit() is not None:
+                owner.lineEdit().setCompleter(None)
+            combo.lineEdit().setCompleter(comp)
+            comp.setWidget(combo)
+        return comp
+
+    def label_for(self, inst_id: Optional[int]) -> Optional[str]:
+        row = self.row_by_id.get(inst_id) if inst_id is not None else None
+        return self.labels[row] if row is not None else None
+
+
+def search_completer(model: QtCore.QAbstractItemModel, parent: Optional[QtCore.QObject] = None) -> QtWidgets.QCompleter:
+    """Popup completer over `model` with case-insensitive "contains" matching."""
+    comp = QtWidgets.QCompleter(parent)
+    comp.setModel(model)
+    comp.setCaseSensitivity(QtCore.Qt.CaseInsensitive)
+    comp.setFilterMode(QtCore.Qt.MatchContains)
+    comp.setCompletionMode(QtWidgets.QCompleter.PopupCompletion)
+    return comp
+
+
 class SearchableComboBox(QtWidgets.QComboBox):
     """
     Normal-looking combobox, but you can type to search.
     Keeps the old dropdown aesthetic: the displayed text stays as the current selection.
+    Given a catalog, it shows the catalog's model and borrows its completer on focus.
     """
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, *, catalog: Optional[InstrumentCatalog] = None):
         super().__init__(parent)
 
         # We use an internal lineEdit for completer, but keep it read-only so it looks like a normal combo.
@@ -34,13 +103,32 @@ class SearchableComboBox(QtWidgets.QComboBox):
         self._reset_timer.setSingleShot(True)
         self._reset_timer.timeout.connect(self._reset_search)
 
-        comp = QtWidgets.QCompleter(self)
-        comp.setModel(self.model())
-        comp.setCaseSensitivity(QtCore.Qt.CaseInsensitive)
-        comp.setFilterMode(QtCore.Qt.MatchContains)
-        comp.setCompletionMode(QtWidgets.QCompleter.PopupCompletion)
-        comp.activated[str].connect(self._on_completer_activated)
-        self.setCompleter(comp)
+        # No completer of our own: the catalog's shared one is attached when
+        # this combo gets focus, otherwise one is made on the first search keystroke
+        self.setCompleter(None)
+        self._catalog = catalog
+        self._completer_hooked = False
+        if catalog is not None:
+            self.setModel(catalog.model())
+
+    def focusInEvent(self, event: QtGui.QFocusEvent) -> None:
+        if self._catalog is not None:
+            self._ensure_completer()
+        super().focusInEvent(event)
+
+    def _ensure_completer(self) -> QtWidgets.QCompleter:
+        if self._catalog is not None:
+            comp = self._catalog.attach_completer(self)
+        else:
+            comp = self.completer()
+            if comp is None:
+                # Searches whatever model the combo shows, no copy
+                comp = search_completer(self.model(), self)
+                self.setCompleter(comp)
+        if not self._completer_hooked:
+            comp.activated[str].connect(self._on_completer_activated)
+            self._completer_hooked = True
+        return comp
 
     def _reset_search(self) -> None:
         self._search = ""
@@ -50,6 +138,9 @@ class SearchableComboBox(QtWidgets.QComboBox):
             c.popup().hide()
 
     def _on_completer_activated(self, text: str) -> None:
+        if self.completer() is None:
+            # The shared completer has moved on to another combo
+            return
         idx = self.findText(text, QtCore.Qt.MatchExactly)
         if idx >= 0:
             self.setCurrentIndex(idx)
@@ -89,11 +180,10 @@ class SearchableComboBox(QtWidgets.QComboBox):
             return
 
         # Show completer popup with "contains" matching
-        c = self.completer()
-        if c:
-            c.setCompletionPrefix(self._search)
-            # Ensure popup shows something useful
-            c.complete()
+        c = self._ensure_completer()
+        c.setCompletionPrefix(self._search)
+        # Ensure popup shows something useful
+        c.complete()
 
         # Reset buffer after a short pause
         self._reset_timer.start(900)
@@ -104,7 +194,24 @@ class MainWindow(QtWidgets.QMainWindow):
         super().__init__()
         self.cfg = cfg
         self.project: Optional[MidiProject] = None
+        # channels shown in the channel table, in row order
+        self._table_channels: list[int] = []
         self.current_midi_path: Optional[Path] = None
+        # Undo/redo snapshots share note storage with the live project
+        self.history = ProjectHistory()
+        # Labels, lookups, list model and completer shared by every channel row's combo
+        self.instrument_catalog = InstrumentCatalog(cfg.instruments, self)
+        # Background MIDI open in progress (worker + its thread), and the
+        # project to go back to if it's cancelled or fails
+        self._midi_loader: Optional[MidiLoadWorker] = None
+        self._midi_load_thread: Optional[QtCore.QThread] = None
+        self._project_before_load: Optional[MidiProject] = None
+        # Preview build running in the background, if any; a finished or
+        # cancelled one that's still letting go of its files; and the new
+        # preview waiting for that
+        self._preview_job: Optional[PreviewJob] = None
+        self._retiring_preview: Optional[PreviewJob] = None
+        self._queued_preview: Optional[PreviewRequest] = None
 
         self.setWindowTitle("MIDI Editor (Preview + Export)")
         self.resize(1200, 700)
@@ -116,6 +223,7 @@ class MainWindow(QtWidgets.QMainWindow):
 
         # Left: channel controls
         left = QtWidgets.QWidget()
+        self._left_panel = left
         left_layout = QtWidgets.QVBoxLayout(left)
 
         self.lbl_warning = QtWidgets.QLabel("")
@@ -184,9 +292,16 @@ class MainWindow(QtWidgets.QMainWindow):
 
         layout.addWidget(left, 0)
 
-        # Right: piano roll
+        # Right: piano roll with the whole-song density minimap underneath
+        right = QtWidgets.QWidget()
+        right_layout = QtWidgets.QVBoxLayout(right)
+        right_layout.setContentsMargins(0, 0, 0, 0)
+        right_layout.setSpacing(2)
         self.pianoroll = PianoRollView(drums_by_note=self.cfg.drums_by_note)
-        layout.addWidget(self.pianoroll, 1)
+        self.minimap = DensityMinimap(self.pianoroll)
+        right_layout.addWidget(self.pianoroll, 1)
+        right_layout.addWidget(self.minimap, 0)
+        layout.addWidget(right, 1)
 
         # Menu
         open_action = QtWidgets.QAction("Open MIDI", self)
@@ -195,11 +310,68 @@ class MainWindow(QtWidgets.QMainWindow):
         save_action = QtWidgets.QAction("Save Project As MIDI", self)
         save_action.triggered.connect(self.save_project_as_midi)
 
+        open_project_action = QtWidgets.QAction("Open Project…", self)
+        open_project_action.triggered.connect(self.open_project_file)
+
+        save_project_action = QtWidgets.QAction("Save Project…", self)
+        save_project_action.triggered.connect(self.save_project_file_dialog)
+
+        self.undo_action = QtWidgets.QAction("Undo", self)
+        self.undo_action.setShortcut(QtGui.QKeySequence.Undo)
+        self.undo_action.triggered.connect(self.undo)
+
+        self.redo_action = QtWidgets.QAction("Redo", self)
+        self.redo_action.setShortcut(QtGui.QKeySequence.Redo)
+        self.redo_action.triggered.connect(self.redo)
+
         menubar = self.menuBar()
         file_menu = menubar.addMenu("File")
         file_menu.addAction(open_action)
+        file_menu.addAction(open_project_action)
+        file_menu.addSeparator()
+        file_menu.addAction(save_project_action)
         file_menu.addAction(save_action)
 
+        edit_menu = menubar.addMenu("Edit")
+        edit_menu.addAction(self.undo_action)
+        edit_menu.addAction(self.redo_action)
+
+        # Debug timings (off by default; tracing costs nothing until switched on)
+        self.trace_overlay_action = QtWidgets.QAction("Timing Overlay", self)
+        self.trace_overlay_action.setCheckable(True)
+        self.trace_overlay_action.setChecked(TRACER.enabled)
+        self.trace_overlay_action.toggled.connect(self.pianoroll.set_trace_overlay)
+        self.pianoroll.set_trace_overlay(TRACER.enabled)
+        export_trace_action = QtWidgets.QAction("Export Timing Trace…", self)
+        export_trace_action.triggered.connect(self.export_trace_dialog)
+
+        # Stage messages and make output of the latest preview
+        self.preview_log = PreviewLogPane()
+        self.preview_log_dock = QtWidgets.QDockWidget("Preview Log", self)
+        self.preview_log_dock.setObjectName("preview_log_dock")
+        self.preview_log_dock.setWidget(self.preview_log)
+        self.addDockWidget(QtCore.Qt.BottomDockWidgetArea, self.preview_log_dock)
+        self.preview_log_dock.hide()
+
+        view_menu = menubar.addMenu("View")
+        view_menu.addAction(self.trace_overlay_action)
+        view_menu.addAction(export_trace_action)
+        view_menu.addSeparator()
+        view_menu.addAction(self.preview_log_dock.toggleViewAction())
+
+        # Actions that would act on a half-loaded project
+        self._save_actions = [save_action, save_project_action]
+
+        # MIDI load progress + cancel, in the status bar
+        self.load_status = MidiLoadStatus()
+        self.load_status.cancel_requested.connect(self.cancel_midi_load)
+        self.statusBar().addPermanentWidget(self.load_status)
+
+        # Preview stage progress + cancel, in the status bar
+        self.preview_status = PreviewStatus()
+        self.preview_status.cancel_requested.connect(self.cancel_preview)
+        self.statusBar().addPermanentWidget(self.preview_status)
+
         # Connections
         self.btn_delete_channel.clicked.connect(self.delete_selected_channel_contents)
         self.btn_swap.clicked.connect(self.swap_channels_dialog)
@@ -208,6 +380,8 @@ class MainWindow(QtWidgets.QMainWindow):
         self.btn_export.clicked.connect(self.export_assets_dialog)
         self.channel_table.cellChanged.connect(self.on_channel_cell_changed)
 
+        self._update_undo_actions()
+
         # Keybind for deleting notes
         delete_shortcut = QtWidgets.QShortcut(QtCore.Qt.Key_Delete, self)
         delete_shortcut.activated.connect(self.on_delete_key)
@@ -305,81 +479,13 @@ class MainWindow(QtWidgets.QMainWindow):
             mapping[int(old_pitch)] = int(new_pitch)
 
         return mapping
-    def _make_searchable_instrument_combo(
-        self,
-        *,
-        ch: int,
-        display_labels: list[str],
-        id_by_label: dict[str, int],
-        label_by_id: dict[int, str],
-        default_inst_id: int,
-        default_label: str,
-    ) -> QtWidgets.QComboBox:
-        """
-        Create a searchable instrument combobox:
-        - editable, so user can type
-        - completer popup with case-insensitive contains matching
-        - keeps selection synced with channel_instrument_id
-        """
-        combo = QtWidgets.QComboBox()
-        combo.setEditable(True)
-        combo.addItems(display_labels)
-
-        # Make typing behave like search, not like "edit the current item"
-        line = combo.lineEdit()
-        if line:
-            line.setPlaceholderText("Search…")
-            line.setClearButtonEnabled(False)
-    
-        # Completer with popup filtering
-        completer = QtWidgets.QCompleter(display_labels, combo)
-        completer.setCaseSensitivity(QtCore.Qt.CaseInsensitive)
-        completer.setFilterMode(QtCore.Qt.MatchContains)
-        completer.setCompletionMode(QtWidgets.QCompleter.PopupCompletion)
-        combo.setCompleter(completer)
-
-        # Make it feel like a search box: on focus/click, highlight so typing replaces the current value.
-        if line:
-            line.setPlaceholderText("Search… (type to filter)")
-            line.installEventFilter(self)
-
-        # Ensure model has an instrument id for this channel
-        assert self.project is not None
-        self.project.channel_instrument_id.setdefault(ch, default_inst_id)
-        current_id = self.project.channel_instrument_id.get(ch, default_inst_id)
-
-        # Set current selection
-        combo.setCurrentText(label_by_id.get(current_id, default_label))
-
-        def _apply_label(label: str) -> None:
-            # If user typed something that is not an exact label, snap back
-            if label not in id_by_label:
-                combo.blockSignals(True)
-                combo.setCurrentText(label_by_id.get(current_id, default_label))
-                combo.blockSignals(False)
-                return
-            self.set_channel_instrument_id(ch, id_by_label.get(label, default_inst_id))
-
-        # Trigger when user picks from list OR confirms typed text
-        combo.currentTextChanged.connect(_apply_label)
-        if line:
-            line.editingFinished.connect(lambda: _apply_label(combo.currentText()))
-
-        return combo
-
-    def eventFilter(self, obj, event):
-        if event.type() == QtCore.QEvent.FocusIn:
-            # Select all so typing instantly replaces the current instrument name
-            if isinstance(obj, QtWidgets.QLineEdit):
-                QtCore.QTimer.singleShot(0, obj.selectAll)
-        return super().eventFilter(obj, event)
 
     def manual_remap_drums(self) -> None:
         if not self.project:
             return
 
         # Collect all drum pitches currently used on channel 9
-        used = sorted({int(n.pitch) for n in self.project.notes if n.channel == 9})
+        used = self.project.pitches_for_channel(9)
         if not used:
             QtWidgets.QMessageBox.information(self, "Manual Remap Drums", "No notes found on channel 9.")
             return
@@ -502,28 +608,14 @@ class MainWindow(QtWidgets.QMainWindow):
             QtWidgets.QMessageBox.information(self, "Manual Remap Drums", "No changes selected.")
             return
 
+        self._record_undo("Manual drum remap")
+
         # Apply delete first
         if delete_set:
-            self.project.notes = [
-                n for n in self.project.notes
-                if not (n.channel == 9 and int(n.pitch) in delete_set)
-            ]
+            self.project.delete_pitches(9, delete_set)
 
         # Apply remap
-        changed = 0
-        for n in self.project.notes:
-            if n.channel != 9:
-                continue
-            old = int(n.pitch)
-            new = remap_map.get(old)
-            if new is None:
-                continue
-            if int(new) != old:
-                n.pitch = int(new)
-                changed += 1
-
-        self.pianoroll.redraw()
-        self.refresh_channel_table()
+        changed = self.project.remap_pitches(9, remap_map)
 
         QtWidgets.QMessageBox.information(
             self,
@@ -534,16 +626,17 @@ class MainWindow(QtWidgets.QMainWindow):
 
 
     def on_bpm_changed(self, value: int) -> None:
-        if not self.project:
+        if not self.project or int(value) == self.project.tempo_bpm:
             return
+        # Each spin box step fires this: consecutive steps undo as one change
+        self._record_undo("Change tempo", coalesce=True)
         self.project.tempo_bpm = int(value)
 
     def on_delete_key(self) -> None:
-        if not self.project:
+        if not self.project or self._midi_loader is not None or not self.pianoroll.selected_note_indices():
             return
-        removed = self.pianoroll.delete_selected_notes()
-        if removed:
-            self.refresh_channel_table()
+        self._record_undo("Delete notes")
+        self.pianoroll.delete_selected_notes()
 
     def open_midi(self) -> None:
         path, _ = QtWidgets.QFileDialog.getOpenFileName(
@@ -552,9 +645,229 @@ class MainWindow(QtWidgets.QMainWindow):
         if not path:
             return
 
-        midi_path = Path(path)
-        self.current_midi_path = midi_path
-        self.project = load_midi_as_notes(midi_path)
+        self.start_midi_load(Path(path))
+
+    def export_trace_dialog(self) -> None:
+        if not TRACER.names():
+            QtWidgets.QMessageBox.information(
+                self, "Export Timing Trace", "Nothing recorded: turn on View > Timing Overlay, then repeat the slow interaction."
+            )
+            return
+        path, _ = QtWidgets.QFileDialog.getSaveFileName(
+            self, "Export Timing Trace", "trace.json", "Chrome trace (*.json)"
+        )
+        if not path:
+            return
+        try:
+            count = TRACER.save(Path(path))
+        except OSError as e:
+            QtWidgets.QMessageBox.critical(self, "Export Timing Trace failed", str(e))
+            return
+        self.statusBar().showMessage(f"Wrote {count} trace events to {path} (open in chrome://tracing)", 8000)
+
+    # ---- background MIDI open ----
+
+    def start_midi_load(self, midi_path: Path) -> None:
+        """
+        Decode `midi_path` on a worker thread. The window stays responsive,
+        shows what's been decoded so far as it arrives, and can cancel back
+        to the previous project.
+        """
+        if self._midi_loader is not None:
+            self.cancel_midi_load()
+        self._project_before_load = self.project
+
+        worker = MidiLoadWorker(midi_path, self.pianoroll.metrics.tick_px, parallel=True)
+        thread = QtCore.QThread(self)
+        worker.moveToThread(thread)
+        thread.started.connect(worker.run)
+        worker.progress.connect(self.load_status.set_progress)
+        worker.partial.connect(self._on_midi_partial)
+        worker.loaded.connect(self._on_midi_loaded)
+        worker.failed.connect(self._on_midi_load_failed)
+        worker.cancelled.connect(self._on_midi_load_cancelled)
+        for done in (worker.loaded, worker.failed, worker.cancelled):
+            done.connect(thread.quit)
+        thread.finished.connect(worker.deleteLater)
+        thread.finished.connect(thread.deleteLater)
+
+        self._midi_loader, self._midi_load_thread = worker, thread
+        self.load_status.start(midi_path)
+        self._set_loading(True)
+        thread.start()
+
+    def cancel_midi_load(self, *, wait: bool = False) -> None:
+        worker, thread = self._midi_loader, self._midi_load_thread
+        if worker is None:
+            return
+        worker.cancel()
+        # Results from this worker still queued for the GUI thread are ignored from here on
+        self._midi_loader = None
+        self._midi_load_thread = None
+        thread.quit()
+        if wait:
+            # The worker notices at the end of the track it's decoding
+            thread.wait()
+        self._finish_midi_load()
+        if self._project_before_load is not None and self.project is not self._project_before_load:
+            self._show_project(self._project_before_load)
+        elif self._project_before_load is None:
+            self._clear_project()
+        self._project_before_load = None
+
+    def _is_current_loader(self) -> bool:
+        return self._midi_loader is not None and self.sender() is self._midi_loader
+
+    def _on_midi_partial(self, partial: PartialMidi) -> None:
+        if not self._is_current_loader():
+            return
+        part = partial.project
+        if self.project is None or self.project is self._project_before_load:
+            self._show_project(part, pyramid=partial.pyramid)
+            self._set_loading(True)
+            return
+        # Append the new tracks to what's shown: one NOTES_ADDED edit the piano
+        # roll, minimap and channel table catch up with incrementally
+        default_id = self.cfg.instruments[0].id if self.cfg.instruments else 0
+        for ch in part.used_channels():
+            if ch != 9:
+                self.project.channel_instrument_id.setdefault(ch, default_id)
+        for ch, name in part.channel_track_name.items():
+            self.project.channel_track_name.setdefault(ch, name)
+        self.project.add_notes(part.notes)
+
+    def _on_midi_loaded(self, loaded: LoadedMidi) -> None:
+        if not self._is_current_loader():
+            return
+        self.current_midi_path = self._midi_loader.midi_path
+        self._midi_loader = None
+        self._midi_load_thread = None
+        self._project_before_load = None
+        self._finish_midi_load()
+        self.history.clear()
+        self._show_project(loaded.project, lod=loaded.lod, pyramid=loaded.pyramid)
+
+    def _on_midi_load_failed(self, message: str) -> None:
+        if not self._is_current_loader():
+            return
+        path = self._midi_loader.midi_path
+        self.cancel_midi_load()
+        QtWidgets.QMessageBox.critical(self, "Open MIDI failed", f"{path.name}: {message}")
+
+    def _on_midi_load_cancelled(self) -> None:
+        # cancel_midi_load() already put the window back
+        pass
+
+    def _finish_midi_load(self) -> None:
+        self.load_status.stop()
+        self._set_loading(False)
+
+    def _set_loading(self, loading: bool) -> None:
+        """Lock editing while a partially decoded MIDI is on screen."""
+        self._left_panel.setEnabled(not loading)
+        for action in self._save_actions:
+            action.setEnabled(not loading)
+        if loading:
+            self.undo_action.setEnabled(False)
+            self.redo_action.setEnabled(False)
+        else:
+            self._update_undo_actions()
+
+    def _clear_project(self) -> None:
+        if self.project is not None:
+            self.project.unsubscribe(self._on_notes_changed)
+        self.project = None
+        self.pianoroll.set_project(None)
+        self.minimap.set_project(None)
+        self.refresh_channel_table()
+
+    def closeEvent(self, event: QtGui.QCloseEvent) -> None:
+        self.cancel_midi_load(wait=True)
+        self._queued_preview = None
+        self.cancel_preview(wait=True)
+        super().closeEvent(event)
+
+    def open_project_file(self) -> None:
+        path, _ = QtWidgets.QFileDialog.getOpenFileName(
+            self, "Open Project", "", f"Projects (*{PROJECT_SUFFIX})"
+        )
+        if not path:
+            return
+        try:
+            project = load_project_file(Path(path))
+            self.current_midi_path = project_source_midi(Path(path))
+        except (OSError, ValueError) as e:
+            QtWidgets.QMessageBox.critical(self, "Open Project failed", str(e))
+            return
+        self._set_project(project)
+
+    def save_project_file_dialog(self) -> None:
+        if not self.project:
+            return
+        path, _ = QtWidgets.QFileDialog.getSaveFileName(
+            self, "Save Project As", "", f"Projects (*{PROJECT_SUFFIX})"
+        )
+        if not path:
+            return
+        out_path = Path(path)
+        if out_path.suffix != PROJECT_SUFFIX:
+            out_path = out_path.with_suffix(PROJECT_SUFFIX)
+
+        # Mute state lives in the table checkboxes; persist what the user sees
+        self.project.muted_channels = self._muted_channels_from_table()
+        try:
+            save_project_file(self.project, out_path, source_midi=self.current_midi_path)
+        except OSError as e:
+            QtWidgets.QMessageBox.critical(self, "Save Project failed", str(e))
+
+    def _set_project(self, project: MidiProject) -> None:
+        self.history.clear()
+        self._show_project(project)
+
+    def _record_undo(self, label: str, *, coalesce: bool = False) -> None:
+        if not self.project:
+            return
+        self.project.muted_channels = self._muted_channels_from_table()
+        self.history.record(self.project, label, coalesce=coalesce)
+        self._update_undo_actions()
+
+    def _update_undo_actions(self) -> None:
+        undo_label = self.history.undo_label()
+        redo_label = self.history.redo_label()
+        self.undo_action.setEnabled(undo_label is not None)
+        self.redo_action.setEnabled(redo_label is not None)
+        self.undo_action.setText(f"Undo {undo_label}" if undo_label else "Undo")
+        self.redo_action.setText(f"Redo {redo_label}" if redo_label else "Redo")
+
+    def undo(self) -> None:
+        if not self.project:
+            return
+        # The redo entry is snapshotted from the project: bring its mutes up to date first
+        self.project.muted_channels = self._muted_channels_from_table()
+        project = self.history.undo(self.project)
+        if project is not None:
+            self._show_project(project)
+
+    def redo(self) -> None:
+        if not self.project:
+            return
+        self.project.muted_channels = self._muted_channels_from_table()
+        project = self.history.redo(self.project)
+        if project is not None:
+            self._show_project(project)
+
+    def _show_project(
+        self,
+        project: MidiProject,
+        *,
+        lod: Optional[NoteLodSummary] = None,
+        pyramid: Optional[DensityPyramid] = None,
+    ) -> None:
+        if self.project is not None:
+            self.project.unsubscribe(self._on_notes_changed)
+        self.project = project
+        self.project.subscribe(self._on_notes_changed)
+        self._update_undo_actions()
 
         # Populate BPM from imported MIDI tempo (or default)
         self.spin_bpm.setValue(int(getattr(self.project, "tempo_bpm", 120)))
@@ -570,7 +883,8 @@ class MainWindow(QtWidgets.QMainWindow):
                 continue
             self.project.channel_instrument_id.setdefault(ch, default_id)
 
-        self.pianoroll.set_project(self.project)
+        self.pianoroll.set_project(self.project, lod)
+        self.minimap.set_project(self.project, pyramid)
         self.refresh_channel_table()
 
     def _color_for_channel(self, ch: int) -> QtGui.QColor:
@@ -615,17 +929,20 @@ class MainWindow(QtWidgets.QMainWindow):
         if not isinstance(ch, int):
             return
 
-        if not hasattr(self.project, "muted_channels") or self.project.muted_channels is None:
-            self.project.muted_channels = set()
+        # The checkbox has already flipped: record the mutes from before it
+        checked = cb.isChecked()
+        muted = self._muted_channels_from_table()
+        self.project.muted_channels = muted - {ch} if checked else muted | {ch}
+        self.history.record(self.project, f"{'Mute' if checked else 'Unmute'} channel {ch}")
+        self._update_undo_actions()
 
-        if state == QtCore.Qt.Checked:
-            self.project.muted_channels.add(ch)
-        else:
-            self.project.muted_channels.discard(ch)
+        self.project.muted_channels = muted
 
-    def _filtered_project_copy(self) -> MidiProject:
+    def _export_snapshot(self) -> ProjectSnapshot:
         """
-        Return a safe copy of the project with muted channels removed.
+        Return an immutable snapshot of the project with muted channels filtered out.
+        Notes are shared copy-on-write with the live project, and the mute filter is
+        applied lazily when the snapshot's notes are first read.
         Source of truth for mute is the UI table checkboxes (not project.muted_channels),
         so mute works even if Qt signals are flaky.
         """
@@ -639,37 +956,7 @@ class MainWindow(QtWidgets.QMainWindow):
         except Exception:
             pass
 
-        filtered_notes = []
-        for n in self.project.notes:
-            if n.channel in muted:
-                continue
-            filtered_notes.append(type(n)(
-                start_tick=n.start_tick,
-                end_tick=n.end_tick,
-                pitch=n.pitch,
-                velocity=n.velocity,
-                channel=n.channel,
-                track_index=getattr(n, "track_index", 0),
-            ))
-
-        return MidiProject(
-            ticks_per_beat=self.project.ticks_per_beat,
-            notes=filtered_notes,
-            channel_instrument_id=dict(self.project.channel_instrument_id),
-            tempo_bpm=int(getattr(self.project, "tempo_bpm", 120)),
-            channel_track_name=dict(getattr(self.project, "channel_track_name", {})),
-            muted_channels=set(muted),
-        )
-
-
-        return MidiProject(
-            ticks_per_beat=self.project.ticks_per_beat,
-            notes=filtered_notes,
-            channel_instrument_id=dict(self.project.channel_instrument_id),
-            tempo_bpm=int(getattr(self.project, "tempo_bpm", 120)),
-            channel_track_name=dict(getattr(self.project, "channel_track_name", {})),
-            muted_channels=set(muted),
-        )
+        return self.project.snapshot(muted=muted)
 
     def _channel_number_from_row(self, row: int) -> Optional[int]:
         w = self.channel_table.cellWidget(row, 0)
@@ -696,9 +983,79 @@ class MainWindow(QtWidgets.QMainWindow):
         return muted
 
 
+    def _on_notes_changed(self, change: NoteChange) -> None:
+        """
+        Patch the channel table rows an edit touched. The piano roll listens to
+        the same events; rows are only rebuilt when the set of channels changes.
+        """
+        if not self.project:
+            return
+        if self.project.used_channels() != self._table_channels:
+            self.refresh_channel_table()
+            return
+
+        self._update_channel_rows([ch for ch in sorted(change.channels) if ch in self._table_channels])
+
+    def _update_channel_rows(self, channels: list[int]) -> None:
+        """Bring existing rows up to date with the project (mute, role, instrument, note count)."""
+        counts = self.project.channel_note_counts()
+        muted = getattr(self.project, "muted_channels", set()) or set()
+        catalog = self.instrument_catalog
+        self.channel_table.blockSignals(True)
+        try:
+            for ch in channels:
+                row = self._table_channels.index(ch)
+
+                mute = self.channel_table.cellWidget(row, 1)
+                if isinstance(mute, QtWidgets.QCheckBox):
+                    mute.blockSignals(True)
+                    mute.setChecked(ch in muted)
+                    mute.blockSignals(False)
+
+                role_item = self.channel_table.item(row, 2)
+                if role_item is not None:
+                    role_item.setText(self._channel_role_text(ch))
+
+                # Instrument ids move with swapped/merged channels
+                combo = self.channel_table.cellWidget(row, 3)
+                if ch != 9 and isinstance(combo, QtWidgets.QComboBox):
+                    inst_row = catalog.row_by_id.get(self.project.channel_instrument_id.get(ch))
+                    if inst_row is not None and combo.currentIndex() != inst_row:
+                        combo.blockSignals(True)
+                        combo.setCurrentIndex(inst_row)
+                        combo.blockSignals(False)
+
+                count_item = self.channel_table.item(row, 4)
+                if count_item is not None:
+                    count_item.setText(str(counts.get(ch, 0)))
+        finally:
+            self.channel_table.blockSignals(False)
+
+    def _channel_role_text(self, ch: int) -> str:
+        role = "Drums" if ch == 9 else "Melodic"
+        trk_label = (getattr(self.project, "channel_track_name", {}).get(ch) or "").strip()
+        if trk_label:
+            role = f"{role} ({trk_label})"
+        return role
+
     def refresh_channel_table(self) -> None:
+        """
+        Show the project's channels. Rows are only rebuilt when the set of
+        channels changes; otherwise the existing rows are updated in place.
+        """
+        with TRACER.span("refresh_channel_table") as span:
+            rebuilt = True
+            if self.project and self.project.used_channels() == self._table_channels and self._table_channels:
+                self._update_channel_rows(list(self._table_channels))
+                rebuilt = False
+            else:
+                self._fill_channel_table()
+            span.set(rows=self.channel_table.rowCount(), rebuilt=rebuilt)
+
+    def _fill_channel_table(self) -> None:
         self.channel_table.blockSignals(True)
         self.channel_table.setRowCount(0)
+        self._table_channels = []
 
         if not self.project:
             self.lbl_warning.setText("")
@@ -706,6 +1063,7 @@ class MainWindow(QtWidgets.QMainWindow):
             return
 
         used = self.project.used_channels()
+        self._table_channels = list(used)
         has_overflow = any(c > 9 for c in used)
 
         warning_lines: list[str] = []
@@ -713,23 +1071,12 @@ class MainWindow(QtWidgets.QMainWindow):
             warning_lines.append("Warning: MIDI uses channels above 9. Preview/Export cuts to channels 0–9.")
         self.lbl_warning.setText("\n".join(warning_lines))
 
-        instruments = self.cfg.instruments
-
-        # Build display labels once per refresh
-        display_labels: list[str] = []
-        id_by_label: dict[str, int] = {}
-        label_by_id: dict[int, str] = {}
-
-        for inst in instruments:
-            label = f"{inst.name} [{inst.bank}]" if inst.bank else inst.name
-            display_labels.append(label)
-            id_by_label[label] = inst.id
-            label_by_id[inst.id] = label
-
-        default_inst_id = instruments[0].id if instruments else 0
-        default_label = display_labels[0] if display_labels else "No instruments loaded"
+        # Labels and lookups are built once per window, not per refresh
+        catalog = self.instrument_catalog
+        default_inst_id = catalog.ids[0] if len(catalog) else 0
 
         muted = getattr(self.project, "muted_channels", set()) or set()
+        note_counts = self.project.channel_note_counts()
 
         for ch in used:
             row = self.channel_table.rowCount()
@@ -748,11 +1095,7 @@ class MainWindow(QtWidgets.QMainWindow):
             self.channel_table.setCellWidget(row, 1, mute)
 
             # Column 2: Role + imported track label
-            role = "Drums" if ch == 9 else "Melodic"
-            trk_label = (getattr(self.project, "channel_track_name", {}).get(ch) or "").strip()
-            if trk_label:
-                role = f"{role} ({trk_label})"
-            item_role = QtWidgets.QTableWidgetItem(role)
+            item_role = QtWidgets.QTableWidgetItem(self._channel_role_text(ch))
             item_role.setFlags(item_role.flags() & ~QtCore.Qt.ItemIsEditable)
             self.channel_table.setItem(row, 2, item_role)
 
@@ -761,9 +1104,14 @@ class MainWindow(QtWidgets.QMainWindow):
                 combo = QtWidgets.QComboBox()
                 combo.addItem("Drums (channel 9)")
                 combo.setEnabled(False)
+            elif not len(catalog):
+                combo = QtWidgets.QComboBox()
+                combo.addItem("No instruments loaded")
+                combo.setEnabled(False)
             else:
-                combo = SearchableComboBox()
-                combo.addItems(display_labels)
+                # Every row shows the same shared model and searches with the
+                # same completer: no per-row items or filter proxies
+                combo = SearchableComboBox(catalog=catalog)
 
                 # Ensure we have a selection stored for this channel
                 self.project.channel_instrument_id.setdefault(ch, default_inst_id)
@@ -771,22 +1119,20 @@ class MainWindow(QtWidgets.QMainWindow):
 
                 # Set shown selection
                 combo.blockSignals(True)
-                combo.setCurrentText(label_by_id.get(current_id, default_label))
+                combo.setCurrentIndex(catalog.row_by_id.get(current_id, 0))
                 combo.blockSignals(False)
 
                 # Update mapping when selection changes
-                def _on_changed(label: str, ch=ch) -> None:
-                    inst_id = id_by_label.get(label)
-                    if inst_id is None:
-                        return
-                    self.set_channel_instrument_id(ch, inst_id)
+                def _on_changed(row: int, ch=ch) -> None:
+                    if 0 <= row < len(catalog):
+                        self.set_channel_instrument_id(ch, catalog.ids[row])
 
-                combo.currentTextChanged.connect(_on_changed)
+                combo.currentIndexChanged.connect(_on_changed)
 
             self.channel_table.setCellWidget(row, 3, combo)
 
             # Column 4: Notes count
-            ncount = len(self.project.notes_for_channel(ch))
+            ncount = note_counts.get(ch, 0)
             item_notes = QtWidgets.QTableWidgetItem(str(ncount))
             item_notes.setFlags(item_notes.flags() & ~QtCore.Qt.ItemIsEditable)
             self.channel_table.setItem(row, 4, item_notes)
@@ -796,6 +1142,9 @@ class MainWindow(QtWidgets.QMainWindow):
     def set_channel_instrument_id(self, ch: int, inst_id: int) -> None:
         if not self.project or ch == 9:
             return
+        if self.project.channel_instrument_id.get(ch) == int(inst_id):
+            return
+        self._record_undo("Change instrument")
         self.project.channel_instrument_id[ch] = int(inst_id)
 
     def on_channel_cell_changed(self, row: int, col: int) -> None:
@@ -817,19 +1166,18 @@ class MainWindow(QtWidgets.QMainWindow):
                 return int(txt)
         return None
 
-    def build_pick_names_for_channels_0_8(self) -> list[str]:
+    def build_pick_ids_for_channels_0_8(self) -> list[int]:
         assert self.project is not None
         instruments = self.cfg.instruments
         if not instruments:
-            return [""] * 9
+            return []
 
-        name_by_id = {inst.id: inst.name for inst in instruments}
         default_id = instruments[0].id
 
-        picks: list[str] = []
+        picks: list[int] = []
         for ch in range(0, 9):
             inst_id = self.project.channel_instrument_id.get(ch, default_id)
-            picks.append(name_by_id.get(inst_id, instruments[0].name))
+            picks.append(inst_id if inst_id in self.instrument_catalog.row_by_id else default_id)
         return picks
 
     def delete_selected_channel_contents(self) -> None:
@@ -838,9 +1186,8 @@ class MainWindow(QtWidgets.QMainWindow):
         ch = self.selected_channel()
         if ch is None:
             return
+        self._record_undo("Delete channel contents")
         self.project.delete_channel(ch)
-        self.pianoroll.redraw()
-        self.refresh_channel_table()
 
     def swap_channels_dialog(self) -> None:
         if not self.project:
@@ -860,9 +1207,8 @@ class MainWindow(QtWidgets.QMainWindow):
         if not ok:
             return
 
+        self._record_undo("Swap channels")
         self.project.swap_channels(a, b)
-        self.pianoroll.redraw()
-        self.refresh_channel_table()
 
     def merge_channels_dialog(self) -> None:
         if not self.project:
@@ -892,9 +1238,8 @@ class MainWindow(QtWidgets.QMainWindow):
         if not ok:
             return
 
+        self._record_undo("Merge channels")
         self.project.merge_channel_into(src, dst)
-        self.pianoroll.redraw()
-        self.refresh_channel_table()
 
     def save_project_as_midi(self) -> None:
         if not self.project:
@@ -906,7 +1251,7 @@ class MainWindow(QtWidgets.QMainWindow):
             return
         out_path = Path(path)
 
-        proj_out = self._filtered_project_copy()
+        proj_out = self._export_snapshot()
         warnings = save_project_to_midi(
             proj_out,
             out_path,
@@ -916,34 +1261,40 @@ class MainWindow(QtWidgets.QMainWindow):
         if warnings:
             QtWidgets.QMessageBox.information(self, "Saved with notes", "\n".join(warnings))
 
-    def _run_cmd(self, cmd: list[str], title: str) -> bool:
-        res = subprocess.run(
-            cmd,
-            cwd=str(self.cfg.project_root),
-            text=True,
-            capture_output=True,
-        )
-        if res.returncode != 0:
-            msg = (res.stderr or res.stdout or "Unknown error").strip()
-            QtWidgets.QMessageBox.critical(self, title, msg)
-            return False
+    def _generate_voicegroup(self, name: str, out_inc: Path) -> bool:
+        # In-process: the DB index is parsed once and reused by later previews/exports
+        picks = self.build_pick_ids_for_channels_0_8()
+        with TRACER.span("preview.generate_voice_group", cat="preview", picks=len(picks)):
+            try:
+                if not picks:
+                    raise ValueError("No DirectSound instruments loaded.")
+                generate_voicegroup(
+                    self.cfg.project_root / self.cfg.db_path,
+                    name,
+                    picks,
+                    out_inc,
+                    pad_to_128=True,
+                    pad_with_square=True,
+                )
+            except (OSError, ValueError, KeyError) as e:
+                msg = e.args[0] if isinstance(e, KeyError) and e.args else str(e)
+                QtWidgets.QMessageBox.critical(self, "Voicegroup generation failed", msg)
+                return False
         return True
 
     def preview_full_song(self) -> None:
+        """
+        Snapshot the song and compile, build and launch it in the background.
+        A preview already running is cancelled first: the new one replaces it.
+        """
         if not self.project:
             return
 
-        self.cfg.resources_midi_dir.mkdir(parents=True, exist_ok=True)
+        self.cancel_preview()
 
-        proj_out = self._filtered_project_copy()
-
-        warnings = save_project_to_midi(
-            proj_out,
-            self.cfg.temp_preview_midi_path,
-            normalize_to_channels_0_9=True,
-            drop_channels_over_9=True,
-            force_programs_at_start=False,
-        )
+        # The song is compiled from this on the preview thread (no MIDI round trip)
+        proj_out = self._export_snapshot()
+        _, warnings = limit_export_channels(proj_out.notes)
 
         if warnings:
             resp = QtWidgets.QMessageBox.warning(
@@ -955,68 +1306,92 @@ class MainWindow(QtWidgets.QMainWindow):
             if resp != QtWidgets.QMessageBox.Yes:
                 return
 
-        injected_mid = self.cfg.resources_midi_dir / "mus_preview_init.mid"
-        bpm = int(self.spin_bpm.value())
+        picks = self.build_pick_ids_for_channels_0_8()
+        if not picks:
+            QtWidgets.QMessageBox.critical(self, "Voicegroup generation failed", "No DirectSound instruments loaded.")
+            return
 
-        inject_init_events(
-            Path(self.cfg.temp_preview_midi_path),
-            Path(injected_mid),
-            tempo_bpm=bpm,
-            program_base=1,
-            max_melodic_channels=9,
+        request = PreviewRequest(
+            snapshot=proj_out,
+            db_path=self.cfg.project_root / self.cfg.db_path,
+            instrument_ids=picks,
+            voicegroup="test",
+            repo=(self.cfg.project_root / Path(self.cfg.preview_repo).expanduser()).resolve(),
+            mgba_path=self.cfg.mgba_path,
+            volume=int(self.spin_volume.value()),
+            reverb=int(self.spin_reverb.value()),
+            priority=int(self.spin_priority.value()),
         )
+        self.start_preview(request)
 
-        picks = self.build_pick_names_for_channels_0_8()
-
-        voicegroup_name = "test"
-        inc_out = Path(self.cfg.preview_repo) / "sound" / "voicegroups" / f"{voicegroup_name}.inc"
+    # ---- background preview ----
 
-        gen_cmd = [
-            "python3",
-            "exporter/generate_voice_group.py",
-            "--db",
-            self.cfg.db_path,
-            "--name",
-            voicegroup_name,
-        ]
-        for p in picks:
-            gen_cmd += ["--pick", p]
-        gen_cmd += ["--pad", "--pad-with-square", "--out", str(inc_out)]
-
-        if not self._run_cmd(gen_cmd, "Voicegroup generation failed"):
+    def start_preview(self, request: PreviewRequest) -> None:
+        """
+        Start a preview job for `request`. Never blocks: a previous job still
+        stopping is cancelled and the new one starts once it has let go.
+        """
+        self.cancel_preview()
+        if self._retiring_preview is not None:
+            # Both would write the same preview files: go once the old one has stopped
+            self._queued_preview = request
+            self.statusBar().showMessage("Stopping the previous preview…")
             return
+        self._queued_preview = None
+
+        job = PreviewJob(request, self)
+        job.stopped.connect(self._on_preview_stopped)
+        job.stage.connect(self.preview_status.set_stage)
+        job.log.connect(self.preview_log.append_text)
+        job.failed.connect(self._on_preview_failed)
+        job.finished.connect(self._on_preview_finished)
+        self._preview_job = job
+
+        self.preview_log.clear()
+        self.preview_log_dock.show()
+        self.preview_status.start()
+        job.start()
+
+    def cancel_preview(self, *, wait: bool = False) -> None:
+        for job in (self._preview_job, self._retiring_preview):
+            if job is not None:
+                job.cancel(wait=wait)
+
+    def _is_current_preview(self) -> bool:
+        return self._preview_job is not None and self.sender() is self._preview_job
+
+    def _on_preview_failed(self, message: str) -> None:
+        if not self._is_current_preview():
+            return
+        self.preview_log_dock.show()
+        QtWidgets.QMessageBox.critical(self, "Preview failed", message)
 
-        vol = int(self.spin_volume.value())
-        rev = int(self.spin_reverb.value())
-        pri = int(self.spin_priority.value())
-
-        prev_cmd = [
-            "python3",
-            "preview_engine/preview_runner.py",
-            "--repo",
-            self.cfg.preview_repo,
-            "--midi",
-            str(injected_mid),
-            "--mgba",
-            self.cfg.mgba_path,
-            "--voicegroup",
-            voicegroup_name,
-            "--volume",
-            str(vol),
-            "--reverb",
-            str(rev),
-            "--priority",
-            str(pri),
-        ]
-
-        self._run_cmd(prev_cmd, "Preview failed")
+    def _on_preview_finished(self, status: str) -> None:
+        if not self._is_current_preview():
+            return
+        job, self._preview_job = self._preview_job, None
+        if not job.idle:
+            self._retiring_preview = job
+        self.preview_status.stop()
+        if status == "done":
+            self.statusBar().showMessage("Preview launched in mGBA", 5000)
+        elif status == "cancelled":
+            self.statusBar().showMessage("Preview cancelled", 5000)
+
+    def _on_preview_stopped(self) -> None:
+        if self.sender() is not self._retiring_preview:
+            return
+        self._retiring_preview = None
+        request, self._queued_preview = self._queued_preview, None
+        if request is not None:
+            self.start_preview(request)
 
     def auto_remap_drums(self) -> None:
         if not self.project:
             return
 
         # If no channel 9 notes, no-op
-        has_drums = any(n.channel == 9 for n in self.project.notes)
+        has_drums = self.project.channel_note_counts().get(9, 0) > 0
         if not has_drums:
             QtWidgets.QMessageBox.information(self, "Auto Remap Drums", "No notes found on channel 9.")
             return
@@ -1032,8 +1407,9 @@ class MainWindow(QtWidgets.QMainWindow):
 
         from midi_editor.drum_remap import remap_channel_9_notes_in_place, GM_NOTE_TO_NAME
 
+        self._record_undo("Auto drum remap")
         changed_auto, unmapped = remap_channel_9_notes_in_place(
-            self.project.notes,
+            self.project,
             self.cfg.drums_by_note,
             keep_unmapped=True,
         )
@@ -1047,37 +1423,16 @@ class MainWindow(QtWidgets.QMainWindow):
                 # 1) Delete requests
                 delete_pitches = {int(k) for k, v in mapping.items() if v == "__DELETE__"}
                 if delete_pitches:
-                    before = len(self.project.notes)
-                    self.project.notes = [
-                        n for n in self.project.notes
-                        if not (n.channel == 9 and int(n.pitch) in delete_pitches)
-                    ]
-                    deleted_manual = before - len(self.project.notes)
+                    deleted_manual = self.project.delete_pitches(9, delete_pitches)
 
                 # 2) Remap requests
-                for n in self.project.notes:
-                    if n.channel != 9:
-                        continue
-                    old = int(n.pitch)
-                    new = mapping.get(old)
-                    if new is None or new == "__DELETE__":
-                        continue
-                    new_i = int(new)
-                    if new_i != old:
-                        n.pitch = new_i
-                        changed_manual += 1
+                remap = {int(k): int(v) for k, v in mapping.items() if v != "__DELETE__"}
+                changed_manual = self.project.remap_pitches(9, remap)
 
                 # 3) Recompute unmapped after manual changes:
                 # pitches still not in RS drumset
                 rs_valid = set(int(k) for k in self.cfg.drums_by_note.keys())
-                unmapped = {
-                    int(n.pitch)
-                    for n in self.project.notes
-                    if n.channel == 9 and int(n.pitch) not in rs_valid
-                }
-
-        self.pianoroll.redraw()
-        self.refresh_channel_table()
+                unmapped = {p for p in self.project.pitches_for_channel(9) if p not in rs_valid}
 
         msg = [
             "Remap complete.",
@@ -1113,16 +1468,23 @@ class MainWindow(QtWidgets.QMainWindow):
         out_dir = Path(folder)
 
         name, ok = QtWidgets.QInputDialog.getText(
-            self, "Song name", "Song name (used for files and --name):"
+            self, "Song name", "Song name (used for the file names; the song symbol becomes mus_<name>):"
         )
         if not ok or not name.strip():
             return
         name = name.strip()
+        # The assembly needs symbols: "My Song" becomes mus_my_song / voicegroup_my_song
+        try:
+            label, group = song_label(name), symbol_name(name)
+        except ValueError as e:
+            QtWidgets.QMessageBox.critical(self, "Export failed", f"Can't use this song name: {e}")
+            return
 
         out_mid = out_dir / f"{name}.mid"
+        out_asm = out_dir / f"{name}.s"
         out_inc = out_dir / f"{name}.inc"
 
-        proj_out = self._filtered_project_copy()
+        proj_out = self._export_snapshot()
 
         warnings = save_project_to_midi(
             proj_out,
@@ -1142,24 +1504,25 @@ class MainWindow(QtWidgets.QMainWindow):
             if resp != QtWidgets.QMessageBox.Yes:
                 return
 
-        picks = self.build_pick_names_for_channels_0_8()
-        gen_cmd = [
-            "python3",
-            "exporter/generate_voice_group.py",
-            "--db",
-            self.cfg.db_path,
-            "--name",
-            name,
-        ]
-        for p in picks:
-            gen_cmd += ["--pick", p]
-        gen_cmd += ["--pad", "--pad-with-square", "--out", str(out_inc)]
+        # Song assembly compiled straight from the project, ready to drop in place of mid2agb's
+        settings = SongSettings(
+            group,
+            volume=int(self.spin_volume.value()),
+            reverb=int(self.spin_reverb.value()),
+            priority=int(self.spin_priority.value()),
+        )
+        asm, _ = compile_project_to_song(proj_out, label, settings)
+        try:
+            out_asm.write_text(asm, encoding="utf-8")
+        except OSError as e:
+            QtWidgets.QMessageBox.critical(self, "Export failed", str(e))
+            return
 
-        if not self._run_cmd(gen_cmd, "Voicegroup generation failed"):
+        if not self._generate_voicegroup(group, out_inc):
             return
 
         QtWidgets.QMessageBox.information(
             self,
             "Export complete",
-            f"Saved:\n{out_mid}\n{out_inc}",
+            f"Saved:\n{out_mid}\n{out_asm}\n{out_inc}\n\nSong symbol: {label}\nVoicegroup: voicegroup_{group}",
         )
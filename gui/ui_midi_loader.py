@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional
+
+from qtpy import QtCore, QtWidgets
+
+from midi_editor.density_pyramid import DensityPyramid
+from midi_editor.lod_summary import NoteLodSummary
+from midi_editor.midi_io import project_from_tracks
+from midi_editor.models import MidiProject
+from midi_editor.smf_reader import TrackNotes, iter_smf_tracks
+from midi_editor.tracing import TRACER
+from gui.ui_minimap import DensityMinimap
+
+# After the first decoded track, partial results go to the GUI at most this often
+PARTIAL_INTERVAL_S = 0.25
+
+
+@dataclass
+class LoadedMidi:
+    """A project decoded on the loader thread, with its view geometry already built."""
+    project: MidiProject
+    lod: NoteLodSummary
+    pyramid: DensityPyramid
+    tracks_done: int
+    tracks_total: int
+
+    @property
+    def complete(self) -> bool:
+        return self.tracks_done >= self.tracks_total
+
+
+@dataclass
+class PartialMidi:
+    """The tracks decoded since the previous partial result, as a project of their own."""
+    project: MidiProject
+    tracks_done: int
+    tracks_total: int
+    # Only for the first partial (the one the window shows as a new project); later ones are appended
+    pyramid: Optional[DensityPyramid] = None
+
+
+class MidiLoadWorker(QtCore.QObject):
+    """
+    Decodes a .mid track by track on a QThread. `partial` carries the tracks
+    decoded since the last one (throttled to PARTIAL_INTERVAL_S), for the
+    window to append to what it shows while the rest decodes; `loaded`
+    carries the whole file, with its note LOD level for the current zoom,
+    density pyramid and query indexes built here rather than on the GUI
+    thread. Those are built once, for the whole file, not for each partial.
+    """
+
+    progress = QtCore.Signal(int, int)      # tracks decoded, track count
+    partial = QtCore.Signal(object)         # PartialMidi
+    loaded = QtCore.Signal(object)          # LoadedMidi
+    failed = QtCore.Signal(str)
+    cancelled = QtCore.Signal()
+
+    def __init__(self, midi_path: Path, tick_px: float, *, parallel: bool = False):
+        super().__init__()
+        self.midi_path = Path(midi_path)
+        self.tick_px = tick_px
+        self.parallel = parallel
+        self._cancel = False
+
+    def cancel(self) -> None:
+        """Stop at the next track boundary (safe to call from the GUI thread)."""
+        self._cancel = True
+
+    def _prepare(self, ticks_per_beat: int, tracks: List[TrackNotes], total: int) -> LoadedMidi:
+        with TRACER.span("load.prepare", cat="load", tracks=len(tracks)) as span:
+            project = project_from_tracks(ticks_per_beat, tracks)
+            project.build_indexes()
+            lod = NoteLodSummary(project.notes)
+            level = lod.level_for(self.tick_px)
+            if level:
+                lod.level(level)
+            span.set(notes=len(project.notes), lod_level=level)
+        return LoadedMidi(project, lod, DensityMinimap.build_pyramid(project), len(tracks), total)
+
+    @QtCore.Slot()
+    def run(self) -> None:
+        executor = ProcessPoolExecutor(max_workers=os.cpu_count() or 1) if self.parallel else None
+        try:
+            tracks: List[TrackNotes] = []
+            # Decoded but not sent in a partial yet
+            pending: List[TrackNotes] = []
+            ticks_per_beat, total = 0, 0
+            last_partial: Optional[float] = None
+            for ticks_per_beat, total, track in iter_smf_tracks(self.midi_path, executor=executor):
+                if self._cancel:
+                    break
+                tracks.append(track)
+                pending.append(track)
+                self.progress.emit(len(tracks), total)
+                now = time.monotonic()
+                if len(tracks) < total and (last_partial is None or now - last_partial >= PARTIAL_INTERVAL_S):
+                    part = project_from_tracks(ticks_per_beat, pending)
+                    pyramid = DensityMinimap.build_pyramid(part) if last_partial is None else None
+                    self.partial.emit(PartialMidi(part, len(tracks), total, pyramid))
+                    pending = []
+                    last_partial = time.monotonic()
+            if self._cancel:
+                self.cancelled.emit()
+                return
+            self.loaded.emit(self._prepare(ticks_per_beat, tracks, total))
+        except BrokenProcessPool:
+            self.failed.emit("A track decoder process stopped unexpectedly")
+        except Exception as e:
+            # Anything escaping a slot would abort the application: report it as a failed load
+            self.failed.emit(str(e) or type(e).__name__)
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+
+class MidiLoadStatus(QtWidgets.QWidget):
+    """Status bar progress bar + Cancel button shown while a MIDI file loads."""
+
+    cancel_requested = QtCore.Signal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        lay = QtWidgets.QHBoxLayout(self)
+        lay.setContentsMargins(0, 0, 0, 0)
+        lay.setSpacing(6)
+
+        self.label = QtWidgets.QLabel()
+        self.bar = QtWidgets.QProgressBar()
+        self.bar.setFixedWidth(160)
+        self.bar.setTextVisible(True)
+        self.btn_cancel = QtWidgets.QPushButton("Cancel")
+        self.btn_cancel.clicked.connect(self.cancel_requested)
+
+        lay.addWidget(self.label)
+        lay.addWidget(self.bar)
+        lay.addWidget(self.btn_cancel)
+        self.hide()
+
+    def start(self, midi_path: Path) -> None:
+        self.label.setText(f"Loading {Path(midi_path).name}…")
+        # Busy indicator until the track count is known
+        self.bar.setRange(0, 0)
+        self.btn_cancel.setEnabled(True)
+        self.show()
+
+    def set_progress(self, done: int, total: int) -> None:
+        self.bar.setRange(0, max(1, total))
+        self.bar.setValue(done)
+        self.bar.setFormat(f"{done}/{total} tracks")
+
+    def stop(self) -> None:
+        self.hide()
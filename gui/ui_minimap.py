@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from qtpy import QtCore, QtGui, QtWidgets
+
+from midi_editor.density_pyramid import DensityPyramid
+from midi_editor.models import NOTES_ADDED, NOTES_RECOLORED, NOTES_REMOVED, MidiProject, NoteChange
+from gui.ui_pianoroll import PianoRollView
+
+
+class DensityMinimap(QtWidgets.QWidget):
+    """
+    Whole-song overview strip under the piano roll: stacked per-channel note
+    density (from a DensityPyramid, so painting never walks the notes) plus
+    the piano roll's visible range. Click or drag to scroll the piano roll.
+    """
+
+    HEIGHT_PX = 48
+
+    def __init__(self, pianoroll: PianoRollView, parent=None):
+        super().__init__(parent)
+        self.pianoroll = pianoroll
+        self.project: Optional[MidiProject] = None
+        self._pyramid: Optional[DensityPyramid] = None
+        # (level, width, height) -> per-channel bar rects; dropped on every edit
+        self._bars: Optional[Tuple[Tuple[int, int, int], List[Tuple[int, List[QtCore.QRectF]]]]] = None
+        self._brushes: Dict[int, QtGui.QBrush] = {}
+        self._window_pen = QtGui.QPen(QtGui.QColor(30, 30, 30), 1)
+        self._window_brush = QtGui.QBrush(QtGui.QColor(0, 0, 0, 40))
+
+        self.setFixedHeight(self.HEIGHT_PX)
+        self.setMouseTracking(False)
+        self.setCursor(QtCore.Qt.PointingHandCursor)
+
+        # Zooming changes the scrollbar range, scrolling its value
+        hbar = pianoroll.horizontalScrollBar()
+        hbar.valueChanged.connect(self.update)
+        hbar.rangeChanged.connect(self.update)
+
+    @staticmethod
+    def build_pyramid(project: MidiProject) -> DensityPyramid:
+        return DensityPyramid.build(project.notes, max(1, project.ticks_per_beat))
+
+    def set_project(self, project: Optional[MidiProject], pyramid: Optional[DensityPyramid] = None) -> None:
+        """Show `project`; `pyramid` is an already built build_pyramid(project)."""
+        if self.project is not None:
+            self.project.unsubscribe(self._on_notes_changed)
+        self.project = project
+        self._pyramid = None
+        if project is not None:
+            project.subscribe(self._on_notes_changed)
+            self._pyramid = pyramid if pyramid is not None else self.build_pyramid(project)
+        self._bars = None
+        self.update()
+
+    def _on_notes_changed(self, change: NoteChange) -> None:
+        if self._pyramid is None:
+            return
+        if change.kind == NOTES_ADDED:
+            self._pyramid.update(change.channel, change.start_tick, change.end_tick, +1)
+        elif change.kind == NOTES_REMOVED:
+            self._pyramid.update(change.channel, change.start_tick, change.end_tick, -1)
+        elif change.kind == NOTES_RECOLORED:
+            self._pyramid.update(change.old_channel, change.start_tick, change.end_tick, -1)
+            self._pyramid.update(change.channel, change.start_tick, change.end_tick, +1)
+        else:
+            # Pitch edits don't move anything in time
+            return
+        self._bars = None
+        self.update()
+
+    # ---- geometry ----
+
+    def _song_ticks(self) -> int:
+        # Same span as the piano roll scene, so the window lines up with the bars
+        width = self.pianoroll.scene_rect().width()
+        if width > 0:
+            return int(width)
+        return self._pyramid.n_buckets * self._pyramid.bucket_ticks if self._pyramid else 1
+
+    def _tick_at(self, x: float) -> int:
+        return int(max(0.0, x) / max(1, self.width()) * self._song_ticks())
+
+    def _x_at(self, tick: float) -> float:
+        return tick / self._song_ticks() * self.width()
+
+    def _channel_bars(self) -> List[Tuple[int, List[QtCore.QRectF]]]:
+        """Stacked bars per channel at the coarsest level with a node per pixel column."""
+        w, h = self.width(), self.height()
+        k = self._pyramid.level_for(max(1, w))
+        key = (k, w, h)
+        if self._bars is not None and self._bars[0] == key:
+            return self._bars[1]
+
+        chans, density = self._pyramid.density(k)
+        bars: List[Tuple[int, List[QtCore.QRectF]]] = []
+        if len(chans):
+            node_ticks = self._pyramid.bucket_ticks << k
+            x0 = np.arange(density.shape[1]) * node_ticks / self._song_ticks() * w
+            col_w = max(1.0, node_ticks / self._song_ticks() * w)
+            # Scale so the busiest column fills the strip
+            tops = np.cumsum(density, axis=0)
+            peak = float(tops[-1].max()) if tops.size else 0.0
+            scale = (h - 2) / peak if peak > 0 else 0.0
+            base = np.zeros(density.shape[1])
+            for i, ch in enumerate(chans):
+                top = tops[i]
+                cols = np.flatnonzero(density[i] > 0)
+                bars.append((ch, [
+                    QtCore.QRectF(float(x0[c]), h - top[c] * scale, col_w, (top[c] - base[c]) * scale)
+                    for c in cols.tolist()
+                ]))
+                base = top
+        self._bars = (key, bars)
+        return bars
+
+    def _brush_for_channel(self, ch: int) -> QtGui.QBrush:
+        if ch not in self._brushes:
+            self._brushes[ch] = QtGui.QBrush(self.pianoroll._color_for_channel(ch))
+        return self._brushes[ch]
+
+    # ---- painting / input ----
+
+    def paintEvent(self, event: QtGui.QPaintEvent) -> None:
+        painter = QtGui.QPainter(self)
+        try:
+            painter.fillRect(self.rect(), self.palette().base())
+            if self._pyramid is None:
+                return
+            painter.setPen(QtCore.Qt.NoPen)
+            for ch, rects in self._channel_bars():
+                if rects:
+                    painter.setBrush(self._brush_for_channel(ch))
+                    painter.drawRects(rects)
+
+            # Visible part of the piano roll
+            visible = self.pianoroll.mapToScene(self.pianoroll.viewport().rect()).boundingRect()
+            left = self._x_at(max(0.0, visible.left()))
+            right = self._x_at(visible.right())
+            painter.setPen(self._window_pen)
+            painter.setBrush(self._window_brush)
+            painter.drawRect(QtCore.QRectF(left, 0, max(2.0, right - left), self.height() - 1))
+        finally:
+            painter.end()
+
+    def mousePressEvent(self, event: QtGui.QMouseEvent) -> None:
+        if event.button() == QtCore.Qt.LeftButton and self._pyramid is not None:
+            self.pianoroll.center_on_tick(self._tick_at(event.position().x()))
+            event.accept()
+            return
+        super().mousePressEvent(event)
+
+    def mouseMoveEvent(self, event: QtGui.QMouseEvent) -> None:
+        if event.buttons() & QtCore.Qt.LeftButton and self._pyramid is not None:
+            self.pianoroll.center_on_tick(self._tick_at(event.position().x()))
+            event.accept()
+            return
+        super().mouseMoveEvent(event)
+
+    def resizeEvent(self, event: QtGui.QResizeEvent) -> None:
+        self._bars = None
+        super().resizeEvent(event)
@@ -1,11 +1,16 @@
 from __future__ import annotations
 
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Optional, Dict
+from typing import Optional, Dict, List, Set, Tuple
 
+import numpy as np
 from qtpy import QtCore, QtGui, QtWidgets
 
-from midi_editor.models import MidiProject, NoteEvent
+from midi_editor.lod_summary import NoteLodSummary
+from midi_editor.models import MidiProject, NoteChange, NoteEvent
+from midi_editor.note_store import NoteView
+from midi_editor.tracing import TRACER
 from midi_editor.config import DrumDef
 
 
@@ -16,21 +21,215 @@ class PianoRollMetrics:
     pitch_min: int = 24
     pitch_max: int = 96
 
+    # Zoom limits
+    tick_px_min: float = 0.0005
+    tick_px_max: float = 2.0
+    key_px_min: float = 4.0
+    key_px_max: float = 40.0
 
-class NoteItem(QtWidgets.QGraphicsRectItem):
-    def __init__(self, note: NoteEvent, rect: QtCore.QRectF, color: QtGui.QColor):
-        super().__init__(rect)
-        self.note = note
-        self.color = color
-        self.setFlag(QtWidgets.QGraphicsItem.ItemIsSelectable, True)
+    def row_y(self, pitch: int) -> float:
+        """Scene y of a pitch row. Scene units are ticks across and key rows down;
+        the view transform scales them by tick_px / key_px."""
+        return float(self.pitch_max - pitch)
+
+
+_NO_ROWS = np.zeros(0, dtype=np.intp)
+
+
+# Note tiles are TILE_PX square in zoomed pixels; the LRU keeps at most this many bytes of them
+TILE_PX = 256
+TILE_CACHE_BYTES = 64 * 1024 * 1024
+# Extra device pixels around an edited note whose tiles are re-rendered
+# (outline width, plus LOD spans that may merge across small gaps)
+TILE_DIRTY_MARGIN_PX = 4
+# Edits touching more notes than this (e.g. tracks appended while a MIDI
+# loads) drop every cached tile: cheaper than finding the ones they touch
+TILE_DIRTY_MAX_NOTES = 20_000
+
+
+@dataclass
+class NoteRegion:
+    """Scene extents of a set of notes (copied out, so they survive the edit)."""
+    starts: np.ndarray
+    ends: np.ndarray
+    pitches: np.ndarray
+
+    def union(self, other: "NoteRegion") -> "NoteRegion":
+        return NoteRegion(
+            np.concatenate([self.starts, other.starts]),
+            np.concatenate([self.ends, other.ends]),
+            np.concatenate([self.pitches, other.pitches]),
+        )
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+
+class TileCache:
+    """LRU of rendered note tiles keyed by (zoom, tile x, tile y), capped by total bytes."""
+
+    def __init__(self, max_bytes: int = TILE_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self._tiles: "OrderedDict[Tuple[Tuple[float, float], int, int], QtGui.QImage]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._tiles)
+
+    def get(self, key) -> Optional[QtGui.QImage]:
+        image = self._tiles.get(key)
+        if image is not None:
+            self._tiles.move_to_end(key)
+        return image
+
+    def put(self, key, image: QtGui.QImage) -> None:
+        self.discard(key)
+        self._tiles[key] = image
+        self.bytes += image.sizeInBytes()
+        while self.bytes > self.max_bytes and len(self._tiles) > 1:
+            _key, old = self._tiles.popitem(last=False)
+            self.bytes -= old.sizeInBytes()
+
+    def discard(self, key) -> None:
+        old = self._tiles.pop(key, None)
+        if old is not None:
+            self.bytes -= old.sizeInBytes()
+
+    def clear(self) -> None:
+        self._tiles.clear()
+        self.bytes = 0
+
+    def invalidate(self, region: NoteRegion, pitch_max: int) -> int:
+        """Drop cached tiles (at every zoom) that any note of the region touches."""
+        if not len(region) or not self._tiles:
+            return 0
+        if len(region) > TILE_DIRTY_MAX_NOTES:
+            dropped = len(self._tiles)
+            self.clear()
+            return dropped
+        by_zoom: Dict[Tuple[float, float], List[Tuple[int, int]]] = {}
+        for zoom, tx, ty in self._tiles:
+            by_zoom.setdefault(zoom, []).append((tx, ty))
+
+        starts = region.starts.astype(np.float64)
+        ends = np.maximum(starts + 1, region.ends)
+        rows = (pitch_max - region.pitches).astype(np.float64)
+        dropped = 0
+        for (sx, sy), cached in by_zoom.items():
+            pad = TILE_DIRTY_MARGIN_PX
+            boxes = np.unique(np.stack([
+                np.floor((starts * sx - pad) / TILE_PX),
+                np.floor((ends * sx + pad) / TILE_PX),
+                np.floor((rows * sy - pad) / TILE_PX),
+                np.floor(((rows + 1) * sy + pad) / TILE_PX),
+            ], axis=1).astype(np.int64), axis=0)
+            for tx, ty in cached:
+                hit = (boxes[:, 0] <= tx) & (tx <= boxes[:, 1]) & (boxes[:, 2] <= ty) & (ty <= boxes[:, 3])
+                if hit.any():
+                    self.discard(((sx, sy), tx, ty))
+                    dropped += 1
+        return dropped
+
+
+class ChannelLayer:
+    """
+    All notes of one channel, drawn in a single drawRects call.
+
+    There is no per-note item: draw() asks the view for the rects inside the
+    area being drawn (one query shared by every layer) and draws just those
+    with the channel's cached pen and brush. Zoomed far out it instead draws
+    a coverage image built from the LOD summary's merged activity spans.
+    """
+
+    def __init__(self, view: "PianoRollView", channel: int, pen: QtGui.QPen, brush: QtGui.QBrush):
+        self.view = view
+        self.channel = channel
+        self.pen = pen
+        self.brush = brush
+
+    def draw(self, painter: QtGui.QPainter, rect: QtCore.QRectF, transform: QtGui.QTransform) -> None:
+        """Draw the layer over a scene rect; transform maps scene to the painter's device."""
+        if self.view.lod_level():
+            coverage = self.view.layer_coverage(rect, self.channel, self.brush.color(), transform)
+            if coverage is not None:
+                painter.drawImage(*coverage)
+            return
+
+        rects = self.view.layer_rects(rect, self.channel, transform)
+        if not rects:
+            return
+        painter.setPen(self.pen)
+        painter.setBrush(self.brush)
+        painter.drawRects(rects)
+
+
+class NoteTilesItem(QtWidgets.QGraphicsItem):
+    """
+    Paints every channel layer through the view's tile cache: exposed tiles
+    that are cached are blitted, the others are rendered off-screen first.
+    """
+
+    def __init__(self, view: "PianoRollView"):
+        super().__init__()
+        self.view = view
+        self.setFlag(QtWidgets.QGraphicsItem.ItemUsesExtendedStyleOption, True)
+
+    def boundingRect(self) -> QtCore.QRectF:
+        return self.view.scene_rect()
 
     def paint(self, painter: QtGui.QPainter, option, widget=None):
-        pen = QtGui.QPen(QtGui.QColor(40, 40, 40))
-        if self.isSelected():
-            pen.setWidth(2)
-        painter.setPen(pen)
-        painter.setBrush(QtGui.QBrush(self.color))
-        painter.drawRect(self.rect())
+        view = self.view
+        m = view.metrics
+        sx, sy = m.tick_px, m.key_px
+        world = painter.worldTransform()
+        dx, dy = round(world.dx()), round(world.dy())
+        rect = option.exposedRect
+
+        tx0, tx1 = int(np.floor(rect.left() * sx / TILE_PX)), int(np.floor(rect.right() * sx / TILE_PX))
+        ty0, ty1 = int(np.floor(rect.top() * sy / TILE_PX)), int(np.floor(rect.bottom() * sy / TILE_PX))
+        painter.resetTransform()
+        with TRACER.span("paint_tiles") as span:
+            rendered = 0
+            for ty in range(ty0, ty1 + 1):
+                for tx in range(tx0, tx1 + 1):
+                    key = ((sx, sy), tx, ty)
+                    image = view.tiles.get(key)
+                    if image is None:
+                        image = view.render_tile(tx, ty)
+                        view.tiles.put(key, image)
+                        rendered += 1
+                    painter.drawImage(QtCore.QPoint(tx * TILE_PX + dx, ty * TILE_PX + dy), image)
+            span.set(tiles=(tx1 - tx0 + 1) * (ty1 - ty0 + 1), rendered=rendered)
+
+
+class SelectionOverlayItem(QtWidgets.QGraphicsItem):
+    """Outlines selected notes on top of every channel layer."""
+
+    def __init__(self, view: "PianoRollView"):
+        super().__init__()
+        self.view = view
+        self.pen = QtGui.QPen(QtGui.QColor(40, 40, 40))
+        self.pen.setCosmetic(True)
+        self.pen.setWidth(2)
+        self.setFlag(QtWidgets.QGraphicsItem.ItemUsesExtendedStyleOption, True)
+        self.setZValue(1000)
+
+    def boundingRect(self) -> QtCore.QRectF:
+        return self.view.scene_rect()
+
+    def paint(self, painter: QtGui.QPainter, option, widget=None):
+        selected = self.view.selected_rows_array()
+        if not len(selected):
+            return
+        rows = self.view.rows_in(option.exposedRect)
+        rows = rows[np.isin(rows, selected)]
+        if not len(rows):
+            return
+        rects = self.view.note_rects(rows, painter.worldTransform())
+        painter.resetTransform()
+        painter.setPen(self.pen)
+        painter.setBrush(QtCore.Qt.NoBrush)
+        painter.drawRects(rects)
 
 
 class PianoRollView(QtWidgets.QGraphicsView):
@@ -45,26 +244,70 @@ class PianoRollView(QtWidgets.QGraphicsView):
         name = PianoRollView.NOTE_NAMES[n % 12]
         return f"{name}{octave}"
 
-    def __init__(self, drums_by_note: Dict[int, DrumDef], parent=None):
+    def __init__(self, drums_by_note: Dict[int, DrumDef], parent=None, *, tile_cache_bytes: int = TILE_CACHE_BYTES):
         super().__init__(parent)
         self._scene = QtWidgets.QGraphicsScene(self)
         self.setScene(self._scene)
         self.setRenderHint(QtGui.QPainter.Antialiasing, False)
         self.setDragMode(QtWidgets.QGraphicsView.RubberBandDrag)
+        # Zoom is the view transform; zoom_by() does its own anchoring
+        self.setTransformationAnchor(QtWidgets.QGraphicsView.NoAnchor)
+        self._grid_pen = QtGui.QPen(QtGui.QColor(230, 230, 230))
+        self._grid_pen.setCosmetic(True)
 
         self.metrics = PianoRollMetrics()
         self.project: Optional[MidiProject] = None
         self.drums_by_note = drums_by_note
-
-        self._scene.selectionChanged.connect(self.selection_changed)
+        self._apply_zoom()
+
+        # Channel layers drawn through cached tiles, plus the selection overlay
+        self._layers: Dict[int, ChannelLayer] = {}
+        self._overlay: Optional[SelectionOverlayItem] = None
+        self.tiles = TileCache(tile_cache_bytes)
+        self._pens: Dict[int, QtGui.QPen] = {}
+        self._brushes: Dict[int, QtGui.QBrush] = {}
+        # Last exposed-area queries, shared by the layers painting the same area
+        self._rows_cache: Optional[Tuple[Tuple[float, float, float, float], np.ndarray]] = None
+        self._spans_cache: Optional[Tuple[tuple, Tuple[np.ndarray, ...]]] = None
+        self._lod: Optional[NoteLodSummary] = None
+        self._prebuilt_lod: Optional[NoteLodSummary] = None
+        self._note_count = 0
+
+        # Selection is kept by store row
+        self._selected_rows: Set[int] = set()
+        self._selected_array: Optional[np.ndarray] = None
+        self._band_base: Set[int] = set()
+
+        self.rubberBandChanged.connect(self._on_rubber_band_changed)
+
+        # Debug timings drawn over the viewport (see set_trace_overlay)
+        self.trace_overlay = False
+
+        # Hover info: hit-tested against the project's note grid on each move
+        self.setMouseTracking(True)
+        self._hover_row: Optional[int] = None
+        self._hover_text = ""
 
         # Small UX: let the view accept focus so keybinds work reliably
         self.setFocusPolicy(QtCore.Qt.StrongFocus)
 
-    def set_project(self, project: Optional[MidiProject]) -> None:
+    def set_project(self, project: Optional[MidiProject], lod: Optional[NoteLodSummary] = None) -> None:
+        """Show `project`; `lod` is an already built summary of its notes (e.g. from the MIDI loader thread)."""
+        if self.project is not None:
+            self.project.unsubscribe(self._on_notes_changed)
         self.project = project
+        if project is not None:
+            project.subscribe(self._on_notes_changed)
+        self._prebuilt_lod = lod
         self.redraw()
 
+    def _on_notes_changed(self, change: NoteChange) -> None:
+        # Repaint just where the edited notes were and now are
+        dirty = NoteRegion(change.start_tick, change.end_tick, change.pitch)
+        if change.old_pitch is not None:
+            dirty = dirty.union(NoteRegion(change.start_tick, change.end_tick, change.old_pitch))
+        self.refresh(dirty)
+
     def _color_for_channel(self, ch: int) -> QtGui.QColor:
         # Drums
         if ch == 9:
@@ -76,27 +319,266 @@ class PianoRollView(QtWidgets.QGraphicsView):
         c.setHsv(hue, 140, 220)
         return c
 
+    def _pen_brush_for_channel(self, ch: int) -> Tuple[QtGui.QPen, QtGui.QBrush]:
+        if ch not in self._pens:
+            # Cosmetic pen: outline width stays in pixels whatever the zoom transform
+            pen = QtGui.QPen(QtGui.QColor(40, 40, 40))
+            pen.setCosmetic(True)
+            self._pens[ch] = pen
+            self._brushes[ch] = QtGui.QBrush(self._color_for_channel(ch))
+        return self._pens[ch], self._brushes[ch]
+
+    def _apply_zoom(self) -> None:
+        m = self.metrics
+        self.setTransform(QtGui.QTransform.fromScale(m.tick_px, m.key_px))
+
+    def zoom_by(self, fx: float = 1.0, fy: float = 1.0, anchor: Optional[QtCore.QPoint] = None) -> None:
+        """
+        Scale the view (clamped to the metrics limits), keeping the scene point
+        under `anchor` (viewport coords, default centre) in place. Scene items
+        are untouched.
+        """
+        m = self.metrics
+        tick_px = max(m.tick_px_min, min(m.tick_px_max, m.tick_px * fx))
+        key_px = max(m.key_px_min, min(m.key_px_max, m.key_px * fy))
+        if tick_px == m.tick_px and key_px == m.key_px:
+            return
+        if anchor is None:
+            anchor = self.viewport().rect().center()
+
+        fixed = self.mapToScene(anchor)
+        m.tick_px, m.key_px = tick_px, key_px
+        self._apply_zoom()
+        drift = self.mapFromScene(fixed) - anchor
+        hbar, vbar = self.horizontalScrollBar(), self.verticalScrollBar()
+        hbar.setValue(hbar.value() + drift.x())
+        vbar.setValue(vbar.value() + drift.y())
+
+    def center_on_tick(self, tick: float) -> None:
+        """Scroll horizontally so `tick` sits in the middle of the viewport."""
+        centre = self.mapToScene(self.viewport().rect().center())
+        self.centerOn(QtCore.QPointF(tick, centre.y()))
+
     def wheelEvent(self, event: QtGui.QWheelEvent) -> None:
+        with TRACER.span("wheelEvent"):
+            self._wheel(event)
+
+    def _wheel(self, event: QtGui.QWheelEvent) -> None:
         mods = event.modifiers()
         delta = event.angleDelta().y()
         factor = 1.15 if delta > 0 else (1 / 1.15)
 
         if mods & QtCore.Qt.ControlModifier:
             # Horizontal zoom (time)
-            self.metrics.tick_px = max(0.005, min(2.0, self.metrics.tick_px * factor))
-            self.redraw()
+            self.zoom_by(fx=factor, anchor=event.position().toPoint())
             event.accept()
             return
 
         if mods & QtCore.Qt.AltModifier:
             # Vertical zoom (pitch)
-            self.metrics.key_px = max(4.0, min(40.0, self.metrics.key_px * factor))
-            self.redraw()
+            self.zoom_by(fy=factor, anchor=event.position().toPoint())
             event.accept()
             return
 
         super().wheelEvent(event)
 
+    def paintEvent(self, event: QtGui.QPaintEvent) -> None:
+        if not TRACER.enabled:
+            super().paintEvent(event)
+            return
+        with TRACER.span("frame") as span:
+            super().paintEvent(event)
+            span.set(items=len(self._scene.items()), notes=self._note_count, lod_level=self.lod_level())
+
+    def drawForeground(self, painter: QtGui.QPainter, rect: QtCore.QRectF) -> None:
+        super().drawForeground(painter, rect)
+        if self.trace_overlay:
+            painter.save()
+            painter.resetTransform()
+            self._draw_trace_overlay(painter)
+            painter.restore()
+
+    def _draw_trace_overlay(self, painter: QtGui.QPainter) -> None:
+        """Frame times and the latest instrumented calls, top-left of the viewport (stats lag one frame)."""
+        frames = TRACER.recent_ms("frame")
+        lines = []
+        if frames:
+            lines.append(f"frame {frames[-1]:.1f} ms  avg {sum(frames) / len(frames):.1f}  max {max(frames):.1f}")
+        last = TRACER.last_args("frame")
+        if last:
+            lines.append(f"items {last.get('items', 0)}  notes {last.get('notes', 0)}  lod {last.get('lod_level', 0)}")
+        for name in TRACER.names():
+            if name == "frame":
+                continue
+            recent = TRACER.recent_ms(name)
+            args = TRACER.last_args(name)
+            extra = "  ".join(f"{k} {v}" for k, v in args.items())
+            lines.append(f"{name} {recent[-1]:.1f} ms (max {max(recent):.1f})  {extra}".rstrip())
+        if not lines:
+            lines.append("tracing: no samples yet")
+
+        metrics = painter.fontMetrics()
+        line_h = metrics.height()
+        width = max(metrics.horizontalAdvance(line) for line in lines) + 12
+        box = QtCore.QRect(6, 6, width, line_h * len(lines) + 8)
+        painter.setPen(QtCore.Qt.NoPen)
+        painter.setBrush(QtGui.QColor(0, 0, 0, 170))
+        painter.drawRect(box)
+        painter.setPen(QtGui.QColor(235, 235, 235))
+        for i, line in enumerate(lines):
+            painter.drawText(box.left() + 6, box.top() + 4 + metrics.ascent() + i * line_h, line)
+
+    def scrollContentsBy(self, dx: int, dy: int) -> None:
+        super().scrollContentsBy(dx, dy)
+        if self.trace_overlay:
+            # Scrolling blits the old pixels, overlay included: repaint so it stays put
+            self.viewport().update()
+
+    def set_trace_overlay(self, on: bool) -> None:
+        """Show frame/call timings over the piano roll; tracing runs only while it's shown."""
+        self.trace_overlay = on
+        TRACER.enable(on)
+        self.viewport().update()
+
+    def drawBackground(self, painter: QtGui.QPainter, rect: QtCore.QRectF) -> None:
+        super().drawBackground(painter, rect)
+        if not self.project or not self.project.notes:
+            return
+        # One line per pitch row, only across the exposed area
+        m = self.metrics
+        scene = self._scene.sceneRect()
+        left, right = max(rect.left(), scene.left()), min(rect.right(), scene.right())
+        first = max(0, int(rect.top()))
+        last = min(m.pitch_max - m.pitch_min, int(rect.bottom()) + 1)
+        painter.setPen(self._grid_pen)
+        painter.drawLines([QtCore.QLineF(left, y, right, y) for y in range(first, last + 1)])
+
+    # ---- note geometry / queries ----
+
+    def scene_rect(self) -> QtCore.QRectF:
+        return self._scene.sceneRect()
+
+    def _query_bounds(self, rect: QtCore.QRectF) -> Tuple[int, int, int, int]:
+        """(start_tick, end_tick, pitch_min, pitch_max) of the notes a scene rect can touch."""
+        m = self.metrics
+        # A note covers [start, end) x [row_y, row_y + 1)
+        hi_pitch = min(m.pitch_max, m.pitch_max - int(np.floor(rect.top())))
+        lo_pitch = max(m.pitch_min, m.pitch_max - int(np.ceil(rect.bottom())) + 1)
+        return int(np.floor(rect.left())), int(np.floor(rect.right())) + 1, lo_pitch, hi_pitch
+
+    def rows_in(self, rect: QtCore.QRectF, channel: Optional[int] = None) -> np.ndarray:
+        """Store rows of in-range notes intersecting a scene rect, optionally for one channel."""
+        if not self.project or not self.project.notes:
+            return _NO_ROWS
+        key = (rect.left(), rect.top(), rect.right(), rect.bottom())
+        if self._rows_cache is None or self._rows_cache[0] != key:
+            a, b, lo, hi = self._query_bounds(rect)
+            rows = self.project.notes_overlapping(a, b, pitch_min=lo, pitch_max=hi)
+            self._rows_cache = (key, rows)
+        rows = self._rows_cache[1]
+        if channel is not None:
+            rows = rows[self.project.notes.channel[rows] == channel]
+        return rows
+
+    def lod_level(self) -> int:
+        """Summary level drawn at the current zoom (0 = individual notes)."""
+        return self._lod.level_for(self.metrics.tick_px) if self._lod is not None else 0
+
+    def layer_rects(self, rect: QtCore.QRectF, channel: int, transform: QtGui.QTransform) -> List[QtCore.QRect]:
+        """Device rects of one channel's notes over an exposed scene rect."""
+        rows = self.rows_in(rect, channel)
+        return self.note_rects(rows, transform) if len(rows) else []
+
+    def layer_coverage(
+        self, rect: QtCore.QRectF, channel: int, color: QtGui.QColor, transform: QtGui.QTransform
+    ) -> Optional[Tuple[QtCore.QRectF, QtGui.QImage]]:
+        """
+        Zoomed-out drawing for one channel: per pitch row and pixel column,
+        whether any LOD span covers it, as a device target rect and an image.
+        Cost follows the exposed pixels and the span count, not the note count.
+        """
+        lvl = self.lod_level()
+        a, b, lo, hi = self._query_bounds(rect)
+        if hi < lo:
+            return None
+        key = (lvl, rect.left(), rect.top(), rect.right(), rect.bottom())
+        if self._spans_cache is None or self._spans_cache[0] != key:
+            self._spans_cache = (key, self._lod.level(lvl).spans(a, b, pitch_min=lo, pitch_max=hi))
+        starts, ends, pitches, chans = self._spans_cache[1]
+        mine = chans == channel
+        if not mine.any():
+            return None
+
+        sx, sy, dx, dy = transform.m11(), transform.m22(), transform.dx(), transform.dy()
+        dev = transform.mapRect(rect)
+        x_lo = int(np.floor(dev.left()))
+        width = max(1, int(np.ceil(dev.right())) - x_lo)
+        n_rows = hi - lo + 1
+
+        x0 = np.floor(starts[mine] * sx + dx).astype(np.int64) - x_lo
+        x1 = np.maximum(x0 + 1, np.floor(ends[mine] * sx + dx).astype(np.int64) - x_lo)
+        x0, x1 = np.clip(x0, 0, width), np.clip(x1, 0, width)
+        r = hi - pitches[mine].astype(np.int64)
+
+        # +1 where a span starts covering a row, -1 where it stops
+        diff = np.zeros((n_rows, width + 1), dtype=np.int32)
+        np.add.at(diff, (r, x0), 1)
+        np.add.at(diff, (r, x1), -1)
+        covered = np.cumsum(diff[:, :width], axis=1) > 0
+
+        pixels = np.where(covered, np.uint32(color.rgba()), np.uint32(0)).astype(np.uint32)
+        image = QtGui.QImage(pixels.tobytes(), width, n_rows, width * 4, QtGui.QImage.Format_ARGB32_Premultiplied)
+        target = QtCore.QRectF(x_lo, (self.metrics.pitch_max - hi) * sy + dy, width, n_rows * sy)
+        return target, image.copy()
+
+    def note_rects(self, rows: np.ndarray, transform: QtGui.QTransform) -> List[QtCore.QRect]:
+        notes = self.project.notes
+        return self._device_rects(notes.start_tick[rows], notes.end_tick[rows], notes.pitch[rows], transform)
+
+    def _device_rects(
+        self, starts: np.ndarray, ends: np.ndarray, pitches: np.ndarray, transform: QtGui.QTransform
+    ) -> List[QtCore.QRect]:
+        """
+        Device-space integer rects under a scale+translate transform.
+        Painting these with an identity transform keeps the raster engine on its
+        fast axis-aligned path instead of stroking scaled outlines.
+        """
+        sx, sy, dx, dy = transform.m11(), transform.m22(), transform.dx(), transform.dy()
+        starts = starts.astype(np.float64)
+        ends = np.maximum(starts + 1, ends)
+        x0 = np.floor(starts * sx + dx).astype(np.int64)
+        x1 = np.maximum(x0 + 1, np.floor(ends * sx + dx).astype(np.int64))
+        y0 = np.floor((self.metrics.pitch_max - pitches) * sy + dy).astype(np.int64)
+        h = max(1, int(sy))
+        rect = QtCore.QRect
+        return [rect(x, y, w, h) for x, y, w in zip(x0.tolist(), y0.tolist(), (x1 - x0).tolist())]
+
+    def note_at(self, view_pos: QtCore.QPoint) -> Optional[NoteView]:
+        """Topmost note under a viewport position (highest channel layer, then latest row)."""
+        if not self.project or not self.project.notes:
+            return None
+        p = self.mapToScene(view_pos)
+        pitch = self.metrics.pitch_max - int(np.floor(p.y()))
+        rows = self.project.notes_at(int(np.floor(p.x())), pitch_min=pitch, pitch_max=pitch)
+        if not len(rows):
+            return None
+        chans = self.project.notes.channel[rows]
+        return self.project.notes[int(rows[np.lexsort((rows, chans))[-1]])]
+
+    # ---- events ----
+
+    def viewportEvent(self, event: QtCore.QEvent) -> bool:
+        # Tooltips are built on demand for the note under the cursor
+        if event.type() == QtCore.QEvent.ToolTip:
+            note = self.note_at(event.pos())
+            if note is None:
+                QtWidgets.QToolTip.hideText()
+                event.ignore()
+            else:
+                QtWidgets.QToolTip.showText(event.globalPos(), self._note_info_text(note), self)
+            return True
+        return super().viewportEvent(event)
+
     def _note_info_text(self, note: NoteEvent) -> str:
         pitch_name = self.midi_note_name(note.pitch)
 
@@ -109,35 +591,113 @@ class PianoRollView(QtWidgets.QGraphicsView):
         else:
             return f"Ch {note.channel} • {pitch_name} (MIDI {note.pitch}) • vel {note.velocity}"
 
-    def _note_item_at_view_pos(self, view_pos: QtCore.QPoint) -> Optional[NoteItem]:
-        scene_pos = self.mapToScene(view_pos)
-        items = self._scene.items(scene_pos)
-        for it in items:
-            if isinstance(it, NoteItem):
-                return it
-        return None
-
     def mousePressEvent(self, event: QtGui.QMouseEvent) -> None:
-        # Let selection work as normal
+        note = self.note_at(event.pos()) if event.button() == QtCore.Qt.LeftButton else None
+        additive = bool(event.modifiers() & QtCore.Qt.ControlModifier)
+
+        if event.button() == QtCore.Qt.LeftButton:
+            # Ctrl-click toggles, a plain click replaces the selection
+            selected = set(self._selected_rows) if additive else set()
+            if note is not None:
+                if additive and note.index in selected:
+                    selected.discard(note.index)
+                else:
+                    selected.add(note.index)
+            self._set_selection(selected)
+            self._band_base = set(selected)
+
+        # Rubber band drag (see _on_rubber_band_changed)
         super().mousePressEvent(event)
 
         # After selection, show the note info on click as well
-        item = self._note_item_at_view_pos(event.pos())
-        if not item:
+        if note is None:
             return
 
-        text = self._note_info_text(item.note)
+        text = self._note_info_text(note)
 
         # Show tooltip immediately on click
         QtWidgets.QToolTip.showText(event.globalPos(), text, self)
 
         # Also pin it in the main window status bar if available
+        self._show_status(text, 8000)
+
+    def mouseMoveEvent(self, event: QtGui.QMouseEvent) -> None:
+        if event.buttons() == QtCore.Qt.NoButton:
+            # Hover: describe the note under the cursor, only when that note changes
+            note = self.note_at(event.pos())
+            row = note.index if note is not None else None
+            if row != self._hover_row:
+                self._hover_row = row
+                if note is not None:
+                    self._show_status(self._note_info_text(note), 0)
+                else:
+                    self._clear_hover_status()
+        super().mouseMoveEvent(event)
+
+    def _status_bar(self) -> Optional[QtWidgets.QStatusBar]:
         mw = self.window()
-        if isinstance(mw, QtWidgets.QMainWindow) and mw.statusBar():
-            mw.statusBar().showMessage(text, 8000)
+        return mw.statusBar() if isinstance(mw, QtWidgets.QMainWindow) else None
+
+    def _show_status(self, text: str, timeout_ms: int) -> None:
+        bar = self._status_bar()
+        if bar:
+            bar.showMessage(text, timeout_ms)
+            self._hover_text = text
+
+    def _clear_hover_status(self) -> None:
+        # Leave other messages (load results, exports, ...) alone
+        bar = self._status_bar()
+        if bar and bar.currentMessage() == self._hover_text:
+            bar.clearMessage()
+
+    def _on_rubber_band_changed(self, band: QtCore.QRect, from_scene: QtCore.QPointF, to_scene: QtCore.QPointF) -> None:
+        # An empty band means the drag ended; the selection is already up to date
+        if band.isNull():
+            return
+        rect = QtCore.QRectF(from_scene, to_scene).normalized()
+        self.select_in_rect(rect, base=self._band_base)
+
+    # ---- selection ----
+
+    def select_in_rect(self, rect: QtCore.QRectF, base: Optional[Set[int]] = None) -> None:
+        """Select every note intersecting a scene rect (added to `base` if given)."""
+        self._rows_cache = None
+        rows = self.rows_in(rect)
+        self._rows_cache = None
+        self._set_selection(set(base or ()) | set(rows.tolist()))
+
+    def _set_selection(self, rows: Set[int]) -> None:
+        if rows == self._selected_rows:
+            return
+        self._selected_rows = rows
+        self._selected_array = None
+        if self._overlay is not None:
+            self._overlay.update()
+        self.selection_changed.emit()
+
+    def selected_rows_array(self) -> np.ndarray:
+        if self._selected_array is None:
+            self._selected_array = np.fromiter(self._selected_rows, dtype=np.intp, count=len(self._selected_rows))
+        return self._selected_array
+
+    def selected_note_indices(self) -> set[int]:
+        return set(self._selected_rows)
+
+    # ---- scene ----
 
     def redraw(self) -> None:
+        """Rebuild everything for a new (or replaced) project."""
+        with TRACER.span("redraw") as span:
+            self._redraw()
+            span.set(items=len(self._scene.items()), notes=self._note_count)
+
+    def _redraw(self) -> None:
         self._scene.clear()
+        self._layers.clear()
+        self._overlay = None
+        self.tiles.clear()
+        self._set_selection(set())
+        self._reset_derived()
         if not self.project:
             return
 
@@ -145,46 +705,92 @@ class PianoRollView(QtWidgets.QGraphicsView):
         if not notes:
             return
 
+        self._scene.addItem(NoteTilesItem(self))
+        self._overlay = SelectionOverlayItem(self)
+        self._scene.addItem(self._overlay)
+        self._sync_layers()
+
+    def refresh(self, dirty: Optional[NoteRegion] = None) -> None:
+        """
+        Catch up with an in-place edit of the current project (called for each
+        NoteChange the project emits). Only cached tiles touching `dirty` (the
+        edited notes' extents before and after the edit) are re-rendered; with
+        no region everything is.
+        """
+        if not self.project or not self.project.notes or not self._scene.items():
+            self.redraw()
+            return
+        with TRACER.span("refresh") as span:
+            dropped = self._refresh(dirty)
+            span.set(tiles_dropped=dropped, notes=self._note_count)
+
+    def _refresh(self, dirty: Optional[NoteRegion]) -> int:
+        if len(self.project.notes) != self._note_count:
+            # Rows were renumbered: row-keyed selection (and hover) no longer applies
+            self._set_selection(set())
+            self._hover_row = None
+        if dirty is None:
+            dropped = len(self.tiles)
+            self.tiles.clear()
+        else:
+            dropped = self.tiles.invalidate(dirty, self.metrics.pitch_max)
+        self._reset_derived()
+        self._sync_layers()
+        self._scene.update()
+        return dropped
+
+    def _reset_derived(self) -> None:
+        self._rows_cache = None
+        self._spans_cache = None
+        self._lod = None
+        self._note_count = len(self.project.notes) if self.project else 0
+        if not self.project or not self.project.notes:
+            return
+        # Scene geometry is zoom-independent: x in ticks, y in key rows
         m = self.metrics
-        max_tick = max(n.end_tick for n in notes)
-        width = max_tick * m.tick_px + 200
-        height = (m.pitch_max - m.pitch_min + 1) * m.key_px + 40
+        notes = self.project.notes
+        width = notes.max_end_tick() + self.project.ticks_per_beat * 4
+        height = m.pitch_max - m.pitch_min + 1 + 4
         self._scene.setSceneRect(0, 0, width, height)
+        # Levels are built lazily, the first time a zoom needs one
+        lod, self._prebuilt_lod = self._prebuilt_lod, None
+        self._lod = lod if lod is not None and lod.store is notes else NoteLodSummary(notes)
 
-        # Grid lines
-        grid_pen = QtGui.QPen(QtGui.QColor(230, 230, 230))
-        for p in range(m.pitch_min, m.pitch_max + 1):
-            y = (m.pitch_max - p) * m.key_px
-            self._scene.addLine(0, y, width, y, grid_pen)
+    def _sync_layers(self) -> None:
+        used = self.project.used_channels() if self.project else []
+        self._layers = {ch: self._layers.get(ch) or ChannelLayer(self, ch, *self._pen_brush_for_channel(ch)) for ch in used}
 
-        # Notes
-        for n in notes:
-            if n.pitch < m.pitch_min or n.pitch > m.pitch_max:
-                continue
-
-            x = n.start_tick * m.tick_px
-            w = max(1.0, (n.end_tick - n.start_tick) * m.tick_px)
-            y = (m.pitch_max - n.pitch) * m.key_px
-            h = m.key_px
-
-            color = self._color_for_channel(n.channel)
-            item = NoteItem(n, QtCore.QRectF(x, y, w, h), color)
-
-            # Tooltip: include note name + drum sample if ch9
-            item.setToolTip(self._note_info_text(n))
-
-            self._scene.addItem(item)
+    def render_tile(self, tx: int, ty: int) -> QtGui.QImage:
+        """Render all channel layers (in channel order) for one tile at the current zoom."""
+        m = self.metrics
+        sx, sy = m.tick_px, m.key_px
+        image = QtGui.QImage(TILE_PX, TILE_PX, QtGui.QImage.Format_ARGB32_Premultiplied)
+        image.fill(0)
+        rect = QtCore.QRectF(tx * TILE_PX / sx, ty * TILE_PX / sy, TILE_PX / sx, TILE_PX / sy)
+        transform = QtGui.QTransform(sx, 0, 0, sy, -tx * TILE_PX, -ty * TILE_PX)
+        painter = QtGui.QPainter(image)
+        with TRACER.span("render_tile", tx=tx, ty=ty) as span:
+            try:
+                for ch in sorted(self._layers):
+                    self._layers[ch].draw(painter, rect, transform)
+            finally:
+                painter.end()
+            if TRACER.enabled:
+                span.set(notes_visited=self._visited_in(rect), lod_level=self.lod_level())
+        return image
+
+    def _visited_in(self, rect: QtCore.QRectF) -> int:
+        """Notes (or LOD spans) the last query over `rect` went through, for tracing."""
+        if self.lod_level():
+            return len(self._spans_cache[1][0]) if self._spans_cache is not None else 0
+        return len(self.rows_in(rect))
 
     def delete_selected_notes(self) -> int:
         if not self.project:
             return 0
-        selected_items = [it for it in self._scene.selectedItems() if isinstance(it, NoteItem)]
-        if not selected_items:
+        selected = self.selected_note_indices()
+        if not selected:
             return 0
 
-        selected_notes = {it.note for it in selected_items}
-        before = len(self.project.notes)
-        self.project.notes = [n for n in self.project.notes if n not in selected_notes]
-        removed = before - len(self.project.notes)
-        self.redraw()
-        return removed
+        # The project's NoteChange brings the scene up to date
+        return self.project.delete_notes(selected)
@@ -0,0 +1,469 @@
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional
+
+from qtpy import QtCore, QtGui, QtWidgets
+
+from exporter.generate_voice_group import generate_voicegroup
+from midi_editor.m4a_compiler import SongSettings, compile_project_to_song, song_label
+from midi_editor.midi_io import save_project_to_midi
+from midi_editor.models import ProjectSnapshot
+from midi_editor.tracing import TRACER
+from preview_engine.preview_runner import (
+    MAKE_CMD,
+    SONG_ASM,
+    SONG_MIDI,
+    dry_run_cmd,
+    fingerprint,
+    incremental_commands,
+    incremental_script,
+    parse_dry_run,
+    preview_inputs_fingerprint,
+    record_rom_build,
+    refresh_build_manifest,
+    rom_is_current,
+    rom_path,
+    stage_preview_asm,
+    voicegroup_inc,
+    write_build_manifest,
+    write_if_changed,
+)
+
+# Symbol of the preview slot's song
+PREVIEW_SONG_LABEL = song_label("preview")
+# What the slot's .s was last compiled from (next to the ROM stamp, in build/)
+ASM_STAMP = Path("build") / "mus_preview.s.fingerprint.json"
+
+# Stage names, in order, as the status bar shows them
+STAGE_COMPILE = "Compiling song"
+STAGE_VOICEGROUP = "Generating voicegroup"
+STAGE_SONG = "Staging song"
+STAGE_BUILD = "Building ROM"
+STAGE_LAUNCH = "Launching mGBA"
+STAGES = (STAGE_COMPILE, STAGE_VOICEGROUP, STAGE_SONG, STAGE_BUILD, STAGE_LAUNCH)
+
+# How long a cancelled make gets to clean up before it's killed
+MAKE_TERMINATE_MS = 3000
+# Lines kept in the log pane
+LOG_MAX_LINES = 5000
+
+
+@dataclass
+class PreviewRequest:
+    """Everything one preview needs, captured on the GUI thread when it's requested."""
+    snapshot: ProjectSnapshot
+    db_path: Path
+    instrument_ids: List[int]
+    voicegroup: str
+    repo: Path
+    mgba_path: str
+    volume: int
+    reverb: int
+    priority: int
+
+
+class PreviewPrepWorker(QtCore.QObject):
+    """
+    Runs the in-process stages (song compile, voicegroup, staging) on a
+    QThread. The song goes straight from the snapshot to m4a assembly, with
+    no MIDI file or mid2agb in between. Files are only written when their
+    content changed, and `done` says whether the staged inputs still need a
+    make (see rom_is_current).
+    """
+
+    stage = QtCore.Signal(int)
+    log = QtCore.Signal(str)
+    done = QtCore.Signal(str, bool)     # inputs fingerprint, build needed
+    failed = QtCore.Signal(str)
+    cancelled = QtCore.Signal()
+
+    def __init__(self, request: PreviewRequest):
+        super().__init__()
+        self.request = request
+        self.asm = ""
+        self._asm_key = ""
+        self.inputs_fp = ""
+        self._cancel = False
+
+    def cancel(self) -> None:
+        """Stop before the next stage (safe to call from the GUI thread)."""
+        self._cancel = True
+
+    def _compile(self) -> None:
+        r = self.request
+        settings = SongSettings(r.voicegroup, volume=r.volume, reverb=r.reverb, priority=r.priority)
+        notes = r.snapshot.notes
+        key = fingerprint(
+            repr(settings),
+            f"tpb={r.snapshot.ticks_per_beat} bpm={r.snapshot.tempo_bpm}",
+            *(col.tobytes() for col in (notes.start_tick, notes.end_tick, notes.pitch, notes.velocity, notes.channel)),
+        )
+        # Same notes and settings as the .s in the slot (and nobody rewrote it since): reuse it
+        asm_path, stamp_path = r.repo / SONG_ASM, r.repo / ASM_STAMP
+        if asm_path.exists() and stamp_path.exists():
+            st = asm_path.stat()
+            if stamp_path.read_text(encoding="utf-8") == json.dumps([key, st.st_size, st.st_mtime_ns]):
+                self.log.emit("song unchanged, reusing compiled assembly\n")
+                self.asm = asm_path.read_text(encoding="utf-8")
+                self._asm_key = key
+                return
+        self.asm, _ = compile_project_to_song(r.snapshot, PREVIEW_SONG_LABEL, settings)
+        self._asm_key = key
+
+    def _voicegroup(self) -> None:
+        r = self.request
+        inc = r.repo / voicegroup_inc(r.voicegroup)
+        mtime = inc.stat().st_mtime_ns if inc.exists() else None
+        generate_voicegroup(
+            r.db_path,
+            r.voicegroup,
+            r.instrument_ids,
+            inc,
+            pad_to_128=True,
+            pad_with_square=True,
+        )
+        if mtime == inc.stat().st_mtime_ns:
+            self.log.emit(f"{inc.name} unchanged\n")
+
+    def _stage_song(self) -> None:
+        r = self.request
+        slot_mid = r.repo / SONG_MIDI
+        if not slot_mid.exists():
+            # Only there so the Makefile lists the song; make never reads it
+            save_project_to_midi(r.snapshot, slot_mid)
+        if not stage_preview_asm(r.repo, self.asm):
+            self.log.emit(f"{PREVIEW_SONG_LABEL}.s unchanged\n")
+        st = (r.repo / SONG_ASM).stat()
+        write_if_changed(r.repo / ASM_STAMP, json.dumps([self._asm_key, st.st_size, st.st_mtime_ns]).encode("utf-8"))
+        self.inputs_fp = preview_inputs_fingerprint(r.repo, r.voicegroup)
+
+    @QtCore.Slot()
+    def run(self) -> None:
+        steps = ((STAGE_COMPILE, self._compile), (STAGE_VOICEGROUP, self._voicegroup), (STAGE_SONG, self._stage_song))
+        try:
+            if not self.request.repo.is_dir():
+                raise FileNotFoundError(f"Preview repo not found: {self.request.repo}")
+            for name, step in steps:
+                if self._cancel:
+                    self.cancelled.emit()
+                    return
+                self.stage.emit(STAGES.index(name))
+                with TRACER.span(f"preview.{name.split()[0].lower()}", cat="preview"):
+                    step()
+        except (OSError, ValueError, KeyError) as e:
+            self.failed.emit(e.args[0] if isinstance(e, KeyError) and e.args else str(e))
+            return
+        if self._cancel:
+            self.cancelled.emit()
+            return
+        self.done.emit(self.inputs_fp, not rom_is_current(self.request.repo, self.inputs_fp))
+
+
+class PreviewJob(QtCore.QObject):
+    """
+    One preview, run without blocking the GUI: the in-process stages on a
+    worker thread, then the build in a QProcess whose output is streamed out
+    through `log`, then mGBA started detached. `finished` fires exactly once,
+    with "done", "failed" or "cancelled"; `stopped` follows once the worker
+    thread and the build have both exited, i.e. once the job's files are free
+    for the next preview.
+
+    The build replays the build manifest when it's warm (only the song and
+    voicegroup objects are rebuilt and the ROM relinked, no make at all) and
+    falls back to a full make otherwise, recording a fresh manifest after it.
+    """
+
+    stage = QtCore.Signal(int, str)      # stage index, stage name
+    log = QtCore.Signal(str)
+    failed = QtCore.Signal(str)
+    finished = QtCore.Signal(str)
+    stopped = QtCore.Signal()
+
+    def __init__(self, request: PreviewRequest, parent: Optional[QtCore.QObject] = None):
+        super().__init__(parent)
+        self.request = request
+        self.status: Optional[str] = None
+        self._worker: Optional[PreviewPrepWorker] = None
+        self._thread: Optional[QtCore.QThread] = None
+        # The running build step: "incremental", "make" or "capture"
+        self._proc: Optional[QtCore.QProcess] = None
+        self._proc_kind = ""
+        self._proc_span = None
+        self._captured: List[bytes] = []
+        self._inputs_fp = ""
+        self._stopped = False
+
+    @property
+    def running(self) -> bool:
+        return self.status is None
+
+    @property
+    def idle(self) -> bool:
+        """Over, with no thread or process of its own left running."""
+        if self.running:
+            return False
+        if self._thread is not None and self._thread.isRunning():
+            return False
+        return self._proc is None or self._proc.state() == QtCore.QProcess.NotRunning
+
+    def start(self) -> None:
+        worker = PreviewPrepWorker(self.request)
+        thread = QtCore.QThread(self)
+        worker.moveToThread(thread)
+        thread.started.connect(worker.run)
+        worker.stage.connect(self._enter_stage)
+        worker.log.connect(self.log)
+        worker.done.connect(self._start_make)
+        worker.failed.connect(self._fail)
+        worker.cancelled.connect(lambda: self._finish("cancelled"))
+        for end in (worker.done, worker.failed, worker.cancelled):
+            end.connect(thread.quit)
+        thread.finished.connect(worker.deleteLater)
+        thread.finished.connect(self._dispose_when_idle)
+        self._worker, self._thread = worker, thread
+        thread.start()
+
+    def cancel(self, *, wait: bool = False) -> None:
+        """
+        Stop the job. The worker stops before its next stage; make is sent
+        SIGTERM (so it removes half-written targets) and killed if it hangs.
+        With wait=True (also on an already finished job), returns only once
+        nothing is left running.
+        """
+        make = self._proc
+        make_running = make is not None and make.state() != QtCore.QProcess.NotRunning
+        if self.running:
+            # Set first so the stop below isn't reported as a make failure
+            self.status = "cancelled"
+            if self._worker is not None:
+                self._worker.cancel()
+            if self._thread is not None:
+                # The worker finishes the stage it's in and stops there
+                self._thread.quit()
+            if make_running:
+                self.log.emit("!! Cancelled\n")
+                make.terminate()
+                if not wait:
+                    kill_timer = QtCore.QTimer(make)
+                    kill_timer.setSingleShot(True)
+                    kill_timer.timeout.connect(make.kill)
+                    kill_timer.start(MAKE_TERMINATE_MS)
+            self.finished.emit("cancelled")
+        if wait:
+            if make_running and not make.waitForFinished(MAKE_TERMINATE_MS):
+                make.kill()
+                make.waitForFinished(-1)
+            if self._thread is not None:
+                self._thread.wait()
+        self._dispose_when_idle()
+
+    # ---- stages ----
+
+    def _enter_stage(self, index: int) -> None:
+        if not self.running:
+            return
+        self.stage.emit(index, STAGES[index])
+        self.log.emit(f"== {STAGES[index]}\n")
+
+    def _start_make(self, inputs_fp: str, build_needed: bool) -> None:
+        if not self.running:
+            return
+        self._enter_stage(STAGES.index(STAGE_BUILD))
+        self._inputs_fp = inputs_fp
+        if not build_needed:
+            self.log.emit("ROM already built from these inputs, skipping make\n")
+            self._launch()
+            return
+        try:
+            commands = incremental_commands(self.request.repo, self._sources())
+        except OSError:
+            commands = None
+        if not commands:
+            self._start_process("make", MAKE_CMD)
+            return
+        self.log.emit(f"Rebuilding the preview song only ({len(commands)} recorded commands)\n")
+        for cmd in commands:
+            self.log.emit(f"$ {cmd}\n")
+        self._start_process("incremental", ["sh", "-c", incremental_script(commands)], echo=False)
+
+    def _sources(self) -> List[Path]:
+        # What the incremental rebuild is for: the compiled song and the voicegroup
+        return [SONG_ASM, voicegroup_inc(self.request.voicegroup)]
+
+    def _start_process(self, kind: str, cmd: List[str], *, echo: bool = True) -> None:
+        if echo:
+            self.log.emit(f"$ {' '.join(cmd)}\n")
+        if self._proc is not None:
+            self._proc.deleteLater()
+        proc = QtCore.QProcess(self)
+        proc.setWorkingDirectory(str(self.request.repo))
+        proc.setProcessChannelMode(QtCore.QProcess.MergedChannels)
+        proc.readyReadStandardOutput.connect(self._read_make_output)
+        proc.finished.connect(self._on_make_finished)
+        proc.finished.connect(self._dispose_when_idle)
+        proc.errorOccurred.connect(self._on_make_error)
+        self._proc, self._proc_kind = proc, kind
+        self._captured = []
+        self._proc_span = TRACER.span(f"preview.{kind}", cat="preview")
+        self._proc_span.__enter__()
+        proc.start(cmd[0], cmd[1:])
+
+    def _read_make_output(self) -> None:
+        data = bytes(self._proc.readAllStandardOutput())
+        if not data:
+            return
+        if self._proc_kind == "capture":
+            # The dry run's output is the manifest, not something to show
+            self._captured.append(data)
+        else:
+            self.log.emit(data.decode("utf-8", errors="replace"))
+
+    def _end_make_span(self, **args) -> None:
+        if self._proc_span is not None:
+            self._proc_span.set(**args)
+            self._proc_span.__exit__(None, None, None)
+            self._proc_span = None
+
+    def _on_make_error(self, error) -> None:
+        # Crashes show up in finished(); only a failed start never gets there
+        if error == QtCore.QProcess.FailedToStart:
+            self.log.emit(f"Could not run {self._proc.program()}: {self._proc.errorString()}\n")
+            self._on_make_finished(-1, QtCore.QProcess.CrashExit)
+
+    def _on_make_finished(self, exit_code: int, exit_status) -> None:
+        self._read_make_output()
+        self._end_make_span(returncode=exit_code)
+        if not self.running:
+            return
+        ok = exit_status == QtCore.QProcess.NormalExit and exit_code == 0
+        kind = self._proc_kind
+        if kind == "capture":
+            self._record_manifest(ok)
+            self._launch()
+            return
+        if not ok:
+            if kind == "incremental":
+                self.log.emit(f"Incremental rebuild failed (exit code {exit_code}), running a full make\n")
+                self._start_process("make", MAKE_CMD)
+            else:
+                self._fail(f"make failed (exit code {exit_code}). See the preview log for details.")
+            return
+        try:
+            record_rom_build(self.request.repo, self._inputs_fp)
+            if kind == "incremental":
+                refresh_build_manifest(self.request.repo)
+        except (OSError, ValueError) as e:
+            # Only costs a rebuild next time
+            self.log.emit(f"Could not record the build fingerprint: {e}\n")
+        if kind == "make":
+            # Ask make once, while the tree is fully built, what the song and
+            # voicegroup rebuild so later previews can skip make entirely
+            self._start_process("capture", dry_run_cmd(self._sources()))
+        else:
+            self._launch()
+
+    def _record_manifest(self, ok: bool) -> None:
+        commands = parse_dry_run(b"".join(self._captured).decode("utf-8", errors="replace")) if ok else []
+        if not commands:
+            self.log.emit("Could not record the incremental rebuild; the next preview runs a full make\n")
+            return
+        try:
+            write_build_manifest(self.request.repo, self._sources(), commands)
+        except OSError as e:
+            self.log.emit(f"Could not write the build manifest: {e}\n")
+            return
+        self.log.emit(f"Recorded {len(commands)} commands for incremental preview rebuilds\n")
+
+    def _launch(self) -> None:
+        self._enter_stage(STAGES.index(STAGE_LAUNCH))
+        rom = rom_path(self.request.repo)
+        if not rom.exists():
+            self._fail(f"ROM not found after build: {rom}")
+            return
+        if not QtCore.QProcess.startDetached(str(Path(self.request.mgba_path).expanduser()), [str(rom)]):
+            self._fail(f"Could not start mGBA: {self.request.mgba_path}")
+            return
+        self._finish("done")
+
+    def _fail(self, message: str) -> None:
+        if not self.running:
+            return
+        self.log.emit(f"!! {message}\n")
+        self.failed.emit(message)
+        self._finish("failed")
+
+    def _finish(self, status: str) -> None:
+        if not self.running:
+            return
+        self.status = status
+        self.finished.emit(status)
+        self._dispose_when_idle()
+
+    def _dispose_when_idle(self) -> None:
+        if self._stopped or not self.idle:
+            return
+        self._stopped = True
+        self.stopped.emit()
+        self.deleteLater()
+
+
+class PreviewLogPane(QtWidgets.QPlainTextEdit):
+    """Read-only make/stage output of the latest preview."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setReadOnly(True)
+        self.setMaximumBlockCount(LOG_MAX_LINES)
+        self.setLineWrapMode(QtWidgets.QPlainTextEdit.NoWrap)
+        self.setFont(QtGui.QFontDatabase.systemFont(QtGui.QFontDatabase.FixedFont))
+
+    def append_text(self, text: str) -> None:
+        # Keep following the output unless the user scrolled up to read
+        bar = self.verticalScrollBar()
+        at_bottom = bar.value() >= bar.maximum() - 2
+        cursor = self.textCursor()
+        cursor.movePosition(QtGui.QTextCursor.End)
+        cursor.insertText(text)
+        if at_bottom:
+            bar.setValue(bar.maximum())
+
+
+class PreviewStatus(QtWidgets.QWidget):
+    """Status bar stage progress + Cancel button shown while a preview runs."""
+
+    cancel_requested = QtCore.Signal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        lay = QtWidgets.QHBoxLayout(self)
+        lay.setContentsMargins(0, 0, 0, 0)
+        lay.setSpacing(6)
+
+        self.label = QtWidgets.QLabel()
+        self.bar = QtWidgets.QProgressBar()
+        self.bar.setFixedWidth(160)
+        self.bar.setRange(0, len(STAGES))
+        self.btn_cancel = QtWidgets.QPushButton("Cancel")
+        self.btn_cancel.clicked.connect(self.cancel_requested)
+
+        lay.addWidget(self.label)
+        lay.addWidget(self.bar)
+        lay.addWidget(self.btn_cancel)
+        self.hide()
+
+    def start(self) -> None:
+        self.label.setText("Preview…")
+        self.bar.setValue(0)
+        self.bar.setFormat(f"0/{len(STAGES)}")
+        self.show()
+
+    def set_stage(self, index: int, name: str) -> None:
+        self.label.setText(f"Preview: {name}")
+        self.bar.setValue(index)
+        self.bar.setFormat(f"{index + 1}/{len(STAGES)}")
+
+    def stop(self) -> None:
+        self.hide()
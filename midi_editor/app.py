@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 import sys
 from pathlib import Path
 
@@ -12,6 +13,7 @@ from midi_editor.config import (
     load_rs_drums_json,
     load_runtime_config_json,
 )
+from midi_editor.tracing import TRACER
 
 
 def resolve(root: Path, p: str) -> str:
@@ -63,10 +65,19 @@ def main() -> int:
         db_path=db_path,
     )
 
+    # MIDI_EDITOR_TRACE=1 starts with the timing overlay on;
+    # MIDI_EDITOR_TRACE=some/trace.json also writes the Chrome trace there on exit
+    trace = os.environ.get("MIDI_EDITOR_TRACE", "").strip()
+    if trace:
+        TRACER.enable()
+
     app = QtWidgets.QApplication(sys.argv)
     w = MainWindow(cfg)
     w.show()
-    return app.exec_()
+    code = app.exec_()
+    if trace.endswith(".json"):
+        TRACER.save(Path(trace))
+    return code
 
 
 if __name__ == "__main__":
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from midi_editor.note_store import NoteStore
+
+_EMPTY = np.zeros(0, dtype=np.intp)
+
+
+class ChannelIndex:
+    """
+    channel -> sorted row positions of that channel's notes in a NoteStore.
+
+    Kept up to date by MidiProject's edit methods, so counts and channel lists
+    are O(channels), and swap/merge are relabels of the affected rows only.
+    """
+
+    def __init__(self) -> None:
+        self._positions: Dict[int, np.ndarray] = {}
+        self.total = 0
+
+    @classmethod
+    def build(cls, store: NoteStore) -> "ChannelIndex":
+        ch = store.channel
+        order = np.argsort(ch, kind="stable")
+        chans, starts = np.unique(ch[order], return_index=True)
+        return cls.from_order(order, chans.tolist(), starts.tolist())
+
+    @classmethod
+    def from_order(cls, order: np.ndarray, channels: List[int], starts: List[int]) -> "ChannelIndex":
+        """
+        Rebuild from a stable argsort of the channel column plus each channel's
+        first offset in it (what project files store), without sorting again.
+        The per-channel position arrays are slices of order, not copies.
+        """
+        idx = cls()
+        bounds = list(starts[1:]) + [len(order)]
+        for c, lo, hi in zip(channels, starts, bounds):
+            idx._positions[int(c)] = order[lo:hi]
+        idx.total = len(order)
+        return idx
+
+    def sorted_order(self) -> Tuple[np.ndarray, List[int], List[int]]:
+        """Inverse of from_order: (order, channels, starts)."""
+        chans = self.channels()
+        parts = [self._positions[c] for c in chans]
+        starts = np.cumsum([0] + [len(p) for p in parts[:-1]]).tolist() if parts else []
+        order = np.concatenate(parts) if parts else _EMPTY
+        return order, chans, starts
+
+    def copy(self) -> "ChannelIndex":
+        # Position arrays are never edited in place, so sharing them is safe
+        out = ChannelIndex()
+        out._positions = dict(self._positions)
+        out.total = self.total
+        return out
+
+    # ---- queries ----
+
+    def channels(self) -> List[int]:
+        return sorted(self._positions)
+
+    def counts(self) -> Dict[int, int]:
+        return {ch: len(pos) for ch, pos in sorted(self._positions.items())}
+
+    def count(self, ch: int) -> int:
+        return len(self._positions.get(int(ch), _EMPTY))
+
+    def positions(self, ch: int) -> np.ndarray:
+        return self._positions.get(int(ch), _EMPTY)
+
+    def __contains__(self, ch: object) -> bool:
+        return ch in self._positions
+
+    # ---- updates ----
+
+    def swap(self, a: int, b: int) -> None:
+        pa = self._positions.pop(a, None)
+        pb = self._positions.pop(b, None)
+        if pa is not None:
+            self._positions[b] = pa
+        if pb is not None:
+            self._positions[a] = pb
+
+    def merge(self, src: int, dst: int) -> None:
+        ps = self._positions.pop(src, None)
+        if ps is None:
+            return
+        pd = self._positions.get(dst)
+        self._positions[dst] = ps if pd is None else np.sort(np.concatenate([pd, ps]), kind="mergesort")
+
+    def add(self, ch: int, row: int) -> None:
+        """Register an appended row (always the highest position in the store)."""
+        pos = self._positions.get(ch)
+        row_arr = np.array([row], dtype=np.intp)
+        self._positions[ch] = row_arr if pos is None else np.concatenate([pos, row_arr])
+        self.total += 1
+
+    def add_rows(self, channels: np.ndarray, rows: np.ndarray) -> None:
+        """Register a block of appended rows (all above every existing position, ascending)."""
+        if not len(rows):
+            return
+        order = np.argsort(channels, kind="stable")
+        chans, starts = np.unique(channels[order], return_index=True)
+        bounds = list(starts[1:]) + [len(order)]
+        for c, lo, hi in zip(chans.tolist(), starts.tolist(), bounds):
+            new = np.asarray(rows, dtype=np.intp)[order[lo:hi]]
+            pos = self._positions.get(c)
+            self._positions[c] = new if pos is None else np.concatenate([pos, new])
+        self.total += len(rows)
+
+    def remove_rows(self, removed: np.ndarray) -> None:
+        """
+        Account for rows deleted (and compacted) from the store.
+        removed must be sorted positions from before the delete.
+        """
+        if not len(removed):
+            return
+        for ch in list(self._positions):
+            pos = self._positions[ch]
+            keep = pos[~np.isin(pos, removed, assume_unique=True)]
+            if not len(keep):
+                del self._positions[ch]
+                continue
+            # each surviving row moves down by the number of deleted rows before it
+            self._positions[ch] = keep - np.searchsorted(removed, keep)
+        self.total -= len(removed)
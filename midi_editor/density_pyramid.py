@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from midi_editor.note_store import NoteStore
+
+# Batches bigger than this are applied in vectorized passes (see
+# _CoverageTree.add_ranges) instead of one O(log buckets) walk per note
+_BULK_MIN_NOTES = 32
+# Vectorized tagging costs about this many dense-rebuild leaves per note and level
+_TAG_COST_LEAVES = 4
+
+
+class _CoverageTree:
+    """
+    Segment-tree pyramid over time buckets for one channel.
+
+    Level k node j covers buckets [j * 2**k, (j + 1) * 2**k). A note is added
+    as +1 on the O(log n) nodes that exactly tile its bucket range (own), and
+    below[k][j] holds the coverage contributed by own counts inside node j's
+    subtree. A node's coverage sum is below[k][j] plus its size times the own
+    counts of its ancestors, so any level can be read without touching the
+    levels beneath it.
+    """
+
+    def __init__(self, leaf_coverage: np.ndarray):
+        n = len(leaf_coverage)
+        self.levels = max(1, int(np.ceil(np.log2(max(1, n)))) + 1)
+        size = 1 << (self.levels - 1)
+        leaves = np.zeros(size, dtype=np.int64)
+        leaves[:n] = leaf_coverage
+        self.own: List[np.ndarray] = [leaves.copy()]
+        self.below: List[np.ndarray] = [leaves]
+        for _ in range(1, self.levels):
+            prev = self.below[-1]
+            self.own.append(np.zeros(len(prev) // 2, dtype=np.int64))
+            self.below.append(prev[0::2] + prev[1::2])
+
+    @property
+    def capacity(self) -> int:
+        return len(self.own[0])
+
+    def add_range(self, b0: int, b1: int, delta: int) -> None:
+        """Add delta to the coverage of buckets b0..b1 (inclusive) in O(log n)."""
+        lo, hi, k = b0, b1 + 1, 0
+        while lo < hi:
+            size = 1 << k
+            if lo & 1:
+                self.own[k][lo] += delta
+                self.below[k][lo] += delta * size
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                self.own[k][hi] += delta
+                self.below[k][hi] += delta * size
+            lo >>= 1
+            hi >>= 1
+            k += 1
+        # Every node tagged above hangs off the two boundary paths: refresh them
+        for leaf in (b0, b1):
+            j = leaf >> 1
+            for k in range(1, self.levels):
+                below_prev = self.below[k - 1]
+                self.below[k][j] = self.own[k][j] * (1 << k) + below_prev[2 * j] + below_prev[2 * j + 1]
+                j >>= 1
+
+    def add_ranges(self, b0: np.ndarray, b1: np.ndarray, delta: int) -> None:
+        """add_range for many ranges at once: the same walk, one level at a time for all of them."""
+        lo = np.asarray(b0, dtype=np.int64)
+        hi = np.asarray(b1, dtype=np.int64) + 1
+        k = 0
+        while len(lo):
+            size = 1 << k
+            tag = (lo & 1).astype(bool)
+            np.add.at(self.own[k], lo[tag], delta)
+            np.add.at(self.below[k], lo[tag], delta * size)
+            lo = lo + tag
+            tag = (hi & 1).astype(bool)
+            hi = hi - tag
+            np.add.at(self.own[k], hi[tag], delta)
+            np.add.at(self.below[k], hi[tag], delta * size)
+            lo, hi = lo >> 1, hi >> 1
+            live = lo < hi
+            lo, hi = lo[live], hi[live]
+            k += 1
+        # Refresh the boundary paths; j stays sorted, so halving it only needs adjacent duplicates dropped
+        j = np.unique(np.concatenate([np.asarray(b0, dtype=np.int64), np.asarray(b1, dtype=np.int64)]) >> 1)
+        for k in range(1, self.levels):
+            below_prev = self.below[k - 1]
+            self.below[k][j] = self.own[k][j] * (1 << k) + below_prev[2 * j] + below_prev[2 * j + 1]
+            j = j >> 1
+            j = j[np.concatenate(([True], j[1:] != j[:-1]))]
+
+    def level_sums(self, k: int) -> np.ndarray:
+        """Coverage summed over each level-k node (bucket-notes), O(nodes at level >= k)."""
+        if k >= self.levels:
+            # Coarser than the root: everything falls into node 0
+            return self.below[-1][:1].copy()
+        inherited = np.zeros(1, dtype=np.int64)
+        for lvl in range(self.levels - 1, k, -1):
+            inherited = np.repeat(inherited + self.own[lvl], 2)
+        return self.below[k] + inherited * (1 << k)
+
+
+class DensityPyramid:
+    """
+    Multi-resolution note coverage per channel over fixed-width time buckets.
+
+    Building is one O(notes + buckets) pass; updates (add/remove, channel
+    moves) are O(log buckets) per note, vectorized for batches, with a
+    dense O(buckets) rebuild only for batches too big for that to pay; reading a level costs the number
+    of nodes at that level and above, so a minimap a few hundred pixels wide
+    never walks the whole song.
+    """
+
+    def __init__(self, bucket_ticks: int):
+        if bucket_ticks <= 0:
+            raise ValueError(f"bucket_ticks must be positive, got {bucket_ticks}")
+        self.bucket_ticks = int(bucket_ticks)
+        self._trees: Dict[int, _CoverageTree] = {}
+        self.n_buckets = 1
+
+    @classmethod
+    def build(cls, store: NoteStore, bucket_ticks: int) -> "DensityPyramid":
+        pyr = cls(bucket_ticks)
+        pyr.n_buckets = max(1, store.max_end_tick() // pyr.bucket_ticks + 1)
+        for ch in store.used_channels():
+            mask = store.channel_mask(ch)
+            pyr._trees[ch] = _CoverageTree(pyr._leaf_coverage(store.start_tick[mask], store.end_tick[mask], +1))
+        return pyr
+
+    def channels(self) -> List[int]:
+        return sorted(self._trees)
+
+    @property
+    def capacity(self) -> int:
+        return max((t.capacity for t in self._trees.values()), default=1)
+
+    def _bucket_range(self, starts: np.ndarray, ends: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        b0 = np.asarray(starts, dtype=np.int64) // self.bucket_ticks
+        b1 = np.maximum(b0, (np.asarray(ends, dtype=np.int64) - 1) // self.bucket_ticks)
+        return b0, b1
+
+    def _leaf_coverage(self, starts: np.ndarray, ends: np.ndarray, delta: int, n: int = 0) -> np.ndarray:
+        b0, b1 = self._bucket_range(starts, ends)
+        n = max(n, self.n_buckets, int(b1.max()) + 1 if len(b1) else 0)
+        diff = np.zeros(n + 1, dtype=np.int64)
+        np.add.at(diff, b0, delta)
+        np.add.at(diff, b1 + 1, -delta)
+        return np.cumsum(diff[:n])
+
+    def _tree_for(self, ch: int, min_capacity: int) -> _CoverageTree:
+        tree = self._trees.get(ch)
+        if tree is None or tree.capacity < min_capacity:
+            # (Re)allocate with room to grow; coverage carries over
+            old = tree.level_sums(0) if tree is not None else np.zeros(0, dtype=np.int64)
+            leaves = np.zeros(max(min_capacity, 2 * len(old), self.n_buckets), dtype=np.int64)
+            leaves[: len(old)] = old
+            tree = self._trees[ch] = _CoverageTree(leaves)
+        return tree
+
+    def update(self, channel: np.ndarray, starts: np.ndarray, ends: np.ndarray, delta: int) -> None:
+        """Add (delta=+1) or remove (delta=-1) notes."""
+        if not len(starts):
+            return
+        b0, b1 = self._bucket_range(starts, ends)
+        self.n_buckets = max(self.n_buckets, int(b1.max()) + 1)
+        channel = np.asarray(channel)
+        for ch in np.unique(channel).tolist():
+            mine = channel == ch
+            tree = self._tree_for(int(ch), int(b1[mine].max()) + 1)
+            count = int(np.count_nonzero(mine))
+            if count * tree.levels * _TAG_COST_LEAVES >= tree.capacity:
+                # Cheaper to redo the channel's leaves in one pass
+                leaves = tree.level_sums(0)
+                # (Past this channel's last bucket, which the tree covers, the coverage is all zeros)
+                leaves += self._leaf_coverage(starts[mine], ends[mine], delta, n=tree.capacity)[: tree.capacity]
+                self._trees[int(ch)] = _CoverageTree(leaves)
+            elif count >= _BULK_MIN_NOTES:
+                tree.add_ranges(b0[mine], b1[mine], delta)
+            else:
+                for lo, hi in zip(b0[mine].tolist(), b1[mine].tolist()):
+                    tree.add_range(lo, hi, delta)
+
+    def level_for(self, columns: int) -> int:
+        """Coarsest level that still gives at least `columns` nodes across the song."""
+        k = 0
+        while (self.n_buckets >> (k + 1)) >= columns:
+            k += 1
+        return k
+
+    def density(self, k: int) -> Tuple[List[int], np.ndarray]:
+        """(channels, average notes sounding per bucket) at level k, one row per channel."""
+        chans = self.channels()
+        n_nodes = -(-self.n_buckets // (1 << k))
+        out = np.zeros((len(chans), n_nodes), dtype=np.float64)
+        for i, ch in enumerate(chans):
+            sums = self._trees[ch].level_sums(k)
+            m = min(n_nodes, len(sums))
+            out[i, :m] = sums[:m] / float(1 << k)
+        return chans, out
@@ -1,7 +1,12 @@
 from __future__ import annotations
 
 import re
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
+
+import numpy as np
+
+from midi_editor.models import MidiProject
+from midi_editor.note_store import NoteStore, NoteView
 
 GM_NOTE_TO_NAME: Dict[int, str] = {
     27: "High Q",
@@ -106,13 +111,19 @@ def _build_gm_to_rs(rs_drums_by_note: Dict[Any, Any]) -> Dict[int, int]:
 
 
 def remap_channel_9_notes_in_place(
-    notes: List[object],
+    notes: Union[MidiProject, NoteStore, List[object]],
     rs_drums_by_note: Dict[Any, Any],
     *,
     keep_unmapped: bool = True,
 ) -> Tuple[int, Set[int]]:
     """
-    Mutates NoteEvent.pitch for channel 9 notes.
+    Mutates pitch for channel 9 notes, GM drum notes -> RS drum notes.
+    Callers holding a MidiProject must pass the project: it goes through
+    remap_pitches, so its time/grid indexes stay current and its listeners hear
+    about it. A bare NoteStore (remapped in one vectorized pass) or a list of
+    notes (NoteViews are remapped through their store the same way) is only
+    for notes no project owns; rewriting a project's notes that way leaves its
+    indexes stale.
     Returns: (changed_count, unmapped_original_pitches)
     """
     gm_to_rs = _build_gm_to_rs(rs_drums_by_note)
@@ -124,10 +135,38 @@ def remap_channel_9_notes_in_place(
         except Exception:
             pass
 
+    if isinstance(notes, MidiProject):
+        unmapped = {p for p in notes.pitches_for_channel(9) if p not in gm_to_rs and p not in rs_valid}
+        return notes.remap_pitches(9, gm_to_rs), unmapped
+
+    if isinstance(notes, NoteStore):
+        # Columnar fast path: one LUT pass over channel 9 instead of per-note setattr.
+        drum_mask = notes.channel_mask(9)
+        used = notes.pitches_in(drum_mask)
+        unmapped = {p for p in used if p not in gm_to_rs and p not in rs_valid}
+        changed = notes.remap_pitches(gm_to_rs, drum_mask)
+        return changed, unmapped
+
     changed = 0
     unmapped: Set[int] = set()
 
+    # NoteViews can't set their pitch (the project's indexes key on it): remap
+    # their rows on the backing store instead, one pass per store
+    rows_by_store: Dict[int, Tuple[NoteStore, List[int]]] = {}
+    events: List[object] = []
     for n in notes:
+        if isinstance(n, NoteView):
+            rows_by_store.setdefault(id(n.store), (n.store, []))[1].append(n.index)
+        else:
+            events.append(n)
+    for store, rows in rows_by_store.values():
+        mask = np.zeros(len(store), dtype=bool)
+        mask[rows] = True
+        mask &= store.channel_mask(9)
+        unmapped.update(p for p in store.pitches_in(mask) if p not in gm_to_rs and p not in rs_valid)
+        changed += store.remap_pitches(gm_to_rs, mask)
+
+    for n in events:
         if getattr(n, "channel", None) != 9:
             continue
         pitch = int(getattr(n, "pitch"))
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from typing import List, Optional, Tuple
+
+from midi_editor.models import MidiProject, ProjectSnapshot
+
+
+class ProjectHistory:
+    """
+    Undo/redo stacks of ProjectSnapshot. Snapshots share note columns with the
+    live project copy-on-write, so a history step only costs the columns an
+    edit actually rewrote. They also hold tempo, timing and mutes, so those
+    edits need recording like note edits or an undo would silently revert them.
+    """
+
+    def __init__(self, limit: int = 100):
+        self.limit = limit
+        self._undo: List[Tuple[str, ProjectSnapshot]] = []
+        self._redo: List[Tuple[str, ProjectSnapshot]] = []
+
+    def clear(self) -> None:
+        self._undo.clear()
+        self._redo.clear()
+
+    def record(self, project: MidiProject, label: str, *, coalesce: bool = False) -> None:
+        """
+        Call right before editing project. With coalesce, an edit with the same
+        label as the last one recorded (and nothing undone since) joins it, so
+        e.g. a run of spin box steps undoes in one go.
+        """
+        if coalesce and self._undo and not self._redo and self._undo[-1][0] == label:
+            return
+        self._undo.append((label, project.snapshot()))
+        if len(self._undo) > self.limit:
+            del self._undo[0]
+        self._redo.clear()
+
+    def can_undo(self) -> bool:
+        return bool(self._undo)
+
+    def can_redo(self) -> bool:
+        return bool(self._redo)
+
+    def undo_label(self) -> Optional[str]:
+        return self._undo[-1][0] if self._undo else None
+
+    def redo_label(self) -> Optional[str]:
+        return self._redo[-1][0] if self._redo else None
+
+    def undo(self, project: MidiProject) -> Optional[MidiProject]:
+        """Return the project state before the last recorded edit, or None."""
+        if not self._undo:
+            return None
+        label, snap = self._undo.pop()
+        self._redo.append((label, project.snapshot()))
+        return snap.restore()
+
+    def redo(self, project: MidiProject) -> Optional[MidiProject]:
+        if not self._redo:
+            return None
+        label, snap = self._redo.pop()
+        self._undo.append((label, project.snapshot()))
+        return snap.restore()
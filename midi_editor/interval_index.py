@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import numpy as np
+
+from midi_editor.note_store import NoteStore
+
+# Notes per block for the block-level max-end summary used to skip dead ranges
+BLOCK = 64
+
+
+class IntervalIndex:
+    """
+    Time-range index over a NoteStore: rows sorted by start tick, augmented
+    with a running max of end ticks.
+
+    overlapping(a, b) binary-searches both bounds: every row before the first
+    prefix-max end > a ends too early, every row from the first start >= b
+    starts too late. Inside that window, per-block max ends skip blocks with
+    no hits, so a query costs O(log n + k + long notes) rather than O(n).
+
+    Edits keep the index in order without re-sorting (see remove_rows/insert);
+    pitch and channel changes don't affect it at all.
+    """
+
+    def __init__(self, rows: np.ndarray, starts: np.ndarray, ends: np.ndarray):
+        self.rows = rows        # store row of each sorted entry
+        self.starts = starts    # sorted start ticks
+        self.ends = ends        # end ticks aligned with starts
+        self._refresh_summaries()
+
+    @classmethod
+    def build(cls, store: NoteStore) -> "IntervalIndex":
+        starts = store.start_tick.astype(np.int64)
+        rows = np.argsort(starts, kind="stable")
+        return cls(rows, starts[rows], store.end_tick.astype(np.int64)[rows])
+
+    def copy(self) -> "IntervalIndex":
+        # Arrays are replaced, never edited in place, so sharing them is safe
+        out = IntervalIndex.__new__(IntervalIndex)
+        out.rows, out.starts, out.ends = self.rows, self.starts, self.ends
+        out.prefix_max_end, out.block_max_end = self.prefix_max_end, self.block_max_end
+        return out
+
+    @property
+    def total(self) -> int:
+        return len(self.rows)
+
+    def _refresh_summaries(self) -> None:
+        ends = self.ends
+        self.prefix_max_end = np.maximum.accumulate(ends) if len(ends) else ends
+        pad = (-len(ends)) % BLOCK
+        if len(ends):
+            padded = np.concatenate([ends, np.full(pad, np.iinfo(np.int64).min)])
+            self.block_max_end = padded.reshape(-1, BLOCK).max(axis=1)
+        else:
+            self.block_max_end = ends
+
+    # ---- queries ----
+
+    def _window(self, a: int, b: int) -> np.ndarray:
+        """Sorted-order positions of entries with start < b and end > a."""
+        lo = int(np.searchsorted(self.prefix_max_end, a, side="right"))
+        hi = int(np.searchsorted(self.starts, b, side="left"))
+        if lo >= hi:
+            return np.zeros(0, dtype=np.intp)
+
+        first_block, last_block = lo // BLOCK, (hi - 1) // BLOCK
+        live = np.flatnonzero(self.block_max_end[first_block : last_block + 1] > a) + first_block
+        if not len(live):
+            return np.zeros(0, dtype=np.intp)
+        if len(live) == last_block - first_block + 1:
+            cand = np.arange(lo, hi)
+        else:
+            cand = (live[:, None] * BLOCK + np.arange(BLOCK)).ravel()
+            cand = cand[(cand >= lo) & (cand < hi)]
+        return cand[self.ends[cand] > a]
+
+    def overlapping(self, start: int, end: int) -> np.ndarray:
+        """Store rows of notes overlapping [start, end), ordered by start tick."""
+        return self.rows[self._window(int(start), int(end))]
+
+    def stabbing(self, tick: int) -> np.ndarray:
+        """Store rows of notes sounding at tick (start <= tick < end)."""
+        return self.overlapping(tick, tick + 1)
+
+    # ---- updates ----
+
+    def remove_rows(self, removed: np.ndarray) -> None:
+        """Drop deleted store rows (sorted, pre-delete positions) and renumber the rest."""
+        if not len(removed):
+            return
+        keep = ~np.isin(self.rows, removed, assume_unique=True)
+        rows = self.rows[keep]
+        self.rows = rows - np.searchsorted(removed, rows)
+        self.starts = self.starts[keep]
+        self.ends = self.ends[keep]
+        self._refresh_summaries()
+
+    def insert_rows(self, rows: np.ndarray, starts: np.ndarray, ends: np.ndarray) -> None:
+        """Add a block of appended store rows in one merge (same order as inserting them one by one)."""
+        if not len(rows):
+            return
+        starts = np.asarray(starts, dtype=np.int64)
+        order = np.argsort(starts, kind="stable")
+        at = np.searchsorted(self.starts, starts[order], side="right")
+        self.rows = np.insert(self.rows, at, np.asarray(rows, dtype=np.intp)[order])
+        self.starts = np.insert(self.starts, at, starts[order])
+        self.ends = np.insert(self.ends, at, np.asarray(ends, dtype=np.int64)[order])
+        self._refresh_summaries()
+
+    def insert(self, row: int, start: int, end: int) -> None:
+        """Add one appended store row, keeping start order (ties go last, like a stable sort)."""
+        at = int(np.searchsorted(self.starts, start, side="right"))
+        self.rows = np.insert(self.rows, at, row)
+        self.starts = np.insert(self.starts, at, start)
+        self.ends = np.insert(self.ends, at, end)
+        self._refresh_summaries()
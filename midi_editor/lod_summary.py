@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from midi_editor.interval_index import IntervalIndex
+from midi_editor.note_store import NoteStore
+
+# Zoomed out past the point where a typical note is this many pixels wide,
+# the piano roll switches from note rects to merged activity spans
+LOD_MIN_NOTE_PX = 2.0
+# ... or once the song averages more notes than this per pixel column
+LOD_MAX_NOTES_PER_PX = 4.0
+# Gaps narrower than this many pixels are merged away in LOD spans
+LOD_MERGE_PX = 2.0
+
+
+class _LodLevel:
+    """Per-(channel, pitch) activity spans with gaps up to `gap` ticks merged."""
+
+    def __init__(self, gap: int, channel: np.ndarray, pitch: np.ndarray, starts: np.ndarray, ends: np.ndarray):
+        self.gap = gap
+        # Everything in start order, so index rows are positions in these arrays
+        order = np.argsort(starts, kind="stable")
+        self.channel = channel[order]
+        self.pitch = pitch[order]
+        self.starts = starts[order]
+        self.ends = ends[order]
+        self.index = IntervalIndex(np.arange(len(order)), self.starts, self.ends)
+
+    def __len__(self) -> int:
+        return self.index.total
+
+    def spans(
+        self,
+        start_tick: int,
+        end_tick: int,
+        *,
+        channel: Optional[int] = None,
+        pitch_min: int = 0,
+        pitch_max: int = 127,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """(starts, ends, pitches, channels) of spans overlapping [start_tick, end_tick)."""
+        pos = self.index.overlapping(start_tick, end_tick)
+        keep = (self.pitch[pos] >= pitch_min) & (self.pitch[pos] <= pitch_max)
+        if channel is not None:
+            keep &= self.channel[pos] == channel
+        pos = pos[keep]
+        return self.starts[pos], self.ends[pos], self.pitch[pos], self.channel[pos]
+
+
+def _merge_spans(
+    channel: np.ndarray, pitch: np.ndarray, starts: np.ndarray, ends: np.ndarray, gap: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Union same-(channel, pitch) intervals that overlap or sit <= gap ticks apart."""
+    if not len(starts):
+        return channel, pitch, starts, ends
+    key = channel.astype(np.int64) * 128 + pitch
+    order = np.lexsort((starts, key))
+    key, s, e = key[order], starts[order], ends[order]
+
+    # Running max end within each key group: offset groups so one accumulate
+    # never carries a value across a group boundary
+    span = int(e.max()) + 1
+    reach = np.maximum.accumulate(e + key * span) - key * span
+
+    new = np.ones(len(s), dtype=bool)
+    new[1:] = (key[1:] != key[:-1]) | (s[1:] > reach[:-1] + gap)
+    first = np.flatnonzero(new)
+    return (
+        (key[first] // 128).astype(channel.dtype),
+        (key[first] % 128).astype(pitch.dtype),
+        s[first],
+        np.maximum.reduceat(e, first),
+    )
+
+
+class NoteLodSummary:
+    """
+    Multi-resolution summary of a NoteStore for zoomed-out drawing.
+
+    Level L (L >= 1) merges each channel+pitch's notes whose gap is at most
+    2**L ticks into one activity span. Each level is built from the one below
+    (merging is monotone in the gap), lazily, the first time a zoom needs it.
+    Drawing the level whose gap is about LOD_MERGE_PX pixels only loses gaps
+    too narrow to see, and caps the spans per pitch row at the row's width in
+    pixels / LOD_MERGE_PX however many notes the song has.
+    """
+
+    def __init__(self, store: NoteStore):
+        self._store = store
+        self._levels: Dict[int, _LodLevel] = {}
+        self._typical_duration: Optional[float] = None
+        self._song_ticks: Optional[int] = None
+
+    @property
+    def store(self) -> NoteStore:
+        return self._store
+
+    @property
+    def typical_duration(self) -> float:
+        if self._typical_duration is None:
+            s = self._store
+            self._typical_duration = float(np.median(s.end_tick - s.start_tick)) if len(s) else 1.0
+        return self._typical_duration
+
+    @property
+    def song_ticks(self) -> int:
+        if self._song_ticks is None:
+            self._song_ticks = max(1, self._store.max_end_tick())
+        return self._song_ticks
+
+    def level_for(self, tick_px: float) -> int:
+        """0 (draw notes) while notes are wide and sparse enough to see, else the pyramid level to draw."""
+        n = len(self._store)
+        if not n:
+            return 0
+        wide = self.typical_duration * tick_px >= LOD_MIN_NOTE_PX
+        sparse = n / (self.song_ticks * tick_px) <= LOD_MAX_NOTES_PER_PX
+        if wide and sparse:
+            return 0
+        return max(1, int(np.floor(np.log2(LOD_MERGE_PX / tick_px))))
+
+    def level(self, lvl: int) -> _LodLevel:
+        if lvl < 1:
+            raise ValueError(f"LOD levels start at 1, got {lvl}")
+        if lvl not in self._levels:
+            if lvl == 1:
+                s = self._store
+                src = (s.channel, s.pitch, s.start_tick.astype(np.int64), s.end_tick.astype(np.int64))
+            else:
+                below = self.level(lvl - 1)
+                src = (below.channel, below.pitch, below.starts, below.ends)
+            self._levels[lvl] = _LodLevel(1 << lvl, *_merge_spans(*src, gap=1 << lvl))
+        return self._levels[lvl]
@@ -0,0 +1,305 @@
+from __future__ import annotations
+
+import argparse
+import re
+import unicodedata
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Tuple, Union
+
+import numpy as np
+
+from midi_editor.midi_io import limit_export_channels
+from midi_editor.models import MidiProject, ProjectSnapshot
+from midi_editor.note_store import NoteStore
+
+# m4a clocks: 24 per beat, 96 per 4/4 measure (tbs=1)
+M4A_TICKS_PER_BEAT = 24
+MEASURE_TICKS = 96
+
+# Lengths that have their own W## wait / N## note command in MPlayDef.s
+_TABLE = tuple(range(0, 25)) + (28, 30, 32, 36, 40, 42, 44, 48, 52, 54, 56, 60, 64, 66, 68, 72, 76, 78, 80, 84, 88, 90, 92, 96)
+# Longest note an N## command can carry (N96 plus gtp3); longer ones are TIE ... EOT
+MAX_NOTE_LEN = 99
+
+_NOTE_NAMES = ("Cn", "Cs", "Dn", "Ds", "En", "Fn", "Fs", "Gn", "Gs", "An", "As", "Bn")
+
+
+def _key_name(pitch: int) -> str:
+    """MIDI note -> MPlayDef key name: 60 -> Cn3, 0 -> CnM2."""
+    octave = pitch // 12 - 2
+    return f"{_NOTE_NAMES[pitch % 12]}{octave if octave >= 0 else f'M{-octave}'}"
+
+
+def _waits(ticks: int) -> List[str]:
+    """W## lines adding up to `ticks` (1..96)."""
+    out: List[str] = []
+    while ticks > 0:
+        step = max(t for t in _TABLE if t <= ticks)
+        out.append(f"\t.byte\tW{step:02d}")
+        ticks -= step
+    return out
+
+
+def _note_cmd(length: int) -> Tuple[str, str]:
+    """(N## command, gtp suffix) for a note `length` clocks long (1..MAX_NOTE_LEN)."""
+    base = max(t for t in _TABLE if 0 < t <= length)
+    extra = length - base
+    return f"N{base:02d}", f" , gtp{extra}" if extra else ""
+
+
+KEY_NAMES = tuple(_key_name(p) for p in range(128))
+WAIT_LINES = tuple(_waits(t) for t in range(MEASURE_TICKS + 1))
+NOTE_CMDS = tuple(_note_cmd(n) if n else ("", "") for n in range(MAX_NOTE_LEN + 1))
+
+
+@dataclass
+class SongSettings:
+    """What midi.cfg would pass to mid2agb for the song (-G, -V, -R, -P)."""
+    voicegroup: str
+    volume: int = 127
+    reverb: int = 0
+    priority: int = 0
+    # Same voice layout inject_init_events gives mid2agb: drums on VOICE 0, channel n on VOICE n + 1
+    program_base: int = 1
+    drum_channel: int = 9
+
+
+_SYMBOL_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+
+
+def symbol_name(name: str) -> str:
+    """
+    name as an assembler symbol: accents dropped, lower case, with every run of
+    anything but a-z/0-9 turned into "_". ValueError if no letters or digits are left.
+    """
+    ascii_name = unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode("ascii")
+    sym = re.sub(r"[^0-9a-z]+", "_", ascii_name.lower()).strip("_")
+    if not sym:
+        raise ValueError(f"{name!r} has no letters or digits to make a symbol from")
+    return sym
+
+
+def song_label(name: str) -> str:
+    """Song symbol for name, pokeemerald style: mus_<symbol_name(name)>."""
+    sym = symbol_name(name)
+    return sym if sym.startswith("mus_") else f"mus_{sym}"
+
+
+def _to_m4a_ticks(ticks: np.ndarray, ticks_per_beat: int) -> np.ndarray:
+    # Rounded to the nearest m4a clock
+    t = ticks.astype(np.int64) * (2 * M4A_TICKS_PER_BEAT) + ticks_per_beat
+    return t // (2 * ticks_per_beat)
+
+
+def _tie_ends(starts: np.ndarray, ends: np.ndarray, pitch: np.ndarray, tie: np.ndarray) -> np.ndarray:
+    """
+    ends with tied notes shortened so no EOT lands while another note on its
+    key still sounds (EOT stops every voice on the key): a tie ends where its
+    key is struck again, and ties struck together on one key end together.
+    """
+    strike = pitch * (1 << 40) + starts
+    order = np.argsort(strike, kind="stable")
+    s, p, e = strike[order], pitch[order], ends[order]
+    first = np.r_[True, s[1:] != s[:-1]]
+    group_end = np.maximum.reduceat(e, np.flatnonzero(first))[np.cumsum(first) - 1]
+    # First strike after this one (on the same key, or none)
+    nxt = np.searchsorted(s, s, side="right")
+    restruck = nxt < len(s)
+    restruck[restruck] = p[nxt[restruck]] == p[restruck]
+    new_end = group_end.copy()
+    new_end[restruck] = np.minimum(group_end[restruck], starts[order][nxt[restruck]])
+    out = ends.copy()
+    sel = tie[order]
+    out[order[sel]] = new_end[sel]
+    return out
+
+
+def _cmd(name: str, args: str) -> str:
+    return f"\t.byte\t\t{name:<6}, {args}"
+
+
+def _track_lines(
+    label: str,
+    number: int,
+    channel: int,
+    notes: NoteStore,
+    rows: np.ndarray,
+    ticks_per_beat: int,
+    settings: SongSettings,
+    tempo_bpm: int,
+) -> List[str]:
+    starts = _to_m4a_ticks(notes.start_tick[rows], ticks_per_beat)
+    ends = np.maximum(_to_m4a_ticks(notes.end_tick[rows], ticks_per_beat), starts + 1)
+    pitch = notes.pitch[rows].astype(np.int64)
+    vel = np.clip(notes.velocity[rows].astype(np.int64), 1, 127)
+    lengths = ends - starts
+    tie = lengths > MAX_NOTE_LEN
+    if tie.any():
+        ends = _tie_ends(starts, ends, pitch, tie)
+        lengths = ends - starts
+        tie = lengths > MAX_NOTE_LEN
+
+    # One event per note start, plus an EOT where tied notes end (one per key
+    # and clock, since it ends them all); at the same clock EOTs go first (so a
+    # key can be struck again), then by pitch
+    n = len(rows)
+    tied = np.flatnonzero(tie)
+    _, first = np.unique(ends[tied] * 128 + pitch[tied], return_index=True)
+    eot = tied[np.sort(first)]
+    ev_time = np.concatenate([starts, ends[eot]])
+    ev_note = np.concatenate([np.arange(n), eot])
+    ev_on = np.concatenate([np.ones(n, dtype=bool), np.zeros(len(eot), dtype=bool)])
+    order = np.lexsort((pitch[ev_note], ev_on, ev_time))
+
+    voice = 0 if channel == settings.drum_channel else settings.program_base + channel
+    lines = [
+        "",
+        f"@{'*' * 16} Track {number} (Midi-Chn.{channel + 1}) {'*' * 16}@",
+        "",
+        f"{label}_{number}:",
+        f"\t.byte\tKEYSH , {label}_key+0",
+        f"@ 000   {'-' * 40}",
+    ]
+    if number == 1:
+        lines.append(f"\t.byte\tTEMPO , {tempo_bpm}*{label}_tbs/2")
+    lines.append(_cmd("VOICE", str(voice)))
+    lines.append(_cmd("VOL", f"127*{label}_mvl/mxv"))
+
+    clock = 0
+
+    def wait_until(t: int) -> None:
+        nonlocal clock
+        # Waits are split at measure lines, like mid2agb's output
+        while clock < t:
+            boundary = (clock // MEASURE_TICKS + 1) * MEASURE_TICKS
+            step = min(t, boundary) - clock
+            lines.extend(WAIT_LINES[step])
+            clock += step
+            if clock == boundary:
+                lines.append(f"@ {clock // MEASURE_TICKS:03d}   {'-' * 40}")
+
+    pitch_l, vel_l, len_l, tie_l = pitch.tolist(), vel.tolist(), lengths.tolist(), tie.tolist()
+    for t, i, on in zip(ev_time[order].tolist(), ev_note[order].tolist(), ev_on[order].tolist()):
+        if t > clock:
+            wait_until(t)
+        key = KEY_NAMES[pitch_l[i]]
+        if not on:
+            lines.append(_cmd("EOT", key))
+        elif tie_l[i]:
+            lines.append(_cmd("TIE", f"{key} , v{vel_l[i]:03d}"))
+        else:
+            cmd, gtp = NOTE_CMDS[len_l[i]]
+            lines.append(_cmd(cmd, f"{key} , v{vel_l[i]:03d}{gtp}"))
+
+    # Let the last notes ring out before the track ends
+    if n:
+        wait_until(int(ends.max()))
+    lines.append("\t.byte\tFINE")
+    return lines
+
+
+def compile_project_to_song(
+    project: Union[MidiProject, ProjectSnapshot],
+    label: str,
+    settings: SongSettings,
+    *,
+    drop_channels_over_9: bool = True,
+) -> Tuple[str, List[str]]:
+    """
+    Compile the project straight to pokeemerald m4a song assembly (the .s
+    mid2agb would make from an exported, init-injected MIDI with -E): one
+    track per channel with KEYSH/TEMPO/VOICE/VOL, N## notes with exact gate
+    times, TIE/EOT for notes over 99 clocks, and W## waits. Notes are
+    rounded to 24 clocks per beat; commands are never abbreviated with
+    running status, so the song is a bit larger than mid2agb's. An EOT stops
+    every voice on its key, so a tied note is cut short where its key is
+    struck again (and ties struck together on one key end together).
+
+    The output is a pure function of the notes and settings, checked byte
+    for byte against benchmarks/m4a_golden/ for the bundled MIDIs (python -m
+    benchmarks.check_m4a_golden). Returns (assembly, warnings).
+
+    label and settings.voicegroup must be valid symbols (see song_label and
+    symbol_name); ValueError otherwise, rather than assembly that won't build.
+    """
+    for sym in (label, f"voicegroup_{settings.voicegroup}"):
+        if not _SYMBOL_RE.fullmatch(sym):
+            raise ValueError(f"{sym!r} is not a valid assembler symbol")
+    notes, warnings = limit_export_channels(project.notes, drop_channels_over_9=drop_channels_over_9)
+    tpb = max(1, int(project.ticks_per_beat))
+    bpm = max(30, min(300, int(getattr(project, "tempo_bpm", 120))))
+
+    # Each channel's notes by start time, then pitch
+    order = np.lexsort((notes.pitch, notes.start_tick, notes.channel))
+    chans = notes.channel[order]
+    channels = sorted(set(chans.tolist())) or [0]
+
+    lines = [
+        '\t.include "MPlayDef.s"',
+        "",
+        f"\t.equ\t{label}_grp, voicegroup_{settings.voicegroup}",
+        f"\t.equ\t{label}_pri, {settings.priority}",
+        f"\t.equ\t{label}_rev, reverb_set+{settings.reverb}",
+        f"\t.equ\t{label}_mvl, {settings.volume}",
+        f"\t.equ\t{label}_key, 0",
+        f"\t.equ\t{label}_tbs, 1",
+        f"\t.equ\t{label}_exg, 1",
+        f"\t.equ\t{label}_cmp, 1",
+        "",
+        "\t.section .rodata",
+        f"\t.global\t{label}",
+        "\t.align\t2",
+    ]
+    for number, ch in enumerate(channels, start=1):
+        lo, hi = np.searchsorted(chans, [ch, ch + 1])
+        lines.extend(_track_lines(label, number, ch, notes, order[lo:hi], tpb, settings, bpm))
+
+    lines += [
+        "",
+        f"@{'*' * 54}@",
+        "\t.align\t2",
+        "",
+        f"{label}:",
+        f"\t.byte\t{len(channels)}\t@ NumTrks",
+        "\t.byte\t0\t@ NumBlks",
+        f"\t.byte\t{label}_pri\t@ Priority",
+        f"\t.byte\t{label}_rev\t@ Reverb.",
+        "",
+        f"\t.word\t{label}_grp",
+        "",
+    ]
+    lines += [f"\t.word\t{label}_{number}" for number in range(1, len(channels) + 1)]
+    lines += ["", "\t.end", ""]
+    return "\n".join(lines), warnings
+
+
+def main() -> None:
+    from midi_editor.midi_io import load_midi_as_notes
+
+    ap = argparse.ArgumentParser(description="Compile a MIDI file straight to pokeemerald m4a song assembly.")
+    ap.add_argument("midi", type=Path)
+    ap.add_argument("--label", default=None, help="Song symbol (default: mus_<file name>)")
+    ap.add_argument("--voicegroup", default="test", help="Voicegroup suffix, as in midi.cfg's -G_<name>")
+    ap.add_argument("--volume", type=int, default=127)
+    ap.add_argument("--reverb", type=int, default=0)
+    ap.add_argument("--priority", type=int, default=0)
+    ap.add_argument("--out", type=Path, default=None, help="Output .s (default: next to the MIDI)")
+    args = ap.parse_args()
+
+    project = load_midi_as_notes(args.midi)
+    settings = SongSettings(args.voicegroup, volume=args.volume, reverb=args.reverb, priority=args.priority)
+    try:
+        label = args.label or song_label(args.midi.stem)
+        text, warnings = compile_project_to_song(project, label, settings)
+    except ValueError as e:
+        ap.error(str(e))
+    out = args.out or args.midi.with_suffix(".s")
+    out.write_text(text, encoding="utf-8")
+    for w in warnings:
+        print(f"warning: {w}")
+    print(f"Wrote {out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,15 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict, List
+from functools import cached_property
+from typing import Callable, Dict, FrozenSet, Iterable, List, Mapping, Optional
+
+import numpy as np
+
+from midi_editor.channel_index import ChannelIndex
+from midi_editor.interval_index import IntervalIndex
+from midi_editor.note_grid import NoteGrid
+from midi_editor.note_store import NoteStore, NoteView
 
 
 @dataclass
@@ -17,10 +25,44 @@ class NoteEvent:
         return max(0, self.end_tick - self.start_tick)
 
 
+# NoteChange kinds
+NOTES_ADDED = "added"
+NOTES_REMOVED = "removed"
+NOTES_RECOLORED = "recolored"   # channel changed (swap / merge)
+PITCHES_CHANGED = "pitches"
+
+
+@dataclass(frozen=True)
+class NoteChange:
+    """
+    One in-place edit of a MidiProject's notes, sent to its listeners after the edit.
+
+    rows are store rows; for NOTES_REMOVED they are positions from before the
+    delete (everything after them has since moved down). start_tick/end_tick/
+    pitch/channel describe the affected notes (as they were, for removals),
+    old_pitch is set for PITCHES_CHANGED, old_channel for NOTES_RECOLORED, and
+    channels lists every channel touched.
+    """
+    kind: str
+    rows: np.ndarray
+    start_tick: np.ndarray
+    end_tick: np.ndarray
+    pitch: np.ndarray
+    channel: np.ndarray
+    channels: FrozenSet[int]
+    old_pitch: Optional[np.ndarray] = None
+    old_channel: Optional[np.ndarray] = None
+
+
+NoteListener = Callable[[NoteChange], None]
+
+
 @dataclass
 class MidiProject:
     ticks_per_beat: int
-    notes: List[NoteEvent]
+    # Columnar note storage. A List[NoteEvent] is accepted and converted in __post_init__;
+    # iterating yields NoteView objects with the same attributes as NoteEvent.
+    notes: NoteStore
     # channel -> directsound instrument id (not GM program)
     channel_instrument_id: Dict[int, int]
 
@@ -32,39 +74,263 @@ class MidiProject:
     
     muted_channels: set[int] = field(default_factory=set)
 
+    # channel -> note positions; maintained by the edit methods below.
+    # Built in __post_init__ unless a matching one is passed in (project files store it).
+    channel_index: Optional[ChannelIndex] = field(default=None, repr=False, compare=False)
+    # start-sorted time index; built on first time-range query, then kept up to date
+    interval_index: Optional[IntervalIndex] = field(default=None, repr=False, compare=False)
+    # (pitch, time bucket) grid for hit tests and pitch-bounded queries; built and kept up to date the same way
+    note_grid: Optional[NoteGrid] = field(default=None, repr=False, compare=False)
+    # called with a NoteChange after each note edit made through the methods below
+    listeners: List[NoteListener] = field(default_factory=list, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.notes, NoteStore):
+            self.notes = NoteStore.from_events(self.notes)
+        if self.channel_index is None or self.channel_index.total != len(self.notes):
+            self.rebuild_channel_index()
+
+    def rebuild_channel_index(self) -> None:
+        """Only needed after editing note channels on the store directly."""
+        self.channel_index = ChannelIndex.build(self.notes)
+
+    def subscribe(self, listener: NoteListener) -> None:
+        if listener not in self.listeners:
+            self.listeners.append(listener)
+
+    def unsubscribe(self, listener: NoteListener) -> None:
+        if listener in self.listeners:
+            self.listeners.remove(listener)
+
+    def _change(self, kind: str, rows: np.ndarray, channels: Iterable[int], **extra) -> Optional[NoteChange]:
+        """Describe an edit of rows (call before removing them). None when nobody listens."""
+        if not self.listeners:
+            return None
+        n = self.notes
+        return NoteChange(
+            kind=kind,
+            rows=rows,
+            start_tick=n.start_tick[rows].copy(),
+            end_tick=n.end_tick[rows].copy(),
+            pitch=n.pitch[rows].copy(),
+            channel=n.channel[rows].copy(),
+            channels=frozenset(int(c) for c in channels),
+            **extra,
+        )
+
+    def _emit(self, change: Optional[NoteChange]) -> None:
+        if change is None or not len(change.rows):
+            return
+        for listener in list(self.listeners):
+            listener(change)
+
+    def _index(self) -> ChannelIndex:
+        # Cheap guard against rows appended/deleted behind the project's back
+        if self.channel_index.total != len(self.notes):
+            self.rebuild_channel_index()
+        return self.channel_index
+
+    def _time_index(self) -> IntervalIndex:
+        if self.interval_index is None or self.interval_index.total != len(self.notes):
+            self.interval_index = IntervalIndex.build(self.notes)
+        return self.interval_index
+
+    def _grid(self) -> NoteGrid:
+        if self.note_grid is None or self.note_grid.total != len(self.notes):
+            self.note_grid = NoteGrid.build(self.notes)
+        return self.note_grid
+
+    def build_indexes(self) -> None:
+        """Build the lazily built channel/time/grid indexes now (e.g. on a loader thread) rather than on first query."""
+        self._index()
+        self._time_index()
+        self._grid()
+
+    def notes_overlapping(
+        self,
+        start_tick: int,
+        end_tick: int,
+        *,
+        channels: Optional[Iterable[int]] = None,
+        pitch_min: Optional[int] = None,
+        pitch_max: Optional[int] = None,
+    ) -> np.ndarray:
+        """
+        Row indices of notes overlapping [start_tick, end_tick), ordered by start,
+        optionally restricted to some channels and an inclusive pitch range.
+        A pitch range is answered from the note grid (only notes in the
+        touched pitch rows are looked at), otherwise from the time index.
+        """
+        if pitch_min is None and pitch_max is None:
+            rows = self._time_index().overlapping(start_tick, end_tick)
+        else:
+            rows = self.notes_in_rect(
+                start_tick, end_tick, 0 if pitch_min is None else pitch_min, 127 if pitch_max is None else pitch_max
+            )
+        if channels is not None:
+            rows = rows[np.isin(self.notes.channel[rows], list(channels))]
+        return rows
+
+    def notes_in_rect(self, start_tick: int, end_tick: int, pitch_min: int, pitch_max: int) -> np.ndarray:
+        """Row indices of notes overlapping [start_tick, end_tick) within [pitch_min, pitch_max], ordered by start."""
+        n = self.notes
+        rows = self._grid().candidates(start_tick, end_tick, pitch_min, pitch_max)
+        hit = (n.start_tick[rows] < end_tick) & (n.end_tick[rows] > start_tick)
+        hit &= (n.pitch[rows] >= pitch_min) & (n.pitch[rows] <= pitch_max)
+        rows = rows[hit]
+        # Same order as the time index: by start, then row (one int64 sort key)
+        return rows[np.argsort((n.start_tick[rows].astype(np.int64) << 32) | rows)]
+
+    def notes_at(self, tick: int, **filters) -> np.ndarray:
+        """Row indices of notes sounding at tick (same filters as notes_overlapping)."""
+        return self.notes_overlapping(tick, tick + 1, **filters)
+
     def used_channels(self) -> List[int]:
-        return sorted({n.channel for n in self.notes})
+        return self._index().channels()
+
+    def channel_rows(self, ch: int) -> np.ndarray:
+        """Sorted store rows of a channel's notes."""
+        return self._index().positions(ch)
+
+    def notes_for_channel(self, ch: int) -> List[NoteView]:
+        return self.notes.views(self._index().positions(ch))
+
+    def channel_note_counts(self) -> Dict[int, int]:
+        return self._index().counts()
+
+    def pitches_for_channel(self, ch: int) -> List[int]:
+        return np.unique(self.notes.pitch[self._index().positions(ch)]).tolist()
+
+    def add_note(
+        self,
+        start_tick: int,
+        end_tick: int,
+        pitch: int,
+        velocity: int,
+        channel: int,
+        track_index: int = 0,
+    ) -> int:
+        index = self._index()
+        row = self.notes.append(start_tick, end_tick, pitch, velocity, channel, track_index)
+        index.add(int(channel), row)
+        if self.interval_index is not None:
+            self.interval_index.insert(row, int(start_tick), int(end_tick))
+        if self.note_grid is not None:
+            self.note_grid.insert(row, int(start_tick), int(end_tick), int(pitch))
+        self._emit(self._change(NOTES_ADDED, np.array([row], dtype=np.intp), [channel]))
+        return row
+
+    def add_notes(self, notes: NoteStore) -> np.ndarray:
+        """
+        Append every note of `notes` as one edit (indexes updated in bulk, a
+        single NOTES_ADDED). Returns the new rows.
+        """
+        index = self._index()
+        first = len(self.notes)
+        self.notes.extend(notes)
+        rows = np.arange(first, len(self.notes), dtype=np.intp)
+        if not len(rows):
+            return rows
+        n = self.notes
+        index.add_rows(n.channel[rows], rows)
+        if self.interval_index is not None:
+            self.interval_index.insert_rows(rows, n.start_tick[rows], n.end_tick[rows])
+        if self.note_grid is not None:
+            self.note_grid.insert_rows(rows, n.start_tick[rows], n.end_tick[rows], n.pitch[rows])
+        self._emit(self._change(NOTES_ADDED, rows, np.unique(n.channel[rows]).tolist()))
+        return rows
+
+    def delete_notes(self, indices: Iterable[int]) -> int:
+        index = self._index()
+        rows = np.unique(np.fromiter((int(i) for i in indices), dtype=np.intp))
+        change = self._change(NOTES_REMOVED, rows, np.unique(self.notes.channel[rows]).tolist()) if len(rows) else None
+        removed = self.notes.delete(rows)
+        index.remove_rows(rows)
+        if self.interval_index is not None:
+            self.interval_index.remove_rows(rows)
+        if self.note_grid is not None:
+            self.note_grid.remove_rows(rows)
+        self._emit(change)
+        return removed
 
-    def notes_for_channel(self, ch: int) -> List[NoteEvent]:
-        return [n for n in self.notes if n.channel == ch]
+    def delete_pitches(self, ch: int, pitches: Iterable[int]) -> int:
+        """Delete every note on channel ch whose pitch is in pitches. Returns notes removed."""
+        pos = self._index().positions(ch)
+        values = np.fromiter((int(p) for p in pitches), dtype=np.int64)
+        return self.delete_notes(pos[np.isin(self.notes.pitch[pos], values)])
+
+    def remap_pitches(self, ch: int, mapping: Mapping[int, int]) -> int:
+        """Apply old_pitch -> new_pitch to notes on channel ch. Returns notes changed."""
+        if not mapping:
+            return 0
+        pos = self._index().positions(ch)
+        old = self.notes.pitch[pos]
+        new = old.copy()
+        for src, dst in mapping.items():
+            new[old == int(src)] = int(dst)
+        moved = new != old
+        changed = int(np.count_nonzero(moved))
+        if changed:
+            self.notes.writable("pitch")[pos] = new
+            if self.note_grid is not None:
+                moved_rows = pos[moved]
+                self.note_grid.move_rows(
+                    moved_rows, self.notes.start_tick[moved_rows], self.notes.end_tick[moved_rows], new[moved]
+                )
+            self._emit(self._change(PITCHES_CHANGED, pos[moved], [ch], old_pitch=old[moved]))
+        return changed
+
+    def snapshot(self, muted: Optional[Iterable[int]] = None) -> "ProjectSnapshot":
+        """
+        Immutable snapshot sharing note columns with the live project (copy-on-write).
+        muted defaults to project.muted_channels; those channels are filtered out
+        lazily, only when the snapshot's notes are first read.
+        """
+        return ProjectSnapshot(
+            ticks_per_beat=self.ticks_per_beat,
+            base_notes=self.notes.share(),
+            channel_instrument_id=dict(self.channel_instrument_id),
+            tempo_bpm=int(self.tempo_bpm),
+            channel_track_name=dict(self.channel_track_name),
+            muted_channels=frozenset(self.muted_channels if muted is None else muted),
+            channel_index=self._index().copy(),
+            interval_index=self.interval_index.copy() if self.interval_index is not None else None,
+            note_grid=self.note_grid.copy() if self.note_grid is not None else None,
+        )
 
     def delete_channel(self, ch: int) -> None:
-        self.notes = [n for n in self.notes if n.channel != ch]
         self.channel_instrument_id.pop(ch, None)
         self.channel_track_name.pop(ch, None)
+        self.delete_notes(self._index().positions(ch))
 
     def merge_channel_into(self, src: int, dst: int) -> None:
         if src == dst:
             return
-        for n in self.notes:
-            if n.channel == src:
-                n.channel = dst
+        index = self._index()
+        moved = index.positions(src)
+        self.notes.writable("channel")[moved] = dst
+        index.merge(src, dst)
         self.channel_instrument_id.pop(src, None)
 
         # carry label to dst if dst doesn't already have one
         if src in self.channel_track_name and dst not in self.channel_track_name:
             self.channel_track_name[dst] = self.channel_track_name[src]
         self.channel_track_name.pop(src, None)
+        self._emit(self._change(
+            NOTES_RECOLORED, moved, [src, dst], old_channel=np.full(len(moved), src, dtype=self.notes.channel.dtype)
+        ))
 
     def swap_channels(self, a: int, b: int) -> None:
         if a == b:
             return
 
-        for n in self.notes:
-            if n.channel == a:
-                n.channel = b
-            elif n.channel == b:
-                n.channel = a
+        index = self._index()
+        channel = self.notes.writable("channel")
+        pos_a = index.positions(a)
+        pos_b = index.positions(b)
+        channel[pos_a] = b
+        channel[pos_b] = a
+        index.swap(a, b)
 
         ida = self.channel_instrument_id.get(a)
         idb = self.channel_instrument_id.get(b)
@@ -88,3 +354,51 @@ class MidiProject:
             self.channel_track_name.pop(a, None)
         else:
             self.channel_track_name[a] = lb
+        old = np.concatenate([np.full(len(pos_a), a), np.full(len(pos_b), b)]).astype(channel.dtype)
+        self._emit(self._change(NOTES_RECOLORED, np.concatenate([pos_a, pos_b]), [a, b], old_channel=old))
+
+
+@dataclass(frozen=True)
+class ProjectSnapshot:
+    """
+    Read-only view of a MidiProject at one point in time (preview/export input,
+    undo history entry). Note columns are shared copy-on-write with the project
+    it came from, so taking one costs O(channels), not O(notes).
+    """
+    ticks_per_beat: int
+    base_notes: NoteStore
+    channel_instrument_id: Dict[int, int]
+    tempo_bpm: int
+    channel_track_name: Dict[int, str]
+    muted_channels: FrozenSet[int]
+    channel_index: ChannelIndex = field(repr=False, compare=False)
+    interval_index: Optional[IntervalIndex] = field(default=None, repr=False, compare=False)
+    note_grid: Optional[NoteGrid] = field(default=None, repr=False, compare=False)
+
+    @cached_property
+    def notes(self) -> NoteStore:
+        """base_notes minus muted channels; computed on first access, shared when nothing is muted."""
+        muted = [ch for ch in self.muted_channels if ch in self.channel_index]
+        if not muted:
+            return self.base_notes
+        keep = np.ones(len(self.base_notes), dtype=bool)
+        for ch in muted:
+            keep[self.channel_index.positions(ch)] = False
+        return self.base_notes.select(keep)
+
+    def used_channels(self) -> List[int]:
+        return [ch for ch in self.channel_index.channels() if ch not in self.muted_channels]
+
+    def restore(self) -> MidiProject:
+        """A new live project with this snapshot's state (still sharing unchanged columns)."""
+        return MidiProject(
+            ticks_per_beat=self.ticks_per_beat,
+            notes=self.base_notes.share(),
+            channel_instrument_id=dict(self.channel_instrument_id),
+            tempo_bpm=self.tempo_bpm,
+            channel_track_name=dict(self.channel_track_name),
+            muted_channels=set(self.muted_channels),
+            channel_index=self.channel_index.copy(),
+            interval_index=self.interval_index.copy() if self.interval_index is not None else None,
+            note_grid=self.note_grid.copy() if self.note_grid is not None else None,
+        )
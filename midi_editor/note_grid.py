@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+from typing import Optional
+
+import numpy as np
+
+from midi_editor.note_store import NoteStore
+
+# Cell key = pitch << _PITCH_SHIFT | time bucket (buckets never get near 2**40)
+_PITCH_SHIFT = 40
+_BUCKET_MASK = (1 << _PITCH_SHIFT) - 1
+# Notes covering more buckets than this are kept in a separate list and
+# checked directly, so one long pad can't fill hundreds of cells
+LONG_NOTE_BUCKETS = 16
+
+
+class NoteGrid:
+    """
+    Spatial hash over note rectangles in model coordinates: one cell per
+    (pitch, bucket_ticks-wide time bucket), each listing the notes that cover
+    it. Cells are stored as a key-sorted (key, row) list, so a point is one
+    binary search and a rect is one search pair per pitch row; either way
+    only notes in the touched cells are looked at.
+
+    bucket_ticks is picked from the song (about twice the median note
+    length) so most notes sit in one or two cells. Like IntervalIndex, edits
+    update the lists in place of a rebuild; channel changes don't touch it.
+    """
+
+    def __init__(
+        self, bucket_ticks: int, keys: np.ndarray, rows: np.ndarray, first: np.ndarray, long_rows: np.ndarray
+    ):
+        self.bucket_ticks = int(bucket_ticks)
+        self.keys = keys            # sorted cell keys
+        self.rows = rows            # store row per key
+        self.first = first          # True where the cell is the note's first one
+        self.long_rows = long_rows  # sorted rows too long for cells
+        self.total = 0
+
+    @classmethod
+    def build(cls, store: NoteStore, bucket_ticks: Optional[int] = None) -> "NoteGrid":
+        starts = store.start_tick.astype(np.int64)
+        ends = store.end_tick.astype(np.int64)
+        if bucket_ticks is None:
+            bucket_ticks = max(1, 2 * int(np.median(ends - starts))) if len(starts) else 1
+        grid = cls(bucket_ticks, np.zeros(0, np.int64), np.zeros(0, np.intp), np.zeros(0, bool), np.zeros(0, np.intp))
+        grid._add(np.arange(len(starts), dtype=np.intp), starts, ends, store.pitch)
+        grid.total = len(starts)
+        return grid
+
+    def copy(self) -> "NoteGrid":
+        # Arrays are replaced, never edited in place, so sharing them is safe
+        out = NoteGrid(self.bucket_ticks, self.keys, self.rows, self.first, self.long_rows)
+        out.total = self.total
+        return out
+
+    def _cells(self, starts: np.ndarray, ends: np.ndarray):
+        b0 = starts // self.bucket_ticks
+        b1 = np.maximum(b0, (ends - 1) // self.bucket_ticks)
+        return b0, b1
+
+    def _add(self, rows: np.ndarray, starts: np.ndarray, ends: np.ndarray, pitches: np.ndarray) -> None:
+        if not len(rows):
+            return
+        b0, b1 = self._cells(np.asarray(starts, np.int64), np.asarray(ends, np.int64))
+        span = b1 - b0 + 1
+        long = span > LONG_NOTE_BUCKETS
+        if long.any():
+            self.long_rows = np.union1d(self.long_rows, rows[long]).astype(np.intp)
+            rows, b0, span, pitches = rows[~long], b0[~long], span[~long], np.asarray(pitches)[~long]
+
+        # One entry per covered cell: repeat each note over its buckets
+        n = int(span.sum())
+        offset = np.arange(n) - np.repeat(np.cumsum(span) - span, span)
+        keys = (np.repeat(np.asarray(pitches, np.int64), span) << _PITCH_SHIFT) | (np.repeat(b0, span) + offset)
+        rows = np.repeat(rows, span)
+        first = offset == 0
+        order = np.argsort(keys, kind="stable")
+        keys, rows, first = keys[order], rows[order], first[order]
+        if not len(self.keys):
+            self.keys, self.rows, self.first = keys, rows, first
+            return
+        # Merge into the existing sorted lists in one O(n) pass
+        at = np.searchsorted(self.keys, keys, side="right")
+        self.keys = np.insert(self.keys, at, keys)
+        self.rows = np.insert(self.rows, at, rows)
+        self.first = np.insert(self.first, at, first)
+
+    def _drop(self, rows: np.ndarray) -> None:
+        keep = ~np.isin(self.rows, rows)
+        self.keys, self.rows, self.first = self.keys[keep], self.rows[keep], self.first[keep]
+        self.long_rows = np.setdiff1d(self.long_rows, rows).astype(np.intp)
+
+    # ---- queries ----
+
+    def candidates(self, start_tick: int, end_tick: int, pitch_min: int, pitch_max: int) -> np.ndarray:
+        """
+        Rows of the notes filed in cells covering [start_tick, end_tick) x
+        [pitch_min, pitch_max], each once, plus all long notes. Not filtered
+        any further: callers check the exact bounds.
+        """
+        if end_tick <= start_tick or pitch_max < pitch_min:
+            return np.zeros(0, dtype=np.intp)
+        ba = max(0, int(start_tick)) // self.bucket_ticks
+        bb = max(0, int(end_tick) - 1) // self.bucket_ticks
+        pitches = np.arange(max(0, pitch_min), min(127, pitch_max) + 1, dtype=np.int64) << _PITCH_SHIFT
+        lo = np.searchsorted(self.keys, pitches | ba, side="left")
+        hi = np.searchsorted(self.keys, pitches | bb, side="right")
+        counts = hi - lo
+        n = int(counts.sum())
+        if n:
+            # Concatenate the per-pitch slices without a Python loop
+            pos = np.repeat(lo - (np.cumsum(counts) - counts), counts) + np.arange(n)
+            # A note covering several of the cells counts in its first one, or the first queried
+            pos = pos[self.first[pos] | ((self.keys[pos] & _BUCKET_MASK) == ba)]
+            cand = self.rows[pos]
+        else:
+            cand = np.zeros(0, dtype=np.intp)
+        if len(self.long_rows):
+            cand = np.concatenate([cand, self.long_rows])
+        return cand
+
+    # ---- updates (mirroring MidiProject's edits) ----
+
+    def remove_rows(self, removed: np.ndarray) -> None:
+        """Drop deleted store rows (sorted, pre-delete positions) and renumber the rest."""
+        if not len(removed):
+            return
+        self._drop(removed)
+        self.rows = self.rows - np.searchsorted(removed, self.rows)
+        self.long_rows = self.long_rows - np.searchsorted(removed, self.long_rows)
+        self.total -= len(removed)
+
+    def insert(self, row: int, start: int, end: int, pitch: int) -> None:
+        """Add one appended store row."""
+        self._add(np.array([row], dtype=np.intp), np.array([start]), np.array([end]), np.array([pitch]))
+        self.total += 1
+
+    def insert_rows(self, rows: np.ndarray, starts: np.ndarray, ends: np.ndarray, pitches: np.ndarray) -> None:
+        """Add a block of appended store rows."""
+        self._add(np.asarray(rows, dtype=np.intp), starts, ends, pitches)
+        self.total += len(rows)
+
+    def move_rows(self, rows: np.ndarray, starts: np.ndarray, ends: np.ndarray, pitches: np.ndarray) -> None:
+        """Re-file notes whose pitch (or time) changed."""
+        if not len(rows):
+            return
+        self._drop(rows)
+        self._add(np.asarray(rows, np.intp), starts, ends, pitches)
@@ -0,0 +1,377 @@
+from __future__ import annotations
+
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Set, Union
+
+import numpy as np
+
+# Ticks need the full int32 range; everything else fits comfortably in int16
+# (pitch/velocity 0..127, channel 0..127 in the UI, track index < 32k).
+TICK_DTYPE = np.int32
+FIELD_DTYPE = np.int16
+
+# Column name -> dtype. Names match the NoteEvent attributes.
+COLUMNS: Dict[str, type] = {
+    "start_tick": TICK_DTYPE,
+    "end_tick": TICK_DTYPE,
+    "pitch": FIELD_DTYPE,
+    "velocity": FIELD_DTYPE,
+    "channel": FIELD_DTYPE,
+    "track_index": FIELD_DTYPE,
+}
+
+Selector = Union[np.ndarray, Iterable[int]]
+
+
+class NoteView:
+    """
+    Thin NoteEvent-compatible view onto one row of a NoteStore.
+
+    Reads and writes go straight to the backing arrays. A view is only valid
+    until notes are deleted from (or inserted into) its store, because rows
+    are compacted on delete.
+
+    Timing, pitch and channel are read-only: a project's channel, time and grid
+    indexes are keyed on them, so those edits go through MidiProject's methods.
+    """
+
+    __slots__ = ("_store", "index")
+
+    def __init__(self, store: "NoteStore", index: int):
+        self._store = store
+        self.index = index
+
+    @property
+    def store(self) -> "NoteStore":
+        return self._store
+
+    @property
+    def start_tick(self) -> int:
+        return int(self._store.start_tick[self.index])
+
+    @property
+    def end_tick(self) -> int:
+        return int(self._store.end_tick[self.index])
+
+    @property
+    def pitch(self) -> int:
+        return int(self._store.pitch[self.index])
+
+    @property
+    def velocity(self) -> int:
+        return int(self._store.velocity[self.index])
+
+    @velocity.setter
+    def velocity(self, value: int) -> None:
+        self._store.writable("velocity")[self.index] = int(value)
+
+    @property
+    def channel(self) -> int:
+        return int(self._store.channel[self.index])
+
+    @property
+    def track_index(self) -> int:
+        return int(self._store.track_index[self.index])
+
+    @track_index.setter
+    def track_index(self, value: int) -> None:
+        self._store.writable("track_index")[self.index] = int(value)
+
+    def duration(self) -> int:
+        return max(0, self.end_tick - self.start_tick)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, NoteView):
+            return NotImplemented
+        return self._store is other._store and self.index == other.index
+
+    def __hash__(self) -> int:
+        return hash((id(self._store), self.index))
+
+    def __repr__(self) -> str:
+        return (
+            f"NoteView(index={self.index}, start_tick={self.start_tick}, end_tick={self.end_tick}, "
+            f"pitch={self.pitch}, velocity={self.velocity}, channel={self.channel}, "
+            f"track_index={self.track_index})"
+        )
+
+
+class NoteStore:
+    """
+    Struct-of-arrays note storage: one numpy column per NoteEvent field.
+
+    A note costs 16 bytes here instead of a full dataclass instance, and bulk
+    operations (channel relabel, delete, mute filtering, stats) are vectorized
+    masks over the columns. Iterating or indexing yields NoteView objects so
+    code written against List[NoteEvent] keeps working.
+
+    share() gives a copy-on-write clone: shared columns are read-only, and
+    in-place edits go through writable(), which copies only that column.
+    """
+
+    def __init__(self, capacity: int = 0):
+        cap = max(0, int(capacity))
+        self._cols: Dict[str, np.ndarray] = {
+            name: np.zeros(cap, dtype=dt) for name, dt in COLUMNS.items()
+        }
+        self._size = 0
+        # columns whose array is also referenced by another store (read-only until copied)
+        self._shared: Set[str] = set()
+
+    # ---- construction ----
+
+    @classmethod
+    def from_arrays(
+        cls,
+        start_tick: Iterable[int],
+        end_tick: Iterable[int],
+        pitch: Iterable[int],
+        velocity: Iterable[int],
+        channel: Iterable[int],
+        track_index: Optional[Iterable[int]] = None,
+    ) -> "NoteStore":
+        cols = {
+            "start_tick": np.asarray(start_tick, dtype=TICK_DTYPE),
+            "end_tick": np.asarray(end_tick, dtype=TICK_DTYPE),
+            "pitch": np.asarray(pitch, dtype=FIELD_DTYPE),
+            "velocity": np.asarray(velocity, dtype=FIELD_DTYPE),
+            "channel": np.asarray(channel, dtype=FIELD_DTYPE),
+        }
+        n = len(cols["start_tick"])
+        if track_index is None:
+            cols["track_index"] = np.zeros(n, dtype=FIELD_DTYPE)
+        else:
+            cols["track_index"] = np.asarray(track_index, dtype=FIELD_DTYPE)
+
+        for name, arr in cols.items():
+            if arr.ndim != 1 or len(arr) != n:
+                raise ValueError(f"Column {name!r} must be 1-D with {n} entries")
+
+        store = cls()
+        store._cols = {name: np.ascontiguousarray(cols[name]) for name in COLUMNS}
+        store._size = n
+        # read-only inputs (e.g. another store's shared columns) are copied on first write
+        store._shared = {name for name, arr in store._cols.items() if not arr.flags.writeable}
+        return store
+
+    @classmethod
+    def from_events(cls, notes: Iterable[object]) -> "NoteStore":
+        """Build a store from NoteEvent-like objects (anything with the six attributes)."""
+        if isinstance(notes, NoteStore):
+            return notes.copy()
+        rows = [
+            (
+                int(n.start_tick),
+                int(n.end_tick),
+                int(n.pitch),
+                int(n.velocity),
+                int(n.channel),
+                int(getattr(n, "track_index", 0)),
+            )
+            for n in notes
+        ]
+        if not rows:
+            return cls()
+        s, e, p, v, c, t = zip(*rows)
+        return cls.from_arrays(s, e, p, v, c, t)
+
+    def copy(self) -> "NoteStore":
+        out = NoteStore()
+        out._cols = {name: arr[: self._size].copy() for name, arr in self._cols.items()}
+        out._size = self._size
+        return out
+
+    def share(self) -> "NoteStore":
+        """
+        O(1) copy-on-write clone. Both stores keep the same column arrays,
+        marked read-only; whichever store edits a column first copies just
+        that column (see writable()).
+        """
+        out = NoteStore()
+        for name, arr in self._cols.items():
+            arr.flags.writeable = False
+            out._cols[name] = arr[: self._size]
+        out._size = self._size
+        self._shared = set(COLUMNS)
+        out._shared = set(COLUMNS)
+        return out
+
+    def writable(self, name: str) -> np.ndarray:
+        """Column `name` ready for in-place edits, un-sharing it first if needed."""
+        if name in self._shared:
+            self._cols[name] = self._cols[name][: self._size].copy()
+            self._shared.discard(name)
+        return self._cols[name][: self._size]
+
+    # ---- columns ----
+
+    @property
+    def start_tick(self) -> np.ndarray:
+        return self._cols["start_tick"][: self._size]
+
+    @property
+    def end_tick(self) -> np.ndarray:
+        return self._cols["end_tick"][: self._size]
+
+    @property
+    def pitch(self) -> np.ndarray:
+        return self._cols["pitch"][: self._size]
+
+    @property
+    def velocity(self) -> np.ndarray:
+        return self._cols["velocity"][: self._size]
+
+    @property
+    def channel(self) -> np.ndarray:
+        return self._cols["channel"][: self._size]
+
+    @property
+    def track_index(self) -> np.ndarray:
+        return self._cols["track_index"][: self._size]
+
+    @property
+    def nbytes(self) -> int:
+        return sum(arr[: self._size].nbytes for arr in self._cols.values())
+
+    # ---- sequence protocol (NoteEvent compatibility) ----
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __bool__(self) -> bool:
+        return self._size > 0
+
+    def __iter__(self) -> Iterator[NoteView]:
+        for i in range(self._size):
+            yield NoteView(self, i)
+
+    def __getitem__(self, i: int) -> NoteView:
+        i = int(i)
+        if i < 0:
+            i += self._size
+        if not 0 <= i < self._size:
+            raise IndexError("note index out of range")
+        return NoteView(self, i)
+
+    def views(self, indices: Iterable[int]) -> List[NoteView]:
+        return [NoteView(self, int(i)) for i in indices]
+
+    def rows(self) -> Iterator[tuple]:
+        """Yield plain (start, end, pitch, velocity, channel, track) tuples; fastest way to walk every note."""
+        return zip(*(self._cols[name][: self._size].tolist() for name in COLUMNS))
+
+    # ---- mutation ----
+
+    def _reserve(self, needed: int) -> None:
+        cap = len(self._cols["start_tick"])
+        if needed <= cap and not self._shared:
+            return
+        new_cap = max(needed, cap * 2, 64)
+        for name, arr in self._cols.items():
+            grown = np.zeros(new_cap, dtype=arr.dtype)
+            grown[: self._size] = arr[: self._size]
+            self._cols[name] = grown
+        self._shared.clear()
+
+    def append(
+        self,
+        start_tick: int,
+        end_tick: int,
+        pitch: int,
+        velocity: int,
+        channel: int,
+        track_index: int = 0,
+    ) -> int:
+        """Append one note (amortized O(1)) and return its row index."""
+        self._reserve(self._size + 1)
+        i = self._size
+        self._cols["start_tick"][i] = start_tick
+        self._cols["end_tick"][i] = end_tick
+        self._cols["pitch"][i] = pitch
+        self._cols["velocity"][i] = velocity
+        self._cols["channel"][i] = channel
+        self._cols["track_index"][i] = track_index
+        self._size += 1
+        return i
+
+    def extend(self, other: "NoteStore") -> None:
+        n = len(other)
+        if not n:
+            return
+        self._reserve(self._size + n)
+        for name in COLUMNS:
+            self._cols[name][self._size : self._size + n] = other._cols[name][:n]
+        self._size += n
+
+    def _as_mask(self, selector: Selector) -> np.ndarray:
+        sel = np.asarray(selector if isinstance(selector, np.ndarray) else list(selector))
+        if sel.dtype == bool:
+            if len(sel) != self._size:
+                raise ValueError("mask length does not match note count")
+            return sel
+        mask = np.zeros(self._size, dtype=bool)
+        if len(sel):
+            mask[sel.astype(np.intp)] = True
+        return mask
+
+    def delete(self, selector: Selector) -> int:
+        """Delete rows by boolean mask or index list. Returns the number removed."""
+        mask = self._as_mask(selector)
+        removed = int(np.count_nonzero(mask))
+        if not removed:
+            return 0
+        keep = ~mask
+        for name, arr in self._cols.items():
+            self._cols[name] = arr[: self._size][keep]
+        self._size -= removed
+        self._shared.clear()
+        return removed
+
+    def select(self, selector: Selector) -> "NoteStore":
+        """Return a new store holding copies of the selected rows (mask or indices)."""
+        mask = self._as_mask(selector)
+        out = NoteStore()
+        out._cols = {name: arr[: self._size][mask] for name, arr in self._cols.items()}
+        out._size = int(np.count_nonzero(mask))
+        return out
+
+    def remap_pitches(self, mapping: Mapping[int, int], mask: Optional[np.ndarray] = None) -> int:
+        """Apply old_pitch -> new_pitch (optionally only where mask is set). Returns notes changed."""
+        if not mapping or not self._size:
+            return 0
+        lut = np.arange(128, dtype=FIELD_DTYPE)
+        for src, dst in mapping.items():
+            if 0 <= int(src) < 128:
+                lut[int(src)] = int(dst)
+        pitch = self.pitch
+        sel = (pitch >= 0) & (pitch < 128)
+        if mask is not None:
+            sel &= mask
+        new = pitch.copy()
+        new[sel] = lut[pitch[sel]]
+        changed = int(np.count_nonzero(new != pitch))
+        if changed:
+            self.writable("pitch")[:] = new
+        return changed
+
+    # ---- queries / statistics ----
+
+    def channel_mask(self, ch: int) -> np.ndarray:
+        return self.channel == int(ch)
+
+    def used_channels(self) -> List[int]:
+        return np.unique(self.channel).tolist()
+
+    def channel_counts(self) -> Dict[int, int]:
+        if not self._size:
+            return {}
+        counts = np.bincount(self.channel.astype(np.intp))
+        return {int(ch): int(c) for ch, c in enumerate(counts) if c}
+
+    def pitches_in(self, mask: np.ndarray) -> List[int]:
+        return np.unique(self.pitch[mask]).tolist()
+
+    def max_end_tick(self) -> int:
+        return int(self.end_tick.max()) if self._size else 0
+
+    def __repr__(self) -> str:
+        return f"NoteStore(notes={self._size}, nbytes={self.nbytes})"
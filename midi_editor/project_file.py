@@ -0,0 +1,156 @@
+"""
+Native project file (.mproj): a small header + JSON metadata + raw note columns.
+
+Layout (all little-endian):
+  0   8s  magic  b"MIDPROJ\\0"
+  8   I   format version
+  12  I   metadata length in bytes
+  16  Q   offset of the first column (64-byte aligned)
+  24  ... metadata JSON (utf-8): project fields + column table
+  ... columns, each 64-byte aligned, in the order listed in metadata["columns"]
+
+Columns are the NoteStore arrays plus the channel index order, so reopening
+memory-maps the file copy-on-write and wraps the columns without copying or
+re-sorting anything until the notes are edited.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import struct
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from midi_editor.channel_index import ChannelIndex
+from midi_editor.models import MidiProject
+from midi_editor.note_store import COLUMNS, NoteStore
+
+PROJECT_SUFFIX = ".mproj"
+MAGIC = b"MIDPROJ\0"
+VERSION = 1
+
+_HEADER = struct.Struct("<8sIIQ")
+_ALIGN = 64
+
+# file column name -> little-endian dtype
+_FILE_DTYPES: Dict[str, str] = {
+    name: np.dtype(dt).newbyteorder("<").str for name, dt in COLUMNS.items()
+}
+_FILE_DTYPES["channel_order"] = "<i8"
+
+
+def _align(n: int) -> int:
+    return (n + _ALIGN - 1) // _ALIGN * _ALIGN
+
+
+def save_project_file(project: MidiProject, path: Path, *, source_midi: Optional[Path] = None) -> None:
+    """Write the project atomically (temp file + rename)."""
+    store = project.notes
+    order, chans, starts = project.channel_index.sorted_order()
+
+    arrays: Dict[str, np.ndarray] = {name: getattr(store, name) for name in COLUMNS}
+    arrays["channel_order"] = order
+
+    meta: Dict[str, Any] = {
+        "ticks_per_beat": int(project.ticks_per_beat),
+        "tempo_bpm": int(project.tempo_bpm),
+        "channel_instrument_id": {str(k): int(v) for k, v in project.channel_instrument_id.items()},
+        "channel_track_name": {str(k): str(v) for k, v in project.channel_track_name.items()},
+        "muted_channels": sorted(int(c) for c in project.muted_channels),
+        "source_midi": str(source_midi) if source_midi else None,
+        "note_count": len(store),
+        "channel_index": {"channels": [int(c) for c in chans], "starts": [int(s) for s in starts]},
+        "columns": [],
+    }
+
+    # Column offsets depend on the metadata size, which depends on the offsets:
+    # lay out relative offsets first, then shift by the aligned data start.
+    rel = 0
+    for name, arr in arrays.items():
+        meta["columns"].append({"name": name, "dtype": _FILE_DTYPES[name], "offset": rel})
+        rel = _align(rel + len(arr) * np.dtype(_FILE_DTYPES[name]).itemsize)
+
+    meta_bytes = json.dumps(meta, separators=(",", ":")).encode("utf-8")
+    data_offset = _align(_HEADER.size + len(meta_bytes))
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, len(meta_bytes), data_offset))
+        f.write(meta_bytes)
+        for col, (name, arr) in zip(meta["columns"], arrays.items()):
+            f.seek(data_offset + col["offset"])
+            f.write(np.ascontiguousarray(arr, dtype=_FILE_DTYPES[name]).tobytes())
+    os.replace(tmp, path)
+
+
+def read_project_meta(path: Path) -> Dict[str, Any]:
+    with open(path, "rb") as f:
+        header = f.read(_HEADER.size)
+        if len(header) < _HEADER.size:
+            raise ValueError(f"Not a project file (too short): {path}")
+        magic, version, meta_len, data_offset = _HEADER.unpack(header)
+        if magic != MAGIC:
+            raise ValueError(f"Not a project file (bad magic): {path}")
+        if version > VERSION:
+            raise ValueError(f"Project file version {version} is newer than supported ({VERSION}): {path}")
+        meta = json.loads(f.read(meta_len).decode("utf-8"))
+    meta["_data_offset"] = data_offset
+    return meta
+
+
+def load_project_file(path: Path) -> MidiProject:
+    """
+    Reopen a .mproj. Note columns are copy-on-write views of a memory map:
+    nothing is read until touched, and edits never write back to the file.
+    """
+    path = Path(path)
+    meta = read_project_meta(path)
+    n = int(meta["note_count"])
+    data_offset = int(meta["_data_offset"])
+
+    if n:
+        raw = np.memmap(path, dtype=np.uint8, mode="c")
+    cols: Dict[str, np.ndarray] = {}
+    for col in meta["columns"]:
+        dt = np.dtype(col["dtype"])
+        if not n:
+            cols[col["name"]] = np.zeros(0, dtype=dt)
+            continue
+        lo = data_offset + int(col["offset"])
+        arr = raw[lo : lo + n * dt.itemsize].view(dt)
+        if not dt.isnative:
+            arr = arr.astype(dt.newbyteorder("="))
+        cols[col["name"]] = arr
+
+    missing = [name for name in COLUMNS if name not in cols]
+    if missing:
+        raise ValueError(f"Project file is missing note columns {missing}: {path}")
+
+    notes = NoteStore.from_arrays(*(cols[name] for name in COLUMNS))
+
+    index: Optional[ChannelIndex] = None
+    ci = meta.get("channel_index")
+    if ci is not None and "channel_order" in cols:
+        index = ChannelIndex.from_order(
+            cols["channel_order"].astype(np.intp, copy=False), ci["channels"], ci["starts"]
+        )
+
+    return MidiProject(
+        ticks_per_beat=int(meta["ticks_per_beat"]),
+        notes=notes,
+        channel_instrument_id={int(k): int(v) for k, v in meta.get("channel_instrument_id", {}).items()},
+        tempo_bpm=int(meta.get("tempo_bpm", 120)),
+        channel_track_name={int(k): str(v) for k, v in meta.get("channel_track_name", {}).items()},
+        muted_channels=set(int(c) for c in meta.get("muted_channels", [])),
+        channel_index=index,
+    )
+
+
+def project_source_midi(path: Path) -> Optional[Path]:
+    src = read_project_meta(path).get("source_midi")
+    return Path(src) if src else None
@@ -0,0 +1,391 @@
+from __future__ import annotations
+
+import mmap
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+from midi_editor.note_store import FIELD_DTYPE, TICK_DTYPE, NoteStore
+
+Buffer = Union[bytes, bytearray, memoryview, mmap.mmap]
+
+# Data byte counts for system common / realtime status bytes (0xF1..0xFE).
+# 0xF4/0xF5 are undefined and rejected, like mido does.
+_SYSTEM_DATA_LEN: Dict[int, int] = {
+    0xF1: 1, 0xF2: 2, 0xF3: 1, 0xF6: 0,
+    0xF8: 0, 0xF9: 0, 0xFA: 0, 0xFB: 0, 0xFC: 0, 0xFD: 0, 0xFE: 0,
+}
+
+META_TRACK_NAME = 0x03
+META_SET_TEMPO = 0x51
+
+# Below these, process-pool startup and result transfer cost more than the decode itself.
+PARALLEL_MIN_TRACKS = 4
+PARALLEL_MIN_BYTES = 256 * 1024
+
+
+@dataclass
+class TrackNotes:
+    """
+    Everything load_midi_as_notes needs from one MTrk chunk, gathered in a single pass.
+    Note columns are compact numpy arrays in note-off order (stuck notes last).
+    """
+    track_index: int
+    start_tick: np.ndarray
+    end_tick: np.ndarray
+    pitch: np.ndarray
+    velocity: np.ndarray
+    channel: np.ndarray
+    tempo: Optional[int] = None          # first set_tempo in this track (microseconds per beat)
+    name: Optional[str] = None           # first non-empty track_name
+    channels: List[int] = field(default_factory=list)  # channels with any channel message
+
+
+@dataclass
+class SmfContents:
+    ticks_per_beat: int
+    tempo_bpm: int
+    channel_track_name: Dict[int, str]
+    notes: NoteStore
+
+
+def read_header(buf: Buffer) -> Tuple[int, int, int]:
+    """Return (format, ntracks, ticks_per_beat) from the MThd chunk."""
+    if len(buf) < 14 or bytes(buf[0:4]) != b"MThd":
+        raise ValueError("MThd not found. Probably not a MIDI file")
+    size = int.from_bytes(buf[4:8], "big")
+    if size < 6:
+        raise ValueError("MThd chunk too short")
+    fmt = int.from_bytes(buf[8:10], "big", signed=True)
+    ntracks = int.from_bytes(buf[10:12], "big", signed=True)
+    division = int.from_bytes(buf[12:14], "big", signed=True)
+    return fmt, ntracks, division
+
+
+def track_chunks(buf: Buffer) -> List[Tuple[int, int]]:
+    """
+    Return (start, end) byte offsets of each MTrk payload, in file order.
+    Unknown chunk types are skipped, as the SMF spec asks.
+    """
+    pos = 8 + int.from_bytes(buf[4:8], "big")
+    total = len(buf)
+    out: List[Tuple[int, int]] = []
+    while pos + 8 <= total:
+        name = bytes(buf[pos : pos + 4])
+        size = int.from_bytes(buf[pos + 4 : pos + 8], "big")
+        start = pos + 8
+        end = start + size
+        if end > total:
+            raise ValueError(f"Truncated {name!r} chunk at byte {pos}")
+        if name == b"MTrk":
+            out.append((start, end))
+        pos = end
+    return out
+
+
+def decode_track(buf: Buffer, start: int, end: int, track_index: int = 0) -> TrackNotes:
+    """
+    Decode one MTrk payload buf[start:end] in a single pass.
+
+    VLQ deltas and running status are decoded inline; note_on/note_off are
+    paired FIFO per (channel, pitch) exactly like the old mido-based loader
+    (zero-length notes dropped, stuck notes closed at end of track).
+    Running status follows mido: meta events don't set it, sysex does.
+    """
+    starts: List[int] = []
+    ends: List[int] = []
+    pitches: List[int] = []
+    vels: List[int] = []
+    chans: List[int] = []
+
+    # active[(ch << 7) | pitch] = [(start_tick, velocity), ...]; dict order = first seen
+    active: Dict[int, List[Tuple[int, int]]] = {}
+    channel_bits = 0
+    tempo: Optional[int] = None
+    name: Optional[str] = None
+
+    pos = start
+    tick = 0
+    status = 0
+
+    try:
+        while pos < end:
+            b = buf[pos]
+            pos += 1
+            delta = b & 0x7F
+            while b & 0x80:
+                b = buf[pos]
+                pos += 1
+                delta = (delta << 7) | (b & 0x7F)
+            tick += delta
+
+            b = buf[pos]
+            pos += 1
+            if b & 0x80:
+                st = b
+                if st != 0xFF:
+                    status = st
+                peek = -1
+            else:
+                if not status:
+                    raise ValueError(f"Running status without last status in track {track_index}")
+                st = status
+                peek = b
+
+            if st < 0xF0:
+                kind = st & 0xF0
+                ch = st & 0x0F
+                channel_bits |= 1 << ch
+                if peek < 0:
+                    d1 = buf[pos]
+                    pos += 1
+                else:
+                    d1 = peek
+                if kind == 0xC0 or kind == 0xD0:
+                    continue
+                d2 = buf[pos]
+                pos += 1
+                if kind == 0x90 and d2 > 0:
+                    key = (ch << 7) | d1
+                    stack = active.get(key)
+                    if stack is None:
+                        active[key] = [(tick, d2)]
+                    else:
+                        stack.append((tick, d2))
+                elif kind == 0x80 or kind == 0x90:
+                    stack = active.get((ch << 7) | d1)
+                    if stack:
+                        s_tick, vel = stack.pop(0)
+                        if tick > s_tick:
+                            starts.append(s_tick)
+                            ends.append(tick)
+                            pitches.append(d1)
+                            vels.append(vel)
+                            chans.append(ch)
+                continue
+
+            if st == 0xFF:
+                mtype = buf[pos]
+                pos += 1
+                b = buf[pos]
+                pos += 1
+                length = b & 0x7F
+                while b & 0x80:
+                    b = buf[pos]
+                    pos += 1
+                    length = (length << 7) | (b & 0x7F)
+                if mtype == META_SET_TEMPO and tempo is None and length >= 3:
+                    tempo = (buf[pos] << 16) | (buf[pos + 1] << 8) | buf[pos + 2]
+                elif mtype == META_TRACK_NAME and name is None:
+                    cleaned = bytes(buf[pos : pos + length]).decode("latin-1").strip()
+                    name = cleaned or None
+                pos += length
+            elif st == 0xF0 or st == 0xF7:
+                b = buf[pos]
+                pos += 1
+                length = b & 0x7F
+                while b & 0x80:
+                    b = buf[pos]
+                    pos += 1
+                    length = (length << 7) | (b & 0x7F)
+                pos += length
+            else:
+                n_data = _SYSTEM_DATA_LEN.get(st)
+                if n_data is None:
+                    raise ValueError(f"Undefined status byte 0x{st:02x} in track {track_index}")
+                pos += n_data - (1 if peek >= 0 else 0)
+    except IndexError:
+        raise ValueError(f"Truncated MIDI track {track_index}") from None
+
+    if pos > end:
+        raise ValueError(f"MIDI track {track_index} overruns its chunk")
+
+    # Close any stuck notes at end of track
+    for key, stack in active.items():
+        for s_tick, vel in stack:
+            starts.append(s_tick)
+            ends.append(max(s_tick + 1, tick))
+            pitches.append(key & 0x7F)
+            vels.append(vel)
+            chans.append(key >> 7)
+
+    return TrackNotes(
+        track_index=track_index,
+        start_tick=np.array(starts, dtype=TICK_DTYPE),
+        end_tick=np.array(ends, dtype=TICK_DTYPE),
+        pitch=np.array(pitches, dtype=FIELD_DTYPE),
+        velocity=np.array(vels, dtype=FIELD_DTYPE),
+        channel=np.array(chans, dtype=FIELD_DTYPE),
+        tempo=tempo,
+        name=name,
+        channels=[ch for ch in range(16) if channel_bits >> ch & 1],
+    )
+
+
+def tempo_to_bpm(tempo: Optional[int]) -> int:
+    """Microseconds per beat -> BPM clamped 30..300. Defaults to 120."""
+    if not tempo:
+        return 120
+    bpm = int(round(60_000_000 / tempo))
+    return max(30, min(300, bpm))
+
+
+def merge_tracks(ticks_per_beat: int, tracks: List[TrackNotes]) -> SmfContents:
+    """Combine per-track decodes (in track order) into notes, tempo and channel labels."""
+    tracks = sorted(tracks, key=lambda t: t.track_index)
+
+    tempo = next((t.tempo for t in tracks if t.tempo is not None), None)
+
+    # First track name wins per channel
+    names: Dict[int, str] = {}
+    for t in tracks:
+        if t.name:
+            for ch in t.channels:
+                names.setdefault(ch, t.name)
+
+    if tracks:
+        notes = NoteStore.from_arrays(
+            np.concatenate([t.start_tick for t in tracks]),
+            np.concatenate([t.end_tick for t in tracks]),
+            np.concatenate([t.pitch for t in tracks]),
+            np.concatenate([t.velocity for t in tracks]),
+            np.concatenate([t.channel for t in tracks]),
+            np.concatenate([np.full(len(t.start_tick), t.track_index, dtype=FIELD_DTYPE) for t in tracks]),
+        )
+    else:
+        notes = NoteStore()
+
+    return SmfContents(
+        ticks_per_beat=ticks_per_beat,
+        tempo_bpm=tempo_to_bpm(tempo),
+        channel_track_name=names,
+        notes=notes,
+    )
+
+
+def read_smf(midi_path: Path) -> SmfContents:
+    """Memory-map a .mid and decode every track without building per-event objects."""
+    with open(midi_path, "rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            raise ValueError(f"Not a valid MIDI file (empty): {midi_path}") from None
+    with mm:
+        _fmt, _ntracks, ticks_per_beat = read_header(mm)
+        tracks = [
+            decode_track(mm, start, end, t_idx)
+            for t_idx, (start, end) in enumerate(track_chunks(mm))
+        ]
+    return merge_tracks(ticks_per_beat, tracks)
+
+
+def _decode_track_from_file(path: str, start: int, end: int, track_index: int) -> TrackNotes:
+    # Runs in a worker process: re-map the file instead of pickling chunk bytes over.
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return decode_track(mm, start, end, track_index)
+
+
+def _scan_file(midi_path: Path) -> Tuple[int, List[Tuple[int, int]], int]:
+    """Return (ticks_per_beat, track chunk offsets, file size) without decoding events."""
+    with open(midi_path, "rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            raise ValueError(f"Not a valid MIDI file (empty): {midi_path}") from None
+    with mm:
+        _fmt, _ntracks, ticks_per_beat = read_header(mm)
+        return ticks_per_beat, track_chunks(mm), len(mm)
+
+
+def read_smf_many(
+    midi_paths: Iterable[Path],
+    *,
+    executor: Optional[Executor] = None,
+    max_workers: Optional[int] = None,
+) -> List[SmfContents]:
+    """
+    Decode many .mid files with every MTrk chunk of every file fanned out to a
+    process pool. Workers return TrackNotes (numpy columns, cheap to pickle) and
+    the parent merges them per file in track order.
+    """
+    paths = [Path(p) for p in midi_paths]
+    scans = [_scan_file(p) for p in paths]
+
+    own_pool = executor is None
+    if own_pool:
+        executor = ProcessPoolExecutor(max_workers=max_workers or os.cpu_count() or 1)
+    try:
+        # Largest chunks first so one long track doesn't end up queued last
+        jobs = [
+            (end - start, f_idx, t_idx, start, end)
+            for f_idx, (_tpb, chunks, _size) in enumerate(scans)
+            for t_idx, (start, end) in enumerate(chunks)
+        ]
+        jobs.sort(reverse=True)
+        futures = [
+            (f_idx, executor.submit(_decode_track_from_file, str(paths[f_idx]), start, end, t_idx))
+            for _size, f_idx, t_idx, start, end in jobs
+        ]
+        per_file: List[List[TrackNotes]] = [[] for _ in paths]
+        for f_idx, fut in futures:
+            per_file[f_idx].append(fut.result())
+    finally:
+        if own_pool:
+            executor.shutdown()
+
+    return [merge_tracks(scans[i][0], per_file[i]) for i in range(len(paths))]
+
+
+def read_smf_parallel(
+    midi_path: Path,
+    *,
+    executor: Optional[Executor] = None,
+    max_workers: Optional[int] = None,
+) -> SmfContents:
+    """
+    Like read_smf, but decodes tracks on a process pool when the file is big
+    enough to benefit (PARALLEL_MIN_TRACKS / PARALLEL_MIN_BYTES); small files
+    fall back to the serial path.
+    """
+    _tpb, chunks, size = _scan_file(Path(midi_path))
+    if len(chunks) < PARALLEL_MIN_TRACKS or size < PARALLEL_MIN_BYTES:
+        return read_smf(midi_path)
+    return read_smf_many([midi_path], executor=executor, max_workers=max_workers)[0]
+
+
+def iter_smf_tracks(
+    midi_path: Path,
+    *,
+    executor: Optional[Executor] = None,
+) -> Iterator[Tuple[int, int, TrackNotes]]:
+    """
+    Decode a .mid a track at a time, yielding (ticks_per_beat, track count,
+    TrackNotes) as each MTrk chunk finishes, for callers that want to show
+    progress or stop early. merge_tracks() over everything yielded so far
+    gives the file as decoded up to that point.
+
+    With an executor (and a file big enough, see read_smf_parallel) tracks
+    are decoded on it and yielded in completion order; closing the generator
+    cancels the ones not started yet.
+    """
+    ticks_per_beat, chunks, size = _scan_file(Path(midi_path))
+    total = len(chunks)
+    if executor is None or total < PARALLEL_MIN_TRACKS or size < PARALLEL_MIN_BYTES:
+        with open(midi_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for t_idx, (start, end) in enumerate(chunks):
+                yield ticks_per_beat, total, decode_track(mm, start, end, t_idx)
+        return
+
+    # Largest chunks first, as in read_smf_many
+    jobs = sorted(((end - start, t_idx, start, end) for t_idx, (start, end) in enumerate(chunks)), reverse=True)
+    futures = [executor.submit(_decode_track_from_file, str(midi_path), start, end, t_idx) for _n, t_idx, start, end in jobs]
+    try:
+        for fut in as_completed(futures):
+            yield ticks_per_beat, total, fut.result()
+    finally:
+        for fut in futures:
+            fut.cancel()
@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import struct
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from midi_editor.note_store import NoteStore
+
+STATUS_NOTE_OFF = 0x80
+STATUS_NOTE_ON = 0x90
+STATUS_PROGRAM_CHANGE = 0xC0
+
+END_OF_TRACK = b"\x00\xff\x2f\x00"
+
+
+def bpm_to_tempo(bpm: int) -> int:
+    """BPM -> microseconds per beat (same rounding as mido.bpm2tempo)."""
+    return int(round(60_000_000 / bpm))
+
+
+def encode_vlq(value: int) -> bytes:
+    value = int(value)
+    if value < 0:
+        raise ValueError("VLQ values must be non-negative")
+    out = [value & 0x7F]
+    value >>= 7
+    while value:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    return bytes(reversed(out))
+
+
+def tempo_event(tempo: int, delta: int = 0) -> bytes:
+    return encode_vlq(delta) + b"\xff\x51\x03" + int(tempo).to_bytes(3, "big")
+
+
+def _check_range(name: str, arr: np.ndarray, lo: int, hi: int) -> None:
+    if len(arr) and (int(arr.min()) < lo or int(arr.max()) > hi):
+        raise ValueError(f"{name} must be in range {lo}..{hi}")
+
+
+def encode_events(
+    ticks: np.ndarray,
+    status: np.ndarray,
+    data1: np.ndarray,
+    data2: np.ndarray,
+) -> bytes:
+    """
+    Encode already-sorted channel events to MTrk body bytes, fully vectorized.
+
+    Each event is VLQ(delta) + [status] + data1 [+ data2]; the status byte is
+    omitted when it equals the previous one (running status). Program change
+    and channel pressure carry one data byte, everything else two.
+    """
+    n = len(ticks)
+    if not n:
+        return b""
+
+    ticks = ticks.astype(np.int64)
+    delta = np.diff(ticks, prepend=0)
+    if int(delta.min()) < 0:
+        raise ValueError("events must be sorted by tick")
+
+    kind = status & 0xF0
+    two_data = (kind != 0xC0) & (kind != 0xD0)
+    running = np.zeros(n, dtype=bool)
+    running[1:] = status[1:] == status[:-1]
+
+    vlq_len = np.ones(n, dtype=np.int64)
+    for shift in (7, 14, 21, 28):
+        vlq_len += delta >= (1 << shift)
+
+    size = vlq_len + (~running) + 1 + two_data
+    offset = np.zeros(n, dtype=np.int64)
+    np.cumsum(size[:-1], out=offset[1:])
+    out = np.zeros(int(offset[-1] + size[-1]), dtype=np.uint8)
+
+    # VLQ: byte k (from the left) of an L-byte quantity holds bits 7*(L-1-k)..
+    for k in range(5):
+        has = vlq_len > k
+        if not has.any():
+            break
+        shift = 7 * (vlq_len[has] - 1 - k)
+        byte = (delta[has] >> shift) & 0x7F
+        byte |= np.where(k < vlq_len[has] - 1, 0x80, 0)
+        out[offset[has] + k] = byte
+
+    pos = offset + vlq_len
+    out[pos[~running]] = status[~running]
+    pos = pos + (~running)
+    out[pos] = data1
+    out[pos[two_data] + 1] = data2[two_data]
+    return out.tobytes()
+
+
+def note_events(
+    notes: NoteStore,
+    programs: Sequence[Tuple[int, int]] = (),
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Build sorted (tick, status, data1, data2) arrays for program changes at tick 0
+    followed by note_on/note_off pairs. Order matches the old mido writer: by tick,
+    note_offs before everything else at the same tick, otherwise stable
+    (program changes, then notes in store order).
+    """
+    n = len(notes)
+    chan = notes.channel.astype(np.int64)
+    pitch = notes.pitch.astype(np.int64)
+    vel = notes.velocity.astype(np.int64)
+    _check_range("channel", chan, 0, 15)
+    _check_range("note", pitch, 0, 127)
+    _check_range("velocity", vel, 0, 127)
+
+    pc_ch = np.array([int(c) for c, _ in programs], dtype=np.int64)
+    pc_prog = np.array([int(p) for _, p in programs], dtype=np.int64)
+    _check_range("channel", pc_ch, 0, 15)
+    _check_range("program", pc_prog, 0, 127)
+    p = len(programs)
+
+    ticks = np.concatenate([
+        np.zeros(p, dtype=np.int64),
+        notes.start_tick.astype(np.int64),
+        notes.end_tick.astype(np.int64),
+    ])
+    status = np.concatenate([STATUS_PROGRAM_CHANGE | pc_ch, STATUS_NOTE_ON | chan, STATUS_NOTE_OFF | chan])
+    data1 = np.concatenate([pc_prog, pitch, pitch])
+    data2 = np.concatenate([np.zeros(p, dtype=np.int64), vel, np.zeros(n, dtype=np.int64)])
+
+    # note_off sorts first at a tick; ties keep list order (pcs, then on/off interleaved per note)
+    pri = np.concatenate([np.zeros(p + n, dtype=np.int8), np.full(n, -1, dtype=np.int8)])
+    seq = np.concatenate([np.arange(p) - p, 2 * np.arange(n), 2 * np.arange(n) + 1])
+    order = np.lexsort((seq, pri, ticks))
+    return ticks[order], status[order], data1[order], data2[order]
+
+
+def track_chunk(body: bytes) -> bytes:
+    return b"MTrk" + struct.pack(">I", len(body)) + body
+
+
+def write_smf(out_path: Path, ticks_per_beat: int, track_bodies: List[bytes], *, smf_format: int = 1) -> None:
+    """Write MThd + one MTrk per body (each body must already end with end_of_track) in one call."""
+    data = bytearray(b"MThd" + struct.pack(">Ihhh", 6, smf_format, len(track_bodies), ticks_per_beat))
+    for body in track_bodies:
+        data += track_chunk(body)
+    out_path = Path(out_path)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    out_path.write_bytes(data)
+
+
+def encode_note_track(
+    notes: NoteStore,
+    *,
+    tempo: Optional[int] = None,
+    programs: Sequence[Tuple[int, int]] = (),
+) -> bytes:
+    """Single MTrk body: optional tempo at tick 0, program changes, notes, end_of_track."""
+    head = tempo_event(tempo) if tempo is not None else b""
+    return head + encode_events(*note_events(notes, programs)) + END_OF_TRACK
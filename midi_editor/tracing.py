@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional
+
+# Spans kept for export; the oldest are dropped past this
+TRACE_MAX_EVENTS = 200_000
+# Durations kept per span name for the live overlay
+RECENT_SAMPLES = 120
+
+
+class _NullSpan:
+    """What span() hands out while tracing is off: entering, leaving and set() do nothing."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        return None
+
+    def set(self, **args: Any) -> None:
+        return None
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("tracer", "name", "cat", "args", "t0")
+
+    def __init__(self, tracer: "Tracer", name: str, cat: str, args: Dict[str, Any]):
+        self.tracer = tracer
+        self.name = name
+        self.cat = cat
+        self.args = args
+        self.t0 = 0
+
+    def __enter__(self) -> "_Span":
+        self.t0 = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.tracer._record(self.name, self.cat, self.t0, time.perf_counter_ns() - self.t0, self.args)
+
+    def set(self, **args: Any) -> None:
+        """Attach counts (scene items, notes visited, ...) to this span."""
+        self.args.update(args)
+
+
+class Tracer:
+    """
+    Opt-in timing of editor operations (redraws, paints, wheel handling,
+    channel table rebuilds, preview steps).
+
+    Call sites wrap work in `with TRACER.span("name") as s:`; while disabled
+    that is one attribute check returning a shared do-nothing span, so the
+    instrumentation stays in normal builds. While enabled, spans are kept as
+    Chrome trace events (open the export in chrome://tracing or Perfetto)
+    and the last RECENT_SAMPLES durations per name feed the live overlay.
+    """
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self._events: Deque[Dict[str, Any]] = deque(maxlen=TRACE_MAX_EVENTS)
+        self._recent: Dict[str, Deque[float]] = {}
+        self._last_args: Dict[str, Dict[str, Any]] = {}
+        self._epoch_ns = time.perf_counter_ns()
+        self._lock = threading.Lock()
+
+    def enable(self, on: bool = True) -> None:
+        self.enabled = on
+
+    def clear(self) -> None:
+        with self._lock:
+            self._events.clear()
+            self._recent.clear()
+            self._last_args.clear()
+            self._epoch_ns = time.perf_counter_ns()
+
+    def span(self, name: str, cat: str = "editor", **args: Any):
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name, cat, args)
+
+    def counter(self, name: str, **values: float) -> None:
+        """Record a counter sample (a "C" event: one graph track per value)."""
+        if not self.enabled:
+            return
+        ts = (time.perf_counter_ns() - self._epoch_ns) / 1000.0
+        with self._lock:
+            self._events.append({
+                "name": name, "cat": "counter", "ph": "C", "ts": ts,
+                "pid": os.getpid(), "tid": threading.get_ident(), "args": dict(values),
+            })
+
+    def _record(self, name: str, cat: str, t0_ns: int, dur_ns: int, args: Dict[str, Any]) -> None:
+        event = {
+            "name": name, "cat": cat, "ph": "X",
+            "ts": (t0_ns - self._epoch_ns) / 1000.0, "dur": dur_ns / 1000.0,
+            "pid": os.getpid(), "tid": threading.get_ident(),
+        }
+        if args:
+            event["args"] = args
+        with self._lock:
+            self._events.append(event)
+            recent = self._recent.get(name)
+            if recent is None:
+                recent = self._recent[name] = deque(maxlen=RECENT_SAMPLES)
+            recent.append(dur_ns / 1e6)
+            self._last_args[name] = args
+
+    # ---- reading ----
+
+    def recent_ms(self, name: str) -> List[float]:
+        """Latest durations (ms) of spans called `name`, oldest first."""
+        with self._lock:
+            return list(self._recent.get(name, ()))
+
+    def last_args(self, name: str) -> Dict[str, Any]:
+        with self._lock:
+            return dict(self._last_args.get(name, {}))
+
+    def names(self) -> List[str]:
+        with self._lock:
+            return sorted(self._recent)
+
+    def chrome_trace(self) -> Dict[str, Any]:
+        with self._lock:
+            events = list(self._events)
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def save(self, path: Path) -> int:
+        """Write everything recorded as Chrome trace JSON; returns the event count."""
+        trace = self.chrome_trace()
+        Path(path).write_text(json.dumps(trace), encoding="utf-8")
+        return len(trace["traceEvents"])
+
+
+# The process-wide tracer every instrumented call site reports to
+TRACER = Tracer()
@@ -1,11 +1,26 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
+import json
 import os
 import re
-import shutil
 import subprocess
+import time
 from pathlib import Path
+from typing import List, Optional, Sequence, Union
+
+# The preview song slot: its MIDI (which the decomp's Makefile lists songs by)
+# and the assembly mid2agb makes from it, or that the editor writes directly
+SONG_MIDI = Path("sound") / "songs" / "midi" / "mus_preview.mid"
+SONG_ASM = Path("sound") / "songs" / "midi" / "mus_preview.s"
+# Where a successful preview build records what it was built from (build/ is ignored by git)
+ROM_STAMP = Path("build") / "mus_preview.fingerprint.json"
+# Warm-state manifest: the commands make runs when only the preview's own
+# sources change, recorded after a full build (see capture_incremental_build)
+BUILD_MANIFEST = Path("build") / "mus_preview.manifest.json"
+# Files whose edits change what make would do for those sources
+MAKE_RULE_GLOBS = ("Makefile", "*.mk", "ld_script*.ld")
 
 
 def assert_valid_midi(midi_path: Path) -> None:
@@ -15,7 +30,34 @@ def assert_valid_midi(midi_path: Path) -> None:
         raise ValueError(f"Not a valid MIDI file (missing MThd header): {midi_path}")
 
 
-def update_midi_cfg(midi_cfg_path: Path, *, voicegroup: str, volume: int, reverb: int, priority: int) -> None:
+def fingerprint(*parts: Union[bytes, str]) -> str:
+    """Content hash of `parts` (in order)."""
+    h = hashlib.sha256()
+    for part in parts:
+        data = part.encode("utf-8") if isinstance(part, str) else part
+        # Length-prefixed so ("ab", "c") and ("a", "bc") differ
+        h.update(len(data).to_bytes(8, "little"))
+        h.update(data)
+    return h.hexdigest()
+
+
+def write_if_changed(path: Path, data: bytes) -> bool:
+    """
+    Write `data` to `path` unless it already holds exactly that, so an
+    unchanged file keeps its mtime and make leaves it alone. Returns
+    whether it wrote.
+    """
+    try:
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    return True
+
+
+def update_midi_cfg(midi_cfg_path: Path, *, voicegroup: str, volume: int, reverb: int, priority: int) -> bool:
     """
     Updates/creates the line for mus_preview.mid in midi.cfg.
 
@@ -44,12 +86,226 @@ def update_midi_cfg(midi_cfg_path: Path, *, voicegroup: str, volume: int, reverb
             lines[-1] += "\n"
         lines.append(new_line)
 
-    midi_cfg_path.write_text("".join(lines), encoding="utf-8")
+    return write_if_changed(midi_cfg_path, "".join(lines).encode("utf-8"))
+
+
+# -j1 makes errors readable; later we can speed up once stable
+MAKE_CMD = ["make", "-j8", "pokeemerald.gba"]
+
+
+def stage_preview_song(
+    repo: Path, midi_in: Path, *, voicegroup: str, volume: int, reverb: int, priority: int
+) -> Path:
+    """
+    Copy the MIDI into the preview slot and point midi.cfg at it, ready for
+    make. Returns the copied .mid. Files already holding the same content
+    aren't rewritten.
+    """
+    # Validate input midi
+    assert_valid_midi(midi_in)
+
+    # Copy to preview slot (your repo structure)
+    dest_mid = repo / SONG_MIDI
+    write_if_changed(dest_mid, midi_in.read_bytes())
+
+    # Update midi.cfg
+    update_midi_cfg(
+        repo / "sound" / "songs" / "midi" / "midi.cfg",
+        voicegroup=voicegroup,
+        volume=volume,
+        reverb=reverb,
+        priority=priority,
+    )
+    return dest_mid
+
+
+def stage_preview_asm(repo: Path, asm: str) -> bool:
+    """
+    Put already compiled song assembly in the preview slot, in place of
+    mid2agb's output. mus_preview.mid must exist (the Makefile finds songs
+    by their .mid); the .s is kept newer than it and midi.cfg so make
+    doesn't regenerate it from that MIDI. Returns whether the .s changed.
+    """
+    dest_mid = repo / SONG_MIDI
+    if not dest_mid.exists():
+        raise FileNotFoundError(f"Preview song slot missing: {dest_mid}")
+    dest_asm = repo / SONG_ASM
+    changed = write_if_changed(dest_asm, asm.encode("utf-8"))
+
+    prereqs = [dest_mid, dest_mid.with_name("midi.cfg")]
+    newest = max(p.stat().st_mtime_ns for p in prereqs if p.exists())
+    if dest_asm.stat().st_mtime_ns <= newest:
+        now = time.time_ns()
+        stamp = max(now, newest + 1_000_000_000)
+        os.utime(dest_asm, ns=(stamp, stamp))
+    return changed
+
+
+def rom_path(repo: Path) -> Path:
+    return repo / "pokeemerald.gba"
+
+
+def preview_inputs_fingerprint(repo: Path, voicegroup: str) -> str:
+    """Hash of everything staging generates: the song (.mid and .s), midi.cfg and the voicegroup."""
+    paths = (
+        repo / SONG_MIDI,
+        repo / SONG_ASM,
+        repo / SONG_MIDI.with_name("midi.cfg"),
+        repo / voicegroup_inc(voicegroup),
+    )
+    return fingerprint(*(p.read_bytes() if p.exists() else b"" for p in paths))
+
+
+def _rom_identity(repo: Path) -> Optional[list]:
+    try:
+        st = rom_path(repo).stat()
+    except FileNotFoundError:
+        return None
+    return [st.st_size, st.st_mtime_ns]
+
+
+def rom_is_current(repo: Path, inputs_fp: str) -> bool:
+    """
+    True when the ROM was last built by a preview from these exact inputs
+    and hasn't been rebuilt or replaced since, so make can be skipped.
+    """
+    rom = _rom_identity(repo)
+    if rom is None:
+        return False
+    try:
+        stamp = json.loads((repo / ROM_STAMP).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return False
+    return isinstance(stamp, dict) and stamp.get("inputs") == inputs_fp and stamp.get("rom") == rom
+
+
+def record_rom_build(repo: Path, inputs_fp: str) -> None:
+    """Remember that the current ROM was built from `inputs_fp` (after a successful make)."""
+    stamp = {"inputs": inputs_fp, "rom": _rom_identity(repo)}
+    write_if_changed(repo / ROM_STAMP, json.dumps(stamp).encode("utf-8"))
+
+
+def voicegroup_inc(voicegroup: str) -> Path:
+    return Path("sound") / "voicegroups" / f"{voicegroup}.inc"
+
+
+def make_rules_fingerprint(repo: Path) -> str:
+    """Hash of the Makefiles and linker scripts at the repo root."""
+    paths = sorted({p for pattern in MAKE_RULE_GLOBS for p in repo.glob(pattern) if p.is_file()})
+    return fingerprint(*(part for p in paths for part in (p.name, p.read_bytes())))
+
+
+def midi_cfg_fingerprint(repo: Path) -> str:
+    """
+    Hash of midi.cfg: the recorded mid2agb command lines carry its -G/-V/-R/-P
+    flags, so a manifest only holds for the midi.cfg it was recorded with.
+    """
+    cfg = repo / SONG_MIDI.with_name("midi.cfg")
+    return fingerprint(cfg.read_bytes() if cfg.exists() else b"")
+
+
+def dry_run_cmd(sources: Sequence[Path]) -> List[str]:
+    """make -n with each source treated as just edited: prints what would rebuild because of them."""
+    cmd = ["make", "-n"]
+    for src in sources:
+        cmd += ["-W", str(src)]
+    return cmd + MAKE_CMD[2:]
+
+
+def parse_dry_run(output: str) -> List[str]:
+    """
+    Recipe lines from `make -n` output, continuations joined, make's own
+    messages dropped. Sub-makes are kept as their `$(MAKE) ...` line only:
+    what they print between entering and leaving a directory is theirs.
+    """
+    commands: List[str] = []
+    pending = ""
+    depth = 0
+    for line in output.splitlines():
+        if not pending:
+            if re.match(r"^make(\[\d+\])?: ", line):
+                if "Entering directory" in line:
+                    depth += 1
+                elif "Leaving directory" in line:
+                    depth -= 1
+                continue
+            if depth > 0 or not line.strip():
+                continue
+        if line.endswith("\\"):
+            pending += line + "\n"
+            continue
+        commands.append(pending + line)
+        pending = ""
+    if pending:
+        commands.append(pending.rstrip("\\\n"))
+    return commands
+
+
+def write_build_manifest(repo: Path, sources: Sequence[Path], commands: Sequence[str]) -> None:
+    """Record `commands` as the rebuild for `sources`, valid for the ROM as it is now."""
+    manifest = {
+        "make_rules": make_rules_fingerprint(repo),
+        "midi_cfg": midi_cfg_fingerprint(repo),
+        "sources": [str(s) for s in sources],
+        "commands": list(commands),
+        "rom": _rom_identity(repo),
+    }
+    write_if_changed(repo / BUILD_MANIFEST, json.dumps(manifest, indent=1).encode("utf-8"))
+
+
+def incremental_commands(repo: Path, sources: Sequence[Path]) -> Optional[List[str]]:
+    """
+    The recorded rebuild for `sources`, or None when it can't be trusted:
+    no manifest, other sources, edited Makefiles/linker scripts or midi.cfg,
+    or a ROM that something other than a preview build has replaced since.
+    """
+    try:
+        manifest = json.loads((repo / BUILD_MANIFEST).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(manifest, dict) or not manifest.get("commands"):
+        return None
+    rom = _rom_identity(repo)
+    if rom is None or manifest.get("rom") != rom or manifest.get("sources") != [str(s) for s in sources]:
+        return None
+    if manifest.get("make_rules") != make_rules_fingerprint(repo):
+        return None
+    if manifest.get("midi_cfg") != midi_cfg_fingerprint(repo):
+        return None
+    return [str(c) for c in manifest["commands"]]
+
+
+def refresh_build_manifest(repo: Path) -> None:
+    """After an incremental rebuild: the manifest stays valid for the ROM it just produced."""
+    path = repo / BUILD_MANIFEST
+    manifest = json.loads(path.read_text(encoding="utf-8"))
+    manifest["rom"] = _rom_identity(repo)
+    write_if_changed(path, json.dumps(manifest, indent=1).encode("utf-8"))
+
+
+def incremental_script(commands: Sequence[str]) -> str:
+    """
+    One sh script running the recorded commands in order, stopping at the
+    first failure. Each runs in its own subshell, as make would (so a `cd`
+    in one doesn't leak into the next).
+    """
+    return "set -e\n" + "".join(f"(\n{cmd}\n)\n" for cmd in commands)
 
 
 def run_make(repo_root: Path) -> None:
-    # -j1 makes errors readable; later we can speed up once stable
-    subprocess.run(["make", "-j8", "pokeemerald.gba"], cwd=repo_root, check=True)
+    subprocess.run(MAKE_CMD, cwd=repo_root, check=True)
+
+
+def capture_incremental_build(repo: Path, sources: Sequence[Path]) -> List[str]:
+    """Ask make (once, right after a full build) what `sources` rebuild, and record it."""
+    out = subprocess.run(dry_run_cmd(sources), cwd=repo, check=True, capture_output=True, text=True).stdout
+    commands = parse_dry_run(out)
+    write_build_manifest(repo, sources, commands)
+    return commands
+
+
+def run_incremental(repo: Path, commands: Sequence[str]) -> None:
+    subprocess.run(["sh", "-c", incremental_script(commands)], cwd=repo, check=True)
 
 
 def launch_mgba(mgba_path: Path, rom_path: Path) -> None:
@@ -74,29 +330,38 @@ def main() -> None:
     assert repo.exists(), f"Repo not found: {repo}"
     assert midi_in.exists(), f"MIDI not found: {midi_in}"
 
-    # Validate input midi
-    assert_valid_midi(midi_in)
-
-    # Copy to preview slot (your repo structure)
-    dest_mid = repo / "sound" / "songs" / "midi" / "mus_preview.mid"
-    dest_mid.parent.mkdir(parents=True, exist_ok=True)
-    shutil.copyfile(midi_in, dest_mid)
-
-    # Update midi.cfg
-    midi_cfg = repo / "sound" / "songs" / "midi" / "midi.cfg"
-    update_midi_cfg(
-        midi_cfg,
+    stage_preview_song(
+        repo,
+        midi_in,
         voicegroup=args.voicegroup,
         volume=args.volume,
         reverb=args.reverb,
         priority=args.priority,
     )
 
-    # Build
-    run_make(repo)
+    # Build, unless the ROM already came from these exact inputs. make
+    # regenerates the .s from the .mid here, so the .mid is the song source
+    inputs_fp = preview_inputs_fingerprint(repo, args.voicegroup)
+    sources = [SONG_MIDI, voicegroup_inc(args.voicegroup)]
+    if rom_is_current(repo, inputs_fp):
+        print("ROM is up to date, skipping make")
+    else:
+        commands = incremental_commands(repo, sources)
+        if commands:
+            print(f"Rebuilding the preview song only ({len(commands)} commands)")
+            try:
+                run_incremental(repo, commands)
+                refresh_build_manifest(repo)
+            except subprocess.CalledProcessError:
+                print("Incremental rebuild failed, running a full make")
+                commands = None
+        if not commands:
+            run_make(repo)
+            capture_incremental_build(repo, sources)
+        record_rom_build(repo, inputs_fp)
 
     # Launch emulator
-    rom = repo / "pokeemerald.gba"
+    rom = rom_path(repo)
     if not rom.exists():
         raise FileNotFoundError(f"ROM not found after build: {rom}")
     launch_mgba(mgba, rom)